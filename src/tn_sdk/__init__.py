@@ -1 +1,20 @@
-from .core import TnApi
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import TnApi, AsyncTnApi
+
+__all__ = ["TnApi", "AsyncTnApi"]
+
+
+def __getattr__(name: str):
+    # The clients are imported on first access, see tn_sdk.core
+    if name in __all__:
+        from . import core
+
+        value = globals()[name] = getattr(core, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,86 @@
+"""
+Measures PayloadCanonicalizer on payloads of increasing size: bytes before and after
+compression with and without canonicalization (and with the derivable fields stripped),
+the time it adds to preparing a payload, and that reordered payloads give the same bytes.
+
+Run with ``python -m tn_sdk.benchmarks.bench_canonical``.
+"""
+
+import json
+from functools import partial
+
+from tn_sdk.benchmarks.bench_models import _time_per_call
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.canonical import PayloadCanonicalizer
+from tn_sdk.utils.constants import DERIVABLE_SEGMENT_FIELDS
+
+SOLUTION_COUNTS = (100, 1000, 5000)
+
+
+def _reversed_keys(value):
+    """
+    The same JSON value, with the keys of every object in reverse order.
+    """
+    if isinstance(value, dict):
+        return {key: _reversed_keys(value[key]) for key in reversed(value)}
+    if isinstance(value, list):
+        return [_reversed_keys(item) for item in value]
+    return value
+
+
+def run() -> list[dict]:
+    """
+    Canonicalizes JSON strings, as prepare_data_for_generate_solutions receives them, and
+    prepares them with zlib at the default level.
+    """
+    canonicalizer = PayloadCanonicalizer()
+    stripping = PayloadCanonicalizer(DERIVABLE_SEGMENT_FIELDS)
+    canonical_prepare = partial(prepare_payload, canonicalizer=canonicalizer)
+    results = []
+    for solutions in SOLUTION_COUNTS:
+        data = generate_request_data(solutions, seed=solutions)
+        encoded = json.dumps(data)
+        shuffled = json.dumps(_reversed_keys(data), indent=2)
+
+        report = canonicalizer.report(encoded)
+        stripped = stripping.report(encoded)
+        results.append(
+            {
+                "solutions": solutions,
+                "raw_size": report.raw_size,
+                "canonical_size": report.canonical_size,
+                "stripped_size": stripped.canonical_size,
+                "compressed_size": report.compressed_size,
+                "canonical_compressed_size": report.canonical_compressed_size,
+                "stripped_compressed_size": stripped.canonical_compressed_size,
+                "prepare_ms": _time_per_call(prepare_payload, encoded) * 1e3,
+                "canonical_prepare_ms": _time_per_call(canonical_prepare, encoded)
+                * 1e3,
+                "deterministic": canonical_prepare(encoded)
+                == canonical_prepare(shuffled),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'solutions':>9} {'raw KB':>8} {'canon KB':>8} {'strip KB':>8}"
+        f" {'zlib KB':>8} {'canon':>8} {'strip':>8} {'prepare ms':>10}"
+        f" {'canon ms':>8} {'same bytes':>10}"
+    )
+    for row in run():
+        print(
+            f"{row['solutions']:>9} {row['raw_size'] / 1e3:>8.1f}"
+            f" {row['canonical_size'] / 1e3:>8.1f} {row['stripped_size'] / 1e3:>8.1f}"
+            f" {row['compressed_size'] / 1e3:>8.1f}"
+            f" {row['canonical_compressed_size'] / 1e3:>8.1f}"
+            f" {row['stripped_compressed_size'] / 1e3:>8.1f}"
+            f" {row['prepare_ms']:>10.2f} {row['canonical_prepare_ms']:>8.2f}"
+            f" {str(row['deterministic']):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Measures the sync client end to end: request throughput and p50/p99 latency of
+TnApi._request under concurrency against a local StubApiServer (healthy, slow, expiring
+tokens, 429/5xx bursts, a latency tail with and without hedging, a brownout with and
+without a retry budget), and time and peak memory of prepare_data_for_generate_solutions
+for increasingly large payloads. Large responses are read both eagerly and streamed, for
+time to first solution and peak memory.
+
+Run with ``python -m tn_sdk.benchmarks.bench_client --output results.json`` and diff the
+JSON files of two SDK versions.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+
+from tn_sdk.benchmarks.itineraries import (
+    generate_pricing_solution,
+    generate_request_data,
+)
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.metrics import MetricsCollector
+from tn_sdk.core.resilience import RetryBudget
+from tn_sdk.core.tn_api import TnApi
+
+BENCH_ENDPOINT = "/bench/"
+CONCURRENCY_LEVELS = (1, 8, 32)
+REQUESTS_PER_SCENARIO = 2000
+SOLUTION_COUNTS = (10, 100, 1000, 5000)
+RESPONSE_SOLUTION_COUNTS = (1000, 20000)
+
+# Stub server behaviours, as StubApiServer keywords
+SCENARIOS = {
+    "healthy": {},
+    "slow": {"latency": 0.02},
+    "token_expiry": {"token_ttl": 0.5},
+    "bursts": {"burst_every": 200, "burst_length": 2, "burst_status": 503},
+    "throttled": {"burst_every": 100, "burst_length": 1, "burst_status": 429},
+    "tail": {"tail_every": 50, "tail_latency": 0.2},
+    "tail_hedged": {"tail_every": 50, "tail_latency": 0.2},
+    "brownout": {"burst_every": 10, "burst_length": 5, "burst_status": 503},
+    "brownout_budget": {"burst_every": 10, "burst_length": 5, "burst_status": 503},
+}
+
+# TnApi keywords of the scenarios measuring a client option, as factories so every run
+# starts from fresh state
+SCENARIO_CLIENT_OPTIONS = {
+    "tail_hedged": lambda: {"hedge_after": 0.02},
+    "brownout_budget": lambda: {"retry_budget": RetryBudget()},
+}
+
+
+def _time_per_call(function, *args) -> float:
+    """
+    Returns the best average time of a call, in seconds.
+    """
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """
+    Returns the q-quantile of the sorted values (nearest rank).
+    """
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def _timed_request(client: TnApi) -> tuple[float, bool]:
+    """
+    Sends one request, returning its latency and whether it succeeded.
+    """
+    started = time.perf_counter()
+    try:
+        client._request("GET", BENCH_ENDPOINT, TokenType.PRODUCTION)
+    except Exception:
+        return time.perf_counter() - started, False
+    return time.perf_counter() - started, True
+
+
+def run_requests(
+    scenario: str, concurrency: int, requests: int = REQUESTS_PER_SCENARIO
+) -> dict:
+    """
+    Sends requests from concurrency threads sharing one client, against a stub server
+    behaving as the scenario says.
+    """
+    metrics = MetricsCollector()
+    with StubApiServer(**SCENARIOS[scenario]) as server:
+        with TnApi(
+            "bench-id",
+            "bench-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+            pool_maxsize=concurrency,
+            hooks=metrics,
+            **SCENARIO_CLIENT_OPTIONS.get(scenario, dict)(),
+        ) as client:
+            client.authenticate()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                started = time.perf_counter()
+                outcomes = list(
+                    executor.map(lambda _: _timed_request(client), range(requests))
+                )
+                elapsed = time.perf_counter() - started
+            pool_stats = client.pool_stats
+        server_stats = server.stats
+
+    latencies = sorted(latency for latency, _ in outcomes)
+    snapshot = metrics.snapshot()
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": requests,
+        "errors": sum(not succeeded for _, succeeded in outcomes),
+        "throughput_rps": requests / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3,
+        "retries": sum(snapshot.retries.values()),
+        "token_refreshes": snapshot.token_refreshes,
+        "pool": asdict(pool_stats),
+        "server": asdict(server_stats),
+    }
+
+
+def run_prepare(solution_counts: tuple[int, ...] = SOLUTION_COUNTS) -> list[dict]:
+    """
+    Measures prepare_data_for_generate_solutions on JSON payloads of increasing size.
+    """
+    client = TnApi(
+        "bench-id", "bench-secret", credential_store=InMemoryCredentialStore()
+    )
+    results = []
+    with client:
+        for solutions in solution_counts:
+            json_data = json.dumps(generate_request_data(solutions, seed=solutions))
+            tracemalloc.start()
+            try:
+                compressed = client.prepare_data_for_generate_solutions(json_data)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            results.append(
+                {
+                    "solutions": solutions,
+                    "raw_bytes": len(json_data),
+                    "prepared_bytes": len(compressed),
+                    "ms": _time_per_call(
+                        client.prepare_data_for_generate_solutions, json_data
+                    )
+                    * 1e3,
+                    "peak_bytes": peak,
+                }
+            )
+    return results
+
+
+def _read_response(client: TnApi, stream: bool) -> tuple[float, float, int]:
+    """
+    Reads every solution of a response, returning the time to the first one, the total
+    time and the peak memory.
+    """
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        if stream:
+            with client._request("GET", BENCH_ENDPOINT, stream=True) as response:
+                solutions = response.iter_items("solutions")
+                next(solutions)
+                first = time.perf_counter() - started
+                for _ in solutions:
+                    pass
+        else:
+            next(iter(client._request("GET", BENCH_ENDPOINT)["solutions"]))
+            first = time.perf_counter() - started
+        total = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return first, total, peak
+
+
+def run_responses(
+    solution_counts: tuple[int, ...] = RESPONSE_SOLUTION_COUNTS,
+) -> list[dict]:
+    """
+    Reads gzip compressed responses of increasing size eagerly and streamed.
+    """
+    results = []
+    for solutions in solution_counts:
+        rng = random.Random(solutions)
+        body = {
+            "trip_id": "bench",
+            "solutions": [generate_pricing_solution(rng) for _ in range(solutions)],
+        }
+        with StubApiServer(response_body=body, gzip_responses=True) as server:
+            with TnApi(
+                "bench-id",
+                "bench-secret",
+                tn_api_url=server.url,
+                credential_store=InMemoryCredentialStore(),
+            ) as client:
+                client.authenticate()
+                for stream in (False, True):
+                    first, total, peak = _read_response(client, stream)
+                    results.append(
+                        {
+                            "solutions": solutions,
+                            "mode": "streamed" if stream else "eager",
+                            "first_ms": first * 1e3,
+                            "total_ms": total * 1e3,
+                            "peak_bytes": peak,
+                        }
+                    )
+    return results
+
+
+def _sdk_version() -> str:
+    try:
+        return version("tn_sdk")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run(
+    scenarios: list[str] | None = None,
+    concurrency_levels: tuple[int, ...] = CONCURRENCY_LEVELS,
+    requests: int = REQUESTS_PER_SCENARIO,
+    solution_counts: tuple[int, ...] = SOLUTION_COUNTS,
+) -> dict:
+    """
+    Runs every request scenario at every concurrency level, then the prepare and response
+    benchmarks.
+    """
+    return {
+        "sdk_version": _sdk_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "requests": [
+            run_requests(scenario, concurrency, requests)
+            for scenario in scenarios or SCENARIOS
+            for concurrency in concurrency_levels
+        ],
+        "prepare": run_prepare(solution_counts),
+        "responses": run_responses(),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tn_sdk.benchmarks.bench_client")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Only run this scenario (repeatable)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        action="append",
+        help="Concurrency level to run (repeatable)",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=REQUESTS_PER_SCENARIO,
+        help="Requests per scenario and concurrency level",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.scenario,
+        tuple(args.concurrency or CONCURRENCY_LEVELS),
+        args.requests,
+    )
+
+    print(
+        f"{'scenario':>15} {'threads':>7} {'req/s':>8} {'p50 ms':>7} {'p99 ms':>7}"
+        f" {'errors':>6} {'retries':>7} {'created':>7}"
+    )
+    for row in results["requests"]:
+        print(
+            f"{row['scenario']:>15} {row['concurrency']:>7}"
+            f" {row['throughput_rps']:>8.0f} {row['p50_ms']:>7.2f} {row['p99_ms']:>7.2f}"
+            f" {row['errors']:>6} {row['retries']:>7} {row['pool']['created']:>7}"
+        )
+    print()
+    print(f"{'solutions':>9} {'raw':>9} {'prepared':>9} {'ms':>8} {'peak':>10}")
+    for row in results["prepare"]:
+        print(
+            f"{row['solutions']:>9} {row['raw_bytes']:>9} {row['prepared_bytes']:>9}"
+            f" {row['ms']:>8.2f} {row['peak_bytes']:>10}"
+        )
+    print()
+    print(f"{'solutions':>9} {'mode':>8} {'first ms':>8} {'total ms':>8} {'peak':>10}")
+    for row in results["responses"]:
+        print(
+            f"{row['solutions']:>9} {row['mode']:>8} {row['first_ms']:>8.2f}"
+            f" {row['total_ms']:>8.2f} {row['peak_bytes']:>10}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
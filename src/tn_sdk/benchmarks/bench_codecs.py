@@ -0,0 +1,124 @@
+"""
+Sweeps the compression codecs and levels over itinerary payloads of increasing size,
+and shows which zlib level the adaptive policy picks for each size.
+
+Run with ``python -m tn_sdk.benchmarks.bench_codecs``. Pass ``--profile`` to print the
+measured per-level zlib profile, to use as AdaptiveCompressionPolicy(profile=...) on
+hardware that differs from the one ZLIB_LEVEL_PROFILE was measured on.
+"""
+
+import argparse
+import json
+import time
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.codecs import (
+    AdaptiveCompressionPolicy,
+    Bz2Codec,
+    Codec,
+    GzipCodec,
+    LzmaCodec,
+    ZlibCodec,
+)
+
+SOLUTION_COUNTS = (1, 10, 100, 1000)
+
+CODECS = (
+    *(ZlibCodec(level) for level in range(1, 10)),
+    GzipCodec(6),
+    Bz2Codec(1),
+    Bz2Codec(9),
+    LzmaCodec(0),
+    LzmaCodec(1),
+    LzmaCodec(6),
+)
+
+
+def _time_per_call(codec: Codec, raw: bytes, min_seconds: float = 0.2) -> float:
+    """
+    Returns the average time of compressing raw with codec, in seconds.
+    """
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        codec.compress(raw)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls
+
+
+def run(solution_counts=SOLUTION_COUNTS, codecs=CODECS) -> list[dict]:
+    """
+    Measures compressed size and CPU time of every codec for every payload size.
+    """
+    results = []
+    for solutions in solution_counts:
+        raw = json.dumps(generate_request_data(solutions, seed=solutions)).encode(
+            "utf-8"
+        )
+        for codec in codecs:
+            seconds = _time_per_call(codec, raw)
+            results.append(
+                {
+                    "solutions": solutions,
+                    "codec": codec.name,
+                    "level": codec.level,
+                    "raw_bytes": len(raw),
+                    "compressed_bytes": len(codec.compress(raw)),
+                    "seconds": seconds,
+                }
+            )
+    return results
+
+
+def measure_zlib_profile(solutions: int = 1000) -> dict[int, tuple[float, float]]:
+    """
+    Measures the throughput (bytes/s) and ratio of each zlib level on this machine,
+    in the format of ZLIB_LEVEL_PROFILE.
+    """
+    rows = run((solutions,), [ZlibCodec(level) for level in range(1, 10)])
+    return {
+        row["level"]: (
+            round(row["raw_bytes"] / row["seconds"], -5),
+            round(row["compressed_bytes"] / row["raw_bytes"], 3),
+        )
+        for row in rows
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tn_sdk.benchmarks.bench_codecs")
+    parser.add_argument(
+        "--profile", action="store_true", help="Print the measured zlib profile"
+    )
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        for level, (throughput, ratio) in measure_zlib_profile().items():
+            print(f"    {level}: ({throughput:.0f}, {ratio}),")
+        return
+
+    print(
+        f"{'solutions':>9} {'codec':>6} {'level':>5} {'raw':>9} {'compressed':>10}"
+        f" {'ratio':>6} {'MB/s':>7} {'ms':>8}"
+    )
+    for row in run():
+        print(
+            f"{row['solutions']:>9} {row['codec']:>6} {row['level']:>5}"
+            f" {row['raw_bytes']:>9} {row['compressed_bytes']:>10}"
+            f" {row['compressed_bytes'] / row['raw_bytes']:>6.3f}"
+            f" {row['raw_bytes'] / row['seconds'] / 1e6:>7.1f}"
+            f" {row['seconds'] * 1e3:>8.2f}"
+        )
+
+    print()
+    policy = AdaptiveCompressionPolicy()
+    print(f"Adaptive choice ({policy!r}):")
+    for solutions in SOLUTION_COUNTS:
+        size = len(json.dumps(generate_request_data(solutions, seed=solutions)))
+        print(f"{solutions:>9} solutions, {size:>9} bytes: {policy.select(size)!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures segment deduplication on itinerary payloads with increasing duplication ratios:
+compressed size and prepare time, with and without the segment table.
+
+Run with ``python -m tn_sdk.benchmarks.bench_dedup``.
+"""
+
+import json
+import timeit
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.dedup import deduplicate_segments
+
+SOLUTIONS = 2000
+DUPLICATION_RATIOS = (0.0, 0.5, 0.9, 0.99)
+
+
+def _time_per_call(function, *args) -> float:
+    """
+    Returns the best average time of a call, in seconds.
+    """
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def run(solutions: int = SOLUTIONS) -> list[dict]:
+    """
+    Prepares the same request as-is (serialize and compress), deduplicated from the dict
+    (deduplicate, serialize, compress), and deduplicated from its JSON string, as
+    prepare_data_for_generate_solutions receives it (decode first).
+    """
+    results = []
+    for duplication in DUPLICATION_RATIOS:
+        data = generate_request_data(solutions, seed=1, duplication=duplication)
+        json_data = json.dumps(data)
+        normalized = deduplicate_segments(data)
+        results.append(
+            {
+                "duplication": duplication,
+                "segments": sum(
+                    len(leg)
+                    for solutions in data["datasource_responses"].values()
+                    for solution in solutions
+                    for leg in solution["segments"]
+                ),
+                "unique_segments": len(normalized["segment_table"]),
+                "raw_bytes": len(json_data),
+                "deduplicated_raw_bytes": len(json.dumps(normalized)),
+                "plain_bytes": len(prepare_payload(json_data)),
+                "deduplicated_bytes": len(prepare_payload(json_data, deduplicate=True)),
+                "plain_ms": _time_per_call(prepare_payload, data) * 1e3,
+                "deduplicated_ms": _time_per_call(
+                    lambda: prepare_payload(data, deduplicate=True)
+                )
+                * 1e3,
+                "deduplicated_from_str_ms": _time_per_call(
+                    lambda: prepare_payload(json_data, deduplicate=True)
+                )
+                * 1e3,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'dup':>5} {'segments':>8} {'unique':>7} {'raw':>9} {'dedup raw':>9}"
+        f" {'wire':>8} {'dedup wire':>10} {'ms':>7} {'dedup ms':>8} {'from str':>8}"
+    )
+    for row in run():
+        print(
+            f"{row['duplication']:>5.2f} {row['segments']:>8} {row['unique_segments']:>7}"
+            f" {row['raw_bytes']:>9} {row['deduplicated_raw_bytes']:>9}"
+            f" {row['plain_bytes']:>8} {row['deduplicated_bytes']:>10}"
+            f" {row['plain_ms']:>7.1f} {row['deduplicated_ms']:>8.1f}"
+            f" {row['deduplicated_from_str_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
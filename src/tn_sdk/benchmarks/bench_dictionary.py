@@ -0,0 +1,69 @@
+"""
+Compares compressing itinerary payloads with and without the bundled preset dictionary.
+
+Run with ``python -m tn_sdk.benchmarks.bench_dictionary``.
+"""
+
+import json
+import timeit
+import zlib
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.itinerary_dictionary import ITINERARY_DICTIONARY_V1
+from tn_sdk.utils.constants import DEFAULT_COMPRESSION_LEVEL
+
+SOLUTION_COUNTS = (1, 5, 20, 100, 1000)
+
+
+def _time_per_call(function, *args) -> float:
+    """
+    Returns the best average time of a call, in seconds.
+    """
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def run(level: int = DEFAULT_COMPRESSION_LEVEL) -> list[dict]:
+    """
+    Measures compressed size and CPU time per payload size, with and without dictionary.
+    Seeds differ from the ones the bundled dictionary was trained on.
+    """
+    results = []
+    for solutions in SOLUTION_COUNTS:
+        data = json.dumps(generate_request_data(solutions, seed=10_000 + solutions))
+        raw = data.encode("utf-8")
+        plain = zlib.compress(raw, level)
+        with_dictionary = ITINERARY_DICTIONARY_V1.compress(raw, level)
+        results.append(
+            {
+                "solutions": solutions,
+                "raw_bytes": len(raw),
+                "plain_bytes": len(plain),
+                "dictionary_bytes": len(with_dictionary),
+                "plain_us": _time_per_call(zlib.compress, raw, level) * 1e6,
+                "dictionary_us": _time_per_call(
+                    ITINERARY_DICTIONARY_V1.compress, raw, level
+                )
+                * 1e6,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'solutions':>9} {'raw':>9} {'plain':>8} {'dict':>8} {'saved':>6}"
+        f" {'plain us':>9} {'dict us':>9}"
+    )
+    for row in run():
+        saved = 1 - row["dictionary_bytes"] / row["plain_bytes"]
+        print(
+            f"{row['solutions']:>9} {row['raw_bytes']:>9} {row['plain_bytes']:>8}"
+            f" {row['dictionary_bytes']:>8} {saved:>6.1%}"
+            f" {row['plain_us']:>9.1f} {row['dictionary_us']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
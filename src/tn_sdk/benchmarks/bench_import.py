@@ -0,0 +1,115 @@
+"""
+Measures the cold start of the SDK in fresh interpreters, as a short-lived (serverless)
+process sees it: importing the package, importing the client, constructing it (eagerly
+and lazily) and sending its first request to a local StubApiServer with stored
+credentials.
+
+Run with ``python -m tn_sdk.benchmarks.bench_import --output results.json`` and diff the
+JSON files of two SDK versions.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from tn_sdk.benchmarks.stub_server import StubApiServer
+
+RUNS = 10
+BENCH_ENDPOINT = "/bench/"
+
+# Run in a fresh interpreter, prints the seconds each phase took as JSON
+_CHILD = """
+import json, sys, time
+
+started = time.perf_counter()
+import tn_sdk
+imported_package = time.perf_counter()
+from tn_sdk import TnApi
+imported_client = time.perf_counter()
+client = TnApi(
+    "bench-id",
+    "bench-secret",
+    credential_file_path=sys.argv[1],
+    tn_api_url=sys.argv[2],
+    lazy=sys.argv[3] == "lazy",
+)
+constructed = time.perf_counter()
+client._request("GET", sys.argv[4])
+first_request = time.perf_counter()
+print(json.dumps({
+    "import_package": imported_package - started,
+    "import_client": imported_client - imported_package,
+    "construct": constructed - imported_client,
+    "first_request": first_request - constructed,
+}))
+"""
+
+PHASES = ("import_package", "import_client", "construct", "first_request")
+
+
+def _run_child(credential_file: Path, url: str, mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(credential_file), url, mode, BENCH_ENDPOINT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def run_mode(mode: str, runs: int = RUNS) -> dict:
+    """
+    Starts runs fresh interpreters with the given constructor mode ("eager" or "lazy"),
+    returning the median milliseconds of each phase.
+    """
+    with tempfile.TemporaryDirectory() as directory, StubApiServer() as server:
+        credential_file = Path(directory) / "credentials.json"
+        # Store credentials first, as a warm container would have them
+        _run_child(credential_file, server.url, "eager")
+
+        timings = [_run_child(credential_file, server.url, mode) for _ in range(runs)]
+
+    result = {"mode": mode, "runs": runs}
+    for phase in PHASES:
+        result[f"{phase}_ms"] = statistics.median(t[phase] for t in timings) * 1e3
+    result["total_ms"] = sum(result[f"{phase}_ms"] for phase in PHASES)
+    return result
+
+
+def run(runs: int = RUNS) -> list[dict]:
+    return [run_mode(mode, runs) for mode in ("eager", "lazy")]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tn_sdk.benchmarks.bench_import")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--runs", type=int, default=RUNS, help="Fresh interpreters per mode"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.runs)
+
+    print(
+        f"{'mode':>6} {'import pkg':>10} {'import api':>10} {'construct':>10}"
+        f" {'1st req':>10} {'total':>10}"
+    )
+    for row in results:
+        print(
+            f"{row['mode']:>6} {row['import_package_ms']:>10.2f}"
+            f" {row['import_client_ms']:>10.2f} {row['construct_ms']:>10.2f}"
+            f" {row['first_request_ms']:>10.2f} {row['total_ms']:>10.2f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
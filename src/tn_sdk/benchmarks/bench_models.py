@@ -0,0 +1,107 @@
+"""
+Compares the typed request model and its serializer against plain dicts and json.dumps:
+memory held per segment, and serialize-and-compress time and peak memory per payload.
+
+Run with ``python -m tn_sdk.benchmarks.bench_models``.
+"""
+
+import json
+import timeit
+import tracemalloc
+import zlib
+from base64 import b64encode
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.utils.constants import DEFAULT_COMPRESSION_LEVEL
+
+SOLUTION_COUNTS = (10, 100, 1000, 5000)
+
+
+def _time_per_call(function, *args) -> float:
+    """
+    Returns the best average time of a call, in seconds.
+    """
+    timer = timeit.Timer(lambda: function(*args))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def _traced_bytes(build) -> tuple[object, int, int]:
+    """
+    Returns what build() returns, the bytes it keeps allocated and its peak allocation.
+    """
+    tracemalloc.start()
+    try:
+        result = build()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, retained, peak
+
+
+def _count_segments(data: dict) -> int:
+    return sum(
+        len(leg)
+        for solutions in data["datasource_responses"].values()
+        for solution in solutions
+        for leg in solution["segments"]
+    )
+
+
+def _dumps_and_compress(data: dict) -> bytes:
+    return b64encode(
+        zlib.compress(json.dumps(data).encode("utf-8"), DEFAULT_COMPRESSION_LEVEL)
+    )
+
+
+def run() -> list[dict]:
+    """
+    Measures both representations of payloads decoded from JSON (as when they come from
+    datasource responses), so repeated strings start out as separate objects.
+    """
+    results = []
+    for solutions in SOLUTION_COUNTS:
+        encoded = json.dumps(generate_request_data(solutions, seed=solutions))
+        data, dict_bytes, _ = _traced_bytes(lambda: json.loads(encoded))
+        model, model_bytes, _ = _traced_bytes(
+            lambda: GenerateSolutionsRequest.from_dict(json.loads(encoded))
+        )
+        dict_prepared, _, dict_peak = _traced_bytes(lambda: _dumps_and_compress(data))
+        model_prepared, _, model_peak = _traced_bytes(lambda: prepare_payload(model))
+        assert model_prepared == dict_prepared
+
+        segments = _count_segments(data)
+        results.append(
+            {
+                "solutions": solutions,
+                "segments": segments,
+                "dict_bytes_per_segment": dict_bytes / segments,
+                "model_bytes_per_segment": model_bytes / segments,
+                "dict_ms": _time_per_call(_dumps_and_compress, data) * 1e3,
+                "model_ms": _time_per_call(prepare_payload, model) * 1e3,
+                "dict_peak_bytes": dict_peak,
+                "model_peak_bytes": model_peak,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'solutions':>9} {'segments':>8} {'dict B/seg':>10} {'model B/seg':>11}"
+        f" {'dict ms':>8} {'model ms':>8} {'dict peak':>10} {'model peak':>10}"
+    )
+    for row in run():
+        print(
+            f"{row['solutions']:>9} {row['segments']:>8}"
+            f" {row['dict_bytes_per_segment']:>10.0f}"
+            f" {row['model_bytes_per_segment']:>11.0f}"
+            f" {row['dict_ms']:>8.2f} {row['model_ms']:>8.2f}"
+            f" {row['dict_peak_bytes']:>10} {row['model_peak_bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
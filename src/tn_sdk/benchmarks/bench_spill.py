@@ -0,0 +1,159 @@
+"""
+Measures the peak memory (RSS) of preparing and uploading payloads of increasing size,
+and of reading responses, in fresh interpreters: in memory, and with a spill_threshold
+spilling them to temporary files. Spilled uploads read from a JSON file keep a flat peak
+whatever the payload size.
+
+Run with ``python -m tn_sdk.benchmarks.bench_spill``.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.benchmarks.stub_server import StubApiServer
+
+PAYLOAD_SIZES_MB = (16, 64, 256)
+RESPONSE_SIZES_MB = (4, 16, 64)
+SPILL_THRESHOLD = 8 * 1024 * 1024
+BENCH_ENDPOINT = "/bench/"
+
+# Run in a fresh interpreter, prints its peak RSS before and after the request as JSON
+_CHILD = """
+import json, resource, sys
+
+from tn_sdk import TnApi
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+
+kind, mode, path, url, threshold, endpoint = sys.argv[1:7]
+client = TnApi(
+    "bench-id",
+    "bench-secret",
+    tn_api_url=url,
+    credential_store=InMemoryCredentialStore(),
+    spill_threshold=int(threshold) if mode == "spilled" else None,
+)
+client.authenticate()
+
+
+def peak_rss():
+    # The high-water mark of this process only: ru_maxrss carries the parent's over
+    # fork and exec on Linux
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+baseline = peak_rss()
+if kind == "response":
+    client._request("GET", endpoint)
+elif mode == "spilled":
+    with open(path, "rb") as file:
+        with client.spool_data_for_generate_solutions(file) as spooled:
+            client._request("POST", endpoint, data=spooled)
+else:
+    with open(path, encoding="utf-8") as file:
+        data = client.prepare_data_for_generate_solutions(file.read())
+    client._request("POST", endpoint, data=data)
+
+peak = peak_rss()
+print(json.dumps({"baseline": baseline, "peak": peak}))
+"""
+
+
+def _write_payload(path: Path, size: int) -> int:
+    """
+    Writes a generate-solutions request of about size bytes, as datasource responses
+    repeated under distinct keys, without building it in memory. Returns its size.
+    """
+    solutions = generate_request_data(500, seed=1)["datasource_responses"]
+    block = json.dumps(next(iter(solutions.values())))
+    written = 0
+    with open(path, "w", encoding="utf-8") as file:
+        written += file.write('{"trip_id": "", "datasource_responses": {')
+        index = 0
+        while written < size:
+            separator = ", " if index else ""
+            written += file.write(f'{separator}"datasource-{index}": {block}')
+            index += 1
+        written += file.write("}}")
+    return written
+
+
+def _run_child(kind: str, mode: str, path: Path, url: str) -> dict:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _CHILD,
+            kind,
+            mode,
+            str(path),
+            url,
+            str(SPILL_THRESHOLD),
+            BENCH_ENDPOINT,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def _measure(kind: str, path: Path, url: str, size: int) -> dict:
+    result = {"kind": kind, "size_mb": size / 1e6}
+    for mode in ("in_memory", "spilled"):
+        rss = _run_child(kind, mode, path, url)
+        result[f"{mode}_peak_mb"] = rss["peak"] / 1e6
+        result[f"{mode}_growth_mb"] = (rss["peak"] - rss["baseline"]) / 1e6
+    return result
+
+
+def run() -> list[dict]:
+    """
+    Uploads payloads prepared from a JSON file, and reads responses of the same shape,
+    from a StubApiServer.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "payload.json"
+        with StubApiServer() as server:
+            for size_mb in PAYLOAD_SIZES_MB:
+                size = _write_payload(path, size_mb * 1024 * 1024)
+                results.append(_measure("upload", path, server.url, size))
+
+        for size_mb in RESPONSE_SIZES_MB:
+            size = _write_payload(path, size_mb * 1024 * 1024)
+            with open(path, encoding="utf-8") as file:
+                body = json.load(file)
+            with StubApiServer(response_body=body) as server:
+                results.append(_measure("response", path, server.url, size))
+            del body
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'kind':>8} {'size MB':>8} {'in-memory peak':>14} {'growth':>8}"
+        f" {'spilled peak':>12} {'growth':>8}"
+    )
+    for row in run():
+        print(
+            f"{row['kind']:>8} {row['size_mb']:>8.0f}"
+            f" {row['in_memory_peak_mb']:>14.1f} {row['in_memory_growth_mb']:>8.1f}"
+            f" {row['spilled_peak_mb']:>12.1f} {row['spilled_growth_mb']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
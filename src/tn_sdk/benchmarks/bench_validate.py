@@ -0,0 +1,73 @@
+"""
+Measures PayloadValidator against the compression it runs before: time to validate dicts,
+request models and JSON strings of increasing size, solutions validated per millisecond,
+and validation time as a share of preparing the same payload.
+
+Run with ``python -m tn_sdk.benchmarks.bench_validate``.
+"""
+
+import json
+
+from tn_sdk.benchmarks.bench_models import _time_per_call
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.validation import PayloadValidator
+
+SOLUTION_COUNTS = (100, 1000, 10000)
+
+
+def run() -> list[dict]:
+    """
+    Validates payloads decoded from JSON (as when they come from datasource responses),
+    with and without the time format checks, and prepares them: from the JSON string for
+    dicts, as prepare_data_for_generate_solutions receives them, and streamed for models.
+    """
+    validator = PayloadValidator()
+    time_validator = PayloadValidator(check_times=True)
+    results = []
+    for solutions in SOLUTION_COUNTS:
+        encoded = json.dumps(generate_request_data(solutions, seed=solutions))
+        data = json.loads(encoded)
+        model = GenerateSolutionsRequest.from_dict(data)
+
+        validate_ms = _time_per_call(validator.validate, data) * 1e3
+        model_validate_ms = _time_per_call(validator.validate, model) * 1e3
+        prepare_ms = _time_per_call(prepare_payload, encoded) * 1e3
+        model_prepare_ms = _time_per_call(prepare_payload, model) * 1e3
+        results.append(
+            {
+                "solutions": solutions,
+                "validate_ms": validate_ms,
+                "model_validate_ms": model_validate_ms,
+                "json_validate_ms": _time_per_call(validator.validate, encoded) * 1e3,
+                "check_times_ms": _time_per_call(time_validator.validate, data) * 1e3,
+                "solutions_per_ms": solutions / validate_ms,
+                "model_solutions_per_ms": solutions / model_validate_ms,
+                "prepare_ms": prepare_ms,
+                "model_prepare_ms": model_prepare_ms,
+                "validate_share": validate_ms / prepare_ms,
+                "model_validate_share": model_validate_ms / model_prepare_ms,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        f"{'solutions':>9} {'dict ms':>8} {'model ms':>8} {'json ms':>8}"
+        f" {'times ms':>8} {'sol/ms':>7} {'prepare ms':>10} {'share':>6}"
+        f" {'model share':>11}"
+    )
+    for row in run():
+        print(
+            f"{row['solutions']:>9} {row['validate_ms']:>8.2f}"
+            f" {row['model_validate_ms']:>8.2f} {row['json_validate_ms']:>8.2f}"
+            f" {row['check_times_ms']:>8.2f} {row['solutions_per_ms']:>7.0f}"
+            f" {row['prepare_ms']:>10.2f} {row['validate_share']:>6.1%}"
+            f" {row['model_validate_share']:>11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
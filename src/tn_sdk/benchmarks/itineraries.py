@@ -0,0 +1,141 @@
+import hashlib
+import random
+from datetime import datetime, timedelta, timezone
+
+AIRPORTS = (
+    ("YHZ", -4),
+    ("YUL", -5),
+    ("YYZ", -5),
+    ("YVR", -8),
+    ("YYC", -7),
+    ("JFK", -5),
+    ("LAX", -8),
+    ("ORD", -6),
+    ("LHR", 0),
+    ("CDG", 1),
+    ("FRA", 1),
+    ("AMS", 1),
+    ("MAD", 1),
+    ("DXB", 4),
+    ("NRT", 9),
+    ("SYD", 10),
+)
+CARRIERS = ("AC", "WS", "PD", "UA", "AA", "DL", "BA", "AF", "LH", "KL", "EK", "NH")
+SEGMENT_SOURCES = ("travelport", "amadeus", "sabre")
+FARE_TYPES = ("PublicFare", "PrivateFare")
+CABIN_CLASSES = ("E", "P", "B", "F")
+BASE_DEPARTURE = datetime(2025, 11, 15, 6, 0, tzinfo=timezone.utc)
+
+
+def _sha1(rng: random.Random) -> str:
+    return hashlib.sha1(rng.getrandbits(64).to_bytes(8, "big")).hexdigest()
+
+
+def _format_local(moment: datetime, utc_offset: int) -> str:
+    """
+    Formats a timestamp like the API does: local time with millis and the UTC offset.
+    """
+    local = moment.astimezone(timezone(timedelta(hours=utc_offset)))
+    return local.isoformat(timespec="milliseconds")
+
+
+def generate_segment(
+    rng: random.Random, departure: datetime, origin: tuple, destination: tuple
+) -> dict:
+    """
+    Generates a single flight segment between two AIRPORTS departing at the given time.
+    """
+    (from_iata, from_offset), (to_iata, to_offset) = origin, destination
+    arrival = departure + timedelta(minutes=rng.randrange(45, 14 * 60, 5))
+    return {
+        "departure_time": _format_local(departure, from_offset),
+        "departure_timestamp": int(departure.timestamp()),
+        "arrival_time": _format_local(arrival, to_offset),
+        "arrival_timestamp": int(arrival.timestamp()),
+        "flight_number": str(rng.randrange(1, 9999)),
+        "operating_carrier": rng.choice(CARRIERS),
+        "transportation_type": "flight",
+        "fare_type": rng.choice(FARE_TYPES),
+        "cabin_class": rng.choice(CABIN_CLASSES),
+        "from_iata": from_iata,
+        "to_iata": to_iata,
+    }
+
+
+def generate_pricing_solution(
+    rng: random.Random,
+    legs: int = 2,
+    max_segments_per_leg: int = 3,
+    duplication: float = 0.0,
+    leg_pool: dict[int, list[list[dict]]] | None = None,
+) -> dict:
+    """
+    Generates a pricing solution made of the given number of legs.
+
+    :param duplication: Probability of reusing a leg of an earlier solution (a copy of its
+        segments) instead of generating a new one, like fares sharing the same flights
+    :param leg_pool: Legs generated so far, per leg index, shared across solutions
+    """
+    segments = []
+    departure = BASE_DEPARTURE + timedelta(minutes=rng.randrange(0, 3 * 24 * 60, 5))
+    for leg_index in range(legs):
+        pool = leg_pool.setdefault(leg_index, []) if leg_pool is not None else None
+        if pool and rng.random() < duplication:
+            leg = [dict(segment) for segment in rng.choice(pool)]
+            departure = datetime.fromtimestamp(
+                leg[-1]["arrival_timestamp"], tz=timezone.utc
+            )
+        else:
+            leg = []
+            stops = rng.sample(AIRPORTS, rng.randint(1, max_segments_per_leg) + 1)
+            for origin, destination in zip(stops, stops[1:]):
+                segment = generate_segment(rng, departure, origin, destination)
+                leg.append(segment)
+                departure = datetime.fromtimestamp(
+                    segment["arrival_timestamp"], tz=timezone.utc
+                ) + timedelta(minutes=rng.randrange(45, 240, 5))
+            if pool is not None:
+                pool.append(leg)
+        segments.append(leg)
+        departure += timedelta(days=rng.randint(2, 10))
+
+    return {
+        "pricing_solution_id": _sha1(rng),
+        "total_price": round(rng.uniform(80, 4000), 2),
+        "segment_source": rng.choice(SEGMENT_SOURCES),
+        "is_private_fare": rng.random() < 0.2,
+        "refundable": rng.random() < 0.3,
+        "segments": segments,
+        "baggage": None,
+    }
+
+
+def generate_request_data(
+    solutions: int,
+    datasources: int = 1,
+    legs: int = 2,
+    seed: int = 0,
+    duplication: float = 0.0,
+) -> dict:
+    """
+    Generates a generate-solutions request shaped like the README example.
+
+    :param solutions: Total number of pricing solutions
+    :param datasources: Number of datasource responses the solutions are spread over
+    :param legs: Number of legs per pricing solution
+    :param seed: Seed, so the same arguments always generate the same payload
+    :param duplication: Probability of each leg reusing the segments of an earlier
+        solution, e.g. 0.9 for searches where most fares share the same flights
+    :return: The request data as a dict
+    """
+    rng = random.Random(seed)
+    leg_pool = {} if duplication else None
+    responses = {_sha1(rng): [] for _ in range(datasources)}
+    keys = list(responses)
+    for index in range(solutions):
+        responses[keys[index % datasources]].append(
+            generate_pricing_solution(
+                rng, legs, duplication=duplication, leg_pool=leg_pool
+            )
+        )
+    return {"trip_id": "", "datasource_responses": responses}
@@ -0,0 +1,228 @@
+"""
+Sends the requests of traces written by a TrafficRecorder again, at the pace they were
+recorded at (or faster, or slower), and reports the latency percentiles next to the
+recorded ones. Requests go to a local StubApiServer unless a URL is given, where the
+client authenticates with the TN_SDK_CLIENT_ID and TN_SDK_CLIENT_SECRET env variables.
+
+Run with ``python -m tn_sdk.benchmarks.replay trace.jsonl.gz --speed 2 --concurrency 16``.
+Give the rotated traces of a recording oldest first (trace.jsonl.gz.1 trace.jsonl.gz).
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from base64 import b64decode
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from tn_sdk.benchmarks.bench_client import _percentile
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.recorder import REDACTED, read_trace
+from tn_sdk.core.tn_api import TnApi
+
+DEFAULT_CONCURRENCY = 8
+
+
+def request_kwargs(entry: dict) -> dict:
+    """
+    Rebuilds the keyword arguments of TnApi._request from a trace entry. Redacted headers
+    are left out, the replaying client sets its own Authorization.
+    """
+    kwargs = {}
+    headers = {
+        name: value
+        for name, value in entry.get("headers", {}).items()
+        if value != REDACTED
+    }
+    if headers:
+        kwargs["headers"] = headers
+    for name in ("params", "json"):
+        if name in entry:
+            kwargs[name] = entry[name]
+    if "data" in entry:
+        data = entry["data"]
+        encoding = entry.get("data_encoding")
+        if encoding == "base64":
+            data = b64decode(data)
+        elif encoding == "ascii":
+            data = data.encode("ascii")
+        kwargs["data"] = data
+    return kwargs
+
+
+def _timed_request(client: TnApi, entry: dict) -> tuple[float, bool]:
+    """
+    Sends a trace entry again, returning its latency and whether it succeeded.
+    """
+    started = time.perf_counter()
+    try:
+        client._request(
+            entry["method"],
+            entry["endpoint"],
+            TokenType(entry["token_type"]),
+            **request_kwargs(entry),
+        )
+    except Exception:
+        return time.perf_counter() - started, False
+    return time.perf_counter() - started, True
+
+
+def replay(
+    client: TnApi,
+    entries: Iterable[dict],
+    *,
+    speed: float = 1.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict:
+    """
+    Sends trace entries with client, each at its recorded offset from the first divided
+    by speed. At most concurrency requests are in flight: when they are all slower than
+    recorded, the following requests start late (see max_lag_ms).
+
+    :param entries: Entries of read_trace, in recorded order
+    :param speed: Pace relative to the recording, e.g. 2 for twice as many requests per
+        second. 0 sends them as fast as concurrency allows (defaults to 1)
+    :param concurrency: Requests in flight at most (defaults to 8)
+    :return: Requests sent and skipped, errors, rate and latency percentiles, replayed
+        and recorded
+    """
+    slots = threading.BoundedSemaphore(concurrency)
+    outcomes: list[tuple[float, bool]] = []
+    recorded: list[float] = []
+    skipped = 0
+    max_lag = 0.0
+
+    def send(entry: dict) -> None:
+        try:
+            outcomes.append(_timed_request(client, entry))
+        finally:
+            slots.release()
+
+    first_at = None
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        started = time.perf_counter()
+        for entry in entries:
+            if entry.get("streamed_body"):
+                # The body wasn't recorded
+                skipped += 1
+                continue
+            if first_at is None:
+                first_at = entry["at"]
+            recorded.append(entry["seconds"])
+
+            slots.acquire()
+            if speed > 0:
+                due = started + max(0.0, entry["at"] - first_at) / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    max_lag = max(max_lag, -delay)
+            executor.submit(send, entry)
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, _ in outcomes)
+    recorded.sort()
+    return {
+        "speed": speed,
+        "concurrency": concurrency,
+        "requests": len(outcomes),
+        "skipped": skipped,
+        "errors": sum(not succeeded for _, succeeded in outcomes),
+        "throughput_rps": len(outcomes) / elapsed if elapsed else 0.0,
+        "max_lag_ms": max_lag * 1e3,
+        "p50_ms": _percentile(latencies, 0.50) * 1e3,
+        "p90_ms": _percentile(latencies, 0.90) * 1e3,
+        "p99_ms": _percentile(latencies, 0.99) * 1e3,
+        "max_ms": latencies[-1] * 1e3 if latencies else 0.0,
+        "recorded_p50_ms": _percentile(recorded, 0.50) * 1e3,
+        "recorded_p90_ms": _percentile(recorded, 0.90) * 1e3,
+        "recorded_p99_ms": _percentile(recorded, 0.99) * 1e3,
+    }
+
+
+def run(
+    paths: list[str],
+    url: str | None = None,
+    speed: float = 1.0,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    latency: float = 0.0,
+) -> dict:
+    """
+    Replays the traces against url, or a local stub answering after latency seconds.
+    """
+    if url is not None:
+        with TnApi(tn_api_url=url, pool_maxsize=concurrency) as client:
+            return replay(
+                client, read_trace(*paths), speed=speed, concurrency=concurrency
+            )
+
+    with StubApiServer(latency=latency) as server:
+        with TnApi(
+            "replay-id",
+            "replay-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+            pool_maxsize=concurrency,
+        ) as client:
+            client.authenticate()
+            return replay(
+                client, read_trace(*paths), speed=speed, concurrency=concurrency
+            )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m tn_sdk.benchmarks.replay")
+    parser.add_argument("traces", nargs="+", help="Trace files, oldest first")
+    parser.add_argument(
+        "--url", help="API to replay against (defaults to a local stub)"
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Pace relative to the recording, 0 for as fast as possible",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="Requests in flight at most",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds the local stub waits"
+    )
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    result = run(args.traces, args.url, args.speed, args.concurrency, args.latency)
+
+    print(
+        f"{'':>9} {'requests':>9} {'errors':>7} {'rps':>9}"
+        f" {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}"
+    )
+    print(
+        f"{'replayed':>9} {result['requests']:>9} {result['errors']:>7}"
+        f" {result['throughput_rps']:>9.1f} {result['p50_ms']:>8.2f}"
+        f" {result['p90_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+    )
+    print(
+        f"{'recorded':>9} {'':>9} {'':>7} {'':>9}"
+        f" {result['recorded_p50_ms']:>8.2f} {result['recorded_p90_ms']:>8.2f}"
+        f" {result['recorded_p99_ms']:>8.2f}"
+    )
+    if result["skipped"]:
+        print(f"\n{result['skipped']} streamed requests skipped", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(result, output, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""
+An in-process HTTP server emulating the Trip Ninja API, so the clients can be measured
+(and tested) over real sockets without reaching the API.
+
+It issues tokens on the SDK auth endpoint, answers any other path with a small JSON
+document, and can emulate tokens expiring (401s), slow responses, a latency tail and
+bursts of 429/5xx. NDJSON request bodies (data streams) are decoded and kept.
+"""
+
+import gzip
+import itertools
+import json
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.utils.constants import NDJSON_CONTENT_TYPE, SDK_AUTH_ENDPOINT
+
+
+@dataclass
+class StubServerStats:
+    """
+    What a StubApiServer has served.
+
+    :param auth_requests: Requests to the SDK auth endpoint
+    :param requests: Requests to any other endpoint
+    :param unauthorized: Requests answered with a 401 (unknown or expired token)
+    :param failures: Requests answered with a burst status (429/5xx)
+    :param peak_concurrency: Most API requests handled at once
+    :param records: NDJSON records received by successful requests
+    :param request_bytes: Bytes of the bodies received by API requests
+    :param statuses: Responses per status code
+    """
+
+    auth_requests: int = 0
+    requests: int = 0
+    unauthorized: int = 0
+    failures: int = 0
+    peak_concurrency: int = 0
+    records: int = 0
+    request_bytes: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, don't wait for the client's delayed ACK
+    disable_nagle_algorithm = True
+    server: "_StubHTTPServer"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                if self.server.stub.read_delay:
+                    time.sleep(self.server.stub.read_delay)
+                size = int(self.rfile.readline().split(b";", 1)[0], 16)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+                if not size:
+                    return b"".join(chunks)
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _handle(self):
+        request_body = self._read_body()
+        stub = self.server.stub
+        if self.path.split("?", 1)[0] == SDK_AUTH_ENDPOINT:
+            if stub.latency:
+                time.sleep(stub.latency)
+            self._send(200, stub.issue_credentials())
+            return
+
+        latency = stub.request_started(request_body)
+        try:
+            if latency:
+                time.sleep(latency)
+            status = stub.next_status(self.headers.get("Authorization", ""))
+        finally:
+            stub.request_finished()
+        if status == 200 and self.headers.get("Content-Type") == NDJSON_CONTENT_TYPE:
+            stub.receive_records(request_body, self.headers.get("Content-Encoding"))
+        body = stub.response_body if status == 200 else {"detail": "stub error"}
+        self._send(status, body)
+
+    def _send(self, status: int, body: dict) -> None:
+        stub = self.server.stub
+        stub.count_status(status)
+        data = stub.encoded_body(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if status == stub.burst_status and stub.retry_after is not None:
+            self.send_header("Retry-After", str(stub.retry_after))
+        if stub.gzip_responses:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Benchmarks open many connections at once, the socketserver default backlog is 5
+    request_queue_size = 1024
+
+    def __init__(self, address, stub: "StubApiServer"):
+        super().__init__(address, _StubHandler)
+        self.stub = stub
+
+
+class StubApiServer:
+    """
+    Local stand-in for the Trip Ninja API, serving from a background thread.
+
+    Use it as a context manager and point the clients at ``url``::
+
+        with StubApiServer(latency=0.01, burst_every=100, burst_length=3) as server:
+            client = TnApi(tn_api_url=server.url, credential_store=InMemoryCredentialStore())
+    """
+
+    def __init__(
+        self,
+        *,
+        token_ttl: float | None = None,
+        send_expiry: bool = False,
+        latency: float = 0.0,
+        tail_every: int = 0,
+        tail_latency: float = 0.0,
+        burst_every: int = 0,
+        burst_length: int = 1,
+        burst_status: int = 503,
+        retry_after: float | None = None,
+        response_body: dict | list | None = None,
+        gzip_responses: bool = False,
+        read_delay: float = 0.0,
+        keep_bodies: bool = False,
+    ):
+        """
+        :keyword token_ttl: Seconds after which issued tokens are rejected with a 401
+            (defaults to None, tokens never expire)
+        :keyword send_expiry: Include ``expires_in`` in the auth response, so clients can
+            refresh ahead of expiry (defaults to False, clients only learn from the 401)
+        :keyword latency: Seconds every response is delayed by (defaults to 0)
+        :keyword tail_every: Delay the first of every that many API requests by
+            tail_latency more (defaults to 0, no tail)
+        :keyword tail_latency: Extra seconds of the tail requests (defaults to 0)
+        :keyword burst_every: Fail a burst of requests out of every that many authorized
+            ones (defaults to 0, no bursts)
+        :keyword burst_length: Consecutive requests failing in each burst (defaults to 1)
+        :keyword burst_status: Status of the failing requests, e.g. 429 or 503
+        :keyword retry_after: Retry-After seconds sent with the failing requests
+            (defaults to None, no header)
+        :keyword response_body: JSON body of successful responses (defaults to {"ok": true})
+        :keyword gzip_responses: Send the bodies gzip compressed, with a Content-Encoding
+            header (defaults to False)
+        :keyword read_delay: Seconds waited before reading each chunk of a chunked request
+            body, like a slow consumer (defaults to 0)
+        :keyword keep_bodies: Keep the body of every API request, see bodies
+            (defaults to False)
+        """
+        self.token_ttl = token_ttl
+        self.send_expiry = send_expiry
+        self.latency = latency
+        self.tail_every = tail_every
+        self.tail_latency = tail_latency
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.burst_status = burst_status
+        self.retry_after = retry_after
+        self.response_body = (
+            response_body if response_body is not None else {"ok": True}
+        )
+        self.gzip_responses = gzip_responses
+        self.read_delay = read_delay
+        self.keep_bodies = keep_bodies
+        # The successful body is encoded once, large ones would dominate the timings
+        self._encoded_response_body = self._encode(self.response_body)
+
+        self._lock = threading.Lock()
+        self._token_counter = itertools.count(1)
+        # Token -> time it was issued at
+        self._tokens: dict[str, float] = {}
+        self._stats = StubServerStats()
+        self._records: list = []
+        self._bodies: list[bytes] = []
+        self._authorized = 0
+        self._in_flight = 0
+        self._started = 0
+        self._httpd: _StubHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "StubApiServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._httpd = _StubHTTPServer(("127.0.0.1", 0), self)
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            # Polled to notice stop(), which tests call often
+            kwargs={"poll_interval": 0.05},
+            name="tn-sdk-stub-api",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._thread.join()
+            self._httpd = self._thread = None
+
+    @property
+    def stats(self) -> StubServerStats:
+        with self._lock:
+            return replace(self._stats, statuses=dict(self._stats.statuses))
+
+    @property
+    def records(self) -> list:
+        """
+        The NDJSON records received by successful requests, in order.
+        """
+        with self._lock:
+            return list(self._records)
+
+    @property
+    def bodies(self) -> list[bytes]:
+        """
+        The bodies of the API requests received, in order, when keep_bodies is set.
+        """
+        with self._lock:
+            return list(self._bodies)
+
+    def receive_records(self, body: bytes, content_encoding: str | None) -> None:
+        if content_encoding == "deflate":
+            body = zlib.decompress(body)
+        records = [json.loads(line) for line in body.splitlines() if line.strip()]
+        with self._lock:
+            self._records.extend(records)
+            self._stats.records += len(records)
+
+    def expire_tokens(self) -> None:
+        """
+        Revokes every token issued so far, the next requests get a 401.
+        """
+        with self._lock:
+            self._tokens.clear()
+
+    def issue_credentials(self) -> dict:
+        with self._lock:
+            self._stats.auth_requests += 1
+            issued_at = time.monotonic()
+            credentials = {}
+            for token_type in TokenType:
+                token = f"stub-{next(self._token_counter)}"
+                self._tokens[token] = issued_at
+                credentials[token_type.value] = token
+        if self.send_expiry and self.token_ttl is not None:
+            credentials["expires_in"] = self.token_ttl
+        return credentials
+
+    def next_status(self, authorization: str) -> int:
+        """
+        Returns the status of the next API request given its Authorization header.
+        """
+        token = authorization.removeprefix("Token ")
+        with self._lock:
+            self._stats.requests += 1
+            issued_at = self._tokens.get(token)
+            if issued_at is None or (
+                self.token_ttl is not None
+                and time.monotonic() - issued_at > self.token_ttl
+            ):
+                self._stats.unauthorized += 1
+                return 401
+            self._authorized += 1
+            # The last burst_length requests of every burst_every fail
+            if (
+                self.burst_every
+                and (self._authorized - 1) % self.burst_every
+                >= self.burst_every - self.burst_length
+            ):
+                self._stats.failures += 1
+                return self.burst_status
+        return 200
+
+    def request_started(self, body: bytes = b"") -> float:
+        """
+        Counts an API request in, returning the seconds it is delayed by.
+        """
+        with self._lock:
+            self._started += 1
+            self._stats.request_bytes += len(body)
+            if self.keep_bodies:
+                self._bodies.append(body)
+            self._in_flight += 1
+            self._stats.peak_concurrency = max(
+                self._stats.peak_concurrency, self._in_flight
+            )
+            if self.tail_every and (self._started - 1) % self.tail_every == 0:
+                return self.latency + self.tail_latency
+        return self.latency
+
+    def request_finished(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _encode(self, body) -> bytes:
+        data = json.dumps(body).encode("utf-8")
+        return gzip.compress(data, 1) if self.gzip_responses else data
+
+    def encoded_body(self, body) -> bytes:
+        if body is self.response_body:
+            return self._encoded_response_body
+        return self._encode(body)
+
+    def count_status(self, status: int) -> None:
+        with self._lock:
+            self._stats.statuses[status] = self._stats.statuses.get(status, 0) + 1
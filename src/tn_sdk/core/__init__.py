@@ -1 +1,56 @@
-from .tn_api import TnApi
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tn_api import TnApi
+    from .async_tn_api import AsyncTnApi
+    from .credential_store import (
+        CredentialStore,
+        FileCredentialStore,
+        InMemoryCredentialStore,
+        SharedMemoryCredentialStore,
+    )
+    from .data_stream import DataStream
+    from .hooks import TnApiHooks
+    from .metrics import MetricsCollector
+    from .pipeline import AdaptiveLimiter
+    from .recorder import TrafficRecorder
+    from .resilience import CircuitBreaker, RetryBudget
+    from .response_cache import ResponseCache
+    from .tenant_pool import TnApiPool
+
+# Exported name -> module defining it. Modules are only imported on first access, so
+# importing the SDK doesn't pull in requests (or httpx) until a client is used
+_EXPORTS = {
+    "TnApi": ".tn_api",
+    "AsyncTnApi": ".async_tn_api",
+    "CredentialStore": ".credential_store",
+    "FileCredentialStore": ".credential_store",
+    "InMemoryCredentialStore": ".credential_store",
+    "SharedMemoryCredentialStore": ".credential_store",
+    "DataStream": ".data_stream",
+    "TnApiHooks": ".hooks",
+    "MetricsCollector": ".metrics",
+    "AdaptiveLimiter": ".pipeline",
+    "TrafficRecorder": ".recorder",
+    "CircuitBreaker": ".resilience",
+    "RetryBudget": ".resilience",
+    "ResponseCache": ".response_cache",
+    "TnApiPool": ".tenant_pool",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cached, later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,467 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the installed extras
+    httpx = None
+
+from tn_sdk.core.credential_store import CredentialStore
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks, endpoint_path, status_code_of
+from tn_sdk.core.tn_api import BaseTnApi
+from tn_sdk.payload.codecs import CompressionPolicy
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.exceptions.exceptions import (
+    TnApiException,
+    TnAuthenticationFailedException,
+)
+from tn_sdk.utils.constants import (
+    PRODUCTION_API_URL,
+    SDK_AUTH_ENDPOINT,
+    NETWORK_RETRY_AFTER_STATUS_CODES,
+    NETWORK_RETRY_BACKOFF_FACTOR,
+    NETWORK_RETRY_METHODS,
+    NETWORK_RETRY_STATUS_CODES,
+    NETWORK_RETRY_TOTAL,
+    DEFAULT_TOKEN_REFRESH_AHEAD,
+    TOKEN_REFRESH_RETRY_INTERVAL,
+)
+
+if TYPE_CHECKING:
+    from tn_sdk.payload.canonical import PayloadCanonicalizer
+    from tn_sdk.payload.validation import PayloadValidator
+
+
+async def _in_thread(function, *args):
+    """
+    Runs a blocking function in a worker thread. If the calling task is cancelled
+    meanwhile, waits for the function to finish before raising, so the caller doesn't
+    release locks while a file is still being read or written.
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(function, *args))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait({future})
+        raise
+
+
+async def _acquire_store_lock(store_lock) -> None:
+    """
+    Enters a credential store lock (which may block) in a worker thread. If the calling
+    task is cancelled meanwhile, the thread still takes the lock: it is released as soon
+    as it is, instead of being held forever.
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(store_lock.__enter__))
+    try:
+        await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait({future})
+        if not future.cancelled() and future.exception() is None:
+            store_lock.__exit__(None, None, None)
+        raise
+
+
+class AsyncTnApi(BaseTnApi):
+    """
+    The asyncio entrypoint to the Trip Ninja SDK.
+
+    Mirrors TnApi on top of a pooled httpx.AsyncClient, so a single event loop can keep
+    many requests in flight. Shares the credentials file format with TnApi.
+    Requires the ``async`` extra (``pip install tn_sdk[async]``).
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        credential_file_path: str = "credentials.json",
+        *,
+        tn_api_url: str = PRODUCTION_API_URL,
+        timeout: int = 30,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        token_ttl: float | None = None,
+        refresh_ahead: float = DEFAULT_TOKEN_REFRESH_AHEAD,
+        background_refresh: bool = False,
+        credential_store: CredentialStore | None = None,
+        compression_dictionary: CompressionDictionary | None = None,
+        compression: CompressionPolicy | None = None,
+        deduplicate_segments: bool = False,
+        validator: "PayloadValidator | None" = None,
+        canonicalizer: "PayloadCanonicalizer | None" = None,
+        spill_threshold: int | None = None,
+        hooks: TnApiHooks | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        lazy: bool = False,
+    ):
+        """
+        Initializes the async SDK client.
+
+        :param client_id: API Client ID (defaults to env TN_SDK_CLIENT_ID)
+        :param client_secret: API Client Secret (defaults to env TN_SDK_CLIENT_SECRET)
+        :param credential_file_path: Credentials file path (defaults to credentials.json)
+        :keyword tn_api_url: Base URL for the API (defaults to the production API URL)
+        :keyword timeout: Default timeout for network requests in seconds (defaults to 30)
+        :keyword connect_timeout: Timeout for establishing connections in seconds (defaults to timeout)
+        :keyword read_timeout: Timeout for waiting on response data in seconds (defaults to timeout)
+        :keyword token_ttl: Token lifetime in seconds, used when the auth response has no expiry
+        :keyword refresh_ahead: Seconds before expiry at which tokens are refreshed (defaults to 60)
+        :keyword background_refresh: Refresh tokens ahead of expiry in a background task,
+            started with the first request or ``async with`` (defaults to False)
+        :keyword credential_store: Where credentials are shared with other clients
+            (defaults to a FileCredentialStore on credential_file_path)
+        :keyword compression_dictionary: Preset dictionary used to compress payloads, e.g.
+            ITINERARY_DICTIONARY_V1. Only use one the API supports (defaults to None)
+        :keyword compression: Codec (e.g. ZlibCodec(9)) or policy (e.g. AdaptiveCompressionPolicy())
+            used to compress payloads, instead of zlib at the default level with
+            compression_dictionary (defaults to None)
+        :keyword deduplicate_segments: Hoist repeated segments into a segment table before
+            compressing payloads. Only enable it once the API accepts it (defaults to False)
+        :keyword validator: Check payloads before compressing them, e.g. PayloadValidator(),
+            raising InvalidDataException on the first malformed value (defaults to None)
+        :keyword canonicalizer: Rewrite payloads as canonical JSON before compressing them,
+            e.g. PayloadCanonicalizer(). Send compression_headers() along with the data
+            when it strips fields (defaults to None)
+        :keyword spill_threshold: Memory ceiling in bytes: larger payloads are prepared
+            through a temporary file instead of in-memory buffers (defaults to None,
+            everything is kept in memory)
+        :keyword hooks: Receive the client's events, e.g. a MetricsCollector. Without hooks
+            the client skips the instrumentation (defaults to None)
+        :keyword max_connections: Maximum number of concurrent connections (defaults to 100)
+        :keyword max_keepalive_connections: Maximum number of idle connections kept alive (defaults to 20)
+        :keyword lazy: Defer creating the HTTP client and reading the stored credentials
+            to the first request, for short-lived processes (defaults to False)
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncTnApi requires httpx. Install it with `pip install tn_sdk[async]`."
+            )
+
+        super().__init__(
+            client_id,
+            client_secret,
+            credential_file_path,
+            tn_api_url=tn_api_url,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            token_ttl=token_ttl,
+            refresh_ahead=refresh_ahead,
+            background_refresh=background_refresh,
+            credential_store=credential_store,
+            compression_dictionary=compression_dictionary,
+            compression=compression,
+            deduplicate_segments=deduplicate_segments,
+            validator=validator,
+            canonicalizer=canonicalizer,
+            spill_threshold=spill_threshold,
+            hooks=hooks,
+            lazy=lazy,
+        )
+
+        self._request_timeout = httpx.Timeout(
+            timeout, connect=self._connect_timeout, read=self._read_timeout
+        )
+
+        # Pooled async transport shared by every request of this client, on first use
+        # when lazy
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._session: httpx.AsyncClient | None = None
+        if not lazy:
+            self._session = self._create_session()
+
+        # Serializes token refreshes across tasks sharing this client
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+
+    async def __aenter__(self):
+        self._ensure_background_refresh()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the SDK client's session and stops the background token refresh.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        if self._session is not None:
+            await self._session.aclose()
+
+    @property
+    def session(self) -> "httpx.AsyncClient":
+        """
+        The HTTP client of this client, created on first use when lazy.
+        """
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: "httpx.AsyncClient") -> None:
+        self._session = session
+
+    def _create_session(self) -> "httpx.AsyncClient":
+        return httpx.AsyncClient(limits=self._limits, timeout=self._request_timeout)
+
+    def _ensure_background_refresh(self) -> None:
+        """
+        Starts the background refresh task on the running loop, if enabled and not started.
+        """
+        if self._background_refresh and self._refresh_task is None:
+            self._refresh_task = asyncio.get_running_loop().create_task(
+                self._background_refresh_loop()
+            )
+
+    async def _background_refresh_loop(self) -> None:
+        """
+        Sleeps until the current tokens are about to expire, then replaces them.
+
+        Requests keep using the current tokens while the refresh runs. Failures are retried
+        shortly after, and the 401 path in _request remains the fallback.
+        """
+        while True:
+            delay = self._seconds_until_refresh()
+            if delay is None:
+                # Expiry unknown (no tokens yet, or no expiry information)
+                await asyncio.sleep(self._refresh_ahead)
+                continue
+            await asyncio.sleep(max(delay, 0))
+
+            try:
+                await self._refresh_credentials(self._credentials, proactive=True)
+            except TnApiException:
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_INTERVAL)
+
+    async def _send_with_network_retries(
+        self, method: str, url: str, **kwargs
+    ) -> "httpx.Response":
+        """
+        Sends a request, retrying network blips (not 401s) with the same policy as TnApi,
+        Retry-After headers included.
+        """
+        retries = NETWORK_RETRY_TOTAL if method.upper() in NETWORK_RETRY_METHODS else 0
+
+        for attempt in range(retries + 1):
+            retry_after = None
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except httpx.TransportError as err:
+                if attempt == retries:
+                    raise
+                status_code, error = None, err
+            else:
+                if (
+                    response.status_code not in NETWORK_RETRY_STATUS_CODES
+                    or attempt == retries
+                ):
+                    return response
+                if response.status_code in NETWORK_RETRY_AFTER_STATUS_CODES:
+                    from tn_sdk.core.pipeline import retry_after_seconds
+
+                    retry_after = retry_after_seconds(response)
+                await response.aclose()
+                status_code, error = response.status_code, None
+
+            if self._hooks is not None:
+                self._hooks.on_retry(
+                    method,
+                    endpoint_path(url.removeprefix(self._tn_api_url)),
+                    status_code,
+                    error,
+                )
+
+            # Same schedule as urllib3: no delay on the first retry, then exponential,
+            # and at least what the API asked for
+            delay = NETWORK_RETRY_BACKOFF_FACTOR * (2**attempt) if attempt else 0.0
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _fetch_new_credentials_from_api(self) -> dict:
+        """
+        Calls the API to get the latest credentials.
+        """
+        headers = self._auth_headers()
+        url = f"{self._tn_api_url}{SDK_AUTH_ENDPOINT}"
+
+        try:
+            response = await self._send_with_network_retries(
+                "POST", url, headers=headers, timeout=self._request_timeout
+            )
+            response.raise_for_status()
+
+            data = response.json()
+
+            if not data:
+                raise TnAuthenticationFailedException("Invalid API Response")
+
+            await _in_thread(self._save_credentials_to_disk, data)
+            return data
+
+        except httpx.HTTPError as err:
+            msg = "Authentication failed"
+            if isinstance(err, httpx.HTTPStatusError):
+                msg += f": {err.response.text}"
+
+            raise TnAuthenticationFailedException(msg) from err
+
+    async def _refresh_credentials(
+        self, stale_credentials: dict, proactive: bool = False
+    ) -> dict:
+        """
+        Replaces the given stale credentials, performing at most one refresh at a time.
+
+        Concurrent tasks wait for the refresh in progress and reuse its result.
+
+        :param stale_credentials: The credentials the caller used (or found empty)
+        :param proactive: Whether this refresh runs ahead of expiry rather than after a failure
+        :return: Fresh credentials
+        """
+        started = time.perf_counter()
+        source, error = "store", None
+        try:
+            async with self._refresh_lock:
+                if self._credentials and self._credentials is not stale_credentials:
+                    self.refresh_stats.coalesced += 1
+                    source = "coalesced"
+                    return self._credentials
+
+                # Only one process on the host refreshes, the others then read its result.
+                # The store lock and the store itself may block, so they are used off the
+                # event loop.
+                store_lock = self._credential_store.lock()
+                await _acquire_store_lock(store_lock)
+                try:
+                    disk_token = await _in_thread(self._load_token_from_disk)
+
+                    if disk_token and disk_token != stale_credentials:
+                        issued_at = await _in_thread(self._stored_credentials_issued_at)
+                        self._credentials = disk_token
+                    else:
+                        source = "api"
+                        issued_at = time.time()
+                        self._credentials = await self._fetch_new_credentials_from_api()
+                finally:
+                    store_lock.__exit__(None, None, None)
+
+                self._track_credentials_expiry(self._credentials, issued_at)
+                self.refresh_stats.performed += 1
+                if proactive:
+                    self.refresh_stats.proactive += 1
+                return self._credentials
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            self._report_token_refresh(source, proactive, started, error)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        token_type: TokenType = TokenType.PRODUCTION,
+        **kwargs,
+    ) -> dict:
+        """
+        Central internal request handler
+
+        Handles:
+        - Refreshing token (known-expired tokens up front, a 401 storm with a single refresh)
+        - Setting headers
+        - Parsing the response JSON
+
+        :param method: HTTP method
+        :param endpoint: API endpoint
+        :param token_type: The TokenType to use for this specific request (defaults to production)
+        :param kwargs: Any additional kwargs to pass to httpx (e.g. content, json, params)
+
+        :return: JSON response
+        """
+        self._ensure_background_refresh()
+
+        if self._hooks is None:
+            response = await self._send_request(method, endpoint, token_type, **kwargs)
+            return response.json()
+
+        path = endpoint_path(endpoint)
+        self._hooks.on_request_start(method, path, token_type)
+        started = time.perf_counter()
+        status_code = error = None
+        try:
+            response = await self._send_request(method, endpoint, token_type, **kwargs)
+            status_code = response.status_code
+            return response.json()
+        except Exception as err:
+            error = err
+            status_code = status_code or status_code_of(err)
+            raise
+        finally:
+            self._hooks.on_request_end(
+                method,
+                path,
+                token_type,
+                status_code,
+                time.perf_counter() - started,
+                error,
+            )
+
+    async def _send_request(
+        self, method: str, endpoint: str, token_type: TokenType, **kwargs
+    ) -> "httpx.Response":
+        """
+        Sends a request for _request, refreshing the token as needed.
+
+        :return: The successful response
+        """
+        credentials = self._credentials
+        if not credentials or self._credentials_expired():
+            # Skip the round trip that would only come back with a 401
+            credentials = await self._refresh_credentials(credentials)
+
+        url = f"{self._tn_api_url}{endpoint}"
+        token = credentials[token_type.value]
+
+        headers = dict(kwargs.get("headers") or {})
+        headers["Authorization"] = f"Token {token}"
+        kwargs["headers"] = headers
+
+        response = await self._send_with_network_retries(
+            method, url, timeout=self._request_timeout, **kwargs
+        )
+
+        if response.status_code == 401:
+            # Token expired, or was already superseded by a concurrent refresh.
+            credentials = await self._refresh_credentials(credentials)
+
+            # Retry the request with the new token
+            token = credentials[token_type.value]
+            headers["Authorization"] = f"Token {token}"
+            response = await self._send_with_network_retries(
+                method, url, timeout=self._request_timeout, **kwargs
+            )
+
+        response.raise_for_status()
+        return response
+
+    async def authenticate(self) -> None:
+        """
+        Retrieves and stores the latest tokens from the API
+        :return: None (updates the file and state in place)
+        """
+        await self._fetch_new_credentials_from_api()
@@ -0,0 +1,333 @@
+import abc
+import contextlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from tn_sdk.utils.constants import (
+    FILE_LOCK_MAX_RETRY_INTERVAL,
+    FILE_LOCK_RETRY_INTERVAL,
+    SHARED_MEMORY_WRITE_TIMEOUT,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def _exclusive_file_lock(lock_path: Path):
+    """
+    Holds an advisory, exclusive, cross-process lock on the given file.
+
+    Degrades to no locking if the lock file can't be opened (e.g. a read-only directory),
+    in which case concurrent processes may each refresh, like before locking existed.
+
+    :param lock_path: Path of the lock file (created if missing)
+    """
+    try:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    except OSError:
+        yield
+        return
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            delay = FILE_LOCK_RETRY_INTERVAL
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(delay)
+                    delay = min(delay * 2, FILE_LOCK_MAX_RETRY_INTERVAL)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+class CredentialStore(abc.ABC):
+    """
+    Where a client keeps its credentials, so they can be shared with other clients.
+
+    The stored data is the auth response as-is (the same format as credentials.json).
+    """
+
+    @abc.abstractmethod
+    def load(self) -> dict:
+        """
+        Returns the stored credentials, or an empty dictionary if there are none.
+        """
+
+    @abc.abstractmethod
+    def save(self, credentials: dict) -> None:
+        """
+        Stores the given credentials, replacing the current ones.
+
+        :param credentials: Token data
+        """
+
+    def issued_at(self) -> float | None:
+        """
+        Returns the epoch time at which the stored credentials were saved, if known.
+        """
+        return None
+
+    @contextlib.contextmanager
+    def lock(self):
+        """
+        Context manager held while refreshing, so only one holder refreshes at a time.
+        Other holders wait, then find the refreshed credentials with load().
+        """
+        yield
+
+
+class FileCredentialStore(CredentialStore):
+    """
+    Stores the credentials in a JSON file, shared by every process pointed at it.
+
+    Reads are cached in memory and only repeated when the file's inode, mtime or size
+    change. Writes go through a unique temporary file, and lock() takes an advisory
+    lock on a ``<file>.lock`` sibling so only one process on the host refreshes.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        :param path: Path of the credentials file
+        """
+        self._path = Path(path)
+        self._lock_path = self._path.with_name(f"{self._path.name}.lock")
+        self._cache_lock = threading.Lock()
+        self._cache_key: tuple | None = None
+        self._cache_data: dict = {}
+
+    def load(self) -> dict:
+        """
+        Reads the credential file safely.
+        Returns the credentials as a dictionary. Or an empty dictionary if no credentials are found.
+        """
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return {}
+
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._cache_lock:
+            if key == self._cache_key:
+                return dict(self._cache_data)
+
+        try:
+            text = self._path.read_text(encoding="utf-8")
+            data = json.loads(text)
+        except (json.JSONDecodeError, OSError):
+            # If file is corrupt or unreadable, ignore it and treat as no credentials
+            return {}
+
+        with self._cache_lock:
+            self._cache_key = key
+            self._cache_data = data
+        return dict(data)
+
+    def save(self, credentials: dict) -> None:
+        """
+        Writes credentials to disk ATOMICALLY.
+        Each writer uses its own temporary file, so concurrent writers never clobber each other.
+
+        :param credentials: Token data
+        """
+        try:
+            fd, temp_name = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f"{self._path.name}.", suffix=".tmp"
+            )
+        except OSError:
+            # If we lack permissions, we just skip saving but keep the token in memory
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                temp_file.write(json.dumps(credentials, indent=4))
+            os.replace(temp_name, self._path)
+            stat = self._path.stat()
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            return
+
+        # Prime the cache so this process doesn't read back what it just wrote
+        with self._cache_lock:
+            self._cache_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._cache_data = dict(credentials)
+
+    def issued_at(self) -> float | None:
+        try:
+            return self._path.stat().st_mtime
+        except OSError:
+            return None
+
+    @contextlib.contextmanager
+    def lock(self):
+        with _exclusive_file_lock(self._lock_path):
+            yield
+
+
+class InMemoryCredentialStore(CredentialStore):
+    """
+    Keeps the credentials in memory only. Cheapest option when a single process
+    (or a single set of clients sharing this store) owns the credentials.
+    """
+
+    def __init__(self, credentials: dict | None = None):
+        """
+        :param credentials: Optional initial credentials
+        """
+        self._credentials = dict(credentials or {})
+        self._saved_at = time.time() if credentials else None
+        self._refresh_lock = threading.Lock()
+
+    def load(self) -> dict:
+        return dict(self._credentials)
+
+    def save(self, credentials: dict) -> None:
+        self._credentials = dict(credentials)
+        self._saved_at = time.time()
+
+    def issued_at(self) -> float | None:
+        return self._saved_at
+
+    @contextlib.contextmanager
+    def lock(self):
+        with self._refresh_lock:
+            yield
+
+
+class SharedMemoryCredentialStore(CredentialStore):
+    """
+    Keeps the credentials in a named shared memory segment, so every process on the
+    host reads them without touching the disk.
+
+    Layout: an 8 byte sequence number (odd while a write is in progress), an 8 byte
+    save timestamp, a 4 byte payload length, then the JSON payload. Readers retry
+    until they see a stable, even sequence number and only re-parse when it changed.
+    Writers are serialized with lock(), an advisory lock on a file in the temp directory.
+    A write still in progress after SHARED_MEMORY_WRITE_TIMEOUT seconds is presumed
+    abandoned by a dead writer: readers then see no credentials, so their client
+    authenticates again and its save repairs the segment.
+    """
+
+    _HEADER = struct.Struct("<QdI")
+
+    def __init__(self, name: str = "tn_sdk_credentials", size: int = 16384):
+        """
+        Attaches to the named segment, creating it if it doesn't exist yet.
+
+        :param name: Name of the shared memory segment
+        :param size: Size of the segment in bytes when it has to be created
+        """
+        from multiprocessing import shared_memory
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._untrack()
+
+        self._lock_path = Path(tempfile.gettempdir()) / f"{name}.lock"
+        self._cache_sequence: int | None = None
+        self._cache_data: dict = {}
+
+    def _untrack(self) -> None:
+        """
+        Stops the resource tracker from destroying the segment when this process exits,
+        since other processes keep using it. Call unlink() to destroy it.
+        """
+        try:
+            from multiprocessing import resource_tracker
+
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        except Exception:  # pragma: no cover - platform specific
+            pass
+
+    def load(self) -> dict:
+        buffer = self._shm.buf
+        deadline = None
+        while True:
+            sequence, _, length = self._HEADER.unpack_from(buffer, 0)
+            if sequence == 0:
+                return {}
+            if sequence == self._cache_sequence:
+                return dict(self._cache_data)
+            if sequence % 2:
+                # A write is in progress, unless its writer died halfway through
+                if deadline is None:
+                    deadline = time.monotonic() + SHARED_MEMORY_WRITE_TIMEOUT
+                elif time.monotonic() > deadline:
+                    return {}
+                time.sleep(0)
+                continue
+
+            start = self._HEADER.size
+            payload = bytes(buffer[start : start + length])
+            if self._HEADER.unpack_from(buffer, 0)[0] != sequence:
+                continue
+
+            try:
+                data = json.loads(payload)
+            except json.JSONDecodeError:
+                return {}
+            self._cache_sequence = sequence
+            self._cache_data = data
+            return dict(data)
+
+    def save(self, credentials: dict) -> None:
+        """
+        Publishes the given credentials. Concurrent writers must hold lock().
+
+        :param credentials: Token data
+        """
+        payload = json.dumps(credentials, separators=(",", ":")).encode("utf-8")
+        if self._HEADER.size + len(payload) > self._shm.size:
+            raise ValueError("Credentials do not fit in the shared memory segment.")
+
+        buffer = self._shm.buf
+        sequence = self._HEADER.unpack_from(buffer, 0)[0]
+        # Writers hold lock(), so an odd sequence was left by a writer that died
+        sequence += sequence % 2
+        # Mark the write as in progress (odd), write, then publish it (even)
+        struct.pack_into("<Q", buffer, 0, sequence + 1)
+        buffer[self._HEADER.size : self._HEADER.size + len(payload)] = payload
+        self._HEADER.pack_into(buffer, 0, sequence + 1, time.time(), len(payload))
+        struct.pack_into("<Q", buffer, 0, sequence + 2)
+
+    def issued_at(self) -> float | None:
+        sequence, saved_at, _ = self._HEADER.unpack_from(self._shm.buf, 0)
+        return saved_at if sequence else None
+
+    @contextlib.contextmanager
+    def lock(self):
+        with _exclusive_file_lock(self._lock_path):
+            yield
+
+    def close(self) -> None:
+        """
+        Detaches this process from the segment.
+        """
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """
+        Destroys the segment. Call once, when no process needs the credentials anymore.
+        """
+        self._shm.unlink()
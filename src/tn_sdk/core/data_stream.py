@@ -0,0 +1,360 @@
+import json
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.stats import DataStreamStats
+from tn_sdk.exceptions.exceptions import DataStreamException, InvalidDataException
+from tn_sdk.payload.codecs import ZlibCodec
+from tn_sdk.utils.constants import (
+    DATA_STREAM_MAX_FAILURES,
+    DATA_STREAM_MAX_RETRY_DELAY,
+    DATA_STREAM_RETRY_BACKOFF,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_DATA_STREAM_BATCH_BYTES,
+    DEFAULT_DATA_STREAM_IDLE_TIMEOUT,
+    DEFAULT_DATA_STREAM_LINGER,
+    DEFAULT_DATA_STREAM_MAX_BUFFERED_BYTES,
+    DEFAULT_DATA_STREAM_MAX_STREAM_BYTES,
+    NDJSON_CONTENT_TYPE,
+)
+
+if TYPE_CHECKING:
+    from tn_sdk.core.tn_api import TnApi
+
+
+def encode_record(record: Any) -> bytes:
+    """
+    Returns a record as an NDJSON line.
+
+    :param record: A dict or list (serialized like json.dumps), or a JSON encoded str or
+        bytes on a single line
+    """
+    if isinstance(record, (dict, list)):
+        try:
+            line = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        except (TypeError, ValueError) as err:
+            raise InvalidDataException(
+                f"Record is not JSON serializable: {err}"
+            ) from err
+    elif isinstance(record, str):
+        line = record.rstrip("\r\n").encode("utf-8")
+    elif isinstance(record, (bytes, bytearray)):
+        line = bytes(record).rstrip(b"\r\n")
+    else:
+        raise InvalidDataException("A record must be JSON data")
+    if b"\n" in line:
+        raise InvalidDataException("A record must be JSON on a single line")
+    return line + b"\n"
+
+
+class _StreamBody:
+    """
+    Request body of a data stream. Every iteration is a new attempt at sending it (after
+    a 401, or a network retry), which starts with the batches the previous attempts sent.
+    """
+
+    def __init__(self, stream: "DataStream"):
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self._stream._iter_stream()
+
+
+class DataStream:
+    """
+    Sends records (e.g. itinerary or pricing updates) continuously over long-lived
+    streamed requests, authenticated with the DATA_STREAM token. Created by
+    TnApi.open_data_stream.
+
+    send() only buffers a record, a background thread writes them to the current
+    stream as NDJSON in batches of about batch_bytes (or what linger seconds gathered),
+    compressed incrementally with zlib (Content-Encoding: deflate) and flushed after
+    every batch. A stream ends after max_stream_bytes, idle_timeout seconds without
+    records, flush() or close(), and the API's answer acknowledges its records.
+
+    Records are kept until acknowledged: after a 401 (the token is refreshed) or a
+    failed stream, a new stream starts with the records of the previous one. When the
+    API reads more slowly than records are sent, the buffer fills up to
+    max_buffered_bytes and send() blocks until there is room. After max_failures failed
+    streams in a row the data stream gives up: send() and flush() raise
+    DataStreamException, and pending_records() returns what wasn't acknowledged.
+    """
+
+    def __init__(
+        self,
+        client: "TnApi",
+        endpoint: str,
+        *,
+        batch_bytes: int = DEFAULT_DATA_STREAM_BATCH_BYTES,
+        linger: float = DEFAULT_DATA_STREAM_LINGER,
+        max_buffered_bytes: int = DEFAULT_DATA_STREAM_MAX_BUFFERED_BYTES,
+        max_stream_bytes: int = DEFAULT_DATA_STREAM_MAX_STREAM_BYTES,
+        idle_timeout: float = DEFAULT_DATA_STREAM_IDLE_TIMEOUT,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_failures: int = DATA_STREAM_MAX_FAILURES,
+        retry_backoff: float = DATA_STREAM_RETRY_BACKOFF,
+    ):
+        """
+        See TnApi.open_data_stream.
+        """
+        self._client = client
+        self._endpoint = endpoint
+        self._batch_bytes = batch_bytes
+        self._linger = linger
+        self._max_buffered_bytes = max_buffered_bytes
+        self._max_stream_bytes = max_stream_bytes
+        self._idle_timeout = idle_timeout
+        self._codec = ZlibCodec(compression_level)
+        self._max_failures = max_failures
+        self._retry_backoff = retry_backoff
+        self._headers = {
+            "Content-Type": NDJSON_CONTENT_TYPE,
+            "Content-Encoding": "deflate",
+        }
+
+        self._cond = threading.Condition()
+        # NDJSON lines not written to a stream yet
+        self._buffer: deque[bytes] = deque()
+        self._buffered_bytes = 0
+        # Batches (and their number of records) written to the current stream, until
+        # the API acknowledges them
+        self._unacked: list[tuple[bytes, int]] = []
+        self._flushing = 0
+        self._closing = False
+        self._error: BaseException | None = None
+        self._stats = DataStreamStats()
+
+        self._thread = threading.Thread(
+            target=self._run, name="tn-sdk-data-stream", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "DataStream":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def stats(self) -> DataStreamStats:
+        """
+        A snapshot of the data stream counters.
+        """
+        with self._cond:
+            return DataStreamStats(**vars(self._stats))
+
+    def _raise_if_unusable(self) -> None:
+        if self._error is not None:
+            raise DataStreamException(
+                f"The data stream failed: {self._error}"
+            ) from self._error
+        if self._closing:
+            raise DataStreamException("The data stream is closed")
+
+    def send(self, record: Any, timeout: float | None = None) -> None:
+        """
+        Buffers a record for sending, waiting for room in the buffer when it is full.
+
+        :param record: A dict or list, or a JSON encoded str or bytes on a single line
+        :param timeout: Most seconds to wait for room (defaults to None, no limit)
+        :raises DataStreamException: The data stream failed or is closed, or the timeout
+            expired
+        """
+        line = encode_record(record)
+        with self._cond:
+            self._raise_if_unusable()
+            if self._is_full(len(line)):
+                started = time.monotonic()
+                deadline = None if timeout is None else started + timeout
+                try:
+                    while self._is_full(len(line)):
+                        remaining = None
+                        if deadline is not None:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                raise DataStreamException(
+                                    "The data stream buffer is full"
+                                )
+                        self._cond.wait(remaining)
+                        self._raise_if_unusable()
+                finally:
+                    self._stats.blocked_seconds += time.monotonic() - started
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            self._stats.records += 1
+            self._cond.notify_all()
+
+    def _is_full(self, size: int) -> bool:
+        # A record larger than the buffer is still accepted when the buffer is empty
+        return bool(self._buffer) and (
+            self._buffered_bytes + size > self._max_buffered_bytes
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Ends the current stream early and waits until the API acknowledged every record
+        sent so far.
+
+        :param timeout: Most seconds to wait (defaults to None, no limit)
+        :return: Whether every record was acknowledged within the timeout
+        :raises DataStreamException: The data stream failed
+        """
+        with self._cond:
+            target = self._stats.records
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                acknowledged = self._cond.wait_for(
+                    lambda: self._error is not None
+                    or self._stats.acknowledged >= target,
+                    timeout,
+                )
+            finally:
+                self._flushing -= 1
+            if self._error is not None:
+                self._raise_if_unusable()
+            return acknowledged
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Sends the buffered records and stops the data stream. Check pending_records()
+        afterwards if it may have failed.
+
+        :param timeout: Most seconds to wait for the records to be acknowledged
+            (defaults to None, no limit)
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def pending_records(self) -> list[bytes]:
+        """
+        The NDJSON lines of the records not acknowledged yet, in order.
+        """
+        with self._cond:
+            lines = [
+                line
+                for batch, _ in self._unacked
+                for line in batch.splitlines(keepends=True)
+            ]
+            return lines + list(self._buffer)
+
+    def _run(self) -> None:
+        failures = 0
+        while True:
+            with self._cond:
+                while not self._buffer and not self._unacked:
+                    if self._closing:
+                        return
+                    self._cond.wait()
+            try:
+                self._client._request(
+                    "POST",
+                    self._endpoint,
+                    TokenType.DATA_STREAM,
+                    data=_StreamBody(self),
+                    headers=self._headers,
+                )
+            except Exception as err:
+                failures += 1
+                delay = min(
+                    self._retry_backoff * 2 ** (failures - 1),
+                    DATA_STREAM_MAX_RETRY_DELAY,
+                )
+                with self._cond:
+                    self._stats.failures += 1
+                    if failures >= self._max_failures:
+                        self._error = err
+                        self._cond.notify_all()
+                        return
+                    # close() doesn't wait out the pause, the records stay pending
+                    if self._cond.wait_for(lambda: self._closing, delay):
+                        return
+                continue
+
+            failures = 0
+            with self._cond:
+                self._stats.acknowledged += sum(records for _, records in self._unacked)
+                self._unacked.clear()
+                self._cond.notify_all()
+
+    def _iter_stream(self) -> Iterator[bytes]:
+        """
+        Yields the compressed body of a stream: the batches of previous attempts first,
+        then new ones until the stream ends.
+        """
+        compressor = self._codec.compressobj()
+        with self._cond:
+            batches = list(self._unacked)
+            self._stats.streams += 1
+            self._stats.resent += sum(records for _, records in batches)
+
+        sent = 0
+        for batch, _ in batches:
+            sent += len(batch)
+            yield self._compress_batch(compressor, batch)
+
+        while sent < self._max_stream_bytes:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            sent += len(batch)
+            yield self._compress_batch(compressor, batch)
+
+        tail = compressor.flush()
+        with self._cond:
+            self._stats.compressed_bytes += len(tail)
+        yield tail
+
+    def _compress_batch(self, compressor, batch: bytes) -> bytes:
+        # Sync flushed, so the API can decompress every batch as it arrives
+        data = compressor.compress(batch) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        with self._cond:
+            self._stats.batches += 1
+            self._stats.raw_bytes += len(batch)
+            self._stats.compressed_bytes += len(data)
+        return data
+
+    def _next_batch(self) -> bytes | None:
+        """
+        Takes the next batch off the buffer, waiting up to linger seconds for it to fill.
+        Returns None when the stream should end.
+        """
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._buffer or self._closing or self._flushing,
+                self._idle_timeout,
+            ):
+                return None
+            if not self._buffer:
+                return None
+
+            deadline = time.monotonic() + self._linger
+            while (
+                self._buffered_bytes < self._batch_bytes
+                and not self._closing
+                and not self._flushing
+            ):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            lines = []
+            size = 0
+            while self._buffer and size < self._batch_bytes:
+                line = self._buffer.popleft()
+                lines.append(line)
+                size += len(line)
+            self._buffered_bytes -= size
+            batch = b"".join(lines)
+            self._unacked.append((batch, len(lines)))
+            # Room for the senders waiting on a full buffer
+            self._cond.notify_all()
+            return batch
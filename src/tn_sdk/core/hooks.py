@@ -0,0 +1,110 @@
+from tn_sdk.core.enums import TokenType
+from tn_sdk.payload.codecs import Codec
+
+
+class TnApiHooks:
+    """
+    Receives the events of a client: API requests, network retries, token refreshes,
+    credential store reads and payload compression.
+
+    Every method of this base class does nothing, override the ones you need and pass
+    an instance as ``hooks`` to the client. Clients created without hooks skip the
+    instrumentation altogether.
+
+    Endpoints are reported without their query string.
+
+    Hooks run synchronously in the thread (or event loop) that triggered the event, and
+    concurrently when a client is shared, so they must be fast and thread-safe.
+    """
+
+    def on_request_start(
+        self, method: str, endpoint: str, token_type: TokenType
+    ) -> None:
+        """
+        An API request is about to be sent (before any token refresh it needs).
+        """
+
+    def on_request_end(
+        self,
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        status_code: int | None,
+        seconds: float,
+        error: BaseException | None,
+    ) -> None:
+        """
+        An API request finished, including its network retries and the retry after a 401.
+
+        :param status_code: Status of the last response, None if none was received
+        :param seconds: Time since on_request_start
+        :param error: The exception the request raised, if any
+        """
+
+    def on_retry(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int | None,
+        error: BaseException | None,
+    ) -> None:
+        """
+        A request attempt failed with a network error or a retryable status (429, 5xx)
+        and is about to be retried.
+
+        :param status_code: Status of the failed attempt, None for network errors
+        :param error: The network error, if any
+        """
+
+    def on_token_refresh(
+        self,
+        source: str,
+        proactive: bool,
+        seconds: float,
+        error: BaseException | None,
+    ) -> None:
+        """
+        Stale credentials were replaced.
+
+        :param source: "api" (authenticated again), "store" (adopted the credentials another
+            client saved) or "coalesced" (a concurrent refresh already replaced them)
+        :param proactive: Whether the refresh ran ahead of expiry rather than on demand
+        :param seconds: Time spent, including waiting for a refresh in progress
+        :param error: The exception the refresh raised, if any
+        """
+
+    def on_credentials_load(self, found: bool, seconds: float) -> None:
+        """
+        Credentials were read from the credential store (the credentials file by default).
+
+        :param found: Whether the store held credentials
+        """
+
+    def on_compression(
+        self, codec: Codec, raw_size: int, compressed_size: int, seconds: float
+    ) -> None:
+        """
+        A payload was prepared by prepare_data_for_generate_solutions (or
+        prepare_data_with_metadata).
+
+        :param codec: The codec that compressed it
+        :param raw_size: Size of the JSON payload in bytes
+        :param compressed_size: Size of the compressed payload before base64 encoding
+        :param seconds: Time spent serializing, deduplicating and compressing it
+        """
+
+
+def endpoint_path(endpoint: str) -> str:
+    """
+    Returns the endpoint without its query string: what hooks and circuits are keyed by,
+    so that their number stays bounded.
+    """
+    return endpoint.split("?", 1)[0]
+
+
+def status_code_of(error: BaseException) -> int | None:
+    """
+    Returns the status of the response an HTTP error was raised for, if any.
+    """
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
@@ -0,0 +1,129 @@
+import threading
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks
+from tn_sdk.core.stats import EndpointStats, LatencyHistogram, MetricsSnapshot
+from tn_sdk.payload.codecs import Codec
+from tn_sdk.utils.constants import DEFAULT_LATENCY_BUCKETS
+
+
+class MetricsCollector(TnApiHooks):
+    """
+    In-memory metrics of one or more clients: request counts, errors, status codes and
+    latency histograms per endpoint and token type, retries, token refreshes and payload
+    compression.
+
+    Every event costs a lock and a few dict updates, cheap enough to leave on in
+    production. Read the metrics with snapshot(), e.g. from a periodic exporter.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """
+        :param buckets: Upper bounds of the latency histogram buckets, in seconds
+        """
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._metrics = self._empty_metrics()
+
+    def _empty_metrics(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            token_refresh_latency=LatencyHistogram(self._buckets),
+            compression_latency=LatencyHistogram(self._buckets),
+        )
+
+    def on_request_end(
+        self,
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        status_code: int | None,
+        seconds: float,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            stats = self._metrics.endpoints.get((endpoint, token_type))
+            if stats is None:
+                stats = self._metrics.endpoints[(endpoint, token_type)] = EndpointStats(
+                    latency=LatencyHistogram(self._buckets)
+                )
+            stats.requests += 1
+            if error is not None:
+                stats.errors += 1
+            if status_code is not None:
+                stats.status_codes[status_code] = (
+                    stats.status_codes.get(status_code, 0) + 1
+                )
+            stats.latency.observe(seconds)
+
+    def on_retry(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int | None,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            retries = self._metrics.retries
+            retries[endpoint] = retries.get(endpoint, 0) + 1
+
+    def on_token_refresh(
+        self,
+        source: str,
+        proactive: bool,
+        seconds: float,
+        error: BaseException | None,
+    ) -> None:
+        with self._lock:
+            if error is not None:
+                self._metrics.token_refresh_failures += 1
+            else:
+                refreshes = self._metrics.token_refreshes
+                refreshes[source] = refreshes.get(source, 0) + 1
+            self._metrics.token_refresh_latency.observe(seconds)
+
+    def on_credentials_load(self, found: bool, seconds: float) -> None:
+        with self._lock:
+            self._metrics.credential_loads += 1
+
+    def on_compression(
+        self, codec: Codec, raw_size: int, compressed_size: int, seconds: float
+    ) -> None:
+        with self._lock:
+            self._metrics.compressions += 1
+            self._metrics.raw_bytes += raw_size
+            self._metrics.compressed_bytes += compressed_size
+            self._metrics.compression_latency.observe(seconds)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """
+        Returns a copy of the metrics gathered so far.
+        """
+        with self._lock:
+            metrics = self._metrics
+            return MetricsSnapshot(
+                endpoints={
+                    key: EndpointStats(
+                        stats.requests,
+                        stats.errors,
+                        dict(stats.status_codes),
+                        stats.latency.copy(),
+                    )
+                    for key, stats in metrics.endpoints.items()
+                },
+                retries=dict(metrics.retries),
+                token_refreshes=dict(metrics.token_refreshes),
+                token_refresh_failures=metrics.token_refresh_failures,
+                token_refresh_latency=metrics.token_refresh_latency.copy(),
+                credential_loads=metrics.credential_loads,
+                compressions=metrics.compressions,
+                raw_bytes=metrics.raw_bytes,
+                compressed_bytes=metrics.compressed_bytes,
+                compression_latency=metrics.compression_latency.copy(),
+            )
+
+    def reset(self) -> None:
+        """
+        Clears the metrics, e.g. after exporting a snapshot.
+        """
+        with self._lock:
+            self._metrics = self._empty_metrics()
@@ -0,0 +1,244 @@
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from tn_sdk.core.stats import SubmitStats
+from tn_sdk.utils.constants import (
+    DEFAULT_SUBMIT_CONCURRENCY,
+    DEFAULT_SUBMIT_MAX_IN_FLIGHT_BYTES,
+    SUBMIT_MAX_THROTTLE_DELAY,
+    SUBMIT_THROTTLE_BACKOFF,
+)
+
+
+@dataclass
+class SubmitResult:
+    """
+    The outcome of one submitted payload.
+
+    :param index: Position of the payload in the input
+    :param response: JSON response, None if it failed
+    :param error: Why the payload couldn't be prepared or sent, None if it succeeded
+    :param throttled: Times it was answered with a 429 and sent again
+    """
+
+    index: int
+    response: dict | None = None
+    error: Exception | None = None
+    throttled: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AdaptiveLimiter:
+    """
+    Admits requests within a concurrency limit and an in-flight byte budget, slowing
+    everyone down when the API throttles.
+
+    A throttled request pauses all admissions (for its Retry-After, or an exponential
+    backoff) and halves the concurrency limit, once per round of requests admitted before
+    it. Every limit successes in a row then raise the limit by one, up to max_concurrency.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_SUBMIT_CONCURRENCY,
+        max_bytes: int = DEFAULT_SUBMIT_MAX_IN_FLIGHT_BYTES,
+        *,
+        backoff: float = SUBMIT_THROTTLE_BACKOFF,
+        max_delay: float = SUBMIT_MAX_THROTTLE_DELAY,
+    ):
+        """
+        :param max_concurrency: Most requests in flight at once
+        :param max_bytes: Most bytes in flight at once. A larger request is admitted alone
+        :keyword backoff: Pause after a 429 without Retry-After, doubling on each in a row
+        :keyword max_delay: Longest pause in seconds
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._max_bytes = max_bytes
+        self._backoff = backoff
+        self._max_delay = max_delay
+
+        self._condition = threading.Condition()
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._in_flight_bytes = 0
+        self._paused_until = 0.0
+        # Bumped on every decrease, so one burst of 429s only halves the limit once
+        self._epoch = 0
+        self._successes = 0
+        self._throttles_in_a_row = 0
+        self._stats = SubmitStats(limit=max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @property
+    def stats(self) -> SubmitStats:
+        """
+        A snapshot of the limiter counters.
+        """
+        with self._condition:
+            return SubmitStats(**vars(self._stats))
+
+    def acquire(self, size: int) -> int:
+        """
+        Blocks until a request of size bytes may be sent.
+
+        :return: Token to give back to release()
+        """
+        with self._condition:
+            while True:
+                delay = self._paused_until - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                if self._in_flight < self._limit and (
+                    self._in_flight == 0
+                    or self._in_flight_bytes + size <= self._max_bytes
+                ):
+                    break
+                self._condition.wait()
+
+            self._in_flight += 1
+            self._in_flight_bytes += size
+            self._stats.peak_in_flight = max(
+                self._stats.peak_in_flight, self._in_flight
+            )
+            return self._epoch
+
+    def release(
+        self,
+        size: int,
+        token: int,
+        *,
+        throttled: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Gives back what acquire() admitted, reporting whether the API throttled it.
+
+        :param size: Size given to acquire()
+        :param token: What acquire() returned
+        :keyword throttled: The request was answered with a 429
+        :keyword retry_after: Seconds the API asked to wait, if it said
+        """
+        with self._condition:
+            self._in_flight -= 1
+            self._in_flight_bytes -= size
+            if throttled:
+                self._throttle(token, retry_after)
+            else:
+                self._throttles_in_a_row = 0
+                self._successes += 1
+                if self._successes >= self._limit:
+                    self._successes = 0
+                    self._limit = min(self._limit + 1, self._max_concurrency)
+                    self._stats.limit = self._limit
+            self._condition.notify_all()
+
+    def _throttle(self, token: int, retry_after: float | None) -> None:
+        """
+        Pauses admissions and lowers the limit. Must hold the condition.
+        """
+        self._stats.throttled += 1
+        if retry_after is None:
+            retry_after = self._backoff * 2**self._throttles_in_a_row
+        self._throttles_in_a_row += 1
+        self._paused_until = max(
+            self._paused_until,
+            time.monotonic() + min(max(retry_after, 0.0), self._max_delay),
+        )
+        if token == self._epoch:
+            self._epoch += 1
+            self._successes = 0
+            self._limit = max(1, self._limit // 2)
+            self._stats.limit = self._limit
+            self._stats.slowdowns += 1
+
+
+def retry_after_seconds(response: requests.Response) -> float | None:
+    """
+    Returns the seconds a response's Retry-After header asks to wait, if it has one.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # A -0000 zone parses as naive, yet is UTC like any HTTP date
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return retry_at.timestamp() - time.time()
+
+
+def iter_submit(
+    payloads: Iterable[Any],
+    send: Callable[[int, Any], SubmitResult],
+    concurrency: int,
+    ordered: bool = True,
+) -> Iterator[SubmitResult]:
+    """
+    Runs send(index, payload) for every payload in a pool of concurrency threads.
+
+    Payloads are only pulled from the input while fewer than twice concurrency are
+    submitted and not yet yielded, so a slow API holds back the producer.
+
+    :param payloads: Payloads of any length, consumed lazily
+    :param send: Prepares and sends one payload, never raising
+    :param concurrency: Number of threads
+    :param ordered: Yield results in input order, instead of as they complete
+    :return: Iterator of SubmitResult, one per payload
+    """
+    max_pending = concurrency * 2
+    executor = ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="tn-sdk-submit"
+    )
+    pending: deque[Future] = deque()
+    try:
+        for index, payload in enumerate(payloads):
+            pending.append(executor.submit(send, index, payload))
+            while len(pending) >= max_pending:
+                yield from _pop_results(pending, ordered)
+
+        while pending:
+            yield from _pop_results(pending, ordered)
+    finally:
+        # The consumer stopped early, don't send what is still queued
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _pop_results(pending: deque[Future], ordered: bool) -> Iterator[SubmitResult]:
+    """
+    Waits for the next result (the oldest one if ordered) and yields every result then
+    available, removing them from pending.
+    """
+    if ordered:
+        yield pending.popleft().result()
+        while pending and pending[0].done():
+            yield pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in [future for future in pending if future in done]:
+        pending.remove(future)
+        yield future.result()
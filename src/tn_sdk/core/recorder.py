@@ -0,0 +1,417 @@
+import gzip
+import json
+import os
+import queue
+import threading
+import weakref
+from base64 import b64encode
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.stats import RecorderStats
+from tn_sdk.utils.constants import (
+    DEFAULT_RECORDER_BACKUPS,
+    DEFAULT_RECORDER_MAX_BYTES,
+    DEFAULT_RECORDER_QUEUE_SIZE,
+    RECORDER_REDACTED_FIELDS,
+    RECORDER_REDACTED_HEADERS,
+)
+
+REDACTED = "[REDACTED]"
+
+# Tells the writer thread to finish
+_STOP = object()
+# Most uncompressed bytes written between flushes, after which the size on disk (checked
+# for rotation) is up to date
+_FLUSH_BYTES = 64 * 1024
+# Seconds between checks that the writer is still alive while close() waits to queue _STOP
+_STOP_POLL_INTERVAL = 0.1
+
+# Open recorders, whose writer thread is started again in forked children
+_live_recorders: "weakref.WeakSet[TrafficRecorder]" = weakref.WeakSet()
+
+
+def _reset_recorders_after_fork() -> None:
+    for recorder in list(_live_recorders):
+        recorder._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_recorders_after_fork)
+
+
+def child_trace_path(path: str, pid: int) -> str:
+    """
+    Returns the trace a forked child records to: path with the child's pid appended to
+    the file name, before its extensions (trace.jsonl.gz -> trace-1234.jsonl.gz).
+    """
+    directory, name = os.path.split(path)
+    stem, dot, extensions = name.partition(".")
+    return os.path.join(directory, f"{stem}-{pid}{dot}{extensions}")
+
+
+def redact(value: Any, fields: frozenset[str]) -> Any:
+    """
+    Returns a copy of a JSON-like value with the values of secret keys replaced, at any
+    depth. Keys are secret when listed in fields or ending in _secret or _token.
+    """
+    if isinstance(value, dict):
+        return {
+            key: (REDACTED if _is_secret(key, fields) else redact(item, fields))
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item, fields) for item in value]
+    return value
+
+
+def _is_secret(key: Any, fields: frozenset[str]) -> bool:
+    if not isinstance(key, str):
+        return False
+    key = key.lower()
+    return key in fields or key.endswith(("_secret", "_token"))
+
+
+class TrafficRecorder:
+    """
+    Appends the requests of a TnApi to a gzip compressed JSONL trace, which
+    tn_sdk.benchmarks.replay sends again, e.g. to a local stub.
+
+    Each line holds a request (method, endpoint, token type, headers, payload) and what
+    came of it (status, seconds, response bytes, error). Secrets are redacted: the
+    Authorization (and other credential) headers, and secret keys of JSON bodies and
+    query parameters. Streamed bodies aren't recorded.
+
+    Requests only hand their entry over to a queue: encoding, compressing and writing
+    happen on a background thread. When the queue is full (the disk can't keep up)
+    entries are dropped and counted rather than slowing requests down.
+
+    The trace rotates once it reaches max_bytes on disk, like logging's
+    RotatingFileHandler: path is renamed path.1, path.1 becomes path.2... and the oldest
+    beyond backups is removed.
+
+    An entry that can't be encoded is skipped and counted as failed. An error writing
+    the trace stops the writer: later entries are counted as dropped, the error is
+    available as ``error`` and close() raises it. A forked child records to its own
+    trace (see child_trace_path), with a writer of its own.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        max_bytes: int = DEFAULT_RECORDER_MAX_BYTES,
+        backups: int = DEFAULT_RECORDER_BACKUPS,
+        queue_size: int = DEFAULT_RECORDER_QUEUE_SIZE,
+        redact_headers: Iterable[str] = RECORDER_REDACTED_HEADERS,
+        redact_fields: Iterable[str] = RECORDER_REDACTED_FIELDS,
+    ):
+        """
+        :param path: Trace file, appended to if it exists
+        :keyword max_bytes: Compressed size at which the trace rotates (defaults to 64MB)
+        :keyword backups: Rotated traces kept (defaults to 5)
+        :keyword queue_size: Entries waiting to be written before new ones are dropped
+            (defaults to 10000)
+        :keyword redact_headers: Headers whose value is redacted, case insensitive
+            (defaults to Authorization, Cookie, Proxy-Authorization and X-Api-Key)
+        :keyword redact_fields: Keys whose value is redacted in JSON bodies and query
+            parameters, besides those ending in _secret or _token, case insensitive
+        """
+        self._path = os.fspath(path)
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self._redact_headers = frozenset(name.lower() for name in redact_headers)
+        self._redact_fields = frozenset(name.lower() for name in redact_fields)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._stats = RecorderStats()
+        self._closed = False
+        self._error: BaseException | None = None
+
+        self._raw = None
+        self._file = None
+        self._unflushed = 0
+        self._open()
+        self._start_writer()
+        _live_recorders.add(self)
+
+    def __enter__(self) -> "TrafficRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def error(self) -> BaseException | None:
+        """
+        The error that stopped the writer, if any.
+        """
+        return self._error
+
+    @property
+    def stats(self) -> RecorderStats:
+        """
+        A snapshot of the recorder counters.
+        """
+        with self._stats_lock:
+            return RecorderStats(**vars(self._stats))
+
+    def close(self) -> None:
+        """
+        Writes the entries still queued and closes the trace. Raises the error that
+        stopped the writer, if any.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # A full queue is drained by the writer, unless it stopped
+        while self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=_STOP_POLL_INTERVAL)
+                break
+            except queue.Full:
+                continue
+        self._thread.join()
+        _live_recorders.discard(self)
+        self._drop_queued()
+        try:
+            try:
+                self._file.close()
+            finally:
+                self._raw.close()
+        except OSError:
+            # The trace is already broken by the writer's error, which is raised instead
+            if self._error is None:
+                raise
+        if self._error is not None:
+            raise self._error
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        request_kwargs: dict,
+        status_code: int | None,
+        seconds: float,
+        response_bytes: int | None,
+        error: BaseException | None,
+        started_at: float,
+    ) -> None:
+        """
+        Queues a finished request for writing. Only cheap work happens here, this runs
+        on the thread that sent the request.
+
+        :param request_kwargs: The keyword arguments the request was sent with
+        :param response_bytes: Size of the response body, None if unknown
+        :param started_at: Wall clock time (time.time()) the request started at
+        """
+        if self._closed:
+            return
+        if self._error is not None:
+            with self._stats_lock:
+                self._stats.dropped += 1
+            return
+        entry = (
+            started_at,
+            method,
+            endpoint,
+            token_type,
+            dict(request_kwargs),
+            status_code,
+            seconds,
+            response_bytes,
+            type(error).__name__ if error is not None else None,
+        )
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._stats_lock:
+                self._stats.dropped += 1
+
+    def _open(self) -> None:
+        # Unbuffered, so the file holds nothing a forked child could write again (the
+        # gzip compressor buffers already)
+        self._raw = open(self._path, "ab", buffering=0)
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="ab")
+
+    def _start_writer(self) -> None:
+        self._thread = threading.Thread(
+            target=self._write_loop, name="tn-sdk-recorder", daemon=True
+        )
+        self._thread.start()
+
+    def _reset_after_fork(self) -> None:
+        """
+        Gives a forked child its own trace, queue and writer thread: the writer isn't
+        running in the child, and the inherited trace is the parent's.
+        """
+        if self._closed:
+            return
+        # Closing the inherited gzip file would write its trailer into the parent's trace
+        self._file.fileobj = None
+        self._raw.close()
+        self._path = child_trace_path(self._path, os.getpid())
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._stats_lock = threading.Lock()
+        self._stats = RecorderStats()
+        self._error = None
+        self._unflushed = 0
+        self._open()
+        self._start_writer()
+
+    def _write_loop(self) -> None:
+        try:
+            self._write_entries()
+        except BaseException as err:
+            self._error = err
+            with self._stats_lock:
+                self._stats.failed += 1
+            self._drop_queued()
+
+    def _drop_queued(self) -> None:
+        """
+        Counts the entries left in the queue (by a writer that stopped) as dropped.
+        """
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if entry is not _STOP:
+                with self._stats_lock:
+                    self._stats.dropped += 1
+
+    def _write_entries(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                self._file.flush()
+                return
+            try:
+                # Bodies the client sent but JSON can't encode as is (e.g. dates) as
+                # strings
+                encoded = json.dumps(
+                    self._encode(*entry), separators=(",", ":"), default=str
+                )
+            except Exception:
+                with self._stats_lock:
+                    self._stats.failed += 1
+                continue
+            self._unflushed += self._file.write(encoded.encode() + b"\n")
+            with self._stats_lock:
+                self._stats.recorded += 1
+            # Flushed when idle too, so the trace is readable up to here even if the
+            # process dies before close()
+            if self._queue.empty() or self._unflushed >= min(
+                self._max_bytes, _FLUSH_BYTES
+            ):
+                self._file.flush()
+                self._unflushed = 0
+                if self._raw.tell() >= self._max_bytes:
+                    self._rotate()
+
+    def _encode(
+        self,
+        started_at: float,
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        request_kwargs: dict,
+        status_code: int | None,
+        seconds: float,
+        response_bytes: int | None,
+        error: str | None,
+    ) -> dict:
+        entry = {
+            "at": started_at,
+            "method": method,
+            "endpoint": endpoint,
+            "token_type": token_type.value,
+        }
+        headers = request_kwargs.get("headers")
+        if headers:
+            entry["headers"] = {
+                name: REDACTED if name.lower() in self._redact_headers else value
+                for name, value in headers.items()
+            }
+        for name in ("params", "json"):
+            if request_kwargs.get(name) is not None:
+                entry[name] = redact(request_kwargs[name], self._redact_fields)
+
+        data = request_kwargs.get("data")
+        if isinstance(data, (str, bytes, bytearray)):
+            data = self._redact_body(data)
+        if isinstance(data, str):
+            entry["data"] = data
+        elif isinstance(data, (bytes, bytearray)):
+            # Prepared payloads are base64 already, kept readable
+            if data.isascii():
+                entry["data"] = data.decode("ascii")
+                entry["data_encoding"] = "ascii"
+            else:
+                entry["data"] = b64encode(data).decode()
+                entry["data_encoding"] = "base64"
+        elif data is not None:
+            entry["streamed_body"] = True
+
+        entry.update(
+            status=status_code,
+            seconds=seconds,
+            response_bytes=response_bytes,
+            error=error,
+        )
+        return entry
+
+    def _redact_body(self, body: str | bytes) -> str | bytes:
+        """
+        Returns a JSON body with the values of its secret keys redacted, encoded again only
+        when there were any, and other bodies (e.g. prepared payloads) as they are.
+        """
+        try:
+            value = json.loads(body)
+        except ValueError:  # Not JSON, nor even UTF-8
+            return body
+        redacted = redact(value, self._redact_fields)
+        if redacted == value:
+            return body
+        text = json.dumps(redacted)
+        return text if isinstance(body, str) else text.encode("ascii")
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._raw.close()
+        if self._backups > 0:
+            for index in range(self._backups - 1, 0, -1):
+                source = f"{self._path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self._path}.{index + 1}")
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+        self._open()
+        with self._stats_lock:
+            self._stats.rotations += 1
+
+
+def read_trace(*paths: str | os.PathLike) -> Iterator[dict]:
+    """
+    Yields the entries of traces written by TrafficRecorder, file after file. A trace
+    cut short (its process was killed) is read up to its last complete entry.
+
+    :param paths: Trace files, oldest first (e.g. trace.jsonl.gz.1 then trace.jsonl.gz)
+    """
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as trace:
+            try:
+                for line in trace:
+                    if line.endswith("\n"):
+                        yield json.loads(line)
+            except EOFError:
+                pass
@@ -0,0 +1,240 @@
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+import requests
+
+from tn_sdk.core.hooks import status_code_of
+from tn_sdk.core.stats import CircuitBreakerStats, RetryBudgetStats
+from tn_sdk.exceptions.exceptions import CircuitOpenException
+from tn_sdk.utils.constants import (
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+    DEFAULT_RETRY_BUDGET_RATIO,
+    DEFAULT_RETRY_BUDGET_RESERVE,
+    NETWORK_RETRY_STATUS_CODES,
+)
+
+
+def _causes(error: BaseException | None) -> Iterator[BaseException]:
+    """
+    Yields the error, then the errors it was raised from (e.g. the ConnectionError
+    behind a TnAuthenticationFailedException).
+    """
+    while error is not None:
+        yield error
+        error = error.__cause__
+
+
+def is_outage(error: BaseException) -> bool:
+    """
+    Whether a request failure says the API is unavailable (connection errors, timeouts,
+    429s and 5xx), rather than that the request itself was wrong.
+    """
+    for cause in _causes(error):
+        if isinstance(cause, requests.HTTPError):
+            if status_code_of(cause) in NETWORK_RETRY_STATUS_CODES:
+                return True
+        elif isinstance(
+            cause,
+            (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.RetryError,
+            ),
+        ):
+            return True
+    return False
+
+
+def reached_api(error: BaseException) -> bool:
+    """
+    Whether a request failure comes with a response from the API (e.g. a 4xx).
+    """
+    return any(status_code_of(cause) is not None for cause in _causes(error))
+
+
+class RetryBudget:
+    """
+    Caps retries client-wide to a fraction of the successful traffic, so a failing API
+    isn't sent several times its usual load.
+
+    Each successful request deposits ratio into the budget and each retry withdraws one,
+    with the balance capped at reserve (which is also where it starts). With the defaults
+    a healthy client can retry 10 requests in a row, then 1 per 10 successes.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_BUDGET_RATIO,
+        reserve: int = DEFAULT_RETRY_BUDGET_RESERVE,
+    ):
+        """
+        :param ratio: Retries earned per successful request (defaults to 0.1)
+        :param reserve: Retries allowed without any success, and most ever saved up
+            (defaults to 10)
+        """
+        self._ratio = ratio
+        self._reserve = float(reserve)
+        self._lock = threading.Lock()
+        self._balance = float(reserve)
+        self._stats = RetryBudgetStats()
+
+    @property
+    def stats(self) -> RetryBudgetStats:
+        """
+        A snapshot of the budget counters.
+        """
+        with self._lock:
+            return RetryBudgetStats(**vars(self._stats))
+
+    @property
+    def balance(self) -> float:
+        """
+        Retries currently allowed.
+        """
+        with self._lock:
+            return self._balance
+
+    def deposit(self) -> None:
+        """
+        Records a successful request.
+        """
+        with self._lock:
+            self._balance = min(self._balance + self._ratio, self._reserve)
+            self._stats.deposits += 1
+
+    def try_spend(self) -> bool:
+        """
+        Withdraws one retry, if the budget allows it.
+        """
+        with self._lock:
+            if self._balance < 1:
+                self._stats.rejected += 1
+                return False
+            self._balance -= 1
+            self._stats.spent += 1
+            return True
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    # Monotonic time the circuit opened at, None while closed
+    opened_at: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast, per endpoint, while the API keeps failing them.
+
+    A circuit opens after failure_threshold outages (see is_outage) in a row on its
+    endpoint. While open, requests raise CircuitOpenException without being sent. After
+    recovery_timeout seconds a single probe request is let through (half-open): its
+    success closes the circuit, its failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param failure_threshold: Outages in a row opening a circuit (defaults to 5)
+        :param recovery_timeout: Seconds a circuit stays open before a probe (defaults to 30)
+        :keyword clock: Returns the current time in seconds (defaults to time.monotonic)
+        """
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._stats = CircuitBreakerStats()
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """
+        A snapshot of the breaker counters.
+        """
+        with self._lock:
+            return CircuitBreakerStats(**vars(self._stats))
+
+    def state(self, endpoint: str) -> str:
+        """
+        Returns CLOSED, OPEN or HALF_OPEN for the endpoint's circuit.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return self.CLOSED
+            if circuit.probing or self._recovered(circuit):
+                return self.HALF_OPEN
+            return self.OPEN
+
+    def _recovered(self, circuit: _Circuit) -> bool:
+        return self._clock() - circuit.opened_at >= self._recovery_timeout
+
+    def before_request(self, endpoint: str) -> None:
+        """
+        Raises CircuitOpenException if a request to endpoint must not be sent now.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None or circuit.opened_at is None:
+                return
+            if not circuit.probing and self._recovered(circuit):
+                circuit.probing = True
+                return
+            self._stats.rejected += 1
+            retry_in = max(
+                0.0, circuit.opened_at + self._recovery_timeout - self._clock()
+            )
+        raise CircuitOpenException(
+            f"Circuit open for {endpoint} after repeated failures, retry in {retry_in:.1f}s"
+        )
+
+    def record_success(self, endpoint: str) -> None:
+        """
+        Records a request to endpoint that reached the API (even if it was rejected).
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is None:
+                return
+            if circuit.opened_at is not None:
+                self._stats.closed += 1
+            del self._circuits[endpoint]
+
+    def record_abort(self, endpoint: str) -> None:
+        """
+        Records a request to endpoint that ended without telling whether the API is up
+        (e.g. interrupted by KeyboardInterrupt): if it was the probe, the next request
+        probes instead.
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint)
+            if circuit is not None:
+                circuit.probing = False
+
+    def record_failure(self, endpoint: str) -> None:
+        """
+        Records a request to endpoint that failed because of an outage.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(endpoint, _Circuit())
+            circuit.failures += 1
+            if circuit.probing or (
+                circuit.opened_at is None
+                and circuit.failures >= self._failure_threshold
+            ):
+                circuit.opened_at = self._clock()
+                circuit.probing = False
+                self._stats.opened += 1
@@ -0,0 +1,285 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.stats import CacheStats
+from tn_sdk.utils.constants import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+)
+
+# Expired files are swept from the disk tier every that many writes
+_DISK_PRUNE_INTERVAL = 100
+
+
+def response_cache_key(
+    method: str, endpoint: str, token_type: TokenType, request_kwargs: dict
+) -> str | None:
+    """
+    Returns the content address of a request: a hash of its method, endpoint, token type,
+    body, query parameters and headers (except Authorization, which changes on refresh).
+
+    :param request_kwargs: The kwargs the request is sent with
+    :return: Hex digest, or None if the body is streamed and can't be hashed
+    """
+    body = request_kwargs.get("data")
+    if body is None and request_kwargs.get("json") is not None:
+        body = json.dumps(request_kwargs["json"], sort_keys=True)
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    elif body is not None and not isinstance(body, (bytes, bytearray, memoryview)):
+        return None
+
+    headers = {
+        name.lower(): value
+        for name, value in (request_kwargs.get("headers") or {}).items()
+        if name.lower() != "authorization"
+    }
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [
+                method.upper(),
+                endpoint,
+                token_type.value,
+                sorted(headers.items()),
+                repr(request_kwargs.get("params")),
+            ]
+        ).encode("utf-8")
+    )
+    digest.update(b"\0")
+    if body is not None:
+        digest.update(body)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Caches response bodies by content address, for clients re-sending identical requests.
+
+    Entries are evicted least recently used first once max_entries or max_bytes are
+    exceeded, and expire ttl seconds after they were stored. Concurrent lookups of the
+    same key share a single in-flight request (single-flight), and failed requests are
+    never cached.
+
+    With a disk_path, entries are also written there so worker processes pointed at the
+    same directory share them. Only the memory tier coalesces in-flight requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        disk_path: str | Path | None = None,
+    ):
+        """
+        :keyword ttl: Seconds an entry stays valid (defaults to 30)
+        :keyword max_entries: Maximum number of entries kept in memory (defaults to 1024)
+        :keyword max_bytes: Maximum total size of the bodies kept in memory (defaults to 64MB)
+        :keyword disk_path: Directory of the disk tier, created if missing (defaults to None)
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._disk_path = Path(disk_path) if disk_path is not None else None
+        if self._disk_path is not None:
+            self._disk_path.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Key -> (monotonic expiry, body), least recently used first
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._in_flight: dict[str, Future] = {}
+        self._disk_writes = 0
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        A snapshot of the cache counters.
+        """
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size in bytes of the bodies kept in memory.
+        """
+        with self._lock:
+            return self._size
+
+    def get_or_load(self, key: str, load: Callable[[], bytes]) -> bytes:
+        """
+        Returns the cached body for key, or calls load() to get it and caches the result.
+
+        :param key: Content address of the request (see response_cache_key)
+        :param load: Sends the request, returning the body of a successful response
+        :return: Response body
+        """
+        with self._lock:
+            body = self._get_from_memory(key)
+            if body is not None:
+                self._stats.hits += 1
+                return body
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                in_flight = self._in_flight[key] = Future()
+                leader = True
+            else:
+                self._stats.coalesced += 1
+                leader = False
+
+        if not leader:
+            return in_flight.result()
+
+        try:
+            body = self._get_from_disk(key)
+            if body is None:
+                body = load()
+                self._save_to_disk(key, body)
+            self._store(key, body)
+        except BaseException as err:
+            in_flight.set_exception(err)
+            raise
+        else:
+            in_flight.set_result(body)
+            return body
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _get_from_memory(self, key: str) -> bytes | None:
+        """
+        Returns the valid entry for key, if any. Must hold the lock.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self._stats.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    def _store(self, key: str, body: bytes) -> None:
+        """
+        Adds an entry, evicting the least recently used ones beyond the bounds.
+        """
+        if len(body) > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self._ttl, body)
+            self._size += len(body)
+            while (
+                len(self._entries) > self._max_entries or self._size > self._max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self._stats.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """
+        Removes an entry from memory. Must hold the lock.
+        """
+        _, body = self._entries.pop(key)
+        self._size -= len(body)
+
+    def _get_from_disk(self, key: str) -> bytes | None:
+        """
+        Reads a valid entry from the disk tier, counting the lookup as a disk hit or a miss.
+        """
+        body = None
+        if self._disk_path is not None:
+            path = self._disk_path / key
+            try:
+                expires_at, _, body = path.read_bytes().partition(b"\n")
+                if float(expires_at) <= time.time():
+                    body = None
+                    with contextlib.suppress(OSError):
+                        path.unlink()
+                    with self._lock:
+                        self._stats.expirations += 1
+            except (OSError, ValueError):
+                body = None
+
+        with self._lock:
+            if body is None:
+                self._stats.misses += 1
+            else:
+                self._stats.disk_hits += 1
+        return body
+
+    def _save_to_disk(self, key: str, body: bytes) -> None:
+        """
+        Writes an entry to the disk tier atomically. Best effort: errors are ignored.
+        """
+        if self._disk_path is None:
+            return
+        try:
+            fd, temp_name = tempfile.mkstemp(dir=self._disk_path, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                temp_file.write(f"{time.time() + self._ttl}\n".encode("ascii"))
+                temp_file.write(body)
+            os.replace(temp_name, self._disk_path / key)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            return
+
+        with self._lock:
+            self._disk_writes += 1
+            prune = self._disk_writes % _DISK_PRUNE_INTERVAL == 0
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        """
+        Deletes the expired entries of the disk tier.
+        """
+        now = time.time()
+        for path in self._disk_path.iterdir():
+            if path.suffix == ".tmp":
+                continue
+            try:
+                with path.open("rb") as entry_file:
+                    expired = float(entry_file.readline()) <= now
+                if expired:
+                    path.unlink()
+            except (OSError, ValueError):
+                continue
+
+    def clear(self) -> None:
+        """
+        Drops every entry, from memory and from the disk tier.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self._disk_path is not None:
+            for path in self._disk_path.iterdir():
+                with contextlib.suppress(OSError):
+                    path.unlink()
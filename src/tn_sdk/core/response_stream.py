@@ -0,0 +1,260 @@
+import codecs
+import json
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import requests
+
+from tn_sdk.exceptions.exceptions import InvalidResponseException
+from tn_sdk.utils.constants import DEFAULT_STREAM_CHUNK_SIZE
+
+_WHITESPACE = " \t\n\r"
+
+
+class JsonStreamReader:
+    """
+    Reads JSON values from a stream of bytes chunks, keeping only the value being decoded
+    (and the chunk it ends in) in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        :param chunks: UTF-8 encoded JSON document, in chunks of any size
+        """
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        # Text read past the buffer, joined to it only when needed: appending every
+        # chunk to the buffer would copy it over and over
+        self._pending: list[str] = []
+        self._pending_size = 0
+        self._eof = False
+
+    @property
+    def started(self) -> bool:
+        """
+        Whether anything was read yet.
+        """
+        return bool(self._buffer or self._pending) or self._eof
+
+    def _fill(self) -> bool:
+        """
+        Reads the next chunk into the pending text. Returns False at the end of the stream.
+        """
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            text = self._decoder.decode(b"", final=True)
+            self._eof = True
+        else:
+            text = self._decoder.decode(chunk)
+        if text:
+            self._pending.append(text)
+            self._pending_size += len(text)
+        return not self._eof
+
+    def _join(self) -> None:
+        """
+        Appends the pending text to the buffer, dropping the text already consumed.
+        """
+        if self._pending:
+            self._pending.insert(0, self._buffer[self._pos :])
+            self._buffer = "".join(self._pending)
+            self._pos = 0
+            self._pending = []
+            self._pending_size = 0
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, "" at the end of the stream.
+        """
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill() and not self._pending:
+                return ""
+            self._join()
+
+    def expect(self, char: str) -> None:
+        """
+        Consumes the given structural character.
+        """
+        found = self.peek()
+        if found != char:
+            raise InvalidResponseException(
+                f"Expected {char!r} in the response, found {found or 'its end'!r}"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decodes the next complete JSON value.
+        """
+        if not self.peek():
+            raise InvalidResponseException("Unexpected end of the response")
+        wanted = 0
+        while True:
+            available = len(self._buffer) - self._pos + self._pending_size
+            if self._eof or available >= wanted:
+                self._join()
+                try:
+                    value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError as err:
+                    if self._eof:
+                        raise InvalidResponseException(
+                            f"Invalid JSON in the response: {err}"
+                        ) from err
+                else:
+                    # A number (or literal) at the end of the buffer may continue
+                    if end < len(self._buffer) or self._eof:
+                        self._pos = end
+                        return value
+                # Wait for twice as much text before trying again, so a value spanning
+                # many chunks isn't re-decoded from its start after each one
+                wanted = 2 * (len(self._buffer) - self._pos)
+            self._fill()
+
+    def document(self) -> Any:
+        """
+        Reads the rest of the stream and decodes it as one JSON document, in a single
+        json.loads call. Nothing must have been read yet.
+        """
+        if self.started:
+            raise InvalidResponseException("The response was already partially read")
+        self._eof = True
+        try:
+            return json.loads(b"".join(self._chunks).decode("utf-8"))
+        except ValueError as err:
+            raise InvalidResponseException(
+                f"Invalid JSON in the response: {err}"
+            ) from err
+
+    def iter_array(self, *path: str) -> Iterator[Any]:
+        """
+        Yields the elements of the array found at path (object keys from the top level),
+        one at a time. Other members are decoded and dropped along the way.
+
+        :param path: Keys leading to the array, none for a top level array
+        """
+        for key in path:
+            self._enter_member(key)
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+            else:
+                self.expect("]")
+                return
+
+    def _enter_member(self, key: str) -> None:
+        """
+        Moves to the value of the given member of the object at the current position.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            raise InvalidResponseException(f"Key {key!r} not found in the response")
+        while True:
+            name = self.value()
+            self.expect(":")
+            if name == key:
+                return
+            self.value()
+            if self.peek() != ",":
+                raise InvalidResponseException(f"Key {key!r} not found in the response")
+            self._pos += 1
+
+
+class StreamedResponse:
+    """
+    A response whose JSON body is read lazily, as it is consumed.
+
+    Content-Encoding compressed bodies (gzip, deflate) are decompressed on the fly. Close it
+    (or use it as a context manager) when done, so its connection returns to the pool.
+    """
+
+    def __init__(
+        self, response: requests.Response, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ):
+        """
+        :param response: A response sent with stream=True
+        :param chunk_size: Size of the chunks read from the connection
+        """
+        self.response = response
+        self._reader = JsonStreamReader(response.iter_content(chunk_size))
+
+    def __enter__(self) -> "StreamedResponse":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        return self.response.headers
+
+    def iter_items(self, *path: str) -> Iterator[Any]:
+        """
+        Yields the elements of the array at path one at a time, e.g.
+        ``iter_items("solutions")`` for ``{"solutions": [...]}``. The body can only be
+        read once, so the keys before path are skipped and the rest is left unread.
+
+        :param path: Object keys leading to the array, none for a top level array
+        """
+        return self._reader.iter_array(*path)
+
+    def json(self) -> Any:
+        """
+        Reads and decodes the whole body, like requests.Response.json().
+        """
+        return self._reader.document()
+
+    def close(self) -> None:
+        self.response.close()
+
+
+def read_spooled_json(
+    response: requests.Response,
+    max_memory: int,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> Any:
+    """
+    Reads and decodes the JSON body of a response sent with stream=True, like
+    response.json(), without holding its raw bytes next to the decoded value.
+
+    A body larger than max_memory (or of unknown length) is copied to a
+    SpooledTemporaryFile, which spills to disk past max_memory bytes, and the connection
+    is released before it is decoded. Smaller bodies are read as usual.
+
+    :param response: A response sent with stream=True
+    :param max_memory: Bytes of body kept in memory before spilling to a temporary file
+    :param chunk_size: Size of the chunks read from the connection
+    :return: The decoded JSON
+    """
+    length = response.headers.get("Content-Length")
+    if length and int(length) <= max_memory:
+        return response.json()
+
+    with tempfile.SpooledTemporaryFile(max_size=max_memory, prefix="tn-sdk-") as spool:
+        try:
+            for chunk in response.iter_content(chunk_size):
+                spool.write(chunk)
+        finally:
+            response.close()
+        spool.seek(0)
+        # The bytes read back are dropped once decoded, before the JSON is
+        return json.loads(spool.read().decode(response.encoding or "utf-8"))
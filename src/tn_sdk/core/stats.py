@@ -0,0 +1,279 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.utils.constants import DEFAULT_LATENCY_BUCKETS
+
+
+@dataclass
+class RefreshStats:
+    """
+    Counters describing how token refreshes were handled by a client.
+
+    :param performed: Refreshes that reloaded the credentials from disk or the API
+    :param coalesced: Refreshes skipped because a concurrent caller had already refreshed
+    :param proactive: Performed refreshes that ran ahead of expiry rather than after a 401
+    """
+
+    performed: int = 0
+    coalesced: int = 0
+    proactive: int = 0
+
+
+@dataclass
+class PoolStats:
+    """
+    Counters describing how a client's HTTP connection pools were used.
+
+    :param created: Connections opened (each one a TCP, and TLS, handshake)
+    :param reused: Pooled connections handed out again to a request
+    :param discarded: Connections closed on release because their pool was already full
+    """
+
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+
+
+@dataclass
+class LatencyHistogram:
+    """
+    Latency distribution over fixed buckets.
+
+    :param bounds: Upper bounds of the buckets in seconds, ascending. Slower observations
+        land in an extra overflow bucket
+    :param counts: Observations per bucket (len(bounds) + 1 of them)
+    :param count: Total observations
+    :param total: Sum of the observed seconds
+    :param max: Slowest observation in seconds
+    """
+
+    bounds: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates the q-quantile (e.g. 0.99) as the upper bound of the bucket holding it,
+        capped by the slowest observation. 0.0 without observations.
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.bounds, self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def copy(self) -> "LatencyHistogram":
+        return LatencyHistogram(
+            self.bounds, list(self.counts), self.count, self.total, self.max
+        )
+
+
+@dataclass
+class EndpointStats:
+    """
+    Metrics of the requests made to one endpoint with one token type.
+
+    :param requests: Requests finished, successfully or not
+    :param errors: Requests that raised (HTTP error statuses included)
+    :param status_codes: Requests per status of their last response
+    :param latency: Request durations, retries and token refreshes included
+    """
+
+    requests: int = 0
+    errors: int = 0
+    status_codes: dict[int, int] = field(default_factory=dict)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class MetricsSnapshot:
+    """
+    A point in time copy of the metrics gathered by a MetricsCollector.
+
+    :param endpoints: Request metrics per (endpoint, token type)
+    :param retries: Network retries per endpoint
+    :param token_refreshes: Token refreshes per source ("api", "store" or "coalesced")
+    :param token_refresh_failures: Token refreshes that raised
+    :param token_refresh_latency: Token refresh durations
+    :param credential_loads: Reads of the credential store
+    :param compressions: Payloads prepared
+    :param raw_bytes: Total size of the prepared payloads before compression
+    :param compressed_bytes: Total size of the prepared payloads after compression
+    :param compression_latency: Payload preparation durations
+    """
+
+    endpoints: dict[tuple[str, TokenType], EndpointStats] = field(default_factory=dict)
+    retries: dict[str, int] = field(default_factory=dict)
+    token_refreshes: dict[str, int] = field(default_factory=dict)
+    token_refresh_failures: int = 0
+    token_refresh_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    credential_loads: int = 0
+    compressions: int = 0
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+    compression_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing how a ResponseCache was used.
+
+    :param hits: Lookups answered from memory
+    :param disk_hits: Lookups answered from the disk tier
+    :param misses: Lookups that had to send the request
+    :param coalesced: Lookups that waited for an identical request already in flight
+    :param evictions: Entries dropped to stay within the entry count or byte bounds
+    :param expirations: Entries dropped because they outlived the TTL
+    """
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class SubmitStats:
+    """
+    Counters describing how an AdaptiveLimiter paced submitted requests.
+
+    :param limit: Current concurrency limit
+    :param peak_in_flight: Most requests in flight at once
+    :param throttled: Requests answered with a 429
+    :param slowdowns: Times the 429s halved the concurrency limit
+    """
+
+    limit: int = 0
+    peak_in_flight: int = 0
+    throttled: int = 0
+    slowdowns: int = 0
+
+
+@dataclass
+class RetryBudgetStats:
+    """
+    Counters describing how a RetryBudget was spent.
+
+    :param deposits: Successful requests that added to the budget
+    :param spent: Retries (and hedges) the budget allowed
+    :param rejected: Retries (and hedges) skipped because the budget was empty
+    """
+
+    deposits: int = 0
+    spent: int = 0
+    rejected: int = 0
+
+
+@dataclass
+class CircuitBreakerStats:
+    """
+    Counters describing what a CircuitBreaker did.
+
+    :param opened: Times a circuit opened (or re-opened after a failed probe)
+    :param closed: Times a probe succeeded and closed a circuit
+    :param rejected: Requests failed fast while their circuit was open
+    """
+
+    opened: int = 0
+    closed: int = 0
+    rejected: int = 0
+
+
+@dataclass
+class HedgeStats:
+    """
+    Counters describing a client's hedged requests.
+
+    :param sent: Hedges sent because the first attempt was slower than hedge_after
+    :param won: Hedges that answered before the attempt they backed up
+    """
+
+    sent: int = 0
+    won: int = 0
+
+
+@dataclass
+class TenantPoolStats:
+    """
+    Counters describing a TnApiPool's tenant clients.
+
+    :param tenants: Tenants registered
+    :param clients: Tenant clients currently kept
+    :param created: Tenant clients created, each authenticating on its first request
+    :param hits: Requests for a tenant client that was already kept
+    :param evicted: Least recently used clients dropped to stay within max_clients
+    """
+
+    tenants: int = 0
+    clients: int = 0
+    created: int = 0
+    hits: int = 0
+    evicted: int = 0
+
+
+@dataclass
+class RecorderStats:
+    """
+    Counters describing what a TrafficRecorder wrote.
+
+    :param recorded: Requests written to the trace
+    :param dropped: Requests not recorded because the write queue was full, or the
+        writer had stopped on an error
+    :param rotations: Times the trace reached max_bytes and was rotated
+    :param failed: Requests that couldn't be encoded or written
+    """
+
+    recorded: int = 0
+    dropped: int = 0
+    rotations: int = 0
+    failed: int = 0
+
+
+@dataclass
+class DataStreamStats:
+    """
+    Counters describing a DataStream.
+
+    :param records: Records accepted by send()
+    :param acknowledged: Records the API confirmed receiving
+    :param streams: Streamed requests sent, including the ones sent again
+    :param batches: Batches written to streams, including the ones sent again
+    :param resent: Records sent again after their stream failed or was answered with a 401
+    :param failures: Streams that failed (their records are sent on the next one)
+    :param raw_bytes: NDJSON bytes written to streams
+    :param compressed_bytes: Bytes written to streams after compression
+    :param blocked_seconds: Time send() waited for room in the buffer
+    """
+
+    records: int = 0
+    acknowledged: int = 0
+    streams: int = 0
+    batches: int = 0
+    resent: int = 0
+    failures: int = 0
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+    blocked_seconds: float = 0.0
@@ -0,0 +1,300 @@
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import requests
+
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks
+from tn_sdk.core.resilience import CircuitBreaker, RetryBudget
+from tn_sdk.core.response_stream import StreamedResponse
+from tn_sdk.core.stats import PoolStats, TenantPoolStats
+from tn_sdk.core.tn_api import TnApi
+from tn_sdk.core.transport import InstrumentedHTTPAdapter, mount_retrying_adapter
+from tn_sdk.payload.canonical import PayloadCanonicalizer
+from tn_sdk.payload.codecs import CompressionPolicy
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.payload.validation import PayloadValidator
+from tn_sdk.utils.constants import (
+    PRODUCTION_API_URL,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TOKEN_REFRESH_AHEAD,
+    DEFAULT_TENANT_POOL_MAX_CLIENTS,
+)
+from tn_sdk.utils.validators import is_valid_base_url
+
+# Open pools, whose inherited session is replaced in forked children
+_live_pools: "weakref.WeakSet[TnApiPool]" = weakref.WeakSet()
+
+
+def _reset_pools_after_fork() -> None:
+    for pool in list(_live_pools):
+        pool._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+@dataclass(frozen=True)
+class _Tenant:
+    client_id: str
+    client_secret: str
+
+
+@dataclass
+class _TenantCounters:
+    created: int = 0
+    hits: int = 0
+    evicted: int = 0
+
+
+class TnApiPool:
+    """
+    Serves many API accounts (tenants) from one process, over a single connection pool.
+
+    Each registered tenant gets its own TnApi, with its own tokens and 401 refresh, created
+    on first use and sharing the pool's HTTP session. At most max_clients of them are kept,
+    the least recently used one being dropped (with its tokens, so its next request
+    authenticates again) to make room for another.
+    """
+
+    def __init__(
+        self,
+        *,
+        tn_api_url: str = PRODUCTION_API_URL,
+        timeout: int = 30,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        token_ttl: float | None = None,
+        refresh_ahead: float = DEFAULT_TOKEN_REFRESH_AHEAD,
+        compression_dictionary: CompressionDictionary | None = None,
+        compression: CompressionPolicy | None = None,
+        deduplicate_segments: bool = False,
+        validator: PayloadValidator | None = None,
+        canonicalizer: PayloadCanonicalizer | None = None,
+        spill_threshold: int | None = None,
+        hooks: TnApiHooks | None = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        max_clients: int = DEFAULT_TENANT_POOL_MAX_CLIENTS,
+    ):
+        """
+        Initializes the pool. The keywords are those of TnApi, applied to every tenant.
+
+        Tenants have no response cache: cached responses would be shared across accounts.
+        The hooks, retry_budget and circuit_breaker are shared by every tenant, as the
+        connections are.
+
+        :keyword max_clients: Tenant clients (and tokens) kept at once (defaults to 128)
+        """
+        if not is_valid_base_url(tn_api_url):
+            raise ValueError("Invalid API URL.")
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1.")
+
+        self._client_options = dict(
+            tn_api_url=tn_api_url,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            token_ttl=token_ttl,
+            refresh_ahead=refresh_ahead,
+            compression_dictionary=compression_dictionary,
+            compression=compression,
+            deduplicate_segments=deduplicate_segments,
+            validator=validator,
+            canonicalizer=canonicalizer,
+            spill_threshold=spill_threshold,
+            hooks=hooks,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+        )
+        self._hooks = hooks
+        self._retry_budget = retry_budget
+        self._pool_options = dict(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._keep_alive = keep_alive
+        self._max_clients = max_clients
+
+        self._lock = threading.Lock()
+        self._tenants: dict[str, _Tenant] = {}
+        # Most recently used last
+        self._clients: "OrderedDict[str, TnApi]" = OrderedDict()
+        self._stats = _TenantCounters()
+
+        self._session: requests.Session | None = None
+        self._adapter: InstrumentedHTTPAdapter | None = None
+        self._create_session()
+
+        _live_pools.add(self)
+
+    def __enter__(self) -> "TnApiPool":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the shared session and drops every tenant client.
+        """
+        _live_pools.discard(self)
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+        if self._session is not None:
+            self._session.close()
+
+    def _create_session(self) -> None:
+        """
+        Creates the HTTP session shared by the tenant clients.
+        """
+        session = requests.Session()
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        self._adapter = mount_retrying_adapter(
+            session,
+            hooks=self._hooks,
+            budget=self._retry_budget,
+            **self._pool_options,
+        )
+        self._session = session
+
+    def _reset_after_fork(self) -> None:
+        """
+        Runs in a forked child: gives the pool (and its cached clients) a new session,
+        leaving the connections inherited from the parent to it.
+        """
+        self._lock = threading.Lock()
+        self._create_session()
+        for client in self._clients.values():
+            client.session = self._session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The HTTP session shared by the tenant clients.
+        """
+        return self._session
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """
+        Connections created, reused and discarded by all the tenants so far.
+        """
+        return self._adapter.stats
+
+    @property
+    def stats(self) -> TenantPoolStats:
+        """
+        A snapshot of the pool counters.
+        """
+        with self._lock:
+            return TenantPoolStats(
+                **vars(self._stats),
+                tenants=len(self._tenants),
+                clients=len(self._clients),
+            )
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tenants
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def register(self, key: str, client_id: str, client_secret: str) -> None:
+        """
+        Adds a tenant, or replaces its API credentials.
+
+        :param key: Name requests are routed by, e.g. a customer ID
+        :param client_id: API Client ID of the tenant
+        :param client_secret: API Client Secret of the tenant
+        """
+        tenant = _Tenant(client_id, client_secret)
+        with self._lock:
+            if self._tenants.get(key) == tenant:
+                return
+            self._tenants[key] = tenant
+            client = self._clients.pop(key, None)
+        if client is not None:
+            client.close()
+
+    def unregister(self, key: str) -> None:
+        """
+        Removes a tenant and forgets its tokens.
+
+        :param key: Name the tenant was registered with
+        """
+        with self._lock:
+            del self._tenants[key]
+            client = self._clients.pop(key, None)
+        if client is not None:
+            client.close()
+
+    def client(self, key: str) -> TnApi:
+        """
+        Returns the client of a registered tenant, creating it if needed. It shares the
+        pool's session, so it doesn't need closing.
+
+        :param key: Name the tenant was registered with
+        :raises KeyError: The tenant isn't registered
+        """
+        evicted = None
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self._stats.hits += 1
+                return client
+
+            tenant = self._tenants[key]
+            client = TnApi(
+                tenant.client_id,
+                tenant.client_secret,
+                credential_store=InMemoryCredentialStore(),
+                session=self._session,
+                lazy=True,
+                **self._client_options,
+            )
+            self._clients[key] = client
+            self._stats.created += 1
+            if len(self._clients) > self._max_clients:
+                _, evicted = self._clients.popitem(last=False)
+                self._stats.evicted += 1
+        if evicted is not None:
+            # Only its tokens go, requests it has in flight finish on the shared session
+            evicted.close()
+        return client
+
+    def _request(
+        self,
+        tenant: str,
+        method: str,
+        endpoint: str,
+        token_type: TokenType = TokenType.PRODUCTION,
+        **kwargs,
+    ) -> dict | StreamedResponse:
+        """
+        Sends a request as the given tenant, see TnApi._request.
+
+        :param tenant: Name the tenant was registered with
+        :param method: HTTP method
+        :param endpoint: API endpoint
+        :param token_type: The TokenType to use for this specific request (defaults to production)
+        :param kwargs: Any additional kwargs of TnApi._request
+        """
+        return self.client(tenant)._request(method, endpoint, token_type, **kwargs)
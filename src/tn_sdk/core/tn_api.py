@@ -1,29 +1,120 @@
+import contextlib
+import functools
+import io
 import json
 import os
-import zlib
+import sys
+import threading
+import time
+import weakref
 from base64 import b64encode
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
+from tn_sdk.core.credential_store import CredentialStore, FileCredentialStore
 from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks, endpoint_path, status_code_of
+from tn_sdk.core.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    is_outage,
+    reached_api,
+)
+from tn_sdk.core.response_stream import StreamedResponse, read_spooled_json
+from tn_sdk.core.stats import HedgeStats, PoolStats, RefreshStats
+from tn_sdk.core.transport import (
+    InstrumentedHTTPAdapter,
+    carry_retry_overrides,
+    mount_retrying_adapter,
+    passthrough_statuses,
+)
 from tn_sdk.exceptions.exceptions import (
     InvalidDataException,
+    TnApiException,
     TnAuthenticationFailedException,
 )
+from tn_sdk.payload.codecs import Codec, CompressionPolicy, PreparedPayload, ZlibCodec
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.streaming import (
+    StreamablePayload,
+    compress_chunks,
+    iter_payload_bytes,
+    iter_prepared_payload,
+)
 from tn_sdk.utils.constants import (
     PRODUCTION_API_URL,
     SDK_AUTH_ENDPOINT,
     DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_TOKEN_REFRESH_AHEAD,
+    TOKEN_REFRESH_RETRY_INTERVAL,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    HEDGE_METHODS,
+    DEFAULT_SUBMIT_CONCURRENCY,
+    DEFAULT_SUBMIT_MAX_IN_FLIGHT_BYTES,
+    SUBMIT_THROTTLE_RETRIES,
+    DEFAULT_DATA_STREAM_BATCH_BYTES,
+    DEFAULT_DATA_STREAM_LINGER,
+    DEFAULT_DATA_STREAM_MAX_BUFFERED_BYTES,
+    DEFAULT_DATA_STREAM_MAX_STREAM_BYTES,
+    DEFAULT_DATA_STREAM_IDLE_TIMEOUT,
+    DATA_STREAM_MAX_FAILURES,
+    DATA_STREAM_RETRY_BACKOFF,
+    DEFAULT_SPILL_THRESHOLD,
 )
 from tn_sdk.utils.validators import is_valid_base_url
 
+if TYPE_CHECKING:
+    from tn_sdk.core.data_stream import DataStream
+    from tn_sdk.core.pipeline import AdaptiveLimiter, SubmitResult
+    from tn_sdk.core.recorder import TrafficRecorder
+    from tn_sdk.core.response_cache import ResponseCache
+    from tn_sdk.payload.batch import PreparablePayload, PrepareResult
+    from tn_sdk.payload.canonical import PayloadCanonicalizer
+    from tn_sdk.payload.spill import SpooledPayload
+    from tn_sdk.payload.validation import PayloadValidator
+
+
+# Open clients, whose inherited transport is dropped in forked children
+_live_clients: "weakref.WeakSet[TnApi]" = weakref.WeakSet()
+
+
+def _is_spooled(data) -> bool:
+    # Only a spooled payload's own module can have made one, don't import it to check
+    spill = sys.modules.get("tn_sdk.payload.spill")
+    return spill is not None and isinstance(data, spill.SpooledPayload)
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_live_clients):
+        client._reset_after_fork()
+
 
-class TnApi:
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+def _close_response(attempt: Future) -> None:
     """
-    The entrypoint to the Trip Ninja SDK. Exposes useful functionality of the Trip Ninja API to the end user.
+    Closes the response of a finished request attempt, if it got one.
+    """
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().close()
+
+
+class BaseTnApi:
+    """
+    Transport-agnostic base of the Trip Ninja SDK clients.
+
+    Holds the configuration, the credentials file handling and the payload preparation,
+    so the sync and async clients behave the same and can share one credentials file.
     """
 
     _GZIP_DEFAULT_COMPRESSION_LEVEL: int = DEFAULT_COMPRESSION_LEVEL
@@ -36,15 +127,55 @@ class TnApi:
         *,
         tn_api_url: str = PRODUCTION_API_URL,
         timeout: int = 30,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        token_ttl: float | None = None,
+        refresh_ahead: float = DEFAULT_TOKEN_REFRESH_AHEAD,
+        background_refresh: bool = False,
+        credential_store: CredentialStore | None = None,
+        compression_dictionary: CompressionDictionary | None = None,
+        compression: CompressionPolicy | None = None,
+        deduplicate_segments: bool = False,
+        validator: "PayloadValidator | None" = None,
+        canonicalizer: "PayloadCanonicalizer | None" = None,
+        spill_threshold: int | None = None,
+        hooks: TnApiHooks | None = None,
+        lazy: bool = False,
     ):
         """
-        Initializes the SDK client.
+        Validates and stores the client configuration.
 
         :param client_id: API Client ID (defaults to env TN_SDK_CLIENT_ID)
         :param client_secret: API Client Secret (defaults to env TN_SDK_CLIENT_SECRET)
         :param credential_file_path: Credentials file path (defaults to credentials.json)
         :keyword tn_api_url: Base URL for the API (defaults to the production API URL)
         :keyword timeout: Default timeout for network requests in seconds (defaults to 30)
+        :keyword connect_timeout: Timeout for establishing connections in seconds (defaults to timeout)
+        :keyword read_timeout: Timeout for waiting on response data in seconds (defaults to timeout)
+        :keyword token_ttl: Token lifetime in seconds, used when the auth response has no expiry
+        :keyword refresh_ahead: Seconds before expiry at which tokens are refreshed (defaults to 60)
+        :keyword background_refresh: Refresh tokens ahead of expiry in the background (defaults to False)
+        :keyword credential_store: Where credentials are shared with other clients
+            (defaults to a FileCredentialStore on credential_file_path)
+        :keyword compression_dictionary: Preset dictionary used to compress payloads, e.g.
+            ITINERARY_DICTIONARY_V1. Only use one the API supports (defaults to None)
+        :keyword compression: Codec (e.g. ZlibCodec(9)) or policy (e.g. AdaptiveCompressionPolicy())
+            used to compress payloads, instead of zlib at the default level with
+            compression_dictionary (defaults to None)
+        :keyword deduplicate_segments: Hoist repeated segments into a segment table before
+            compressing payloads. Only enable it once the API accepts it (defaults to False)
+        :keyword validator: Check payloads before compressing them, e.g. PayloadValidator(),
+            raising InvalidDataException on the first malformed value (defaults to None)
+        :keyword canonicalizer: Rewrite payloads as canonical JSON before compressing them,
+            e.g. PayloadCanonicalizer(). Send compression_headers() along with the data
+            when it strips fields (defaults to None)
+        :keyword spill_threshold: Memory ceiling in bytes: larger payloads are prepared
+            through a temporary file instead of in-memory buffers (defaults to None,
+            everything is kept in memory)
+        :keyword hooks: Receive the client's events, e.g. a MetricsCollector. Without hooks
+            the client skips the instrumentation (defaults to None)
+        :keyword lazy: Defer reading the stored credentials to the first request
+            (defaults to False)
         """
         self._tn_api_url = tn_api_url.rstrip("/")
         self._client_id = client_id or os.getenv("TN_SDK_CLIENT_ID", "")
@@ -53,6 +184,20 @@ class TnApi:
             credential_file_path or "credentials.json"
         ).resolve()
         self._timeout = timeout
+        self._connect_timeout = timeout if connect_timeout is None else connect_timeout
+        self._read_timeout = timeout if read_timeout is None else read_timeout
+        self._token_ttl = token_ttl
+        self._refresh_ahead = refresh_ahead
+        self._background_refresh = background_refresh
+        self._compression_dictionary = compression_dictionary
+        self._deduplicate_segments = deduplicate_segments
+        self._validator = validator
+        self._canonicalizer = canonicalizer
+        self._spill_threshold = spill_threshold
+        self._hooks = hooks
+        self._compression = compression or ZlibCodec(
+            self._GZIP_DEFAULT_COMPRESSION_LEVEL, compression_dictionary
+        )
 
         # Validate that the client_id and secret exist (non-empty values)
         if not self._client_id or not self._client_secret:
@@ -69,12 +214,573 @@ class TnApi:
         if not is_valid_base_url(self._tn_api_url):
             raise ValueError("Invalid API URL.")
 
-        # Request Session setup
-        self.session = requests.Session()
-        self._configure_network_retries()
+        self._credential_store = credential_store or FileCredentialStore(
+            self._credential_file_path
+        )
+
+        # Try to load token from the store immediately on init, unless lazy (the first
+        # request then finds no credentials and loads them)
+        self._credentials_expires_at: float | None = None
+        self._credentials_issued_at: float | None = None
+        self._credentials = {} if lazy else self._load_token_from_disk()
+        if self._credentials:
+            self._track_credentials_expiry(
+                self._credentials, self._stored_credentials_issued_at()
+            )
+        self.refresh_stats = RefreshStats()
+
+    def _load_token_from_disk(self) -> dict:
+        """
+        Reads the credentials from the credential store (the credentials file by default).
+        Returns the credentials as a dictionary. Or an empty dictionary if no credentials are found.
+        """
+        if self._hooks is None:
+            return self._credential_store.load()
+
+        started = time.perf_counter()
+        credentials = self._credential_store.load()
+        self._hooks.on_credentials_load(
+            bool(credentials), time.perf_counter() - started
+        )
+        return credentials
+
+    def _save_credentials_to_disk(self, token_data: dict) -> None:
+        """
+        Writes credentials to the credential store (the credentials file by default).
+
+        :param token_data: Token data
+        """
+        self._credential_store.save(token_data)
+
+    def _stored_credentials_issued_at(self) -> float:
+        """
+        Returns when the stored credentials were saved, which is when their tokens were issued.
+        """
+        return self._credential_store.issued_at() or time.time()
+
+    def _track_credentials_expiry(self, credentials: dict, issued_at: float) -> None:
+        """
+        Records when the given credentials expire.
+
+        Uses ``expires_at`` (epoch seconds) or ``expires_in`` (seconds) from the auth response
+        when present, falling back to the configured ``token_ttl``. Unknown otherwise.
+
+        :param credentials: The credentials that just became current
+        :param issued_at: Epoch time at which the credentials were issued
+        """
+        self._credentials_issued_at = issued_at
+        if credentials.get("expires_at"):
+            self._credentials_expires_at = float(credentials["expires_at"])
+        elif credentials.get("expires_in"):
+            self._credentials_expires_at = issued_at + float(credentials["expires_in"])
+        elif self._token_ttl:
+            self._credentials_expires_at = issued_at + self._token_ttl
+        else:
+            self._credentials_expires_at = None
+
+    def _seconds_until_refresh(self) -> float | None:
+        """
+        Returns how long the current credentials can be used before they should be refreshed.
+        None if their expiry is unknown.
+        """
+        if self._credentials_expires_at is None:
+            return None
+        # Never refresh earlier than halfway through the token's lifetime
+        lifetime = self._credentials_expires_at - self._credentials_issued_at
+        lead = min(self._refresh_ahead, lifetime / 2)
+        return self._credentials_expires_at - lead - time.time()
+
+    def _credentials_expired(self) -> bool:
+        """
+        Returns whether the current credentials are known to be past their expiry.
+        """
+        return (
+            self._credentials_expires_at is not None
+            and self._credentials_expires_at <= time.time()
+        )
+
+    def _report_token_refresh(
+        self,
+        source: str,
+        proactive: bool,
+        started: float,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Reports a token refresh that started at the given perf_counter() time to the hooks.
+        """
+        if self._hooks is not None:
+            self._hooks.on_token_refresh(
+                source, proactive, time.perf_counter() - started, error
+            )
+
+    def compression_headers(self, codec: Codec | None = None) -> dict:
+        """
+        Headers to send along with payloads prepared by this client, telling the API
+        which codec and preset compression dictionary (if any) were used, whether
+        segments were deduplicated and which fields were stripped. Empty for the default
+        zlib compression.
+
+        :param codec: The codec the payload was compressed with (its ``codec``), when a
+            compression policy picks it per payload. Defaults to the policy's default
+        """
+        if codec is None:
+            codec = self._compression.select(None)
+        headers = codec.headers()
+        if self._deduplicate_segments:
+            from tn_sdk.payload.dedup import segment_table_headers
+
+            headers.update(segment_table_headers())
+        if self._canonicalizer is not None:
+            headers.update(self._canonicalizer.headers())
+        return headers
+
+    def _auth_headers(self) -> dict:
+        """
+        Builds the headers sent to the SDK auth endpoint.
+        """
+        return {
+            "Content-Type": "application/json",
+            "X-Client-ID": self._client_id,
+            "X-Client-Secret": self._client_secret,
+        }
+
+    def prepare_data_for_generate_solutions(
+        self, json_data: str | GenerateSolutionsRequest
+    ) -> bytes:
+        """
+        This function prepares the data for generating solutions by compressing the data
+
+        :param json_data: JSON encoded data, or a GenerateSolutionsRequest which is
+            serialized straight into the compressor
+        :return: compressed bytes
+        """
+
+        return self.prepare_data_with_metadata(json_data).data
+
+    def prepare_data_with_metadata(
+        self, json_data: str | GenerateSolutionsRequest
+    ) -> PreparedPayload:
+        """
+        Same as prepare_data_for_generate_solutions, also reporting the codec the
+        compression policy chose for this payload and the resulting sizes.
+
+        :param json_data: JSON encoded data, or a GenerateSolutionsRequest
+        :return: The compressed bytes and their metadata
+        """
+        if self._validator is not None:
+            self._validator.validate(json_data)
+        if self._hooks is None:
+            return self._compress_payload(json_data)
+
+        started = time.perf_counter()
+        prepared = self._compress_payload(json_data)
+        self._hooks.on_compression(
+            prepared.codec,
+            prepared.raw_size,
+            prepared.compressed_size,
+            time.perf_counter() - started,
+        )
+        return prepared
+
+    def _compress_payload(
+        self, json_data: str | GenerateSolutionsRequest
+    ) -> PreparedPayload:
+        """
+        Deduplicates, canonicalizes, serializes and compresses a payload for
+        prepare_data_with_metadata.
+        """
+        if isinstance(json_data, (str, GenerateSolutionsRequest)):
+            json_data = self._rewrite_payload(json_data)
+
+        if self._spills(json_data):
+            # Only the output is held whole, the JSON is fed to the compressor in chunks
+            with self._spool_payload(json_data) as spooled:
+                return spooled.to_prepared()
+
+        if isinstance(json_data, GenerateSolutionsRequest):
+            # Its size is unknown until serialized, so policies pick their default codec
+            codec = self._compression.select(None)
+            compressed_data, raw_size = compress_chunks(
+                iter_payload_bytes(json_data), codec
+            )
+            return PreparedPayload(
+                data=b64encode(compressed_data),
+                codec=codec,
+                raw_size=raw_size,
+                compressed_size=len(compressed_data),
+            )
+
+        if not isinstance(json_data, str):
+            raise InvalidDataException("Input must be a JSON-encoded string")
+
+        raw_data = json_data.encode("utf-8")
+        codec = self._compression.select(len(raw_data))
+        compressed_data = codec.compress(raw_data)
+        return PreparedPayload(
+            data=b64encode(compressed_data),
+            codec=codec,
+            raw_size=len(raw_data),
+            compressed_size=len(compressed_data),
+        )
+
+    def _rewrite_payload(
+        self, json_data: str | dict | GenerateSolutionsRequest
+    ) -> str | dict | GenerateSolutionsRequest:
+        """
+        Deduplicates and canonicalizes a payload as configured, returning it as a JSON
+        encoded str if it was rewritten.
+        """
+        if self._deduplicate_segments:
+            from tn_sdk.payload.dedup import deduplicate_payload
+
+            json_data = deduplicate_payload(json_data)
+            if self._canonicalizer is None:
+                json_data = json.dumps(json_data)
+        if self._canonicalizer is not None:
+            json_data = self._canonicalizer.canonicalize(json_data)
+        return json_data
+
+    def _spills(self, json_data) -> bool:
+        """
+        Returns whether a payload is prepared through a temporary file: JSON strings
+        larger than spill_threshold, and request models, whose size is unknown until
+        serialized (the spool keeps them in memory under the threshold).
+        """
+        if self._spill_threshold is None:
+            return False
+        if isinstance(json_data, str):
+            return len(json_data) > self._spill_threshold
+        return isinstance(json_data, GenerateSolutionsRequest)
+
+    def _spool_payload(self, json_data) -> "SpooledPayload":
+        """
+        Compresses a (rewritten) payload into a SpooledPayload, with the codec
+        _compress_payload would pick for it.
+        """
+        from tn_sdk.payload.spill import spool_prepared_payload
+
+        if isinstance(json_data, str):
+            # ASCII strings are as long as their UTF-8 encoding, don't encode them to know
+            size = (
+                len(json_data)
+                if json_data.isascii()
+                else len(json_data.encode("utf-8"))
+            )
+            codec = self._compression.select(size)
+        elif isinstance(json_data, GenerateSolutionsRequest) or hasattr(
+            json_data, "read"
+        ):
+            codec = self._compression.select(None)
+        else:
+            raise InvalidDataException(
+                "Input must be a JSON-encoded string or a file object"
+            )
+        return spool_prepared_payload(
+            json_data, codec, self._spill_threshold or DEFAULT_SPILL_THRESHOLD
+        )
+
+    def spool_data_for_generate_solutions(
+        self, json_data: str | GenerateSolutionsRequest | io.IOBase
+    ) -> "SpooledPayload":
+        """
+        Same as prepare_data_with_metadata, writing the prepared payload to a
+        SpooledTemporaryFile instead of returning it as bytes: it stays in memory up to
+        spill_threshold bytes (64MB without one) and spills to disk past it. Its bytes are
+        identical to prepare_data_for_generate_solutions.
+
+        The JSON is compressed chunk by chunk, so with a file object as input memory stays
+        flat whatever the payload size. File objects are read as they are, without
+        validation, and can't be deduplicated nor canonicalized.
+
+        :param json_data: JSON encoded data, a GenerateSolutionsRequest, or a file object
+            (text or binary) of JSON
+        :return: The spooled payload, to send as a request body or read. Close it when done
+        """
+        if self._validator is not None and isinstance(
+            json_data, (str, GenerateSolutionsRequest)
+        ):
+            self._validator.validate(json_data)
+        # Like the in-memory path, only decoded JSON is rewritten: files are sent as is
+        if isinstance(json_data, (str, GenerateSolutionsRequest)):
+            json_data = self._rewrite_payload(json_data)
+        if self._hooks is None:
+            return self._spool_payload(json_data)
+
+        started = time.perf_counter()
+        spooled = self._spool_payload(json_data)
+        self._hooks.on_compression(
+            spooled.codec,
+            spooled.raw_size,
+            spooled.compressed_size,
+            time.perf_counter() - started,
+        )
+        return spooled
+
+    def iter_prepare_data_for_generate_solutions(
+        self,
+        data: StreamablePayload,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Streaming variant of prepare_data_for_generate_solutions for very large payloads.
+
+        Compresses and encodes the data incrementally, so peak memory is bounded by chunk_size
+        instead of the payload size. The yielded chunks can be passed directly as a streaming
+        request body, and joined they are byte-identical to prepare_data_for_generate_solutions.
+
+        :param data: A dict, a JSON encoded str, bytes/memoryview, a file object,
+            or an iterable of JSON chunks. Only dicts, str, bytes and
+            GenerateSolutionsRequests are checked by the validator, as a whole, and file
+            objects and iterables can't be deduplicated
+        :param chunk_size: Approximate size of the chunks fed to the compressor
+        :return: Iterator of compressed bytes chunks
+        """
+        if self._validator is not None and isinstance(
+            data, (str, bytes, dict, GenerateSolutionsRequest)
+        ):
+            self._validator.validate(data)
+        if self._deduplicate_segments:
+            from tn_sdk.payload.dedup import deduplicate_payload
+
+            data = deduplicate_payload(data)
+        if self._canonicalizer is not None and isinstance(
+            data, (str, bytes, dict, GenerateSolutionsRequest)
+        ):
+            data = self._canonicalizer.canonicalize(data)
+
+        # The size of a stream isn't known up front, so policies pick their default
+        return iter_prepared_payload(
+            data,
+            chunk_size=chunk_size,
+            codec=self._compression.select(None),
+        )
+
+    def prepare_many(
+        self,
+        payloads: "Iterable[PreparablePayload]",
+        workers: int | None = None,
+        executor: Executor | None = None,
+        *,
+        serialize_in_processes: bool = False,
+        lazy: bool = False,
+    ) -> "list[PrepareResult] | Iterator[PrepareResult]":
+        """
+        Prepares many payloads for generating solutions in parallel.
+
+        Compression runs in a thread pool (zlib releases the GIL), results keep the input
+        order, and a payload that can't be prepared doesn't abort the batch: its slot holds
+        the InvalidDataException instead.
+
+        :param payloads: JSON encoded strings, dicts and/or GenerateSolutionsRequests
+        :param workers: Number of workers (defaults to the CPU count)
+        :param executor: Executor used instead of an internal thread pool (e.g. a
+            ProcessPoolExecutor). It is not shut down.
+        :keyword serialize_in_processes: Serialize dict payloads to JSON in a process pool
+            (a ProcessPoolExecutor executor already does, so it is ignored then)
+        :keyword lazy: Return an iterator preparing payloads as it is consumed, with a
+            bounded number in flight, instead of a list
+        :return: For each payload, the compressed bytes or an InvalidDataException
+        """
+        results = self._iter_prepare_many(
+            payloads, workers or os.cpu_count() or 1, executor, serialize_in_processes
+        )
+        return results if lazy else list(results)
+
+    def _iter_prepare_many(
+        self,
+        payloads: "Iterable[PreparablePayload]",
+        workers: int,
+        executor: Executor | None,
+        serialize_in_processes: bool,
+    ) -> "Iterator[PrepareResult]":
+        """
+        Runs prepare_many, owning (and shutting down) any pools it had to create.
+        """
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="tn-sdk-prepare"
+                    )
+                )
+            serializer = None
+            if serialize_in_processes:
+                # Imported here, multiprocessing is slow to import and rarely needed
+                from concurrent.futures import ProcessPoolExecutor
+
+                # A process pool executor already serializes payloads in its processes
+                if not isinstance(executor, ProcessPoolExecutor):
+                    serializer = stack.enter_context(
+                        ProcessPoolExecutor(max_workers=workers)
+                    )
+
+            from tn_sdk.payload.batch import iter_prepare_many
+
+            yield from iter_prepare_many(
+                payloads,
+                executor,
+                max_pending=workers * 2,
+                serializer=serializer,
+                compression=self._compression,
+                deduplicate=self._deduplicate_segments,
+                validator=self._validator,
+                canonicalizer=self._canonicalizer,
+            )
+
+
+class TnApi(BaseTnApi):
+    """
+    The entrypoint to the Trip Ninja SDK. Exposes useful functionality of the Trip Ninja API to the end user.
+    """
+
+    def __init__(
+        self,
+        client_id: str | None = None,
+        client_secret: str | None = None,
+        credential_file_path: str = "credentials.json",
+        *,
+        tn_api_url: str = PRODUCTION_API_URL,
+        timeout: int = 30,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        token_ttl: float | None = None,
+        refresh_ahead: float = DEFAULT_TOKEN_REFRESH_AHEAD,
+        background_refresh: bool = False,
+        credential_store: CredentialStore | None = None,
+        compression_dictionary: CompressionDictionary | None = None,
+        compression: CompressionPolicy | None = None,
+        deduplicate_segments: bool = False,
+        validator: "PayloadValidator | None" = None,
+        canonicalizer: "PayloadCanonicalizer | None" = None,
+        spill_threshold: int | None = None,
+        hooks: TnApiHooks | None = None,
+        response_cache: "ResponseCache | None" = None,
+        retry_budget: RetryBudget | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedge_after: float | None = None,
+        recorder: "TrafficRecorder | None" = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: requests.Session | None = None,
+        lazy: bool = False,
+    ):
+        """
+        Initializes the SDK client.
+
+        :param client_id: API Client ID (defaults to env TN_SDK_CLIENT_ID)
+        :param client_secret: API Client Secret (defaults to env TN_SDK_CLIENT_SECRET)
+        :param credential_file_path: Credentials file path (defaults to credentials.json)
+        :keyword tn_api_url: Base URL for the API (defaults to the production API URL)
+        :keyword timeout: Default timeout for network requests in seconds (defaults to 30)
+        :keyword connect_timeout: Timeout for establishing connections in seconds (defaults to timeout)
+        :keyword read_timeout: Timeout for waiting on response data in seconds (defaults to timeout)
+        :keyword token_ttl: Token lifetime in seconds, used when the auth response has no expiry
+        :keyword refresh_ahead: Seconds before expiry at which tokens are refreshed (defaults to 60)
+        :keyword background_refresh: Refresh tokens ahead of expiry in the background (defaults to False)
+        :keyword credential_store: Where credentials are shared with other clients
+            (defaults to a FileCredentialStore on credential_file_path)
+        :keyword compression_dictionary: Preset dictionary used to compress payloads, e.g.
+            ITINERARY_DICTIONARY_V1. Only use one the API supports (defaults to None)
+        :keyword compression: Codec (e.g. ZlibCodec(9)) or policy (e.g. AdaptiveCompressionPolicy())
+            used to compress payloads, instead of zlib at the default level with
+            compression_dictionary (defaults to None)
+        :keyword deduplicate_segments: Hoist repeated segments into a segment table before
+            compressing payloads. Only enable it once the API accepts it (defaults to False)
+        :keyword validator: Check payloads before compressing them, e.g. PayloadValidator(),
+            raising InvalidDataException on the first malformed value (defaults to None)
+        :keyword canonicalizer: Rewrite payloads as canonical JSON before compressing them,
+            e.g. PayloadCanonicalizer(). Send compression_headers() along with the data
+            when it strips fields (defaults to None)
+        :keyword spill_threshold: Memory ceiling in bytes: larger payloads are prepared
+            through a temporary file instead of in-memory buffers (and uploaded from it by
+            submit_many), and larger responses are read through one (defaults to None,
+            everything is kept in memory)
+        :keyword hooks: Receive the client's events, e.g. a MetricsCollector. Without hooks
+            the client skips the instrumentation (defaults to None)
+        :keyword response_cache: Cache answering identical requests made with cache=True,
+            e.g. ResponseCache(ttl=30) (defaults to None)
+        :keyword retry_budget: Only retry failing requests (429/5xx, connection errors) while
+            this budget allows, e.g. RetryBudget(ratio=0.1). Without one every request is
+            retried up to 3 times (defaults to None)
+        :keyword circuit_breaker: Fail requests fast with CircuitOpenException while their
+            endpoint keeps failing, e.g. CircuitBreaker(failure_threshold=5) (defaults to None)
+        :keyword hedge_after: Seconds after which a GET still unanswered is sent a second
+            time, the first response winning. Hedges are paid from retry_budget when there
+            is one (defaults to None, no hedging)
+        :keyword recorder: Append every request sent by _request to a trace, e.g.
+            TrafficRecorder("trace.jsonl.gz"), for tn_sdk.benchmarks.replay. It is not
+            closed with the client (defaults to None)
+        :keyword pool_connections: Number of per-host connection pools kept (defaults to 10)
+        :keyword pool_maxsize: Maximum connections kept open per host. Set it to at least the
+            number of threads sharing this client (defaults to 10)
+        :keyword pool_block: Make requests wait for a free connection when pool_maxsize are in
+            use, instead of opening extra ones that are discarded after use (defaults to False)
+        :keyword keep_alive: Keep connections open between requests (defaults to True)
+        :keyword session: HTTP session shared with other clients, e.g. by TnApiPool. It is
+            used as is (the pool options above are ignored) and not closed with this client
+            (defaults to None, the client creates its own)
+        :keyword lazy: Defer creating the HTTP session and reading the stored credentials
+            to the first request, for short-lived processes (defaults to False)
+        """
+        super().__init__(
+            client_id,
+            client_secret,
+            credential_file_path,
+            tn_api_url=tn_api_url,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            token_ttl=token_ttl,
+            refresh_ahead=refresh_ahead,
+            background_refresh=background_refresh,
+            credential_store=credential_store,
+            compression_dictionary=compression_dictionary,
+            compression=compression,
+            deduplicate_segments=deduplicate_segments,
+            validator=validator,
+            canonicalizer=canonicalizer,
+            spill_threshold=spill_threshold,
+            hooks=hooks,
+            lazy=lazy,
+        )
+        self._response_cache = response_cache
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+        self._hedge_after = hedge_after
+        self._recorder = recorder
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_lock = threading.Lock()
+        self.hedge_stats = HedgeStats()
 
-        # Try to load token from file immediately on init
-        self._credentials = self._load_token_from_disk()
+        # Request Session setup, on first use when lazy
+        self._pool_options = dict(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._keep_alive = keep_alive
+        self._session: requests.Session | None = session
+        self._owns_session = session is None
+        self._adapter: InstrumentedHTTPAdapter | None = None
+        self._session_lock = threading.Lock()
+        if self._owns_session and not lazy:
+            self._create_session()
+
+        # (connect, read) as requests expects them
+        self._request_timeout = (self._connect_timeout, self._read_timeout)
+
+        # Serializes token refreshes across threads sharing this client
+        self._refresh_lock = threading.Lock()
+
+        self._refresh_thread: threading.Thread | None = None
+        self._refresh_stop = threading.Event()
+        if self._background_refresh:
+            self._start_background_refresh()
+
+        _live_clients.add(self)
 
     def __enter__(self):
         return self
@@ -84,67 +790,148 @@ class TnApi:
 
     def close(self):
         """
-        Closes the SDK client's session.
+        Closes the SDK client's session and stops the background token refresh.
+        """
+        _live_clients.discard(self)
+        self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=self._timeout)
+            self._refresh_thread = None
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
+        if self._session is not None and self._owns_session:
+            self._session.close()
+
+    def _reset_after_fork(self) -> None:
+        """
+        Runs in a forked child (e.g. a gunicorn worker): drops the connections, locks and
+        threads inherited from the parent, keeping the configuration and the credentials.
+        The session is then rebuilt on first use.
+        """
+        # Sockets of pooled connections are shared with the parent, never reuse them.
+        # They are left open for the parent rather than closed. A shared session is
+        # replaced by its owner
+        if self._owns_session:
+            self._session = None
+            self._adapter = None
+        # Locks may have been held by parent threads, which don't exist in the child
+        self._session_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._hedge_lock = threading.Lock()
+        self._hedge_executor = None
+
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
+        if self._background_refresh:
+            self._start_background_refresh()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The HTTP session of this client, created on first use when lazy.
         """
-        self.session.close()
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._create_session()
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
 
-    def _configure_network_retries(self):
-        """Configures retries for network blips (not 401s)."""
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST"],
+    def _create_session(self) -> None:
+        """
+        Creates the HTTP session, with its retries and connection pools.
+        """
+        session = requests.Session()
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        self._adapter = self._configure_network_retries(session, **self._pool_options)
+        self._session = session
+
+    def _start_background_refresh(self) -> None:
+        """
+        Starts the daemon thread that refreshes the tokens ahead of their expiry.
+        """
+        self._refresh_thread = threading.Thread(
+            target=self._background_refresh_loop,
+            name="tn-sdk-token-refresh",
+            daemon=True,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
+        self._refresh_thread.start()
 
-    def _load_token_from_disk(self) -> dict:
+    def _background_refresh_loop(self) -> None:
         """
-        Reads the credential file safely.
-        Returns the credentials as a dictionary. Or an empty dictionary if no credentials are found.
+        Sleeps until the current tokens are about to expire, then replaces them.
+
+        Requests keep using the current tokens while the refresh runs. Failures are retried
+        shortly after, and the 401 path in _request remains the fallback.
         """
-        if not self._credential_file_path.exists():
-            return {}
+        while True:
+            delay = self._seconds_until_refresh()
+            if delay is None:
+                # Expiry unknown (no tokens yet, or no expiry information)
+                delay = self._refresh_ahead
+            if self._refresh_stop.wait(max(delay, 0)):
+                return
+            if self._seconds_until_refresh() is None:
+                continue
 
-        try:
-            text = self._credential_file_path.read_text(encoding="utf-8")
-            data = json.loads(text)
-            return data
-        except (json.JSONDecodeError, OSError):
-            # If file is corrupt or unreadable, ignore it and treat as no credentials
-            return {}
+            try:
+                self._refresh_credentials(self._credentials, proactive=True)
+            except TnApiException:
+                if self._refresh_stop.wait(TOKEN_REFRESH_RETRY_INTERVAL):
+                    return
 
-    def _save_credentials_to_disk(self, token_data: dict) -> None:
+    def _configure_network_retries(
+        self,
+        session: requests.Session,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> InstrumentedHTTPAdapter:
+        """
+        Configures retries for network blips (not 401s) and connection pooling,
+        for both schemes tn_api_url can use.
         """
-        Writes credentials to disk ATOMICALLY.
-        This prevents partial writes if the process crashes or two processes write at once.
+        return mount_retrying_adapter(
+            session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            hooks=self._hooks,
+            budget=self._retry_budget,
+        )
 
-        :param token_data: Token data
+    @property
+    def pool_stats(self) -> PoolStats:
         """
-        temp_path = self._credential_file_path.with_suffix(".tmp")
-        try:
-            temp_path.write_text(json.dumps(token_data, indent=4), encoding="utf-8")
+        Connections created, reused and discarded by this client so far. Many discards
+        mean pool_maxsize is lower than the number of concurrent requests.
+        """
+        if self._adapter is None:
+            return PoolStats()
+        return self._adapter.stats
 
-            temp_path.replace(self._credential_file_path)
-        except OSError:
-            # If we lack permissions, we just skip saving but keep the token in memory
-            pass
+    @property
+    def response_cache(self) -> "ResponseCache | None":
+        """
+        The cache answering requests made with cache=True, if any.
+        """
+        return self._response_cache
 
     def _fetch_new_credentials_from_api(self) -> str:
         """
         Calls the API to get the latest credentials.
         """
-        headers = {
-            "Content-Type": "application/json",
-            "X-Client-ID": self._client_id,
-            "X-Client-Secret": self._client_secret,
-        }
+        headers = self._auth_headers()
         url = f"{self._tn_api_url}{SDK_AUTH_ENDPOINT}"
 
         try:
             response = self.session.post(
-                url=url, headers=headers, timeout=self._timeout
+                url=url, headers=headers, timeout=self._request_timeout
             )
             response.raise_for_status()
 
@@ -163,80 +950,499 @@ class TnApi:
 
             raise TnAuthenticationFailedException(msg) from err
 
+    def _refresh_credentials(
+        self, stale_credentials: dict, proactive: bool = False
+    ) -> dict:
+        """
+        Replaces the given stale credentials, performing at most one refresh at a time.
+
+        Concurrent callers block until the refresh in progress finishes. If the credentials
+        were already replaced while waiting, the newer ones are reused (coalesced) instead
+        of hitting the disk or the API again.
+
+        :param stale_credentials: The credentials the caller used (or found empty)
+        :param proactive: Whether this refresh runs ahead of expiry rather than after a failure
+        :return: Fresh credentials
+        """
+        started = time.perf_counter()
+        source, error = "store", None
+        try:
+            with self._refresh_lock:
+                if self._credentials and self._credentials is not stale_credentials:
+                    self.refresh_stats.coalesced += 1
+                    source = "coalesced"
+                    return self._credentials
+
+                # Only one process on the host refreshes, the others then read its result
+                with self._credential_store.lock():
+                    disk_token = self._load_token_from_disk()
+
+                    if disk_token and disk_token != stale_credentials:
+                        issued_at = self._stored_credentials_issued_at()
+                        self._credentials = disk_token
+                    else:
+                        source = "api"
+                        issued_at = time.time()
+                        self._credentials = self._fetch_new_credentials_from_api()
+
+                self._track_credentials_expiry(self._credentials, issued_at)
+                self.refresh_stats.performed += 1
+                if proactive:
+                    self.refresh_stats.proactive += 1
+                return self._credentials
+        except Exception as err:
+            error = err
+            raise
+        finally:
+            self._report_token_refresh(source, proactive, started, error)
+
     def _request(
         self,
         method: str,
         endpoint: str,
         token_type: TokenType = TokenType.PRODUCTION,
+        *,
+        cache: bool = False,
+        stream: bool = False,
+        hedge: bool | None = None,
         **kwargs,
-    ) -> dict:
+    ) -> dict | StreamedResponse:
         """
-        Central internal request handler
+        Central internal request handler. Safe to call from multiple threads.
 
         Handles:
-        - Refreshing token
+        - Refreshing token (known-expired tokens up front, a 401 storm with a single refresh)
         - Setting headers
         - Parsing the response JSON
+        - Answering identical requests from the response cache, when asked to
+        - Reading the response JSON lazily, when asked to
+        - Reading responses larger than spill_threshold through a temporary file
+        - Hedging slow idempotent requests, failing fast on failing endpoints
 
         :param method: HTTP method
         :param endpoint: API endpoint
         :param token_type: The TokenType to use for this specific request (defaults to production)
+        :keyword cache: Answer from the client's response_cache when the same request (body,
+            endpoint, token type...) succeeded recently, and share identical requests in
+            flight. Ignored without a response_cache or with a streamed body (defaults to False)
+        :keyword stream: Return a StreamedResponse as soon as the headers arrive, reading and
+            decoding the body as it is consumed, e.g. one item of a large array at a time.
+            Not cached nor hedged (defaults to False)
+        :keyword hedge: Send the request again if it is unanswered after the client's
+            hedge_after, only set it for idempotent requests (defaults to hedging GETs)
         :param kwargs: Any additional kwargs to pass to the request
 
-        :return: JSON response
+        :return: JSON response, or a StreamedResponse to read it from
+        """
+        send = self._observed_request
+        if stream:
+            if self._recorder is not None:
+                send = functools.partial(self._recorded_request, send)
+            return StreamedResponse(
+                send(method, endpoint, token_type, stream=True, **kwargs)
+            )
+
+        if (
+            self._hedge_after is not None
+            and not isinstance(kwargs.get("data"), Iterator)
+            and not _is_spooled(kwargs.get("data"))
+        ):
+            if method.upper() in HEDGE_METHODS if hedge is None else hedge:
+                send = self._hedged_request
+        if self._recorder is not None:
+            send = functools.partial(self._recorded_request, send)
+
+        if cache and self._response_cache is not None:
+            from tn_sdk.core.response_cache import response_cache_key
+
+            key = response_cache_key(method, endpoint, token_type, kwargs)
+            if key is not None:
+                body = self._response_cache.get_or_load(
+                    key,
+                    lambda: send(method, endpoint, token_type, **kwargs).content,
+                )
+                return json.loads(body)
+
+        if self._spill_threshold is not None:
+            return read_spooled_json(
+                send(method, endpoint, token_type, stream=True, **kwargs),
+                self._spill_threshold,
+            )
+        return send(method, endpoint, token_type, **kwargs).json()
+
+    def _recorded_request(
+        self,
+        send: Callable[..., requests.Response],
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends a request for _request with send, handing it to the recorder once done.
         """
-        if not self._credentials:
-            self._credentials = self._fetch_new_credentials_from_api()
+        started_at = time.time()
+        started = time.perf_counter()
+        response = error = None
+        try:
+            response = send(method, endpoint, token_type, **kwargs)
+            return response
+        except Exception as err:
+            error = err
+            response = getattr(err, "response", None)
+            raise
+        finally:
+            response_bytes = None
+            if response is not None:
+                if kwargs.get("stream") and response.ok:
+                    # Don't read a body the caller is going to stream
+                    length = response.headers.get("Content-Length")
+                    response_bytes = int(length) if length else None
+                else:
+                    response_bytes = len(response.content)
+            self._recorder.record(
+                method,
+                endpoint,
+                token_type,
+                kwargs,
+                response.status_code if response is not None else None,
+                time.perf_counter() - started,
+                response_bytes,
+                error,
+                started_at,
+            )
+
+    def _hedged_request(
+        self, method: str, endpoint: str, token_type: TokenType, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request for _request, and sends it again if the first attempt is still
+        unanswered after hedge_after seconds. Returns the first successful response.
+        """
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    thread_name_prefix="tn-sdk-hedge"
+                )
+            executor = self._hedge_executor
+
+        # The attempts run on the executor's threads, with this thread's retry overrides
+        send = carry_retry_overrides(self._observed_request)
+        first = executor.submit(send, method, endpoint, token_type, **kwargs)
+        try:
+            return first.result(timeout=self._hedge_after)
+        except FutureTimeoutError:
+            pass
+        if self._retry_budget is not None and not self._retry_budget.try_spend():
+            return first.result()
+
+        second = executor.submit(send, method, endpoint, token_type, **kwargs)
+        with self._hedge_lock:
+            self.hedge_stats.sent += 1
+
+        attempts = {first, second}
+        error = None
+        for attempt in as_completed(attempts):
+            if attempt.exception() is None:
+                break
+            error = error or attempt.exception()
+        else:
+            raise error
+
+        attempts.remove(attempt)
+        # The slower attempt's response is dropped, releasing its connection
+        attempts.pop().add_done_callback(_close_response)
+        if attempt is second:
+            with self._hedge_lock:
+                self.hedge_stats.won += 1
+        return attempt.result()
+
+    def _observed_request(
+        self, method: str, endpoint: str, token_type: TokenType, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request for _request, reporting it to the hooks.
+        """
+        if self._hooks is None:
+            return self._guarded_request(method, endpoint, token_type, **kwargs)
+
+        path = endpoint_path(endpoint)
+        self._hooks.on_request_start(method, path, token_type)
+        started = time.perf_counter()
+        status_code = error = None
+        try:
+            response = self._guarded_request(method, endpoint, token_type, **kwargs)
+            status_code = response.status_code
+            return response
+        except Exception as err:
+            error = err
+            status_code = status_code or status_code_of(err)
+            raise
+        finally:
+            self._hooks.on_request_end(
+                method,
+                path,
+                token_type,
+                status_code,
+                time.perf_counter() - started,
+                error,
+            )
+
+    def _guarded_request(
+        self, method: str, endpoint: str, token_type: TokenType, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request for _request through the circuit breaker, feeding the retry budget.
+        """
+        if self._circuit_breaker is None and self._retry_budget is None:
+            return self._send_request(method, endpoint, token_type, **kwargs)
+
+        circuit = endpoint_path(endpoint)
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request(circuit)
+        try:
+            response = self._send_request(method, endpoint, token_type, **kwargs)
+        except Exception as err:
+            if self._circuit_breaker is not None:
+                if is_outage(err):
+                    self._circuit_breaker.record_failure(circuit)
+                elif reached_api(err):
+                    self._circuit_breaker.record_success(circuit)
+                else:
+                    # Says nothing of the API's health
+                    self._circuit_breaker.record_abort(circuit)
+            raise
+        except BaseException:
+            # Interrupted, a probe must not be left in flight forever
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.record_abort(circuit)
+            raise
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record_success(circuit)
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        return response
+
+    def _send_request(
+        self, method: str, endpoint: str, token_type: TokenType, **kwargs
+    ) -> requests.Response:
+        """
+        Sends a request for _request, refreshing the token as needed.
+
+        :return: The successful response
+        """
+        credentials = self._credentials
+        if not credentials or self._credentials_expired():
+            # Skip the round trip that would only come back with a 401
+            credentials = self._refresh_credentials(credentials)
 
         url = f"{self._tn_api_url}{endpoint}"
-        token = self._credentials[token_type.value]
+        token = credentials[token_type.value]
 
-        headers = kwargs.get("headers", {})
+        # Copy the headers so concurrent callers sharing a dict don't overwrite each other
+        headers = dict(kwargs.get("headers") or {})
         headers["Authorization"] = f"Token {token}"
         kwargs["headers"] = headers
 
-        response = self.session.request(method, url, timeout=self._timeout, **kwargs)
+        response = self.session.request(
+            method, url, timeout=self._request_timeout, **kwargs
+        )
 
         if response.status_code == 401:
-            # Token expired.
-            disk_token = self._load_token_from_disk()
+            # Token expired, or was already superseded by a concurrent refresh.
+            credentials = self._refresh_credentials(credentials)
 
-            if disk_token and disk_token != self._credentials:
-                self._credentials = disk_token
-            else:
-                self._credentials = self._fetch_new_credentials_from_api()
+            if _is_spooled(kwargs.get("data")):
+                # A spooled body is read again from its start
+                kwargs["data"].seek(0)
+            elif isinstance(kwargs.get("data"), Iterator):
+                # A streamed body was consumed by the first attempt and can't be replayed,
+                # the caller has to send it again (with the refreshed token).
+                response.raise_for_status()
+
+            # Release the connection of a streamed response before sending the retry
+            response.close()
 
             # Retry the request with the new token
-            token = self._credentials[token_type.value]
+            token = credentials[token_type.value]
             headers["Authorization"] = f"Token {token}"
-            kwargs["headers"] = headers
             response = self.session.request(
-                method, url, timeout=self._timeout, **kwargs
+                method, url, timeout=self._request_timeout, **kwargs
             )
 
+        if kwargs.get("stream") and not response.ok:
+            # Read the error body, which releases the connection of a streamed response
+            response.content
         response.raise_for_status()
-        return response.json()
+        return response
 
-    def prepare_data_for_generate_solutions(self, json_data: str) -> bytes:
+    def authenticate(self) -> None:
         """
-        This function prepares the data for generating solutions by compressing the data
+        Retrieves and stores the latest tokens from the API
+        :return: None (updates the file and state in place)
+        """
+        self._fetch_new_credentials_from_api()
 
-        :param json_data: JSON encoded data
-        :return: compressed bytes
+    def open_data_stream(
+        self,
+        endpoint: str,
+        *,
+        batch_bytes: int = DEFAULT_DATA_STREAM_BATCH_BYTES,
+        linger: float = DEFAULT_DATA_STREAM_LINGER,
+        max_buffered_bytes: int = DEFAULT_DATA_STREAM_MAX_BUFFERED_BYTES,
+        max_stream_bytes: int = DEFAULT_DATA_STREAM_MAX_STREAM_BYTES,
+        idle_timeout: float = DEFAULT_DATA_STREAM_IDLE_TIMEOUT,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_failures: int = DATA_STREAM_MAX_FAILURES,
+        retry_backoff: float = DATA_STREAM_RETRY_BACKOFF,
+    ) -> "DataStream":
         """
+        Opens a data stream sending records continuously to endpoint, as NDJSON over
+        long-lived chunked requests authenticated with the DATA_STREAM token (see
+        DataStream). Close it (or use it as a context manager) to send the last records.
 
-        if not isinstance(json_data, str):
-            raise InvalidDataException("Input must be a JSON-encoded string")
+        :param endpoint: API endpoint receiving the records
+        :keyword batch_bytes: Records written to the stream at once (defaults to 64KB)
+        :keyword linger: Seconds a batch waits for more records before being written
+            (defaults to 0.05)
+        :keyword max_buffered_bytes: Records buffered before send() blocks (defaults to 8MB)
+        :keyword max_stream_bytes: Records sent on a stream before it is ended and they are
+            acknowledged, also the most kept for sending again (defaults to 16MB)
+        :keyword idle_timeout: Seconds a stream is kept open without records (defaults to 5)
+        :keyword compression_level: zlib level the stream is compressed at (defaults to 6)
+        :keyword max_failures: Failed streams in a row before giving up (defaults to 5)
+        :keyword retry_backoff: Seconds before the first new stream after a failure,
+            doubling on each one in a row (defaults to 0.5)
+        :return: The DataStream
+        """
+        from tn_sdk.core.data_stream import DataStream
 
-        compressed_data = zlib.compress(
-            json_data.encode("utf-8"), level=self._GZIP_DEFAULT_COMPRESSION_LEVEL
+        return DataStream(
+            self,
+            endpoint,
+            batch_bytes=batch_bytes,
+            linger=linger,
+            max_buffered_bytes=max_buffered_bytes,
+            max_stream_bytes=max_stream_bytes,
+            idle_timeout=idle_timeout,
+            compression_level=compression_level,
+            max_failures=max_failures,
+            retry_backoff=retry_backoff,
         )
-        encoded_compressed_response = b64encode(compressed_data)
-        return encoded_compressed_response
 
-    def authenticate(self) -> None:
+    def submit_many(
+        self,
+        payloads: "Iterable[PreparablePayload]",
+        endpoint: str,
+        *,
+        method: str = "POST",
+        token_type: TokenType = TokenType.PRODUCTION,
+        concurrency: int = DEFAULT_SUBMIT_CONCURRENCY,
+        max_in_flight_bytes: int = DEFAULT_SUBMIT_MAX_IN_FLIGHT_BYTES,
+        ordered: bool = True,
+        limiter: "AdaptiveLimiter | None" = None,
+    ) -> "Iterator[SubmitResult]":
         """
-        Retrieves and stores the latest tokens from the API
-        :return: None (updates the file and state in place)
+        Prepares and sends many generate-solutions payloads, a bounded number at a time.
+
+        Payloads are pulled from the input only as fast as they are sent, so it can be a
+        lazy iterable of any length. A 429 pauses and slows down the whole pipeline (see
+        AdaptiveLimiter) before the throttled payload is sent again, instead of each
+        request backing off on its own. A payload that fails doesn't abort the others:
+        its result holds the error.
+
+        :param payloads: JSON encoded strings, dicts and/or GenerateSolutionsRequests
+        :param endpoint: API endpoint the prepared payloads are sent to
+        :keyword method: HTTP method (defaults to POST)
+        :keyword token_type: The TokenType to send them with (defaults to production)
+        :keyword concurrency: Most requests in flight at once (defaults to 8)
+        :keyword max_in_flight_bytes: Most prepared bytes in flight at once (defaults to 32MB)
+        :keyword ordered: Yield results in input order, instead of as they complete
+            (defaults to True)
+        :keyword limiter: Share the pacing of another pipeline, instead of concurrency and
+            max_in_flight_bytes (defaults to None)
+        :return: Iterator of SubmitResult, one per payload
         """
-        self._fetch_new_credentials_from_api()
+        from tn_sdk.core.pipeline import AdaptiveLimiter, iter_submit
+
+        if limiter is None:
+            limiter = AdaptiveLimiter(concurrency, max_in_flight_bytes)
+        return iter_submit(
+            payloads,
+            functools.partial(
+                self._submit_payload, limiter, method, endpoint, token_type
+            ),
+            limiter.max_concurrency,
+            ordered,
+        )
+
+    def _submit_payload(
+        self,
+        limiter: "AdaptiveLimiter",
+        method: str,
+        endpoint: str,
+        token_type: TokenType,
+        index: int,
+        payload: "PreparablePayload",
+    ) -> "SubmitResult":
+        """
+        Prepares and sends one payload for submit_many, sending it again while throttled.
+        """
+        from tn_sdk.core.pipeline import SubmitResult, retry_after_seconds
+        from tn_sdk.payload.batch import serialize_payload
+
+        result = SubmitResult(index)
+        try:
+            if isinstance(payload, dict):
+                payload = serialize_payload(payload)
+            if self._spills(payload):
+                # Uploaded from the spool, the prepared payload is never held whole
+                prepared = body = self.spool_data_for_generate_solutions(payload)
+            else:
+                prepared = self.prepare_data_with_metadata(payload)
+                body = prepared.data
+        except InvalidDataException as err:
+            result.error = err
+            return result
+
+        headers = self.compression_headers(prepared.codec)
+        size = len(body)
+
+        # 429s come back here rather than being retried by the adapter
+        with passthrough_statuses(429), contextlib.ExitStack() as stack:
+            if _is_spooled(body):
+                stack.callback(body.close)
+            while True:
+                token = limiter.acquire(size)
+                throttled, retry_after = False, None
+                if _is_spooled(body):
+                    body.seek(0)
+                try:
+                    result.response = self._request(
+                        method,
+                        endpoint,
+                        token_type,
+                        data=body,
+                        headers=headers,
+                    )
+                    return result
+                except requests.HTTPError as err:
+                    throttled = (
+                        err.response is not None and err.response.status_code == 429
+                    )
+                    if throttled:
+                        retry_after = retry_after_seconds(err.response)
+                    if not throttled or result.throttled >= SUBMIT_THROTTLE_RETRIES:
+                        result.error = err
+                        return result
+                    if self._hooks is not None:
+                        self._hooks.on_retry(method, endpoint_path(endpoint), 429, err)
+                    result.throttled += 1
+                except Exception as err:
+                    result.error = err
+                    return result
+                finally:
+                    limiter.release(
+                        size, token, throttled=throttled, retry_after=retry_after
+                    )
@@ -0,0 +1,269 @@
+import contextlib
+import functools
+import queue
+import threading
+from collections.abc import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from tn_sdk.core.hooks import TnApiHooks, endpoint_path
+from tn_sdk.core.resilience import RetryBudget
+from tn_sdk.core.stats import PoolStats
+from tn_sdk.utils.constants import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    NETWORK_RETRY_BACKOFF_FACTOR,
+    NETWORK_RETRY_METHODS,
+    NETWORK_RETRY_STATUS_CODES,
+    NETWORK_RETRY_TOTAL,
+)
+
+
+class _PoolCounters:
+    """
+    Thread-safe counters shared by every connection pool of an adapter.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self._stats, name, getattr(self._stats, name) + 1)
+
+    def snapshot(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**vars(self._stats))
+
+
+class _CountingLifoQueue(queue.LifoQueue):
+    """
+    The queue urllib3 keeps idle connections in, counting reuses and discards.
+    """
+
+    def __init__(self, maxsize: int, counters: _PoolCounters):
+        super().__init__(maxsize)
+        self._counters = counters
+
+    def get(self, block: bool = True, timeout: float | None = None):
+        connection = super().get(block, timeout)
+        # Empty slots are None, a connection means an open one is reused
+        if connection is not None:
+            self._counters.increment("reused")
+        return connection
+
+    def put(self, item, block: bool = True, timeout: float | None = None) -> None:
+        try:
+            super().put(item, block, timeout)
+        except queue.Full:
+            self._counters.increment("discarded")
+            raise
+
+
+def _counting_pool_class(base: type, counters: _PoolCounters) -> type:
+    """
+    Returns a subclass of the given urllib3 pool class reporting to counters.
+    """
+
+    class CountingPool(base):
+        QueueCls = functools.partial(_CountingLifoQueue, counters=counters)
+
+        def _new_conn(self):
+            counters.increment("created")
+            return super()._new_conn()
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connection pools count created, reused and discarded connections.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # init_poolmanager runs from HTTPAdapter.__init__, so set these up first
+        self._setup_counters()
+        super().__init__(*args, **kwargs)
+
+    def __setstate__(self, state):
+        self._setup_counters()
+        super().__setstate__(state)
+
+    def _setup_counters(self) -> None:
+        self._counters = _PoolCounters()
+        self._pool_classes = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._counters),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._counters),
+        }
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    @property
+    def stats(self) -> PoolStats:
+        """
+        A snapshot of the pool counters.
+        """
+        return self._counters.snapshot()
+
+
+class _RetryOverrides(threading.local):
+    # Statuses returned to the caller of this thread instead of retried
+    passthrough: frozenset[int] = frozenset()
+
+
+_retry_overrides = _RetryOverrides()
+
+
+@contextlib.contextmanager
+def passthrough_statuses(*status_codes: int):
+    """
+    Makes ClientRetry return responses with the given statuses to the requests sent from
+    this thread instead of retrying them, for callers handling them themselves. Work
+    sent from other threads on this thread's behalf carries them with
+    carry_retry_overrides (hedged attempts do).
+    """
+    previous = _retry_overrides.passthrough
+    _retry_overrides.passthrough = previous | frozenset(status_codes)
+    try:
+        yield
+    finally:
+        _retry_overrides.passthrough = previous
+
+
+def carry_retry_overrides(function: Callable) -> Callable:
+    """
+    Wraps function to run with the passthrough_statuses of the calling thread, for work
+    handed over to other threads (e.g. an executor's) on its behalf.
+    """
+    passthrough = _retry_overrides.passthrough
+    if not passthrough:
+        return function
+
+    def run(*args, **kwargs):
+        with passthrough_statuses(*passthrough):
+            return function(*args, **kwargs)
+
+    return run
+
+
+class ClientRetry(Retry):
+    """
+    urllib3 Retry whose status retries can be turned off per thread (see
+    passthrough_statuses), and which only retries while the client's RetryBudget allows.
+
+    Without budget, a failing status is returned as is and a failing connection raises
+    as if the retries were exhausted.
+    """
+
+    def __init__(self, *args, budget: RetryBudget | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.budget = budget
+
+    def new(self, **kw) -> "ClientRetry":
+        # Retry objects are immutable, each increment builds the next one with new()
+        return super().new(budget=self.budget, **kw)
+
+    def is_retry(self, method, status_code, has_retry_after=False) -> bool:
+        if status_code in _retry_overrides.passthrough:
+            return False
+        if not super().is_retry(method, status_code, has_retry_after):
+            return False
+        if any(count is not None and count < 1 for count in (self.total, self.status)):
+            # Retries are exhausted: increment gives up, there is no retry to pay for
+            return True
+        return self.budget is None or self.budget.try_spend()
+
+    def increment(
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ) -> "ClientRetry":
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        # Status retries were already paid for in is_retry
+        if (
+            error is not None
+            and self.budget is not None
+            and not self.budget.try_spend()
+        ):
+            raise MaxRetryError(_pool, url, error) from error
+        return retry
+
+
+class ObservedRetry(ClientRetry):
+    """
+    urllib3 Retry reporting every retry it allows to the client's hooks.
+    """
+
+    def __init__(self, *args, hooks: TnApiHooks, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hooks = hooks
+
+    def new(self, **kw) -> "ObservedRetry":
+        return super().new(hooks=self.hooks, **kw)
+
+    def increment(
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ) -> "ObservedRetry":
+        # Raises once the retries are exhausted, only report the ones that happen
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        endpoint = endpoint_path(url or "")
+        status_code = response.status if response is not None else None
+        self.hooks.on_retry(method, endpoint, status_code, error)
+        return retry
+
+
+def mount_retrying_adapter(
+    session: requests.Session,
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    hooks: TnApiHooks | None = None,
+    budget: RetryBudget | None = None,
+) -> InstrumentedHTTPAdapter:
+    """
+    Mounts an InstrumentedHTTPAdapter retrying network blips (not 401s) on the session,
+    for both schemes tn_api_url can use.
+
+    :keyword hooks: Reported every retry (defaults to None)
+    :keyword budget: Retries are only made while it allows (defaults to None)
+    :return: The mounted adapter
+    """
+    retry_options = dict(
+        total=NETWORK_RETRY_TOTAL,
+        backoff_factor=NETWORK_RETRY_BACKOFF_FACTOR,
+        status_forcelist=list(NETWORK_RETRY_STATUS_CODES),
+        allowed_methods=list(NETWORK_RETRY_METHODS),
+        budget=budget,
+    )
+    if hooks is None:
+        retry_strategy = ClientRetry(**retry_options)
+    else:
+        retry_strategy = ObservedRetry(hooks=hooks, **retry_options)
+    adapter = InstrumentedHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry_strategy,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
@@ -1,3 +1,15 @@
-from .exceptions import TnApiException, InvalidDataException
+from .exceptions import (
+    TnApiException,
+    InvalidDataException,
+    InvalidResponseException,
+    CircuitOpenException,
+    DataStreamException,
+)
 
-__all__ = ["TnApiException", "InvalidDataException"]
+__all__ = [
+    "TnApiException",
+    "InvalidDataException",
+    "InvalidResponseException",
+    "CircuitOpenException",
+    "DataStreamException",
+]
@@ -40,3 +40,33 @@ class TnAuthenticationFailedException(TnApiException):
 
     def __init__(self, message: str = DEFAULT_MESSAGE, code: str = DEFAULT_CODE):
         super().__init__(message, code=code)
+
+
+class InvalidResponseException(TnApiException):
+    """Raised when a response body isn't JSON, or doesn't have the expected shape."""
+
+    DEFAULT_MESSAGE = "Invalid or malformed response"
+    DEFAULT_CODE = "INVALID_RESPONSE"
+
+    def __init__(self, message: str = DEFAULT_MESSAGE, code: str = DEFAULT_CODE):
+        super().__init__(message, code=code)
+
+
+class CircuitOpenException(TnApiException):
+    """Raised instead of sending a request to an endpoint whose circuit breaker is open."""
+
+    DEFAULT_MESSAGE = "The endpoint is failing, request not sent"
+    DEFAULT_CODE = "CIRCUIT_OPEN"
+
+    def __init__(self, message: str = DEFAULT_MESSAGE, code: str = DEFAULT_CODE):
+        super().__init__(message, code=code)
+
+
+class DataStreamException(TnApiException):
+    """Raised when records can't be sent on a data stream (failed, closed or full)."""
+
+    DEFAULT_MESSAGE = "The data stream can't send records"
+    DEFAULT_CODE = "DATA_STREAM_FAILED"
+
+    def __init__(self, message: str = DEFAULT_MESSAGE, code: str = DEFAULT_CODE):
+        super().__init__(message, code=code)
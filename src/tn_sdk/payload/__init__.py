@@ -0,0 +1,77 @@
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .dictionary import CompressionDictionary, train_dictionary
+    from .codecs import (
+        Codec,
+        ZlibCodec,
+        GzipCodec,
+        Bz2Codec,
+        LzmaCodec,
+        AdaptiveCompressionPolicy,
+        PreparedPayload,
+    )
+    from .models import Segment, PricingSolution, GenerateSolutionsRequest
+    from .serializer import iter_request_json
+    from .dedup import deduplicate_segments, expand_segments, segment_key
+    from .itinerary_dictionary import ITINERARY_DICTIONARY_V1
+    from .batch import prepare_payload, iter_prepare_many
+    from .validation import PayloadValidator
+    from .canonical import PayloadCanonicalizer, CanonicalizationReport
+    from .spill import SpooledPayload, spool_prepared_payload
+    from .streaming import (
+        iter_payload_bytes,
+        iter_compressed,
+        iter_b64encoded,
+        iter_prepared_payload,
+    )
+
+# Exported name -> module defining it. Modules are only imported on first access, so
+# importing one payload module doesn't pull in the optional rewriting/spilling ones
+_EXPORTS = {
+    "CompressionDictionary": ".dictionary",
+    "train_dictionary": ".dictionary",
+    "ITINERARY_DICTIONARY_V1": ".itinerary_dictionary",
+    "Codec": ".codecs",
+    "ZlibCodec": ".codecs",
+    "GzipCodec": ".codecs",
+    "Bz2Codec": ".codecs",
+    "LzmaCodec": ".codecs",
+    "AdaptiveCompressionPolicy": ".codecs",
+    "PreparedPayload": ".codecs",
+    "Segment": ".models",
+    "PricingSolution": ".models",
+    "GenerateSolutionsRequest": ".models",
+    "iter_request_json": ".serializer",
+    "deduplicate_segments": ".dedup",
+    "expand_segments": ".dedup",
+    "segment_key": ".dedup",
+    "prepare_payload": ".batch",
+    "iter_prepare_many": ".batch",
+    "PayloadValidator": ".validation",
+    "PayloadCanonicalizer": ".canonical",
+    "CanonicalizationReport": ".canonical",
+    "SpooledPayload": ".spill",
+    "spool_prepared_payload": ".spill",
+    "iter_payload_bytes": ".streaming",
+    "iter_compressed": ".streaming",
+    "iter_b64encoded": ".streaming",
+    "iter_prepared_payload": ".streaming",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cached, later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,215 @@
+import json
+from base64 import b64encode
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future
+
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.canonical import PayloadCanonicalizer
+from tn_sdk.payload.codecs import CompressionPolicy, ZlibCodec
+from tn_sdk.payload.dedup import deduplicate_payload
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.serializer import iter_request_json
+from tn_sdk.payload.streaming import compress_chunks, iter_payload_bytes
+from tn_sdk.payload.validation import PayloadValidator
+from tn_sdk.utils.constants import DEFAULT_COMPRESSION_LEVEL
+
+# A prepared payload, or the reason it couldn't be prepared
+PrepareResult = bytes | InvalidDataException
+
+# What prepare_payload accepts
+PreparablePayload = str | dict | GenerateSolutionsRequest
+
+
+def serialize_payload(payload: PreparablePayload) -> str:
+    """
+    Returns the JSON encoded payload. Strings are assumed to already be JSON.
+
+    Module level so it can run in a process pool.
+
+    :param payload: JSON encoded str, or a dict or GenerateSolutionsRequest to serialize
+    :return: JSON encoded str
+    """
+    if isinstance(payload, GenerateSolutionsRequest):
+        return "".join(iter_request_json(payload))
+    if isinstance(payload, dict):
+        try:
+            return json.dumps(payload)
+        except (TypeError, ValueError) as err:
+            raise InvalidDataException(
+                f"Input is not JSON serializable: {err}"
+            ) from err
+    return payload
+
+
+def prepare_payload(
+    payload: PreparablePayload,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    zdict: CompressionDictionary | None = None,
+    compression: CompressionPolicy | None = None,
+    deduplicate: bool = False,
+    validator: PayloadValidator | None = None,
+    canonicalizer: PayloadCanonicalizer | None = None,
+) -> bytes:
+    """
+    Same as TnApi.prepare_data_for_generate_solutions, also accepting dicts.
+
+    Module level so it can run in a process pool.
+
+    :param payload: JSON encoded str, or a dict to serialize, or a GenerateSolutionsRequest
+        (streamed into the compressor)
+    :param level: zlib compression level
+    :param zdict: Optional preset dictionary
+    :param compression: Codec or policy to use instead of zlib at the given level
+    :param deduplicate: Hoist repeated segments into a segment table first
+    :param validator: Check the payload first
+    :param canonicalizer: Rewrite the payload as canonical JSON (after deduplicating)
+    :return: compressed bytes
+    """
+    if validator is not None:
+        validator.validate(payload)
+    if deduplicate:
+        payload = deduplicate_payload(payload)
+    if canonicalizer is not None:
+        payload = canonicalizer.canonicalize(payload)
+
+    if isinstance(payload, GenerateSolutionsRequest):
+        # Its size is unknown until serialized, so policies pick their default codec
+        codec = (
+            ZlibCodec(level, zdict) if compression is None else compression.select(None)
+        )
+        return b64encode(compress_chunks(iter_payload_bytes(payload), codec)[0])
+
+    json_data = serialize_payload(payload)
+    if not isinstance(json_data, str):
+        raise InvalidDataException("Input must be a JSON-encoded string")
+
+    raw = json_data.encode("utf-8")
+    if compression is None:
+        codec = ZlibCodec(level, zdict)
+    else:
+        codec = compression.select(len(raw))
+    return b64encode(codec.compress(raw))
+
+
+def _serialize_then_prepare(
+    payload: PreparablePayload,
+    level: int,
+    zdict: CompressionDictionary | None,
+    compression: CompressionPolicy | None,
+    deduplicate: bool,
+    validator: PayloadValidator | None,
+    canonicalizer: PayloadCanonicalizer | None,
+    serializer: Executor,
+) -> bytes:
+    """
+    Serializes dicts and models (deduplicating and canonicalizing them if asked) in the
+    serializer executor (e.g. a process pool), then compresses in the calling worker
+    thread.
+    """
+    if validator is not None:
+        validator.validate(payload)
+    if deduplicate:
+        payload = serializer.submit(
+            _deduplicate_then_serialize, payload, canonicalizer
+        ).result()
+    elif canonicalizer is not None:
+        payload = serializer.submit(canonicalizer.canonicalize, payload).result()
+    elif isinstance(payload, (dict, GenerateSolutionsRequest)):
+        payload = serializer.submit(serialize_payload, payload).result()
+    return prepare_payload(payload, level, zdict, compression)
+
+
+def _deduplicate_then_serialize(
+    payload: PreparablePayload, canonicalizer: PayloadCanonicalizer | None = None
+) -> str:
+    """
+    Deduplicates the payload's segments, then serializes it (as canonical JSON with a
+    canonicalizer).
+    Module level so it can run in a process pool.
+    """
+    normalized = deduplicate_payload(payload)
+    if canonicalizer is not None:
+        return canonicalizer.canonicalize(normalized)
+    return serialize_payload(normalized)
+
+
+def _result_or_error(future: Future) -> PrepareResult:
+    """
+    Returns the future's result, or the InvalidDataException describing why its payload
+    couldn't be prepared. Any other failure is raised.
+    """
+    try:
+        return future.result()
+    except InvalidDataException as err:
+        return err
+    except (TypeError, ValueError) as err:
+        # Not serializable, or not valid JSON (json.JSONDecodeError is a ValueError)
+        return InvalidDataException(f"Failed to prepare payload: {err!r}")
+
+
+def iter_prepare_many(
+    payloads: Iterable[PreparablePayload],
+    executor: Executor,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    zdict: CompressionDictionary | None = None,
+    max_pending: int = 16,
+    serializer: Executor | None = None,
+    compression: CompressionPolicy | None = None,
+    deduplicate: bool = False,
+    validator: PayloadValidator | None = None,
+    canonicalizer: PayloadCanonicalizer | None = None,
+) -> Iterator[PrepareResult]:
+    """
+    Prepares payloads concurrently in the given executor, yielding results in input order.
+
+    At most max_pending payloads are in flight at once, so the input can be a lazy
+    iterable of any length. Failed items are yielded as InvalidDataException instances
+    instead of aborting the batch.
+
+    :param payloads: JSON encoded strings, dicts and/or GenerateSolutionsRequests
+    :param executor: Executor doing the compression (threads, or processes)
+    :param level: zlib compression level
+    :param zdict: Optional preset dictionary
+    :param max_pending: Maximum number of submitted, not yet yielded payloads
+    :param serializer: Optional executor (e.g. a process pool) serializing dicts to JSON.
+        Not supported with a process pool executor, which serializes in its processes
+    :param compression: Codec or policy to use instead of zlib at the given level
+    :param deduplicate: Hoist repeated segments into a segment table first
+    :param validator: Check every payload first, an invalid one yields the
+        InvalidDataException of its first error
+    :param canonicalizer: Rewrite every payload as canonical JSON (after deduplicating)
+    :return: Iterator of compressed bytes or InvalidDataException, one per payload
+    """
+    if serializer is not None:
+        # Imported here, multiprocessing is slow to import and rarely needed
+        from concurrent.futures import ProcessPoolExecutor
+
+        if isinstance(executor, ProcessPoolExecutor):
+            # The serializer would be sent to the processes, executors can't be pickled
+            raise ValueError(
+                "A serializer can't be used with a ProcessPoolExecutor, which already"
+                " serializes payloads in its processes"
+            )
+
+    task: Callable
+    options = (level, zdict, compression, deduplicate, validator, canonicalizer)
+    if serializer is None:
+        task, extra_args = prepare_payload, options
+    else:
+        task, extra_args = _serialize_then_prepare, (*options, serializer)
+
+    pending: deque[Future] = deque()
+    try:
+        for payload in payloads:
+            pending.append(executor.submit(task, payload, *extra_args))
+            if len(pending) >= max_pending:
+                yield _result_or_error(pending.popleft())
+
+        while pending:
+            yield _result_or_error(pending.popleft())
+    finally:
+        # The consumer stopped early, don't leave queued work behind
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,165 @@
+import json
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.codecs import Codec, ZlibCodec
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.serializer import iter_request_json
+from tn_sdk.utils.constants import DEFAULT_COMPRESSION_LEVEL, STRIPPED_FIELDS_HEADER
+
+# What canonicalize accepts
+CanonicalizablePayload = str | bytes | dict | GenerateSolutionsRequest
+
+# Values kept as they are
+_PLAIN_TYPES = frozenset((str, int, bool))
+# Integral floats below this magnitude are exact integers, written as such. Larger ones
+# stay floats: as integers, a decoder could read a value no double holds
+_MAX_SAFE_INTEGER = 2**53
+
+
+def _canonical_number(value: float) -> int | float:
+    """
+    Writes floats with at most 15 significant digits, dropping float noise such as
+    0.1 + 0.2 == 0.30000000000000004, and integral floats within +/-2**53 as integers.
+    """
+    if not math.isfinite(value):
+        raise InvalidDataException(f"{value} can't be sent as JSON")
+    value = float(f"{value:.15g}")
+    if value.is_integer() and abs(value) < _MAX_SAFE_INTEGER:
+        return int(value)
+    return value
+
+
+def _canonical(value, strip: frozenset):
+    """
+    Returns a copy of a decoded JSON value without null (or stripped) fields, and with
+    normalized numbers. Nulls in lists are kept, they hold a position.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {
+            key: item if type(item) in _PLAIN_TYPES else _canonical(item, strip)
+            for key, item in value.items()
+            if item is not None and key not in strip
+        }
+    if value_type is list or value_type is tuple:
+        return [
+            item if type(item) in _PLAIN_TYPES else _canonical(item, strip)
+            for item in value
+        ]
+    if value_type is float:
+        return _canonical_number(value)
+    if value is None or value_type in _PLAIN_TYPES:
+        return value
+    raise InvalidDataException(f"Input is not JSON serializable: {value!r}")
+
+
+@dataclass
+class CanonicalizationReport:
+    """
+    Sizes of a payload prepared as is, and canonicalized.
+
+    :param raw_size: Bytes of the JSON as prepared without canonicalization
+    :param canonical_size: Bytes of the canonical JSON
+    :param compressed_size: Compressed bytes (before base64) of the JSON as is
+    :param canonical_compressed_size: Compressed bytes of the canonical JSON
+    """
+
+    raw_size: int
+    canonical_size: int
+    compressed_size: int
+    canonical_compressed_size: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.raw_size - self.canonical_size
+
+    @property
+    def saved_compressed_bytes(self) -> int:
+        return self.compressed_size - self.canonical_compressed_size
+
+
+class PayloadCanonicalizer:
+    """
+    Rewrites generate-solutions payloads as canonical JSON before they are compressed:
+    null fields (e.g. a baggage of None) dropped, keys sorted, compact separators and
+    normalized numbers, optionally without fields the API can derive from others.
+
+    The same search always gives the same bytes, whatever the key order or float noise
+    of the data it was built from, so its compressed payload is identical too (and can
+    be cached). Sorted keys also put the same keys in the same order in every object,
+    which compresses better.
+    """
+
+    def __init__(self, strip_fields: Iterable[str] = ()):
+        """
+        :param strip_fields: Fields left out wherever they appear, e.g.
+            tn_sdk.utils.constants.DERIVABLE_SEGMENT_FIELDS. Only strip fields the API derives itself, and send
+            headers() along with the data (defaults to none)
+        """
+        self._strip_fields = frozenset(strip_fields)
+
+    def __repr__(self) -> str:
+        return f"PayloadCanonicalizer(strip_fields={sorted(self._strip_fields)!r})"
+
+    def canonicalize(self, payload: CanonicalizablePayload) -> str:
+        """
+        Returns the canonical JSON of a payload.
+
+        :param payload: JSON encoded str or bytes, a dict or a GenerateSolutionsRequest
+        :return: Canonical JSON encoded str
+        """
+        if isinstance(payload, (str, bytes, bytearray)):
+            try:
+                payload = json.loads(payload)
+            except json.JSONDecodeError as err:
+                raise InvalidDataException(f"Input is not valid JSON: {err}") from err
+        elif isinstance(payload, GenerateSolutionsRequest):
+            payload = payload.to_dict()
+        elif not isinstance(payload, dict):
+            raise InvalidDataException(
+                "Canonicalization needs JSON, a dict or a GenerateSolutionsRequest"
+            )
+        return json.dumps(
+            _canonical(payload, self._strip_fields),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    def headers(self) -> dict:
+        """
+        Headers to send along with canonicalized payloads: the stripped fields, if any.
+        """
+        if not self._strip_fields:
+            return {}
+        return {STRIPPED_FIELDS_HEADER: ",".join(sorted(self._strip_fields))}
+
+    def report(
+        self, payload: CanonicalizablePayload, codec: Codec | None = None
+    ) -> CanonicalizationReport:
+        """
+        Measures the bytes canonicalization saves on a payload, before and after
+        compression. It compresses the payload twice, use it on samples.
+
+        :param payload: JSON encoded str or bytes, a dict or a GenerateSolutionsRequest
+        :param codec: Codec compressing the payload (defaults to zlib at level 6)
+        """
+        codec = codec or ZlibCodec(DEFAULT_COMPRESSION_LEVEL)
+        if isinstance(payload, GenerateSolutionsRequest):
+            raw = "".join(iter_request_json(payload)).encode("utf-8")
+        elif isinstance(payload, dict):
+            raw = json.dumps(payload).encode("utf-8")
+        elif isinstance(payload, str):
+            raw = payload.encode("utf-8")
+        else:
+            raw = bytes(payload)
+        canonical = self.canonicalize(payload).encode("utf-8")
+        return CanonicalizationReport(
+            raw_size=len(raw),
+            canonical_size=len(canonical),
+            compressed_size=len(codec.compress(raw)),
+            canonical_compressed_size=len(codec.compress(canonical)),
+        )
@@ -0,0 +1,265 @@
+import abc
+import bz2
+import lzma
+import zlib
+from dataclasses import dataclass
+
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.utils.constants import (
+    COMPRESSION_CODEC_HEADER,
+    DEFAULT_COMPRESSION_LEVEL,
+    DEFAULT_SMALL_PAYLOAD_SIZE,
+    DEFAULT_UPLOAD_BANDWIDTH,
+)
+
+# Measured zlib throughput (raw bytes per second) and compression ratio per level on
+# synthetic itinerary payloads (see tn_sdk.benchmarks.bench_codecs to re-measure)
+ZLIB_LEVEL_PROFILE = {
+    1: (160e6, 0.147),
+    2: (150e6, 0.136),
+    3: (130e6, 0.126),
+    4: (95e6, 0.123),
+    5: (95e6, 0.112),
+    6: (70e6, 0.105),
+    7: (60e6, 0.102),
+    8: (25e6, 0.099),
+    9: (18e6, 0.098),
+}
+
+
+class Codec(abc.ABC):
+    """
+    A compression codec used to prepare payloads.
+
+    A codec is also the simplest compression policy: select() always returns itself.
+    """
+
+    name: str = ""
+
+    def __init__(self, level: int):
+        """
+        :param level: Compression level
+        """
+        self.level = level
+
+    def __repr__(self):
+        return f"{type(self).__name__}(level={self.level})"
+
+    def __eq__(self, other):
+        return type(self) is type(other) and vars(self) == vars(other)
+
+    def __hash__(self):
+        return hash((type(self), self.level))
+
+    def compress(self, data: bytes) -> bytes:
+        """
+        Compresses data in one shot.
+        """
+        compressor = self.compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+    @abc.abstractmethod
+    def compressobj(self):
+        """
+        Returns an incremental compressor with compress(data) and flush() methods.
+        """
+
+    def headers(self) -> dict:
+        """
+        Headers telling the API how the data was compressed.
+        """
+        return {COMPRESSION_CODEC_HEADER: self.name}
+
+    def select(self, size: int | None) -> "Codec":
+        """
+        Returns the codec to use for a payload of the given raw size.
+        """
+        return self
+
+
+class ZlibCodec(Codec):
+    """
+    zlib (the API's default format), optionally with a preset dictionary.
+    """
+
+    name = "zlib"
+
+    def __init__(
+        self,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+        zdict: CompressionDictionary | None = None,
+    ):
+        """
+        :param level: Compression level, 0-9
+        :param zdict: Optional preset dictionary
+        """
+        super().__init__(level)
+        self.zdict = zdict
+
+    def __repr__(self):
+        return f"ZlibCodec(level={self.level}, zdict={self.zdict!r})"
+
+    def compress(self, data: bytes) -> bytes:
+        if self.zdict is None:
+            return zlib.compress(data, level=self.level)
+        return self.zdict.compress(data, self.level)
+
+    def compressobj(self):
+        if self.zdict is None:
+            return zlib.compressobj(self.level)
+        return zlib.compressobj(self.level, zdict=self.zdict.data)
+
+    def headers(self) -> dict:
+        # zlib is what the API expects by default, only name the dictionary if any
+        return {} if self.zdict is None else self.zdict.headers()
+
+
+class GzipCodec(Codec):
+    """
+    gzip framing of deflate data (zlib with a gzip header and trailer).
+    """
+
+    name = "gzip"
+
+    def __init__(self, level: int = DEFAULT_COMPRESSION_LEVEL):
+        super().__init__(level)
+
+    def compressobj(self):
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class Bz2Codec(Codec):
+    """
+    bzip2: better ratio than zlib at a much higher CPU cost.
+    """
+
+    name = "bz2"
+
+    def __init__(self, level: int = 9):
+        """
+        :param level: Compression level, 1-9
+        """
+        super().__init__(level)
+
+    def compress(self, data: bytes) -> bytes:
+        return bz2.compress(data, self.level)
+
+    def compressobj(self):
+        return bz2.BZ2Compressor(self.level)
+
+
+class LzmaCodec(Codec):
+    """
+    xz/LZMA: best ratio of the stdlib codecs, slowest to compress.
+    """
+
+    name = "lzma"
+
+    def __init__(self, level: int = 1):
+        """
+        :param level: Preset, 0-9
+        """
+        super().__init__(level)
+
+    def compress(self, data: bytes) -> bytes:
+        return lzma.compress(data, preset=self.level)
+
+    def compressobj(self):
+        return lzma.LZMACompressor(preset=self.level)
+
+
+class AdaptiveCompressionPolicy:
+    """
+    Picks the zlib level per payload from its size.
+
+    Estimates the latency of each level as compression time plus upload time of the
+    (base64 encoded) result, and picks the fastest level whose compression time fits the
+    CPU budget. Small payloads take a few packets whatever the level, so they get the
+    cheapest one. Slow links get more thorough levels, and payloads too large for the
+    budget at any level get the cheapest one.
+    """
+
+    def __init__(
+        self,
+        max_cpu_seconds: float = 0.05,
+        bandwidth: float = DEFAULT_UPLOAD_BANDWIDTH,
+        zdict: CompressionDictionary | None = None,
+        profile: dict[int, tuple[float, float]] | None = None,
+        small_payload_size: int = DEFAULT_SMALL_PAYLOAD_SIZE,
+    ):
+        """
+        :param max_cpu_seconds: Compression time budget per payload
+        :param bandwidth: Expected upload bandwidth in bytes per second
+        :param zdict: Optional preset dictionary
+        :param profile: Throughput (bytes/s) and ratio per zlib level, defaults to
+            ZLIB_LEVEL_PROFILE
+        :param small_payload_size: Raw size under which the cheapest level is used
+        """
+        self.max_cpu_seconds = max_cpu_seconds
+        self.bandwidth = bandwidth
+        self.zdict = zdict
+        self.profile = profile or ZLIB_LEVEL_PROFILE
+        self.small_payload_size = small_payload_size
+
+    def __repr__(self):
+        return (
+            f"AdaptiveCompressionPolicy(max_cpu_seconds={self.max_cpu_seconds}, "
+            f"bandwidth={self.bandwidth})"
+        )
+
+    def select(self, size: int | None) -> ZlibCodec:
+        """
+        Returns the zlib codec to use for a payload of the given raw size.
+        Payloads of unknown size (streams) get the default level.
+
+        :param size: Raw payload size in bytes, if known
+        :return: The selected codec
+        """
+        if size is None:
+            return ZlibCodec(DEFAULT_COMPRESSION_LEVEL, self.zdict)
+
+        best_level, best_latency = min(self.profile), None
+        if size < self.small_payload_size:
+            return ZlibCodec(best_level, self.zdict)
+
+        for level, (throughput, ratio) in sorted(self.profile.items()):
+            cpu_seconds = size / throughput
+            if cpu_seconds > self.max_cpu_seconds:
+                continue
+            # Base64 makes the uploaded body 4/3 of the compressed size
+            latency = cpu_seconds + size * ratio * 4 / 3 / self.bandwidth
+            if best_latency is None or latency < best_latency:
+                best_level, best_latency = level, latency
+        return ZlibCodec(best_level, self.zdict)
+
+
+# Anything with a select(size) -> Codec method
+CompressionPolicy = Codec | AdaptiveCompressionPolicy
+
+
+@dataclass
+class PreparedPayload:
+    """
+    A prepared (compressed and base64 encoded) payload, with how it was compressed.
+    """
+
+    data: bytes
+    codec: Codec
+    raw_size: int
+    compressed_size: int
+
+    @property
+    def ratio(self) -> float:
+        """
+        Compressed size over raw size (before base64).
+        """
+        return self.compressed_size / self.raw_size if self.raw_size else 1.0
+
+    def headers(self) -> dict:
+        """
+        Headers to send along with the data.
+        """
+        return self.codec.headers()
+
+
+CODECS = {codec.name: codec for codec in (ZlibCodec, GzipCodec, Bz2Codec, LzmaCodec)}
@@ -0,0 +1,155 @@
+import json
+from operator import attrgetter, itemgetter
+
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.models import GenerateSolutionsRequest, PricingSolution, Segment
+from tn_sdk.utils.constants import SEGMENT_TABLE_FORMAT, SEGMENT_TABLE_HEADER
+
+_SEGMENT_FIELDS = frozenset(Segment.__slots__)
+_segment_attributes = attrgetter(*Segment.__slots__)
+_segment_items = itemgetter(*Segment.__slots__)
+
+
+def segment_key(segment: dict | Segment) -> tuple:
+    """
+    Returns the canonical key of a segment: equal for segments with the same fields and
+    values, whatever the order of their keys.
+
+    :param segment: A segment dict, or a Segment
+    :return: Hashable key
+    """
+    try:
+        if isinstance(segment, Segment):
+            key = _segment_attributes(segment)
+        elif segment.keys() == _SEGMENT_FIELDS:
+            # The schema's fields, in the schema's order
+            key = _segment_items(segment)
+        else:
+            key = tuple(sorted(segment.items()))
+        # Values that can't be hashed (lists, dicts) fail here rather than in the table
+        hash(key)
+    except (AttributeError, TypeError) as err:
+        raise InvalidDataException(f"Invalid segment: {segment!r}") from err
+    return key
+
+
+def _solution_dict(solution: dict | PricingSolution) -> dict:
+    if isinstance(solution, PricingSolution):
+        return {name: getattr(solution, name) for name in PricingSolution.__slots__}
+    return dict(solution)
+
+
+def deduplicate_segments(data: dict | GenerateSolutionsRequest) -> dict:
+    """
+    Hoists the unique segments of a request into a table, and replaces every segment
+    of every pricing solution with its index in the table.
+
+    The result is still a request dict, with a top level ``segment_table`` and legs made
+    of table indexes. Send it with segment_table_headers() so the API knows to expand it.
+
+    :param data: Request data (a dict like the README example, or a GenerateSolutionsRequest)
+    :return: Normalized request data
+    """
+    if isinstance(data, GenerateSolutionsRequest):
+        normalized_data = {"trip_id": data.trip_id}
+        responses = data.datasource_responses
+        to_dict = Segment.to_dict
+    else:
+        try:
+            normalized_data = dict(data)
+            responses = data["datasource_responses"]
+        except (KeyError, TypeError, ValueError) as err:
+            raise InvalidDataException("Input must be generate-solutions data") from err
+        to_dict = dict
+
+    indexes: dict[tuple, int] = {}
+    table: list[dict] = []
+    normalized_responses = {}
+    for datasource, solutions in responses.items():
+        normalized_solutions = []
+        for solution in solutions:
+            normalized = _solution_dict(solution)
+            legs = []
+            for leg in normalized.get("segments", ()):
+                references = []
+                for segment in leg:
+                    key = segment_key(segment)
+                    index = indexes.get(key)
+                    if index is None:
+                        index = indexes[key] = len(table)
+                        table.append(to_dict(segment))
+                    references.append(index)
+                legs.append(references)
+            normalized["segments"] = legs
+            normalized_solutions.append(normalized)
+        normalized_responses[datasource] = normalized_solutions
+
+    normalized_data["datasource_responses"] = normalized_responses
+    normalized_data["segment_table"] = table
+    return normalized_data
+
+
+def expand_segments(data: dict) -> dict:
+    """
+    Inverse of deduplicate_segments (what the API does): replaces segment table indexes
+    with the segments they reference. Every reference gets its own copy.
+
+    :param data: Normalized request data
+    :return: Request data in the regular format
+    """
+    try:
+        table = data["segment_table"]
+        responses = data["datasource_responses"]
+        expanded_responses = {
+            datasource: [
+                solution
+                | {
+                    "segments": [
+                        [dict(table[index]) for index in leg]
+                        for leg in solution.get("segments", ())
+                    ]
+                }
+                for solution in solutions
+            ]
+            for datasource, solutions in responses.items()
+        }
+    except (KeyError, IndexError, TypeError) as err:
+        raise InvalidDataException("Invalid segment table data") from err
+
+    expanded = {key: value for key, value in data.items() if key != "segment_table"}
+    expanded["datasource_responses"] = expanded_responses
+    return expanded
+
+
+def segment_table_headers() -> dict:
+    """
+    Headers to send along with payloads normalized by deduplicate_segments.
+    """
+    return {SEGMENT_TABLE_HEADER: SEGMENT_TABLE_FORMAT}
+
+
+def deduplicate_payload(
+    payload: str | bytes | memoryview | dict | GenerateSolutionsRequest,
+) -> dict:
+    """
+    deduplicate_segments for any in-memory payload the prepare functions accept,
+    decoding JSON strings and bytes first. Streamed inputs (file objects, iterables of
+    chunks) are rejected: they would have to be read whole to be deduplicated.
+
+    :param payload: JSON encoded str or bytes, dict or GenerateSolutionsRequest
+    :return: Normalized request data
+    """
+    if isinstance(payload, memoryview):
+        payload = payload.tobytes()
+    if isinstance(payload, (str, bytes, bytearray)):
+        try:
+            payload = json.loads(payload)
+        except ValueError as err:
+            raise InvalidDataException(f"Input is not valid JSON: {err}") from err
+    elif not isinstance(payload, (dict, GenerateSolutionsRequest)):
+        raise InvalidDataException(
+            "Segment deduplication needs a JSON-encoded string or bytes, a dict or a "
+            f"GenerateSolutionsRequest, not {type(payload).__name__}. Read streamed "
+            "input first, or use a client without deduplicate_segments"
+        )
+    return deduplicate_segments(payload)
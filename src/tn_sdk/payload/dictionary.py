@@ -0,0 +1,195 @@
+import json
+import re
+import sys
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+from tn_sdk.utils.constants import (
+    COMPRESSION_DICTIONARY_HEADER,
+    DEFAULT_DICTIONARY_SIZE,
+)
+
+# Candidate fragments: `"key": value` members with categorical values (no digits, so
+# dates, prices and ids of the samples don't leak in), `"key": ` prefixes for keys whose
+# values vary, and the structure between objects
+_MEMBER_PATTERN = re.compile(r'"[A-Za-z_]+": (?:"[^"0-9]*"|true|false|null)')
+_KEY_PATTERN = re.compile(r'[{,\[] ?"[A-Za-z_]+": [\[{"]?')
+_STRUCTURE_PATTERN = re.compile(r'[}\]]+, [{\[]+"[A-Za-z_]+": ')
+
+
+class CompressionDictionary:
+    """
+    A versioned zlib preset dictionary (``zdict``) for payloads.
+
+    The zlib header of data compressed with it carries its Adler-32 id, and headers()
+    names it explicitly, so the server knows which dictionary to decompress with.
+    """
+
+    def __init__(self, name: str, version: int, data: bytes):
+        """
+        :param name: Name of the dictionary, e.g. "itinerary"
+        :param version: Version, bumped whenever the data changes
+        :param data: Dictionary contents, most valuable fragments last
+        """
+        self.name = name
+        self.version = version
+        self.data = data
+
+    def __repr__(self):
+        return f"CompressionDictionary({self.identifier!r}, {len(self.data)} bytes)"
+
+    @property
+    def identifier(self) -> str:
+        return f"{self.name}.v{self.version}"
+
+    @property
+    def dict_id(self) -> int:
+        """
+        The Adler-32 checksum zlib writes in the stream header (DICTID).
+        """
+        return zlib.adler32(self.data)
+
+    def headers(self) -> dict:
+        """
+        Headers to send along with data compressed with this dictionary.
+        """
+        return {COMPRESSION_DICTIONARY_HEADER: self.identifier}
+
+    def compress(self, data: bytes, level: int) -> bytes:
+        """
+        Compresses data in one shot using this dictionary.
+        """
+        compressor = zlib.compressobj(level, zdict=self.data)
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompresses data compressed with this dictionary (what the server does).
+        """
+        decompressor = zlib.decompressobj(zdict=self.data)
+        return decompressor.decompress(data) + decompressor.flush()
+
+
+def _sample_text(sample: str | bytes | dict) -> str:
+    if isinstance(sample, dict):
+        return json.dumps(sample)
+    if isinstance(sample, bytes):
+        return sample.decode("utf-8")
+    return sample
+
+
+def train_dictionary(
+    samples: Iterable[str | bytes | dict], size: int = DEFAULT_DICTIONARY_SIZE
+) -> bytes:
+    """
+    Builds a preset dictionary from sample payloads.
+
+    Counts the JSON fragments (members, keys and structure between objects) that repeat
+    across samples, and keeps those saving the most bytes (count x length) until the
+    dictionary is full. The most valuable fragments go last, where zlib reaches them with
+    the shortest distances.
+
+    :param samples: Sample payloads (JSON encoded str/bytes, or dicts)
+    :param size: Maximum dictionary size in bytes (zlib only uses the last 32KB)
+    :return: Dictionary data
+    """
+    counts = Counter()
+    for sample in samples:
+        text = _sample_text(sample)
+        for pattern in (_MEMBER_PATTERN, _KEY_PATTERN, _STRUCTURE_PATTERN):
+            counts.update(pattern.findall(text))
+
+    scored = sorted(
+        (
+            (count * len(fragment), fragment)
+            for fragment, count in counts.items()
+            if count > 1
+        ),
+        reverse=True,
+    )
+
+    chosen = []
+    used = 0
+    for _, fragment in scored:
+        encoded = fragment.encode("utf-8")
+        if used + len(encoded) > size:
+            continue
+        chosen.append(encoded)
+        used += len(encoded)
+
+    return b"".join(reversed(chosen))
+
+
+def _write_module(data: bytes, name: str, version: int) -> str:
+    """
+    Renders the dictionary as a Python module, the way the bundled ones are shipped.
+    """
+    lines = [
+        "# Generated by `python -m tn_sdk.payload.dictionary`, do not edit by hand.",
+        "from tn_sdk.payload.dictionary import CompressionDictionary",
+        "",
+        f"{name.upper()}_DICTIONARY_V{version} = CompressionDictionary(",
+        f'    "{name}",',
+        f"    {version},",
+        "    (",
+    ]
+    for start in range(0, len(data), 64):
+        lines.append(f"        {data[start:start + 64]!r}")
+    lines += ["    ),", ")", ""]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """
+    Command line tool training a dictionary from sample payload files.
+    """
+    # Imported here so importing the SDK doesn't pay for it
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tn_sdk.payload.dictionary",
+        description="Train a zlib preset dictionary from sample JSON payloads.",
+    )
+    parser.add_argument("samples", nargs="*", type=Path, help="Sample JSON files")
+    parser.add_argument("--size", type=int, default=DEFAULT_DICTIONARY_SIZE)
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also train on N synthetic itinerary payloads",
+    )
+    parser.add_argument("--name", default="itinerary")
+    parser.add_argument("--version", type=int, default=1)
+    parser.add_argument(
+        "--output", type=Path, help="Write raw dictionary bytes to this file"
+    )
+    parser.add_argument(
+        "--module", action="store_true", help="Print the dictionary as a Python module"
+    )
+    args = parser.parse_args(argv)
+
+    samples = [path.read_text(encoding="utf-8") for path in args.samples]
+    if args.synthetic:
+        from tn_sdk.benchmarks.itineraries import generate_request_data
+
+        samples += [
+            generate_request_data(solutions=20, seed=seed)
+            for seed in range(args.synthetic)
+        ]
+    if not samples:
+        parser.error("No samples given")
+
+    data = train_dictionary(samples, size=args.size)
+    if args.output:
+        args.output.write_bytes(data)
+    if args.module:
+        sys.stdout.write(_write_module(data, args.name, args.version))
+    else:
+        print(f"Trained a {len(data)} byte dictionary from {len(samples)} samples")
+
+
+if __name__ == "__main__":
+    main()
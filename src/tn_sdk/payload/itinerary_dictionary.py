@@ -0,0 +1,35 @@
+# Generated by `python -m tn_sdk.payload.dictionary`, do not edit by hand.
+from tn_sdk.payload.dictionary import CompressionDictionary
+
+ITINERARY_DICTIONARY_V1 = CompressionDictionary(
+    "itinerary",
+    1,
+    (
+        b'"trip_id": ""{"trip_id": ", "datasource_responses": {"to_iata": '
+        b'"YYC""to_iata": "AMS""to_iata": "LAX""to_iata": "SYD""to_iata": '
+        b'"YHZ""to_iata": "DXB""to_iata": "CDG""to_iata": "NRT""from_iata"'
+        b': "NRT""to_iata": "ORD""from_iata": "CDG""to_iata": "YUL""from_i'
+        b'ata": "LAX""to_iata": "FRA""to_iata": "JFK""from_iata": "SYD""is'
+        b'_private_fare": true"to_iata": "YYZ""to_iata": "MAD""to_iata": "'
+        b'YVR""from_iata": "YYC""from_iata": "AMS""from_iata": "JFK""from_'
+        b'iata": "MAD""to_iata": "LHR""from_iata": "YUL""from_iata": "YHZ"'
+        b'"from_iata": "LHR""from_iata": "YYZ""from_iata": "ORD""from_iata'
+        b'": "FRA""from_iata": "DXB""from_iata": "YVR""refundable": true"o'
+        b'perating_carrier": "EK""segment_source": "sabre""operating_carri'
+        b'er": "AF""operating_carrier": "WS""operating_carrier": "BA""oper'
+        b'ating_carrier": "DL""operating_carrier": "UA""operating_carrier"'
+        b': "KL""operating_carrier": "PD""operating_carrier": "AA""operati'
+        b'ng_carrier": "NH""operating_carrier": "AC""operating_carrier": "'
+        b'LH""segment_source": "amadeus""segment_source": "travelport", "b'
+        b'aggage": "refundable": false"baggage": null, "segments": [, "ref'
+        b'undable": , "total_price": "cabin_class": "P""cabin_class": "B""'
+        b'cabin_class": "F""cabin_class": "E""is_private_fare": false, "is'
+        b'_private_fare": , "segment_source": "}], [{"departure_time": {"p'
+        b'ricing_solution_id": "}, {"pricing_solution_id": }, {"departure_'
+        b'time": "fare_type": "PublicFare""fare_type": "PrivateFare", "to_'
+        b'iata": ", "fare_type": ", "from_iata": ", "cabin_class": ", "arr'
+        b'ival_time": ", "flight_number": "{"departure_time": ", "arrival_'
+        b'timestamp": , "operating_carrier": ", "departure_timestamp": , "'
+        b'transportation_type": ""transportation_type": "flight"'
+    ),
+)
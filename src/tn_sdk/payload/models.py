@@ -0,0 +1,110 @@
+from dataclasses import dataclass, field
+from sys import intern
+from typing import Any
+
+
+@dataclass(slots=True)
+class Segment:
+    """
+    A single flight segment of a pricing solution, as in the generate-solutions schema.
+
+    Slotted, and the categorical strings (carrier, airports, fare type...) are interned,
+    so a search with tens of thousands of segments keeps one copy of each value.
+    """
+
+    departure_time: str
+    departure_timestamp: int
+    arrival_time: str
+    arrival_timestamp: int
+    flight_number: str
+    operating_carrier: str
+    transportation_type: str
+    fare_type: str
+    cabin_class: str
+    from_iata: str
+    to_iata: str
+
+    def __post_init__(self):
+        self.operating_carrier = intern(self.operating_carrier)
+        self.transportation_type = intern(self.transportation_type)
+        self.fare_type = intern(self.fare_type)
+        self.cabin_class = intern(self.cabin_class)
+        self.from_iata = intern(self.from_iata)
+        self.to_iata = intern(self.to_iata)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Segment":
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@dataclass(slots=True)
+class PricingSolution:
+    """
+    A pricing solution of a datasource response: its price, flags and segments per leg.
+    """
+
+    pricing_solution_id: str
+    total_price: float
+    segment_source: str
+    is_private_fare: bool = False
+    refundable: bool = False
+    segments: list[list[Segment]] = field(default_factory=list)
+    baggage: Any = None
+
+    def __post_init__(self):
+        self.segment_source = intern(self.segment_source)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PricingSolution":
+        data = dict(data)
+        data["segments"] = [
+            [Segment.from_dict(segment) for segment in leg]
+            for leg in data.get("segments", ())
+        ]
+        return cls(**data)
+
+    def to_dict(self) -> dict:
+        data = {name: getattr(self, name) for name in self.__slots__}
+        data["segments"] = [
+            [segment.to_dict() for segment in leg] for leg in self.segments
+        ]
+        return data
+
+
+@dataclass(slots=True)
+class GenerateSolutionsRequest:
+    """
+    The data of a generate-solutions request: pricing solutions per datasource response.
+
+    Serialize it with tn_sdk.payload.serializer (or pass it to the prepare methods of the
+    clients) rather than through to_dict() and json.dumps.
+    """
+
+    datasource_responses: dict[str, list[PricingSolution]] = field(default_factory=dict)
+    trip_id: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GenerateSolutionsRequest":
+        return cls(
+            datasource_responses={
+                datasource: [
+                    PricingSolution.from_dict(solution) for solution in solutions
+                ]
+                for datasource, solutions in data.get(
+                    "datasource_responses", {}
+                ).items()
+            },
+            trip_id=data.get("trip_id", ""),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "trip_id": self.trip_id,
+            "datasource_responses": {
+                datasource: [solution.to_dict() for solution in solutions]
+                for datasource, solutions in self.datasource_responses.items()
+            },
+        }
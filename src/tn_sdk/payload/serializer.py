@@ -0,0 +1,90 @@
+import json
+from collections.abc import Iterator
+from json.encoder import encode_basestring_ascii
+
+from tn_sdk.payload.models import GenerateSolutionsRequest, PricingSolution, Segment
+
+# Same output as json.dumps with its default separators, filled in with %-formatting
+_SEGMENT_FORMAT = (
+    '{"departure_time": %s, "departure_timestamp": %s, "arrival_time": %s,'
+    ' "arrival_timestamp": %s, "flight_number": %s, "operating_carrier": %s,'
+    ' "transportation_type": %s, "fare_type": %s, "cabin_class": %s,'
+    ' "from_iata": %s, "to_iata": %s}'
+)
+_SOLUTION_FORMAT = (
+    '{"pricing_solution_id": %s, "total_price": %s, "segment_source": %s,'
+    ' "is_private_fare": %s, "refundable": %s, "segments": [%s], "baggage": %s}'
+)
+_JSON_BOOLEANS = {True: "true", False: "false"}
+
+
+class _EncodedStrings(dict):
+    """
+    Memo of JSON encoded strings, for the categorical values repeated across segments.
+    """
+
+    def __missing__(self, value: str) -> str:
+        encoded = self[value] = encode_basestring_ascii(value)
+        return encoded
+
+
+def _encode_number(value: int | float) -> str:
+    return json.dumps(value) if isinstance(value, float) else int.__repr__(value)
+
+
+def _encode_segment(segment: Segment, strings: _EncodedStrings) -> str:
+    return _SEGMENT_FORMAT % (
+        encode_basestring_ascii(segment.departure_time),
+        int.__repr__(segment.departure_timestamp),
+        encode_basestring_ascii(segment.arrival_time),
+        int.__repr__(segment.arrival_timestamp),
+        encode_basestring_ascii(segment.flight_number),
+        strings[segment.operating_carrier],
+        strings[segment.transportation_type],
+        strings[segment.fare_type],
+        strings[segment.cabin_class],
+        strings[segment.from_iata],
+        strings[segment.to_iata],
+    )
+
+
+def _encode_solution(solution: PricingSolution, strings: _EncodedStrings) -> str:
+    legs = ", ".join(
+        "[%s]" % ", ".join([_encode_segment(segment, strings) for segment in leg])
+        for leg in solution.segments
+    )
+    return _SOLUTION_FORMAT % (
+        encode_basestring_ascii(solution.pricing_solution_id),
+        _encode_number(solution.total_price),
+        strings[solution.segment_source],
+        _JSON_BOOLEANS[bool(solution.is_private_fare)],
+        _JSON_BOOLEANS[bool(solution.refundable)],
+        legs,
+        "null" if solution.baggage is None else json.dumps(solution.baggage),
+    )
+
+
+def iter_request_json(request: GenerateSolutionsRequest) -> Iterator[str]:
+    """
+    Yields the JSON of the request piece by piece (one piece per pricing solution).
+
+    The joined pieces are identical to json.dumps(request.to_dict()), without building
+    the intermediate dicts or the whole string.
+
+    :param request: The request to serialize
+    :return: Iterator of JSON str pieces
+    """
+    strings = _EncodedStrings()
+    yield '{"trip_id": %s, "datasource_responses": {' % encode_basestring_ascii(
+        request.trip_id
+    )
+    for index, (datasource, solutions) in enumerate(
+        request.datasource_responses.items()
+    ):
+        yield "%s%s: [" % (", " if index else "", encode_basestring_ascii(datasource))
+        for position, solution in enumerate(solutions):
+            if position:
+                yield ", "
+            yield _encode_solution(solution, strings)
+        yield "]"
+    yield "}}"
@@ -0,0 +1,139 @@
+import tempfile
+from collections.abc import Iterator
+
+from tn_sdk.payload.codecs import Codec, PreparedPayload
+from tn_sdk.payload.streaming import (
+    StreamablePayload,
+    iter_b64encoded,
+    iter_payload_bytes,
+)
+from tn_sdk.utils.constants import DEFAULT_STREAM_CHUNK_SIZE
+
+
+class SpooledPayload:
+    """
+    A prepared (compressed and base64 encoded) payload held in a SpooledTemporaryFile:
+    in memory up to max_memory bytes, in a temporary file on disk past it.
+
+    It is a readable, seekable file object, so it can be sent as a request body as is
+    (requests then streams it, with a Content-Length). Close it (or use it as a context
+    manager) when done, which deletes the temporary file.
+    """
+
+    def __init__(
+        self,
+        spool: tempfile.SpooledTemporaryFile,
+        codec: Codec,
+        raw_size: int,
+        compressed_size: int,
+        max_memory: int,
+    ):
+        """
+        :param spool: The prepared payload, positioned at its start
+        :param codec: Codec the payload was compressed with
+        :param raw_size: Bytes of the JSON before compression
+        :param compressed_size: Compressed bytes, before base64
+        :param max_memory: Bytes past which the spool was moved to disk
+        """
+        self._spool = spool
+        self.codec = codec
+        self.raw_size = raw_size
+        self.compressed_size = compressed_size
+        self.size = spool.seek(0, 2)
+        self.max_memory = max_memory
+        spool.seek(0)
+
+    def __repr__(self) -> str:
+        return (
+            f"SpooledPayload(size={self.size}, codec={self.codec!r},"
+            f" on_disk={self.on_disk})"
+        )
+
+    def __enter__(self) -> "SpooledPayload":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def on_disk(self) -> bool:
+        """
+        Whether the payload was larger than max_memory, and spilled to disk.
+        """
+        return self.size > self.max_memory
+
+    def read(self, size: int = -1) -> bytes:
+        return self._spool.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._spool.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._spool.tell()
+
+    def close(self) -> None:
+        self._spool.close()
+
+    def headers(self) -> dict:
+        """
+        Headers to send along with the data.
+        """
+        return self.codec.headers()
+
+    def to_prepared(self) -> PreparedPayload:
+        """
+        Reads the whole payload back into memory, as prepare_data_with_metadata returns it.
+        """
+        self._spool.seek(0)
+        return PreparedPayload(
+            data=self._spool.read(),
+            codec=self.codec,
+            raw_size=self.raw_size,
+            compressed_size=self.compressed_size,
+        )
+
+
+def spool_prepared_payload(
+    payload: StreamablePayload,
+    codec: Codec,
+    max_memory: int,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> SpooledPayload:
+    """
+    Serializes, compresses and base64 encodes a payload chunk by chunk into a
+    SpooledPayload, so only about chunk_size bytes of it (plus max_memory bytes of output
+    before it spills to disk) are held in memory. The output is byte-identical to
+    prepare_data_for_generate_solutions with the same codec.
+
+    :param payload: See iter_payload_bytes
+    :param codec: Codec to compress with
+    :param max_memory: Bytes of output kept in memory before spilling to a temporary file
+    :param chunk_size: Approximate size of the raw chunks fed to the compressor
+    :return: The spooled payload, positioned at its start
+    """
+    compressor = codec.compressobj()
+    raw_size = compressed_size = 0
+
+    def iter_compressed() -> Iterator[bytes]:
+        nonlocal raw_size, compressed_size
+        for chunk in iter_payload_bytes(payload, chunk_size):
+            raw_size += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                compressed_size += len(compressed)
+                yield compressed
+        compressed = compressor.flush()
+        compressed_size += len(compressed)
+        yield compressed
+
+    spool = tempfile.SpooledTemporaryFile(max_size=max_memory, prefix="tn-sdk-")
+    try:
+        for encoded in iter_b64encoded(iter_compressed()):
+            spool.write(encoded)
+    except BaseException:
+        spool.close()
+        raise
+    return SpooledPayload(spool, codec, raw_size, compressed_size, max_memory)
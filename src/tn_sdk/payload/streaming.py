@@ -0,0 +1,180 @@
+import io
+import json
+from binascii import b2a_base64
+from collections.abc import Iterable, Iterator
+
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.codecs import Codec, ZlibCodec
+from tn_sdk.payload.dictionary import CompressionDictionary
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.serializer import iter_request_json
+from tn_sdk.utils.constants import DEFAULT_COMPRESSION_LEVEL, DEFAULT_STREAM_CHUNK_SIZE
+
+# Anything iter_payload_bytes knows how to turn into JSON bytes
+StreamablePayload = (
+    GenerateSolutionsRequest
+    | dict
+    | list
+    | str
+    | bytes
+    | bytearray
+    | memoryview
+    | io.IOBase
+    | Iterable
+)
+
+
+def _join_into_chunks(pieces: Iterable[str], chunk_size: int) -> Iterator[bytes]:
+    """
+    Groups many small string pieces into UTF-8 chunks of about chunk_size characters.
+    """
+    buffer = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def iter_payload_bytes(
+    payload: StreamablePayload, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yields the UTF-8 encoded JSON of the payload in chunks, without materializing it whole.
+
+    :param payload: A GenerateSolutionsRequest, a dict/list (serialized like json.dumps),
+        a JSON-encoded str, bytes/bytearray/memoryview of JSON, a file object opened in
+        text or binary mode, or an iterable of str/bytes JSON chunks
+    :param chunk_size: Approximate size of the yielded chunks
+    :return: Iterator of byte chunks (memoryview slices for bytes-like input)
+    """
+    if isinstance(payload, GenerateSolutionsRequest):
+        yield from _join_into_chunks(iter_request_json(payload), chunk_size)
+    elif isinstance(payload, (dict, list)):
+        try:
+            yield from _join_into_chunks(
+                json.JSONEncoder().iterencode(payload), chunk_size
+            )
+        except (TypeError, ValueError) as err:
+            raise InvalidDataException(
+                f"Input is not JSON serializable: {err}"
+            ) from err
+    elif isinstance(payload, str):
+        for start in range(0, len(payload), chunk_size):
+            yield payload[start : start + chunk_size].encode("utf-8")
+    elif isinstance(payload, (bytes, bytearray, memoryview)):
+        view = memoryview(payload).cast("B")
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
+    elif hasattr(payload, "read"):
+        while chunk := payload.read(chunk_size):
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    elif isinstance(payload, Iterable):
+        for chunk in payload:
+            if isinstance(chunk, str):
+                yield chunk.encode("utf-8")
+            elif isinstance(chunk, (bytes, bytearray, memoryview)):
+                yield chunk
+            else:
+                raise InvalidDataException(
+                    "Input chunks must be JSON-encoded str or bytes"
+                )
+    else:
+        raise InvalidDataException("Input must be JSON data or a stream of JSON data")
+
+
+def iter_compressed(
+    chunks: Iterable[bytes],
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    zdict: CompressionDictionary | None = None,
+    codec: Codec | None = None,
+) -> Iterator[bytes]:
+    """
+    Compresses a stream of chunks incrementally, with zlib unless a codec is given.
+
+    For levels 1-9 the concatenated output is byte-identical to zlib.compress(data, level).
+
+    :param chunks: Raw byte chunks
+    :param level: zlib compression level
+    :param zdict: Optional preset dictionary
+    :param codec: Codec to use instead of zlib at the given level
+    :return: Iterator of compressed chunks
+    """
+    if codec is None:
+        codec = ZlibCodec(level, zdict)
+    compressor = codec.compressobj()
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def compress_chunks(chunks: Iterable[bytes], codec: Codec) -> tuple[bytes, int]:
+    """
+    Compresses a stream of chunks into a single compressed bytes object.
+
+    :param chunks: Raw byte chunks
+    :param codec: Codec to use
+    :return: The compressed data, and the raw size of the chunks
+    """
+    compressor = codec.compressobj()
+    compressed = []
+    raw_size = 0
+    for chunk in chunks:
+        raw_size += len(chunk)
+        compressed.append(compressor.compress(chunk))
+    compressed.append(compressor.flush())
+    return b"".join(compressed), raw_size
+
+
+def iter_b64encoded(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Base64 encodes a stream of chunks on the fly.
+
+    Chunks are encoded in multiples of 3 bytes so the concatenated output is
+    byte-identical to b64encode of the concatenated input.
+
+    :param chunks: Raw byte chunks
+    :return: Iterator of base64 encoded chunks
+    """
+    remainder = b""
+    for chunk in chunks:
+        if remainder:
+            chunk = remainder + chunk
+        usable = len(chunk) - len(chunk) % 3
+        if usable:
+            yield b2a_base64(chunk[:usable], newline=False)
+        remainder = bytes(chunk[usable:])
+    if remainder:
+        yield b2a_base64(remainder, newline=False)
+
+
+def iter_prepared_payload(
+    payload: StreamablePayload,
+    level: int = DEFAULT_COMPRESSION_LEVEL,
+    chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    zdict: CompressionDictionary | None = None,
+    codec: Codec | None = None,
+) -> Iterator[bytes]:
+    """
+    Streaming equivalent of TnApi.prepare_data_for_generate_solutions.
+
+    Serializes, compresses and base64 encodes the payload chunk by chunk, so peak memory
+    is bounded by chunk_size rather than by the payload size.
+
+    :param payload: See iter_payload_bytes
+    :param level: zlib compression level
+    :param chunk_size: Approximate size of the raw chunks fed to the compressor
+    :param zdict: Optional preset dictionary
+    :param codec: Codec to use instead of zlib at the given level
+    :return: Iterator of base64 encoded, compressed chunks
+    """
+    return iter_b64encoded(
+        iter_compressed(iter_payload_bytes(payload, chunk_size), level, zdict, codec)
+    )
@@ -0,0 +1,432 @@
+import json
+import math
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, fields
+from operator import attrgetter, itemgetter
+
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.models import GenerateSolutionsRequest, PricingSolution, Segment
+from tn_sdk.utils.constants import VALID_CABIN_CLASSES
+
+# What validate accepts
+ValidatablePayload = str | bytes | dict | GenerateSolutionsRequest
+
+# Local time with the UTC offset, e.g. 2025-11-15T16:40:00.000-04:00
+_TIME_PATTERN = re.compile(
+    r"\d{4}-\d\d-\d\dT\d\d:\d\d(?::\d\d(?:\.\d+)?)?(?:Z|[+-]\d\d:\d\d)\Z"
+)
+_REQUEST_FIELDS = frozenset(("trip_id", "datasource_responses"))
+# Types JSON values of a model field's annotation may have
+_JSON_TYPES = {str: (str,), int: (int,), float: (float, int), bool: (bool,)}
+
+
+def _schema(model: type) -> list[tuple[str, tuple[type, ...] | None, bool, object]]:
+    """
+    The name, accepted JSON types (None for any), whether it is required and the default
+    of each field of a model. The models mirror the README's generate-solutions schema.
+    """
+    return [
+        (
+            field.name,
+            _JSON_TYPES.get(field.type),
+            field.default is MISSING and field.default_factory is MISSING,
+            None if field.default is MISSING else field.default,
+        )
+        for field in fields(model)
+    ]
+
+
+def _fields_message(keys, required: frozenset, known: frozenset) -> str:
+    missing = sorted(required - keys)
+    if missing:
+        return f"is missing {', '.join(missing)}"
+    return f"has unknown fields {', '.join(sorted(keys - known))}"
+
+
+class _Source:
+    """
+    Lines of a generated check function. With explain, a failed check returns the path and
+    description of the error, otherwise the index of the failed solution.
+    """
+
+    def __init__(self, models: bool, explain: bool):
+        self.models = models
+        self.explain = explain
+        self.lines: list[str] = []
+        self.depth = 0
+        # Globals the generated code uses, on top of those of the validator
+        self.namespace: dict = {}
+
+    def emit(self, line: str) -> None:
+        self.lines.append("    " * self.depth + line)
+
+    def check(self, condition: str, path: str, message: str) -> None:
+        self.emit(f"if {condition}:")
+        self.depth += 1
+        self.emit(f"return f{path!r}, f{message!r}" if self.explain else "return index")
+        self.depth -= 1
+
+    def load(self, target: str, schema: list, path: str) -> None:
+        """
+        Loads the fields of the schema into locals of the same name (segments into legs)
+        and checks their types. Explained field by field, otherwise the fields (required
+        ones of dicts) are fetched with a single getter and checked grouped by type.
+        """
+        names = {"segments": "legs"}
+        fetched = []
+        for name, types, required, default in schema:
+            local = names.get(name, name)
+            if not self.explain and (self.models or required):
+                fetched.append((name, local))
+            elif self.models:
+                self.emit(f"{local} = {target}.{name}")
+            elif required:
+                self.emit(f"{local} = {target}[{name!r}]")
+            else:
+                self.emit(f"{local} = {target}.get({name!r}, {default!r})")
+            if self.explain and types is not None:
+                self.check(
+                    " and ".join(f"type({local}) is not {t.__name__}" for t in types),
+                    f"{path}.{name}",
+                    f"must be {' or '.join(t.__name__ for t in types)},"
+                    f" not {{type({local}).__name__}}",
+                )
+        if self.explain:
+            return
+
+        if fetched:
+            getter = f"_{target}_fields"
+            self.namespace[getter] = (attrgetter if self.models else itemgetter)(
+                *(name for name, _ in fetched)
+            )
+            self.emit(
+                f"{', '.join(local for _, local in fetched)}," f" = {getter}({target})"
+                if len(fetched) > 1
+                else f"{fetched[0][1]} = {getter}({target})"
+            )
+
+        groups: dict[tuple[type, ...], list[str]] = {}
+        for name, types, _, _ in schema:
+            if types is not None:
+                groups.setdefault(types, []).append(name)
+        for types, group in groups.items():
+            if len(types) == 1:
+                chain = " is ".join(f"type({name})" for name in group)
+                self.check(f"not ({chain} is {types[0].__name__})", "", "")
+            else:
+                for name in group:
+                    self.check(
+                        " and ".join(
+                            f"type({name}) is not {t.__name__}" for t in types
+                        ),
+                        "",
+                        "",
+                    )
+
+
+def _generate(models: bool, explain: bool, check_times: bool) -> _Source:
+    """
+    Generates the source of a function checking pricing solutions (dicts, or models)
+    with every check inlined, from the schema of the models.
+
+    check(solutions) returns the index of the first invalid solution (or -1): the fields
+    are looked up at once, and checked grouped by type. explain(solution) checks them one
+    by one, returning the path and description of the first error (or None).
+    """
+    source = _Source(models, explain)
+    solution_schema = [
+        # Segments are required, though the model defaults to none
+        (name, types, required or name == "segments", default)
+        for name, types, required, default in _schema(PricingSolution)
+        if name != "baggage"
+    ]
+    segment_schema = _schema(Segment)
+
+    if explain:
+        source.emit("def explain(solution):")
+        source.depth += 1
+    else:
+        source.emit("def check(solutions):")
+        source.depth += 1
+        source.emit("for index, solution in enumerate(solutions):")
+        source.depth += 1
+
+    if models:
+        source.check(
+            "type(solution) is not PricingSolution", "", "is not a PricingSolution"
+        )
+        source.load("solution", solution_schema, "")
+    elif explain:
+        source.check("type(solution) is not dict", "", "is not an object")
+        source.check(
+            "not _SOLUTION_REQUIRED <= solution.keys() <= _SOLUTION_FIELDS",
+            "",
+            "{_fields_message(solution.keys(), _SOLUTION_REQUIRED, _SOLUTION_FIELDS)}",
+        )
+        source.load("solution", solution_schema, "")
+    else:
+        source.check(
+            "type(solution) is not dict or not solution.keys() <= _SOLUTION_FIELDS",
+            "",
+            "",
+        )
+        # A missing required field raises KeyError, at no cost otherwise
+        source.emit("try:")
+        source.depth += 1
+        source.load("solution", [f for f in solution_schema if f[2]], "")
+        source.depth -= 1
+        source.emit("except KeyError:")
+        source.emit("    return index")
+        source.load("solution", [f for f in solution_schema if not f[2]], "")
+
+    source.check("not pricing_solution_id", ".pricing_solution_id", "is empty")
+    source.check(
+        "not 0 <= total_price < _INF",
+        ".total_price",
+        "must be a positive finite number",
+    )
+    source.check(
+        "type(legs) is not list or not legs",
+        ".segments",
+        "must be a non-empty list of legs",
+    )
+
+    leg_path = ".segments[{leg_index}]"
+    source.emit(
+        "for leg_index, leg in enumerate(legs):" if explain else "for leg in legs:"
+    )
+    source.depth += 1
+    source.check(
+        "type(leg) is not list or not leg", leg_path, "must be a non-empty list"
+    )
+    source.emit("previous = 1")
+    source.emit(
+        "for segment_index, segment in enumerate(leg):"
+        if explain
+        else "for segment in leg:"
+    )
+    source.depth += 1
+
+    segment_path = leg_path + "[{segment_index}]"
+    if models:
+        source.check("type(segment) is not Segment", segment_path, "is not a Segment")
+        source.load("segment", segment_schema, segment_path)
+    elif explain:
+        source.check("type(segment) is not dict", segment_path, "is not an object")
+        source.check(
+            "segment.keys() != _SEGMENT_FIELDS",
+            segment_path,
+            "{_fields_message(segment.keys(), _SEGMENT_FIELDS, _SEGMENT_FIELDS)}",
+        )
+        source.load("segment", segment_schema, segment_path)
+    else:
+        # Every field is required: with the lookups succeeding, there are no others
+        source.check(
+            f"type(segment) is not dict or len(segment) != {len(segment_schema)}",
+            "",
+            "",
+        )
+        source.emit("try:")
+        source.depth += 1
+        source.load("segment", segment_schema, "")
+        source.depth -= 1
+        source.emit("except KeyError:")
+        source.emit("    return index")
+
+    source.check(
+        "cabin_class not in _CABIN_CLASSES",
+        f"{segment_path}.cabin_class",
+        "{cabin_class!r} is not one of {_CABIN_CLASSES_TEXT}",
+    )
+    for name in ("from_iata", "to_iata"):
+        source.check(
+            f"len({name}) != 3",
+            f"{segment_path}.{name}",
+            f"{{{name}!r}} is not an IATA code",
+        )
+    source.check(
+        "departure_timestamp < previous",
+        f"{segment_path}.departure_timestamp",
+        "must be positive and not before the arrival of the previous segment",
+    )
+    source.check(
+        "arrival_timestamp < departure_timestamp",
+        f"{segment_path}.arrival_timestamp",
+        "is before the departure",
+    )
+    if check_times:
+        for name in ("departure_time", "arrival_time"):
+            source.check(
+                f"_match_time({name}) is None",
+                f"{segment_path}.{name}",
+                f"{{{name}!r}} is not an ISO 8601 local time with UTC offset",
+            )
+    source.emit("previous = arrival_timestamp")
+
+    source.depth = 1
+    source.emit("return None" if explain else "return -1")
+    return source
+
+
+class PayloadValidator:
+    """
+    Checks generate-solutions payloads before they are compressed and sent, so malformed
+    itineraries fail right away instead of after an upload the API rejects.
+
+    The checks are generated from the schema of the models (see the README) and compiled
+    once, into a single function looping over the pricing solutions of a datasource:
+    every pricing solution and segment is checked in one pass, without a call per field.
+    Only once a solution fails is it checked again, for the error message.
+    """
+
+    def __init__(
+        self,
+        cabin_classes: Iterable[str] = VALID_CABIN_CLASSES,
+        check_times: bool = False,
+    ):
+        """
+        Compiles the checks.
+
+        :param cabin_classes: Accepted cabin_class values (defaults to E, P, B and F)
+        :param check_times: Check that departure_time and arrival_time are ISO 8601 local
+            times with their UTC offset. It about triples the cost (defaults to False)
+        """
+        self._cabin_classes = tuple(cabin_classes)
+        self._check_times = check_times
+
+        namespace = {
+            "PricingSolution": PricingSolution,
+            "Segment": Segment,
+            "_INF": math.inf,
+            "_CABIN_CLASSES": frozenset(self._cabin_classes),
+            "_CABIN_CLASSES_TEXT": ", ".join(self._cabin_classes),
+            "_SOLUTION_FIELDS": frozenset(
+                name for name, *_ in _schema(PricingSolution)
+            ),
+            "_SOLUTION_REQUIRED": frozenset(
+                name for name, _, required, _ in _schema(PricingSolution) if required
+            )
+            | {"segments"},
+            "_SEGMENT_FIELDS": frozenset(name for name, *_ in _schema(Segment)),
+            "_fields_message": _fields_message,
+            "_match_time": _TIME_PATTERN.match,
+        }
+        self._checks = {}
+        for models in (False, True):
+            self._checks[models] = (
+                self._compile(
+                    _generate(models, False, check_times), "check", namespace
+                ),
+                self._compile(
+                    _generate(models, True, check_times), "explain", namespace
+                ),
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"PayloadValidator(cabin_classes={self._cabin_classes!r},"
+            f" check_times={self._check_times!r})"
+        )
+
+    def __reduce__(self):
+        # The compiled functions can't be pickled, they are compiled again instead
+        return type(self), (self._cabin_classes, self._check_times)
+
+    @staticmethod
+    def _compile(source: _Source, name: str, namespace: dict) -> Callable:
+        code = compile(
+            "\n".join(source.lines) + "\n", f"<tn_sdk payload validator {name}>", "exec"
+        )
+        scope = namespace | source.namespace
+        exec(code, scope)
+        return scope[name]
+
+    def validate(self, payload: ValidatablePayload) -> None:
+        """
+        Checks a payload, raising on the first error.
+
+        :param payload: JSON encoded str or bytes, a dict or a GenerateSolutionsRequest
+        :raises InvalidDataException: With the path of the first invalid value, e.g.
+            datasource_responses['4b69...'][3] (pricing_solution_id 'e494...')
+            .segments[0][1].cabin_class
+        """
+        if isinstance(payload, (str, bytes, bytearray)):
+            try:
+                payload = json.loads(payload)
+            except json.JSONDecodeError as err:
+                raise InvalidDataException(f"Input is not valid JSON: {err}") from err
+
+        if isinstance(payload, GenerateSolutionsRequest):
+            models = True
+            trip_id, responses = payload.trip_id, payload.datasource_responses
+        elif isinstance(payload, dict):
+            models = False
+            if not payload.keys() <= _REQUEST_FIELDS:
+                unknown = ", ".join(sorted(payload.keys() - _REQUEST_FIELDS))
+                raise InvalidDataException(f"Payload has unknown fields {unknown}")
+            if "datasource_responses" not in payload:
+                raise InvalidDataException("Payload is missing datasource_responses")
+            trip_id = payload.get("trip_id", "")
+            responses = payload["datasource_responses"]
+        else:
+            raise InvalidDataException(
+                "Payload must be JSON, a dict or a GenerateSolutionsRequest"
+            )
+
+        if type(trip_id) is not str:
+            raise InvalidDataException(
+                f"trip_id must be str, not {type(trip_id).__name__}"
+            )
+        if type(responses) is not dict:
+            raise InvalidDataException("datasource_responses must be an object")
+
+        check, explain = self._checks[models]
+        for datasource, solutions in responses.items():
+            if type(solutions) is not list:
+                raise InvalidDataException(
+                    f"datasource_responses[{datasource!r}] must be a list"
+                )
+            index = check(solutions)
+            if index >= 0:
+                raise self._error(datasource, index, solutions[index], explain)
+
+    def validate_many(
+        self, payloads: Iterable[ValidatablePayload]
+    ) -> list[InvalidDataException | None]:
+        """
+        Checks many payloads, an invalid one doesn't stop the others.
+
+        :param payloads: JSON encoded strings or bytes, dicts and/or
+            GenerateSolutionsRequests
+        :return: For each payload, None or the InvalidDataException describing its first
+            error
+        """
+        errors = []
+        for payload in payloads:
+            try:
+                self.validate(payload)
+            except InvalidDataException as err:
+                errors.append(err)
+            else:
+                errors.append(None)
+        return errors
+
+    @staticmethod
+    def _error(
+        datasource: str, index: int, solution, explain: Callable
+    ) -> InvalidDataException:
+        """
+        Checks a solution the compiled check failed again, field by field, describing
+        where its first error is.
+        """
+        path, message = explain(solution) or ("", "is invalid")
+        location = f"datasource_responses[{datasource!r}][{index}]"
+        solution_id = (
+            solution.get("pricing_solution_id")
+            if isinstance(solution, dict)
+            else getattr(solution, "pricing_solution_id", None)
+        )
+        if solution_id and isinstance(solution_id, str):
+            location += f" (pricing_solution_id {solution_id!r})"
+        return InvalidDataException(f"{location}{path} {message}")
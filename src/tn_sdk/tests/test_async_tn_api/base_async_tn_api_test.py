@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+class BaseAsyncTnApiTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Base class that handles all the common mocking setup.
+    All tests that cover AsyncTnApi should inherit from this class.
+    """
+
+    def setUp(self):
+        # Setup environmental variables
+        self.env_patcher = patch.dict(
+            "os.environ",
+            {"TN_SDK_CLIENT_ID": "test_id", "TN_SDK_CLIENT_SECRET": "test_secret"},
+        )
+        self.env_patcher.start()
+
+        # Patch the Path constructor
+        self.path_patcher = patch("tn_sdk.core.tn_api.Path")
+        self.MockPath = self.path_patcher.start()
+
+        # Patch path logic
+        self.mock_path_instance = MagicMock()
+        self.MockPath.return_value.resolve.return_value = self.mock_path_instance
+        self.mock_path_instance.parent.exists.return_value = True
+        self.mock_path_instance.exists.return_value = False
+
+        # Mock the credential store backing the credentials file
+        self.store_patcher = patch("tn_sdk.core.tn_api.FileCredentialStore")
+        self.MockStore = self.store_patcher.start()
+        self.mock_store_instance = self.MockStore.return_value
+        self.mock_store_instance.load.return_value = {}
+        self.mock_store_instance.issued_at.return_value = None
+
+        # Mock the async client
+        self.client_patcher = patch("httpx.AsyncClient")
+        self.MockAsyncClient = self.client_patcher.start()
+        self.mock_client_instance = self.MockAsyncClient.return_value
+        self.mock_client_instance.request = AsyncMock()
+        self.mock_client_instance.aclose = AsyncMock()
+
+        # Skip the backoff between network retries
+        self.sleep_patcher = patch("asyncio.sleep", new=AsyncMock())
+        self.mock_sleep = self.sleep_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.path_patcher.stop()
+        self.store_patcher.stop()
+        self.client_patcher.stop()
+        self.sleep_patcher.stop()
+
+    @staticmethod
+    def make_response(
+        status_code: int = 200,
+        json_data: dict | None = None,
+        headers: dict | None = None,
+    ):
+        response = MagicMock(status_code=status_code)
+        response.headers = headers or {}
+        response.json.return_value = json_data if json_data is not None else {}
+        response.aclose = AsyncMock()
+        return response
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock
+
+from tn_sdk import AsyncTnApi
+from tn_sdk.tests.test_async_tn_api.base_async_tn_api_test import BaseAsyncTnApiTest
+
+
+class TestAsyncBackgroundRefresh(BaseAsyncTnApiTest):
+
+    async def test_background_refresh__token_close_to_expiry__refreshed_by_background_task(
+        self,
+    ):
+        # The refresh loop needs real sleeps to yield to the event loop
+        self.sleep_patcher.stop()
+
+        api = AsyncTnApi(token_ttl=0.2, refresh_ahead=0.05, background_refresh=True)
+        api._fetch_new_credentials_from_api = AsyncMock(
+            return_value={"prod_token": "fresh"}
+        )
+        api._credentials = {"prod_token": "initial"}
+        api._track_credentials_expiry(api._credentials, time.time())
+
+        async with api:
+            for _ in range(300):
+                if api.refresh_stats.proactive:
+                    break
+                await asyncio.sleep(0.01)
+
+        self.assertGreaterEqual(api.refresh_stats.proactive, 1)
+        self.assertEqual(api._credentials, {"prod_token": "fresh"})
+        self.assertIsNone(api._refresh_task)
+        self.mock_client_instance.request.assert_not_awaited()
+
+    async def test_refresh__cancelled_while_acquiring_store_lock__lock_released(self):
+        self.sleep_patcher.stop()
+        acquiring, proceed = threading.Event(), threading.Event()
+        store_lock = threading.Lock()
+
+        class SlowLock:
+            def __enter__(self):
+                acquiring.set()
+                proceed.wait(5)
+                store_lock.acquire()
+
+            def __exit__(self, *exc_info):
+                store_lock.release()
+
+        self.mock_store_instance.lock.return_value = SlowLock()
+        api = AsyncTnApi()
+        api._fetch_new_credentials_from_api = AsyncMock(
+            return_value={"prod_token": "fresh"}
+        )
+
+        task = asyncio.create_task(api._refresh_credentials({}))
+        while not acquiring.is_set():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        # Still waiting for the thread holding onto the store lock
+        self.assertFalse(task.done())
+        proceed.set()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertFalse(store_lock.locked())
+        api._fetch_new_credentials_from_api.assert_not_awaited()
@@ -0,0 +1,40 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from tn_sdk import AsyncTnApi
+from tn_sdk.exceptions.exceptions import TnAuthenticationFailedException
+from tn_sdk.tests.test_async_tn_api.base_async_tn_api_test import BaseAsyncTnApiTest
+
+
+class TestAsyncFetchNewCredentialsFromApi(BaseAsyncTnApiTest):
+
+    async def test_fetch_new_credentials_from_api__api_call_succeeds__returns_data_and_saves_to_disk(
+        self,
+    ):
+        api = AsyncTnApi()
+        expected_data = {"prod_token": "new_token"}
+        self.mock_client_instance.request.return_value = self.make_response(
+            200, expected_data
+        )
+
+        with patch.object(api, "_save_credentials_to_disk") as mock_save:
+            result = await api._fetch_new_credentials_from_api()
+
+            self.assertEqual(result, expected_data)
+            mock_save.assert_called_once_with(expected_data)
+
+    async def test_fetch_new_credentials_from_api__api_call_fails__raises_tn_authentication_exception(
+        self,
+    ):
+        api = AsyncTnApi()
+        response = self.make_response(403)
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "Boom", request=MagicMock(), response=MagicMock(text="denied")
+        )
+        self.mock_client_instance.request.return_value = response
+
+        with self.assertRaises(TnAuthenticationFailedException) as cm:
+            await api._fetch_new_credentials_from_api()
+
+        self.assertIn("denied", str(cm.exception))
@@ -0,0 +1,26 @@
+from unittest.mock import patch
+
+from tn_sdk import AsyncTnApi
+from tn_sdk.tests.test_async_tn_api.base_async_tn_api_test import BaseAsyncTnApiTest
+
+
+class TestAsyncInit(BaseAsyncTnApiTest):
+
+    def test_init__valid_inputs__creates_pooled_async_client(self):
+        api = AsyncTnApi(max_connections=250, max_keepalive_connections=50)
+
+        limits = self.MockAsyncClient.call_args[1]["limits"]
+        self.assertEqual(limits.max_connections, 250)
+        self.assertEqual(limits.max_keepalive_connections, 50)
+        self.assertEqual(api._client_id, "test_id")
+
+    def test_init__httpx_not_installed__raises_import_error(self):
+        with patch("tn_sdk.core.async_tn_api.httpx", None):
+            with self.assertRaises(ImportError):
+                AsyncTnApi()
+
+    async def test_context_manager__exit__closes_async_client(self):
+        async with AsyncTnApi():
+            pass
+
+        self.mock_client_instance.aclose.assert_awaited_once()
@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from tn_sdk import AsyncTnApi
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks
+from tn_sdk.tests.test_async_tn_api.base_async_tn_api_test import BaseAsyncTnApiTest
+
+
+class TestAsyncRequest(BaseAsyncTnApiTest):
+
+    async def test_request__no_credentials_in_memory__fetches_new_credentials_before_request(
+        self,
+    ):
+        api = AsyncTnApi()
+        api._credentials = {}
+        api._fetch_new_credentials_from_api = AsyncMock(
+            return_value={"sandbox_token": "fresh"}
+        )
+        self.mock_client_instance.request.return_value = self.make_response(
+            json_data={"ok": True}
+        )
+
+        result = await api._request("GET", "/endpoint", TokenType.SANDBOX)
+
+        self.assertEqual(result, {"ok": True})
+        api._fetch_new_credentials_from_api.assert_awaited_once()
+        call_args = self.mock_client_instance.request.call_args
+        self.assertEqual(call_args[1]["headers"]["Authorization"], "Token fresh")
+
+    async def test_request__401_returned__refreshes_from_api_and_retries(self):
+        api = AsyncTnApi()
+        api._credentials = {"prod_token": "stale"}
+
+        # Logic: Disk is stale, API fetch required
+        api._load_token_from_disk = MagicMock(return_value={"prod_token": "stale"})
+        api._fetch_new_credentials_from_api = AsyncMock(
+            return_value={"prod_token": "fresh"}
+        )
+        self.mock_client_instance.request.side_effect = [
+            self.make_response(401),
+            self.make_response(200),
+        ]
+
+        await api._request("GET", "/test")
+
+        api._fetch_new_credentials_from_api.assert_awaited_once()
+        headers_second_call = self.mock_client_instance.request.call_args_list[1][1][
+            "headers"
+        ]
+        self.assertEqual(headers_second_call["Authorization"], "Token fresh")
+
+    async def test_request__401_returned_and_disk_has_newer_token__uses_disk_token(
+        self,
+    ):
+        api = AsyncTnApi()
+        api._credentials = {"prod_token": "old_mem"}
+        api._load_token_from_disk = MagicMock(return_value={"prod_token": "newer_disk"})
+        api._fetch_new_credentials_from_api = AsyncMock()
+        self.mock_client_instance.request.side_effect = [
+            self.make_response(401),
+            self.make_response(200),
+        ]
+
+        await api._request("GET", "/test")
+
+        api._fetch_new_credentials_from_api.assert_not_awaited()
+        headers_second_call = self.mock_client_instance.request.call_args_list[1][1][
+            "headers"
+        ]
+        self.assertEqual(headers_second_call["Authorization"], "Token newer_disk")
+
+    async def test_request__transient_503_returned__retries_with_backoff(self):
+        api = AsyncTnApi()
+        api._credentials = {"prod_token": "token"}
+        self.mock_client_instance.request.side_effect = [
+            self.make_response(503),
+            self.make_response(503),
+            self.make_response(200, {"ok": True}),
+        ]
+
+        result = await api._request("POST", "/test")
+
+        self.assertEqual(result, {"ok": True})
+        self.assertEqual(self.mock_client_instance.request.await_count, 3)
+        self.mock_sleep.assert_awaited_once_with(1.0)
+
+    async def test_request__retry_after__waits_at_least_as_asked(self):
+        api = AsyncTnApi()
+        api._credentials = {"prod_token": "token"}
+        self.mock_client_instance.request.side_effect = [
+            self.make_response(429, headers={"Retry-After": "3"}),
+            self.make_response(503, headers={"Retry-After": "0.2"}),
+            self.make_response(200, {"ok": True}),
+        ]
+
+        result = await api._request("GET", "/test")
+
+        self.assertEqual(result, {"ok": True})
+        # Retry-After over no backoff, then the 1s backoff over a shorter Retry-After
+        self.assertEqual(
+            [call.args[0] for call in self.mock_sleep.await_args_list], [3.0, 1.0]
+        )
+
+    async def test_request__concurrent_401s__refreshes_exactly_once(self):
+        api = AsyncTnApi()
+        api._credentials = {"prod_token": "stale"}
+        api._fetch_new_credentials_from_api = AsyncMock(
+            return_value={"prod_token": "fresh"}
+        )
+
+        stale_senders = []
+        all_sent_stale = asyncio.Event()
+
+        async def fake_request(method, url, headers, **kwargs):
+            if headers["Authorization"] == "Token stale":
+                # Make sure every task used the stale token before any refresh happens
+                stale_senders.append(url)
+                if len(stale_senders) == 5:
+                    all_sent_stale.set()
+                await all_sent_stale.wait()
+                return self.make_response(401)
+            return self.make_response(200, {"ok": True})
+
+        self.mock_client_instance.request.side_effect = fake_request
+
+        results = await asyncio.gather(*(api._request("GET", "/t") for _ in range(5)))
+
+        self.assertEqual(results, [{"ok": True}] * 5)
+        api._fetch_new_credentials_from_api.assert_awaited_once()
+        self.assertEqual(api.refresh_stats.performed, 1)
+        self.assertEqual(api.refresh_stats.coalesced, 4)
+
+    async def test_request__hooks__report_retries_and_request_end(self):
+        hooks = MagicMock(spec=TnApiHooks)
+        api = AsyncTnApi(hooks=hooks)
+        api._credentials = {"prod_token": "valid"}
+        self.mock_client_instance.request.side_effect = [
+            self.make_response(503),
+            self.make_response(200),
+        ]
+
+        await api._request("GET", "/endpoint?trip_id=1")
+
+        # Reported without the query string, as by the sync client
+        hooks.on_retry.assert_called_once_with("GET", "/endpoint", 503, None)
+        hooks.on_request_start.assert_called_once_with(
+            "GET", "/endpoint", TokenType.PRODUCTION
+        )
+        self.assertEqual(hooks.on_request_end.call_args.args[1], "/endpoint")
+        self.assertEqual(hooks.on_request_end.call_args.args[3], 200)
@@ -0,0 +1,133 @@
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.benchmarks.replay import replay, request_kwargs
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.recorder import REDACTED, TrafficRecorder, read_trace
+
+
+class TestRecordAndReplay(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "trace.jsonl.gz"
+
+    def _client(self, server: StubApiServer, **kwargs) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+            **kwargs,
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def _record_traffic(self, requests: int = 10) -> bytes:
+        """
+        Records requests to a stub, returning the payload they sent.
+        """
+        with (
+            StubApiServer(burst_every=requests, burst_status=400) as server,
+            TrafficRecorder(self.path) as recorder,
+        ):
+            client = self._client(server, recorder=recorder)
+            payload = client.prepare_data_for_generate_solutions(
+                json.dumps(generate_request_data(5))
+            )
+            for index in range(requests):
+                try:
+                    client._request(
+                        "POST",
+                        "/generate/",
+                        TokenType.SANDBOX,
+                        data=payload,
+                        headers={"Authorization": "Token leaked", "X-Run": "1"},
+                    )
+                except Exception:
+                    pass
+                if index == 0:
+                    time.sleep(0.05)
+        return payload
+
+    def test_record__entries(self):
+        payload = self._record_traffic()
+
+        entries = list(read_trace(self.path))
+        self.assertEqual(len(entries), 10)
+        first = entries[0]
+        self.assertEqual(first["method"], "POST")
+        self.assertEqual(first["endpoint"], "/generate/")
+        self.assertEqual(first["token_type"], TokenType.SANDBOX.value)
+        self.assertEqual(first["data"], payload.decode())
+        self.assertEqual(first["data_encoding"], "ascii")
+        self.assertEqual(first["headers"], {"Authorization": REDACTED, "X-Run": "1"})
+        self.assertEqual((first["status"], first["error"]), (200, None))
+        self.assertEqual(
+            (entries[-1]["status"], entries[-1]["error"]), (400, "HTTPError")
+        )
+        self.assertGreater(entries[1]["response_bytes"], 0)
+        self.assertGreater(entries[1]["seconds"], 0)
+        self.assertGreaterEqual(entries[1]["at"] - first["at"], 0.05)
+
+    def test_record__streamed_response(self):
+        with StubApiServer() as server, TrafficRecorder(self.path) as recorder:
+            client = self._client(server, recorder=recorder)
+            with client._request("GET", "/x/", stream=True) as response:
+                self.assertEqual(response.json(), {"ok": True})
+
+        (entry,) = read_trace(self.path)
+        self.assertEqual((entry["status"], entry["response_bytes"]), (200, 12))
+
+    def test_request_kwargs__drops_redacted_headers(self):
+        entry = {
+            "headers": {"Authorization": REDACTED, "X-Run": "1"},
+            "data": "AP8=",
+            "data_encoding": "base64",
+        }
+
+        self.assertEqual(
+            request_kwargs(entry), {"headers": {"X-Run": "1"}, "data": b"\x00\xff"}
+        )
+
+    def test_replay__sends_recorded_requests_at_pace(self):
+        self._record_traffic()
+
+        with StubApiServer() as server:
+            client = self._client(server)
+            started = time.perf_counter()
+            result = replay(client, read_trace(self.path), speed=1, concurrency=4)
+            elapsed = time.perf_counter() - started
+            stats = server.stats
+
+        # The stub replaying to has no failure bursts
+        self.assertEqual((result["requests"], result["errors"]), (10, 0))
+        self.assertEqual(stats.requests, 10)
+        # The pause after the first recorded request is kept
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertGreater(result["p99_ms"], 0)
+        self.assertGreater(result["recorded_p99_ms"], 0)
+
+    def test_replay__speed_zero__as_fast_as_possible(self):
+        entries = [
+            {"at": float(index), "method": "GET", "endpoint": "/x/", "seconds": 0.1}
+            for index in range(5)
+        ]
+        entries = [{**entry, "token_type": "prod_token"} for entry in entries]
+        entries.append({**entries[0], "streamed_body": True})
+
+        with StubApiServer() as server:
+            started = time.perf_counter()
+            result = replay(self._client(server), entries, speed=0)
+            elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 1)
+        self.assertEqual((result["requests"], result["skipped"]), (5, 1))
+        self.assertEqual(result["recorded_p50_ms"], 100)
@@ -0,0 +1,58 @@
+import unittest
+
+from requests import HTTPError
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+
+
+class TestStubApiServer(unittest.TestCase):
+    def _client(self, server: StubApiServer) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_request__no_credentials__authenticates_first(self):
+        with StubApiServer(response_body={"solutions": []}) as server:
+            result = self._client(server)._request("GET", "/endpoint")
+
+            self.assertEqual(result, {"solutions": []})
+            stats = server.stats
+        self.assertEqual((stats.auth_requests, stats.requests), (1, 1))
+
+    def test_request__tokens_expired__refreshes_after_401(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            client._request("GET", "/endpoint")
+            server.expire_tokens()
+
+            client._request("GET", "/endpoint")
+
+            stats = server.stats
+        self.assertEqual(stats.unauthorized, 1)
+        self.assertEqual(stats.auth_requests, 2)
+        self.assertEqual(stats.statuses, {200: 4, 401: 1})
+
+    def test_request__failure_burst__retried(self):
+        with StubApiServer(burst_every=2, burst_length=1, burst_status=503) as server:
+            client = self._client(server)
+            client._request("GET", "/endpoint")
+
+            client._request("GET", "/endpoint")
+
+            stats = server.stats
+        self.assertEqual(stats.failures, 1)
+        self.assertEqual(stats.statuses[503], 1)
+
+    def test_request__every_request_fails__raises(self):
+        with StubApiServer(burst_every=1, burst_length=1, burst_status=400) as server:
+            client = self._client(server)
+
+            with self.assertRaises(HTTPError):
+                client._request("GET", "/endpoint")
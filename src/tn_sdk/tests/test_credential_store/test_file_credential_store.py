@@ -0,0 +1,92 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tn_sdk.core.credential_store import FileCredentialStore
+
+
+class TestFileCredentialStore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "credentials.json"
+        self.store = FileCredentialStore(self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_load__file_does_not_exist__returns_empty_dict(self):
+        self.assertEqual(self.store.load(), {})
+
+    def test_load__corrupt_json_file__returns_empty_dict(self):
+        self.path.write_text("{ broken_json: ", encoding="utf-8")
+
+        self.assertEqual(self.store.load(), {})
+
+    def test_load__file_unchanged__parses_file_only_once(self):
+        self.path.write_text(json.dumps({"prod_token": "abc"}), encoding="utf-8")
+
+        with patch.object(
+            Path, "read_text", autospec=True, side_effect=Path.read_text
+        ) as mock_read:
+            first = self.store.load()
+            second = self.store.load()
+
+        self.assertEqual(first, {"prod_token": "abc"})
+        self.assertEqual(second, first)
+        mock_read.assert_called_once()
+
+    def test_load__file_replaced_by_another_process__returns_new_content(self):
+        self.path.write_text(json.dumps({"prod_token": "old"}), encoding="utf-8")
+        self.store.load()
+
+        FileCredentialStore(self.path).save({"prod_token": "new"})
+
+        self.assertEqual(self.store.load(), {"prod_token": "new"})
+
+    def test_save__valid_data__writes_indented_json_without_leftover_temp_files(self):
+        token_data = {"prod_token": "token"}
+
+        self.store.save(token_data)
+
+        self.assertEqual(
+            self.path.read_text(encoding="utf-8"), json.dumps(token_data, indent=4)
+        )
+        self.assertEqual(
+            [p.name for p in Path(self.temp_dir.name).iterdir()], ["credentials.json"]
+        )
+
+    def test_save__os_error_occurs__silently_passes(self):
+        store = FileCredentialStore(Path(self.temp_dir.name) / "missing" / "c.json")
+
+        # Should not raise
+        try:
+            store.save({})
+        except OSError:
+            self.fail("OSError should have been caught")
+
+    def test_lock__concurrent_refreshers__only_first_one_refreshes(self):
+        refreshes = []
+
+        def refresh_if_needed():
+            # Each worker has its own store, like separate processes would
+            store = FileCredentialStore(self.path)
+            with store.lock():
+                if store.load():
+                    return
+                time.sleep(0.05)
+                refreshes.append(1)
+                store.save({"prod_token": "fresh"})
+
+        threads = [threading.Thread(target=refresh_if_needed) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(refreshes), 1)
+        self.assertEqual(self.store.load(), {"prod_token": "fresh"})
@@ -0,0 +1,22 @@
+import unittest
+
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+
+
+class TestInMemoryCredentialStore(unittest.TestCase):
+
+    def test_load__nothing_saved__returns_empty_dict(self):
+        store = InMemoryCredentialStore()
+
+        self.assertEqual(store.load(), {})
+        self.assertIsNone(store.issued_at())
+
+    def test_save__valid_data__load_returns_a_copy(self):
+        store = InMemoryCredentialStore()
+
+        store.save({"prod_token": "abc"})
+        loaded = store.load()
+        loaded["prod_token"] = "mutated"
+
+        self.assertEqual(store.load(), {"prod_token": "abc"})
+        self.assertIsNotNone(store.issued_at())
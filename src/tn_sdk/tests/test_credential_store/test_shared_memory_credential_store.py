@@ -0,0 +1,59 @@
+import struct
+import time
+import unittest
+import uuid
+from unittest.mock import patch
+
+from tn_sdk.core.credential_store import SharedMemoryCredentialStore
+
+
+class TestSharedMemoryCredentialStore(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f"tn_sdk_test_{uuid.uuid4().hex[:12]}"
+        self.store = SharedMemoryCredentialStore(self.name, size=1024)
+
+    def tearDown(self):
+        self.store.close()
+        self.store.unlink()
+
+    def test_load__nothing_saved__returns_empty_dict(self):
+        self.assertEqual(self.store.load(), {})
+        self.assertIsNone(self.store.issued_at())
+
+    def test_save__another_attachment_of_the_segment__sees_the_credentials(self):
+        other = SharedMemoryCredentialStore(self.name)
+        try:
+            with self.store.lock():
+                self.store.save({"prod_token": "abc"})
+            self.assertEqual(other.load(), {"prod_token": "abc"})
+
+            with other.lock():
+                other.save({"prod_token": "def"})
+            self.assertEqual(self.store.load(), {"prod_token": "def"})
+            self.assertIsNotNone(self.store.issued_at())
+        finally:
+            other.close()
+
+    def test_save__credentials_larger_than_segment__raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.store.save({"prod_token": "x" * 2048})
+
+    def test_load__writer_died_mid_write__gives_up_then_save_repairs(self):
+        with self.store.lock():
+            self.store.save({"prod_token": "abc"})
+        other = SharedMemoryCredentialStore(self.name)
+        self.addCleanup(other.close)
+        # A writer marking a write in progress (odd sequence), then dying
+        sequence = struct.unpack_from("<Q", self.store._shm.buf, 0)[0]
+        struct.pack_into("<Q", self.store._shm.buf, 0, sequence + 1)
+
+        with patch("tn_sdk.core.credential_store.SHARED_MEMORY_WRITE_TIMEOUT", 0.05):
+            started = time.monotonic()
+            self.assertEqual(other.load(), {})
+            self.assertLess(time.monotonic() - started, 1)
+
+        with self.store.lock():
+            self.store.save({"prod_token": "def"})
+        self.assertEqual(other.load(), {"prod_token": "def"})
+        self.assertEqual(struct.unpack_from("<Q", self.store._shm.buf, 0)[0] % 2, 0)
@@ -0,0 +1,236 @@
+import threading
+import time
+import unittest
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.data_stream import encode_record
+from tn_sdk.exceptions import DataStreamException, InvalidDataException
+
+STREAM_ENDPOINT = "/stream/"
+
+
+def _record(index: int) -> dict:
+    return {"id": index, "price": 100 + index, "route": "YHZ-YUL"}
+
+
+class TestDataStream(unittest.TestCase):
+    def _client(self, server: StubApiServer) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_send__records_delivered_in_order(self):
+        with StubApiServer() as server:
+            with self._client(server).open_data_stream(STREAM_ENDPOINT) as stream:
+                for index in range(500):
+                    stream.send(_record(index))
+            stats = stream.stats
+
+            self.assertEqual(server.records, [_record(i) for i in range(500)])
+        self.assertEqual((stats.records, stats.acknowledged), (500, 500))
+        self.assertEqual(stats.streams, 1)
+        self.assertLess(stats.compressed_bytes, stats.raw_bytes / 3)
+
+    def test_send__batches_by_size(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, batch_bytes=1024, linger=10
+            ) as stream:
+                for index in range(200):
+                    stream.send(_record(index))
+                self.assertTrue(stream.flush(timeout=5))
+                stats = stream.stats
+
+            self.assertEqual(server.stats.records, 200)
+        # About 50 bytes a record, the linger never ran out
+        self.assertGreaterEqual(stats.batches, 8)
+        self.assertLessEqual(stats.batches, 12)
+
+    def test_send__batches_by_linger(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            with client.open_data_stream(STREAM_ENDPOINT, linger=0.05) as stream:
+                stream.send(_record(0))
+                time.sleep(0.2)
+                # Written after the linger, though the batch isn't full
+                self.assertEqual(stream.stats.batches, 1)
+                stream.send(_record(1))
+                self.assertTrue(stream.flush(timeout=5))
+
+            self.assertEqual(server.stats.records, 2)
+
+    def test_stream__ends_when_idle(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            with client.open_data_stream(STREAM_ENDPOINT, idle_timeout=0.05) as stream:
+                stream.send(_record(0))
+                deadline = time.monotonic() + 5
+                while stream.stats.acknowledged < 1 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                stream.send(_record(1))
+
+            self.assertEqual(server.stats.records, 2)
+            self.assertEqual(server.stats.requests, 2)
+
+    def test_stream__rotates_at_max_stream_bytes(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, batch_bytes=500, max_stream_bytes=2000
+            ) as stream:
+                for index in range(200):
+                    stream.send(_record(index))
+            stats = stream.stats
+
+            self.assertEqual(server.records, [_record(i) for i in range(200)])
+        self.assertGreater(stats.streams, 3)
+
+    def test_stream__401__refreshes_and_resends(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            with client.open_data_stream(STREAM_ENDPOINT) as stream:
+                stream.send(_record(0))
+                stream.flush()
+                server.expire_tokens()
+                for index in range(1, 50):
+                    stream.send(_record(index))
+            stats = stream.stats
+
+            # Every record received once, by the requests that were accepted
+            self.assertEqual(server.records, [_record(i) for i in range(50)])
+            self.assertEqual(server.stats.unauthorized, 1)
+            self.assertEqual(server.stats.auth_requests, 2)
+        self.assertEqual(stats.resent, 49)
+        self.assertEqual(stats.acknowledged, 50)
+
+    def test_stream__failure__reconnects_without_losing_records(self):
+        with StubApiServer(burst_every=2, burst_status=400) as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, batch_bytes=200, retry_backoff=0.01
+            ) as stream:
+                for index in range(20):
+                    stream.send(_record(index))
+                    if index % 5 == 4:
+                        stream.flush()
+            stats = stream.stats
+
+            self.assertEqual(server.records, [_record(i) for i in range(20)])
+        self.assertGreater(stats.failures, 0)
+        self.assertGreater(stats.resent, 0)
+        self.assertEqual(stream.pending_records(), [])
+
+    def test_stream__keeps_failing__gives_up_with_pending_records(self):
+        with StubApiServer(burst_every=1, burst_status=400) as server:
+            stream = self._client(server).open_data_stream(
+                STREAM_ENDPOINT, max_failures=2, retry_backoff=0.01
+            )
+            stream.send(_record(0))
+            stream.send(_record(1))
+
+            with self.assertRaises(DataStreamException):
+                stream.flush(timeout=5)
+            with self.assertRaises(DataStreamException):
+                stream.send(_record(2))
+            stream.close()
+
+            self.assertEqual(server.stats.records, 0)
+        self.assertEqual(
+            stream.pending_records(), [encode_record(_record(i)) for i in range(2)]
+        )
+        self.assertEqual(stream.stats.failures, 2)
+
+    def test_close__during_retry_backoff__returns_with_pending_records(self):
+        with StubApiServer(burst_every=1, burst_status=400) as server:
+            stream = self._client(server).open_data_stream(
+                STREAM_ENDPOINT, idle_timeout=0.05, retry_backoff=10
+            )
+            stream.send(_record(0))
+            deadline = time.monotonic() + 5
+            while stream.stats.failures == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            started = time.monotonic()
+            stream.close()
+
+            self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(stream.stats.failures, 1)
+        self.assertEqual(stream.pending_records(), [encode_record(_record(0))])
+
+    def test_send__buffer_full__blocks_until_sent(self):
+        # Authenticating is slow, the records wait in the buffer meanwhile
+        with StubApiServer(latency=0.2) as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, max_buffered_bytes=500
+            ) as stream:
+                for index in range(100):
+                    stream.send(_record(index))
+                stats = stream.stats
+
+            self.assertEqual(server.stats.records, 100)
+        self.assertGreater(stats.blocked_seconds, 0.1)
+
+    def test_send__buffer_full__timeout(self):
+        with StubApiServer(latency=0.5) as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, max_buffered_bytes=100
+            ) as stream:
+                stream.send(_record(0))
+                stream.send(_record(1))
+                with self.assertRaises(DataStreamException):
+                    for index in range(2, 10):
+                        stream.send(_record(index), timeout=0.05)
+
+    def test_send__slow_reader__all_delivered(self):
+        with StubApiServer(read_delay=0.002) as server:
+            client = self._client(server)
+            with client.open_data_stream(
+                STREAM_ENDPOINT, batch_bytes=256, max_buffered_bytes=1024
+            ) as stream:
+                senders = [
+                    threading.Thread(
+                        target=lambda start: [
+                            stream.send(_record(start + i)) for i in range(100)
+                        ],
+                        args=(start,),
+                    )
+                    for start in (0, 1000)
+                ]
+                for sender in senders:
+                    sender.start()
+                for sender in senders:
+                    sender.join()
+
+            records = server.records
+        self.assertEqual(len(records), 200)
+        self.assertEqual([r["id"] for r in records if r["id"] < 1000], list(range(100)))
+
+    def test_send__after_close__raises(self):
+        with StubApiServer() as server:
+            stream = self._client(server).open_data_stream(STREAM_ENDPOINT)
+            stream.close()
+            with self.assertRaises(DataStreamException):
+                stream.send(_record(0))
+
+
+class TestEncodeRecord(unittest.TestCase):
+    def test_encode_record(self):
+        self.assertEqual(encode_record({"a": [1, 2]}), b'{"a":[1,2]}\n')
+        self.assertEqual(encode_record('{"a": 1}\n'), b'{"a": 1}\n')
+        self.assertEqual(encode_record(b"[1]"), b"[1]\n")
+
+    def test_encode_record__invalid(self):
+        for record in ('{"a":\n1}', {"a": object()}, 42):
+            with self.subTest(record=record):
+                with self.assertRaises(InvalidDataException):
+                    encode_record(record)
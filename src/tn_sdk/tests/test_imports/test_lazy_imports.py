@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+import unittest
+
+import tn_sdk
+import tn_sdk.core
+import tn_sdk.payload
+
+
+def _modules_after(statement: str) -> set[str]:
+    """
+    Returns the modules loaded by a fresh interpreter running statement.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(list(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(json.loads(output))
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_package__no_http_stack(self):
+        modules = _modules_after("import tn_sdk, tn_sdk.core, tn_sdk.payload")
+
+        for heavy in ("requests", "urllib3", "httpx", "multiprocessing"):
+            self.assertNotIn(heavy, modules)
+
+    def test_import_client__only_its_http_stack(self):
+        modules = _modules_after("from tn_sdk import TnApi")
+
+        self.assertIn("requests", modules)
+        self.assertNotIn("httpx", modules)
+        self.assertNotIn("multiprocessing", modules)
+
+    def test_access_client__no_optional_features(self):
+        modules = _modules_after("import tn_sdk; tn_sdk.TnApi")
+
+        for feature in (
+            "tn_sdk.core.recorder",
+            "tn_sdk.core.data_stream",
+            "tn_sdk.core.pipeline",
+            "tn_sdk.core.response_cache",
+            "tn_sdk.payload.validation",
+            "tn_sdk.payload.canonical",
+            "tn_sdk.payload.dedup",
+            "tn_sdk.payload.spill",
+        ):
+            self.assertNotIn(feature, modules)
+
+    def test_getattr__exports(self):
+        from tn_sdk.core.async_tn_api import AsyncTnApi
+        from tn_sdk.core.response_cache import ResponseCache
+        from tn_sdk.core.tn_api import TnApi
+        from tn_sdk.payload.spill import SpooledPayload
+
+        self.assertIs(tn_sdk.TnApi, TnApi)
+        self.assertIs(tn_sdk.AsyncTnApi, AsyncTnApi)
+        self.assertIs(tn_sdk.core.ResponseCache, ResponseCache)
+        self.assertIs(tn_sdk.payload.SpooledPayload, SpooledPayload)
+        self.assertIn("TnApi", dir(tn_sdk))
+
+    def test_getattr__unknown_name__raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            tn_sdk.Missing
+        with self.assertRaises(AttributeError):
+            tn_sdk.core.Missing
+        with self.assertRaises(AttributeError):
+            tn_sdk.payload.Missing
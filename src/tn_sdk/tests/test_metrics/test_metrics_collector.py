@@ -0,0 +1,101 @@
+import threading
+import unittest
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.metrics import MetricsCollector
+from tn_sdk.core.stats import LatencyHistogram
+from tn_sdk.payload.codecs import ZlibCodec
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_quantile__returns_upper_bound_of_bucket(self):
+        histogram = LatencyHistogram((0.1, 1.0, 10.0))
+        for seconds in [0.05] * 98 + [0.5, 5.0]:
+            histogram.observe(seconds)
+
+        self.assertEqual(histogram.counts, [98, 1, 1, 0])
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.99), 1.0)
+        self.assertEqual(histogram.quantile(1.0), 5.0)
+        self.assertAlmostEqual(histogram.mean, (0.05 * 98 + 5.5) / 100)
+
+    def test_quantile__overflow_bucket__returns_max(self):
+        histogram = LatencyHistogram((0.1,))
+        histogram.observe(42.0)
+
+        self.assertEqual(histogram.quantile(0.5), 42.0)
+
+    def test_quantile__empty__zero(self):
+        self.assertEqual(LatencyHistogram().quantile(0.99), 0.0)
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def test_on_request_end__groups_by_endpoint_and_token_type(self):
+        collector = MetricsCollector()
+        collector.on_request_end("GET", "/a", TokenType.PRODUCTION, 200, 0.01, None)
+        collector.on_request_end(
+            "GET", "/a", TokenType.PRODUCTION, 500, 0.2, Exception()
+        )
+        collector.on_request_end("GET", "/a", TokenType.SANDBOX, 200, 0.01, None)
+
+        endpoints = collector.snapshot().endpoints
+
+        production = endpoints[("/a", TokenType.PRODUCTION)]
+        self.assertEqual(production.requests, 2)
+        self.assertEqual(production.errors, 1)
+        self.assertEqual(production.status_codes, {200: 1, 500: 1})
+        self.assertEqual(production.latency.count, 2)
+        self.assertEqual(endpoints[("/a", TokenType.SANDBOX)].requests, 1)
+
+    def test_events__counted(self):
+        collector = MetricsCollector()
+        collector.on_retry("GET", "/a", 503, None)
+        collector.on_token_refresh("api", False, 0.3, None)
+        collector.on_token_refresh("coalesced", False, 0.1, None)
+        collector.on_token_refresh("api", True, 0.3, RuntimeError())
+        collector.on_credentials_load(True, 0.001)
+        collector.on_compression(ZlibCodec(), 1000, 200, 0.002)
+
+        snapshot = collector.snapshot()
+
+        self.assertEqual(snapshot.retries, {"/a": 1})
+        self.assertEqual(snapshot.token_refreshes, {"api": 1, "coalesced": 1})
+        self.assertEqual(snapshot.token_refresh_failures, 1)
+        self.assertEqual(snapshot.token_refresh_latency.count, 3)
+        self.assertEqual(snapshot.credential_loads, 1)
+        self.assertEqual(
+            (snapshot.compressions, snapshot.raw_bytes, snapshot.compressed_bytes),
+            (1, 1000, 200),
+        )
+
+    def test_snapshot__is_a_copy(self):
+        collector = MetricsCollector(buckets=(1.0,))
+        collector.on_request_end("GET", "/a", TokenType.PRODUCTION, 200, 0.5, None)
+        snapshot = collector.snapshot()
+
+        collector.on_request_end("GET", "/a", TokenType.PRODUCTION, 200, 0.5, None)
+        collector.reset()
+
+        stats = snapshot.endpoints[("/a", TokenType.PRODUCTION)]
+        self.assertEqual(stats.requests, 1)
+        self.assertEqual(stats.latency.counts, [1, 0])
+        self.assertEqual(collector.snapshot().endpoints, {})
+
+    def test_on_request_end__concurrent__no_lost_updates(self):
+        collector = MetricsCollector()
+
+        def record():
+            for _ in range(1000):
+                collector.on_request_end(
+                    "GET", "/a", TokenType.PRODUCTION, 200, 0.01, None
+                )
+
+        threads = [threading.Thread(target=record) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = collector.snapshot().endpoints[("/a", TokenType.PRODUCTION)]
+        self.assertEqual(stats.requests, 8000)
+        self.assertEqual(stats.latency.count, 8000)
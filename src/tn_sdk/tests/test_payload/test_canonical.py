@@ -0,0 +1,179 @@
+import json
+import random
+import unittest
+import zlib
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.batch import iter_prepare_many, prepare_payload
+from tn_sdk.payload.canonical import PayloadCanonicalizer
+from tn_sdk.payload.dedup import expand_segments
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.utils.constants import DERIVABLE_SEGMENT_FIELDS, STRIPPED_FIELDS_HEADER
+
+
+def _shuffled(value, rng: random.Random):
+    """
+    The same JSON value, with the keys of every object in another order.
+    """
+    if isinstance(value, dict):
+        items = list(value.items())
+        rng.shuffle(items)
+        return {key: _shuffled(item, rng) for key, item in items}
+    if isinstance(value, list):
+        return [_shuffled(item, rng) for item in value]
+    return value
+
+
+class TestPayloadCanonicalizer(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(30, seed=11)
+        self.canonicalizer = PayloadCanonicalizer()
+
+    def test_canonicalize__drops_nulls_sorts_keys_compacts(self):
+        data = {
+            "trip_id": "t",
+            "datasource_responses": {"b": [{"z": 1, "baggage": None, "a": [None, 2]}]},
+        }
+
+        self.assertEqual(
+            self.canonicalizer.canonicalize(data),
+            '{"datasource_responses":{"b":[{"a":[null,2],"z":1}]},"trip_id":"t"}',
+        )
+
+    def test_canonicalize__normalizes_numbers(self):
+        data = {"a": 392.0, "b": 0.1 + 0.2, "c": -0.0, "d": 1e-7, "e": 392.22}
+
+        self.assertEqual(
+            self.canonicalizer.canonicalize(data),
+            '{"a":392,"b":0.3,"c":0,"d":1e-07,"e":392.22}',
+        )
+        for value in (float("nan"), float("inf")):
+            with self.subTest(value=value):
+                with self.assertRaises(InvalidDataException):
+                    self.canonicalizer.canonicalize({"total_price": value})
+
+    def test_canonicalize__large_integral_floats__kept_as_floats(self):
+        data = {"a": 2.0**53 - 1, "b": 2.0**54, "c": -1e20, "d": 1e300}
+
+        canonical = self.canonicalizer.canonicalize(data)
+
+        self.assertEqual(
+            canonical,
+            '{"a":9007199254740990,"b":1.8014398509482e+16,"c":-1e+20,"d":1e+300}',
+        )
+        self.assertEqual(
+            [type(value) for value in json.loads(canonical).values()],
+            [int, float, float, float],
+        )
+
+    def test_canonicalize__same_search__same_bytes(self):
+        rng = random.Random(3)
+        variants = [
+            self.data,
+            _shuffled(self.data, rng),
+            json.dumps(_shuffled(self.data, rng), indent=2),
+            GenerateSolutionsRequest.from_dict(self.data),
+        ]
+
+        canonical = {self.canonicalizer.canonicalize(v) for v in variants}
+        prepared = {
+            prepare_payload(v, canonicalizer=self.canonicalizer) for v in variants
+        }
+
+        self.assertEqual(len(canonical), 1)
+        self.assertEqual(len(prepared), 1)
+        for solution in next(iter(self.data["datasource_responses"].values())):
+            for field in [k for k, v in solution.items() if v is None]:
+                del solution[field]
+        self.assertEqual(json.loads(canonical.pop()), self.data)
+
+    def test_canonicalize__strip_fields(self):
+        canonicalizer = PayloadCanonicalizer(DERIVABLE_SEGMENT_FIELDS)
+
+        canonical = json.loads(canonicalizer.canonicalize(self.data))
+
+        segment = next(iter(canonical["datasource_responses"].values()))[0]["segments"][
+            0
+        ][0]
+        self.assertNotIn("departure_time", segment)
+        self.assertNotIn("arrival_time", segment)
+        self.assertIn("departure_timestamp", segment)
+        self.assertEqual(
+            canonicalizer.headers(),
+            {STRIPPED_FIELDS_HEADER: "arrival_time,departure_time"},
+        )
+        self.assertEqual(self.canonicalizer.headers(), {})
+
+    def test_canonicalize__invalid_input__raises(self):
+        for payload in ("{", [1], {"a": object()}):
+            with self.subTest(payload=payload):
+                with self.assertRaises(InvalidDataException):
+                    self.canonicalizer.canonicalize(payload)
+
+    def test_report__bytes_saved(self):
+        report = PayloadCanonicalizer(DERIVABLE_SEGMENT_FIELDS).report(
+            json.dumps(self.data)
+        )
+
+        self.assertEqual(report.raw_size, len(json.dumps(self.data)))
+        self.assertGreater(report.saved_bytes, report.raw_size // 4)
+        self.assertGreater(report.saved_compressed_bytes, 0)
+        self.assertEqual(
+            report.saved_compressed_bytes,
+            report.compressed_size - report.canonical_compressed_size,
+        )
+
+    def test_iter_prepare_many__deduplicate__canonical_segment_table(self):
+        with ThreadPoolExecutor(2) as executor:
+            (prepared,) = iter_prepare_many(
+                [self.data],
+                executor,
+                deduplicate=True,
+                canonicalizer=self.canonicalizer,
+            )
+
+        self.assertEqual(
+            prepared,
+            prepare_payload(
+                self.data, deduplicate=True, canonicalizer=self.canonicalizer
+            ),
+        )
+
+
+class TestCanonicalizerClient(unittest.TestCase):
+    def _client(self, **kwargs) -> TnApi:
+        client = TnApi(
+            "id",
+            "secret",
+            credential_store=InMemoryCredentialStore(),
+            lazy=True,
+            **kwargs,
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_prepare__canonical_payload_and_headers(self):
+        data = generate_request_data(10, seed=2)
+        client = self._client(
+            canonicalizer=PayloadCanonicalizer(DERIVABLE_SEGMENT_FIELDS),
+            deduplicate_segments=True,
+        )
+
+        prepared = client.prepare_data_with_metadata(json.dumps(data))
+        streamed = b"".join(client.iter_prepare_data_for_generate_solutions(data))
+
+        self.assertEqual(prepared.data, streamed)
+        sent = zlib.decompress(b64decode(prepared.data)).decode()
+        self.assertEqual(prepared.raw_size, len(sent))
+        self.assertNotIn('": ', sent)
+        canonical = PayloadCanonicalizer(DERIVABLE_SEGMENT_FIELDS).canonicalize(data)
+        self.assertEqual(expand_segments(json.loads(sent)), json.loads(canonical))
+        self.assertEqual(
+            client.compression_headers()[STRIPPED_FIELDS_HEADER],
+            "arrival_time,departure_time",
+        )
@@ -0,0 +1,110 @@
+import bz2
+import gzip
+import json
+import lzma
+import unittest
+import zlib
+from base64 import b64decode
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.codecs import (
+    AdaptiveCompressionPolicy,
+    Bz2Codec,
+    Codec,
+    GzipCodec,
+    LzmaCodec,
+    ZlibCodec,
+)
+from tn_sdk.payload.itinerary_dictionary import ITINERARY_DICTIONARY_V1
+from tn_sdk.payload.streaming import iter_compressed
+
+
+class TestCodecs(unittest.TestCase):
+    def setUp(self):
+        self.raw = json.dumps(generate_request_data(5, seed=1)).encode("utf-8")
+
+    def test_compress__stdlib_codecs__round_trip(self):
+        cases = [
+            (ZlibCodec(1), zlib.decompress),
+            (ZlibCodec(9), zlib.decompress),
+            (GzipCodec(6), gzip.decompress),
+            (Bz2Codec(9), bz2.decompress),
+            (LzmaCodec(1), lzma.decompress),
+        ]
+        for codec, decompress in cases:
+            with self.subTest(codec=codec):
+                self.assertEqual(decompress(codec.compress(self.raw)), self.raw)
+
+    def test_compress__zlib_codec__byte_identical_to_zlib_compress(self):
+        self.assertEqual(ZlibCodec(6).compress(self.raw), zlib.compress(self.raw, 6))
+        self.assertEqual(
+            ZlibCodec(6, ITINERARY_DICTIONARY_V1).compress(self.raw),
+            ITINERARY_DICTIONARY_V1.compress(self.raw, 6),
+        )
+
+    def test_compressobj__streamed__matches_one_shot_compress(self):
+        for codec in (ZlibCodec(6), GzipCodec(6), Bz2Codec(9), LzmaCodec(1)):
+            with self.subTest(codec=codec):
+                chunks = [self.raw[i : i + 1000] for i in range(0, len(self.raw), 1000)]
+                streamed = b"".join(iter_compressed(chunks, codec=codec))
+                self.assertEqual(streamed, codec.compress(self.raw))
+
+    def test_headers__default_zlib__empty_other_codecs__named(self):
+        self.assertEqual(ZlibCodec(9).headers(), {})
+        self.assertEqual(
+            ZlibCodec(6, ITINERARY_DICTIONARY_V1).headers(),
+            {"X-TN-Compression-Dictionary": "itinerary.v1"},
+        )
+        self.assertEqual(LzmaCodec().headers(), {"X-TN-Compression-Codec": "lzma"})
+
+    def test_codec__without_compressobj__cannot_be_instantiated(self):
+        class IncompleteCodec(Codec):
+            name = "incomplete"
+
+        with self.assertRaises(TypeError):
+            IncompleteCodec(1)
+
+    def test_select__fixed_codec__returns_itself(self):
+        codec = GzipCodec(9)
+
+        self.assertIs(codec.select(10), codec)
+        self.assertIs(codec.select(None), codec)
+
+
+class TestAdaptiveCompressionPolicy(unittest.TestCase):
+    def test_select__small_payload__uses_cheapest_level(self):
+        policy = AdaptiveCompressionPolicy()
+
+        self.assertEqual(policy.select(100), ZlibCodec(1))
+
+    def test_select__slow_link__trades_cpu_for_ratio(self):
+        fast = AdaptiveCompressionPolicy(bandwidth=1e9)
+        slow = AdaptiveCompressionPolicy(bandwidth=1e5)
+
+        self.assertLess(fast.select(1_000_000).level, slow.select(1_000_000).level)
+
+    def test_select__over_cpu_budget__falls_back_to_cheapest_level(self):
+        policy = AdaptiveCompressionPolicy(max_cpu_seconds=0.001, bandwidth=1e5)
+
+        self.assertEqual(policy.select(100_000_000).level, 1)
+
+    def test_select__unknown_size__uses_default_level_and_dictionary(self):
+        policy = AdaptiveCompressionPolicy(zdict=ITINERARY_DICTIONARY_V1)
+
+        self.assertEqual(policy.select(None), ZlibCodec(6, ITINERARY_DICTIONARY_V1))
+
+    def test_select__custom_profile__is_used(self):
+        profile = {1: (1e6, 0.5), 9: (1e9, 0.1)}
+        policy = AdaptiveCompressionPolicy(profile=profile)
+
+        self.assertEqual(policy.select(1_000_000).level, 9)
+
+    def test_prepare_payload__policy__compresses_with_selected_codec(self):
+        payload = generate_request_data(20, seed=2)
+        policy = AdaptiveCompressionPolicy(bandwidth=1e5)
+
+        prepared = prepare_payload(payload, compression=policy)
+
+        raw = json.dumps(payload).encode("utf-8")
+        self.assertEqual(b64decode(prepared), policy.select(len(raw)).compress(raw))
@@ -0,0 +1,116 @@
+import json
+import unittest
+import zlib
+from base64 import b64decode
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.dedup import (
+    deduplicate_payload,
+    deduplicate_segments,
+    expand_segments,
+    segment_key,
+)
+from tn_sdk.payload.models import GenerateSolutionsRequest
+
+
+class TestDedup(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(200, datasources=2, seed=7, duplication=0.9)
+
+    def test_deduplicate_segments__duplicated_segments__round_trip(self):
+        normalized = deduplicate_segments(self.data)
+
+        self.assertEqual(json.dumps(expand_segments(normalized)), json.dumps(self.data))
+
+    def test_deduplicate_segments__duplicated_segments__table_holds_unique_segments(
+        self,
+    ):
+        normalized = deduplicate_segments(self.data)
+
+        table = normalized["segment_table"]
+        segments = [
+            segment
+            for solutions in self.data["datasource_responses"].values()
+            for solution in solutions
+            for leg in solution["segments"]
+            for segment in leg
+        ]
+        self.assertEqual(len(table), len({segment_key(s) for s in segments}))
+        self.assertLess(len(table), len(segments) / 2)
+        first_solution = normalized["datasource_responses"][
+            next(iter(normalized["datasource_responses"]))
+        ][0]
+        self.assertTrue(
+            all(
+                isinstance(index, int)
+                for leg in first_solution["segments"]
+                for index in leg
+            )
+        )
+
+    def test_segment_key__key_order__is_canonical(self):
+        segment = self.data["datasource_responses"][
+            next(iter(self.data["datasource_responses"]))
+        ][0]["segments"][0][0]
+        reordered = dict(reversed(list(segment.items())))
+        extended = segment | {"extra": 1}
+
+        self.assertEqual(segment_key(segment), segment_key(reordered))
+        self.assertEqual(
+            segment_key(extended), segment_key(dict(reversed(list(extended.items()))))
+        )
+        self.assertNotEqual(segment_key(segment), segment_key(extended))
+
+    def test_deduplicate_segments__request_model__same_as_dict(self):
+        request = GenerateSolutionsRequest.from_dict(self.data)
+
+        self.assertEqual(deduplicate_segments(request), deduplicate_segments(self.data))
+
+    def test_deduplicate_payload__json_string__decodes_first(self):
+        self.assertEqual(
+            deduplicate_payload(json.dumps(self.data)), deduplicate_segments(self.data)
+        )
+
+    def test_deduplicate_payload__invalid_data__raises_invalid_data_exception(self):
+        for payload in ("{not json", b"{}", {"trip_id": ""}, None):
+            with self.subTest(payload=payload):
+                with self.assertRaises(InvalidDataException):
+                    deduplicate_payload(payload)
+
+    def test_segment_key__unhashable_value__raises_invalid_data_exception(self):
+        segment = self.data["datasource_responses"][
+            next(iter(self.data["datasource_responses"]))
+        ][0]["segments"][0][0]
+
+        for invalid in (segment | {"flight_number": ["1"]}, segment | {"extra": {}}):
+            with self.subTest(segment=invalid):
+                with self.assertRaises(InvalidDataException):
+                    segment_key(invalid)
+
+    def test_expand_segments__unknown_reference__raises_invalid_data_exception(self):
+        normalized = deduplicate_segments(self.data)
+        normalized["segment_table"] = []
+
+        with self.assertRaises(InvalidDataException):
+            expand_segments(normalized)
+
+    def test_prepare_payload__deduplicate__compresses_normalized_payload(self):
+        prepared = prepare_payload(self.data, deduplicate=True)
+
+        self.assertEqual(
+            json.loads(zlib.decompress(b64decode(prepared))),
+            deduplicate_segments(self.data),
+        )
+        self.assertLess(len(prepared), len(prepare_payload(self.data)))
+
+    def test_generate_request_data__duplication__reuses_legs(self):
+        data = generate_request_data(50, duplication=0.9)
+        legs = [
+            json.dumps(leg)
+            for solution in data["datasource_responses"].popitem()[1]
+            for leg in solution["segments"]
+        ]
+
+        self.assertLess(len(set(legs)), len(legs) / 2)
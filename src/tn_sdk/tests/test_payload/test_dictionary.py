@@ -0,0 +1,45 @@
+import json
+import struct
+import unittest
+import zlib
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.dictionary import CompressionDictionary, train_dictionary
+from tn_sdk.payload.itinerary_dictionary import ITINERARY_DICTIONARY_V1
+
+
+class TestDictionary(unittest.TestCase):
+
+    def test_train_dictionary__itinerary_samples__keeps_repeated_fragments_within_size(
+        self,
+    ):
+        samples = [generate_request_data(5, seed=seed) for seed in range(10)]
+
+        data = train_dictionary(samples, size=512)
+
+        self.assertLessEqual(len(data), 512)
+        self.assertIn(b'"transportation_type": "flight"', data)
+        # Sample specific values (dates, prices, ids) are not learned
+        self.assertNotIn(b"2025-", data)
+
+    def test_compress__with_dictionary__round_trips_and_is_smaller_for_small_payloads(
+        self,
+    ):
+        raw = json.dumps(generate_request_data(1, seed=123)).encode("utf-8")
+
+        compressed = ITINERARY_DICTIONARY_V1.compress(raw, 6)
+
+        self.assertEqual(ITINERARY_DICTIONARY_V1.decompress(compressed), raw)
+        self.assertLess(len(compressed), len(zlib.compress(raw, 6)))
+
+    def test_compress__with_dictionary__zlib_header_carries_dictionary_id(self):
+        dictionary = CompressionDictionary("test", 3, b'"cabin_class": "E"')
+
+        compressed = dictionary.compress(b'{"cabin_class": "E"}', 6)
+
+        # FDICT flag set, followed by the big endian Adler-32 of the dictionary
+        self.assertTrue(compressed[1] & 0x20)
+        self.assertEqual(struct.unpack(">I", compressed[2:6])[0], dictionary.dict_id)
+        self.assertEqual(
+            dictionary.headers(), {"X-TN-Compression-Dictionary": "test.v3"}
+        )
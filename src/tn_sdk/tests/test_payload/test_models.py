@@ -0,0 +1,101 @@
+import json
+import pickle
+import unittest
+import zlib
+from base64 import b64decode
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.codecs import Bz2Codec
+from tn_sdk.payload.models import GenerateSolutionsRequest, PricingSolution, Segment
+from tn_sdk.payload.serializer import iter_request_json
+from tn_sdk.payload.streaming import iter_payload_bytes
+
+
+class TestModels(unittest.TestCase):
+    def setUp(self):
+        # Decoded from JSON, like datasource responses are, so strings aren't shared yet
+        self.data = json.loads(json.dumps(generate_request_data(20, datasources=2)))
+        self.request = GenerateSolutionsRequest.from_dict(self.data)
+
+    def test_from_dict__to_dict__round_trips(self):
+        self.assertEqual(self.request.to_dict(), self.data)
+
+    def test_from_dict__repeated_categorical_strings__are_interned(self):
+        segments = [
+            segment
+            for solutions in self.request.datasource_responses.values()
+            for solution in solutions
+            for leg in solution.segments
+            for segment in leg
+        ]
+        carriers = {}
+        for segment in segments:
+            carriers.setdefault(segment.operating_carrier, segment.operating_carrier)
+            self.assertIs(
+                segment.operating_carrier, carriers[segment.operating_carrier]
+            )
+            self.assertIs(segment.transportation_type, "flight")
+
+    def test_segment__slotted__has_no_instance_dict(self):
+        segment = Segment.from_dict(
+            self.data["datasource_responses"][
+                next(iter(self.data["datasource_responses"]))
+            ][0]["segments"][0][0]
+        )
+
+        self.assertFalse(hasattr(segment, "__dict__"))
+
+    def test_models__pickle__round_trip(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.request)), self.request)
+
+
+class TestSerializer(unittest.TestCase):
+    def test_iter_request_json__identical_to_json_dumps(self):
+        data = generate_request_data(10, datasources=3, seed=3)
+        solution = data["datasource_responses"][
+            next(iter(data["datasource_responses"]))
+        ][0]
+        solution["baggage"] = {"pieces": 2, "note": "café"}
+        solution["total_price"] = 100.0
+
+        request = GenerateSolutionsRequest.from_dict(data)
+
+        self.assertEqual("".join(iter_request_json(request)), json.dumps(data))
+
+    def test_iter_request_json__empty_request__identical_to_json_dumps(self):
+        request = GenerateSolutionsRequest(
+            {"datasource": [PricingSolution("id", 10, "sabre")]}, trip_id="trip"
+        )
+
+        self.assertEqual(
+            "".join(iter_request_json(request)), json.dumps(request.to_dict())
+        )
+        self.assertEqual(
+            "".join(iter_request_json(GenerateSolutionsRequest())),
+            json.dumps(GenerateSolutionsRequest().to_dict()),
+        )
+
+    def test_iter_payload_bytes__request__yields_bounded_chunks(self):
+        request = GenerateSolutionsRequest.from_dict(generate_request_data(50))
+
+        chunks = list(iter_payload_bytes(request, chunk_size=4096))
+
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(
+            b"".join(chunks).decode("utf-8"), json.dumps(request.to_dict())
+        )
+
+    def test_prepare_payload__request__same_as_dict(self):
+        data = generate_request_data(20, seed=4)
+        request = GenerateSolutionsRequest.from_dict(data)
+
+        self.assertEqual(prepare_payload(request), prepare_payload(data))
+        self.assertEqual(
+            zlib.decompress(b64decode(prepare_payload(request, level=1))),
+            json.dumps(data).encode("utf-8"),
+        )
+        self.assertEqual(
+            prepare_payload(request, compression=Bz2Codec()),
+            prepare_payload(data, compression=Bz2Codec()),
+        )
@@ -0,0 +1,61 @@
+import io
+import json
+import unittest
+from base64 import b64encode
+
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.payload.codecs import Bz2Codec, GzipCodec, ZlibCodec
+from tn_sdk.payload.itinerary_dictionary import ITINERARY_DICTIONARY_V1
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.spill import spool_prepared_payload
+
+
+class TestSpoolPreparedPayload(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(40, seed=9)
+        self.encoded = json.dumps(self.data)
+
+    def test_spool__any_codec__identical_to_one_shot(self):
+        for codec in (
+            ZlibCodec(),
+            ZlibCodec(9, ITINERARY_DICTIONARY_V1),
+            GzipCodec(),
+            Bz2Codec(),
+        ):
+            with self.subTest(codec=codec):
+                raw = self.encoded.encode("utf-8")
+                compressed = codec.compress(raw)
+
+                with spool_prepared_payload(self.encoded, codec, 1024) as spooled:
+                    prepared = spooled.to_prepared()
+
+                self.assertEqual(prepared.data, b64encode(compressed))
+                self.assertEqual(prepared.raw_size, len(raw))
+                self.assertEqual(prepared.compressed_size, len(compressed))
+
+    def test_spool__max_memory__spills_past_it(self):
+        with spool_prepared_payload(self.encoded, ZlibCodec(), 1024) as spooled:
+            self.assertTrue(spooled.on_disk)
+            self.assertGreater(len(spooled), 1024)
+        with spool_prepared_payload(self.encoded, ZlibCodec(), 1 << 30) as spooled:
+            self.assertFalse(spooled.on_disk)
+
+    def test_spool__file_and_model_input__same_bytes(self):
+        expected = b64encode(ZlibCodec().compress(self.encoded.encode("utf-8")))
+
+        for payload in (
+            io.StringIO(self.encoded),
+            io.BytesIO(self.encoded.encode("utf-8")),
+            GenerateSolutionsRequest.from_dict(self.data),
+        ):
+            with self.subTest(payload=type(payload).__name__):
+                with spool_prepared_payload(payload, ZlibCodec(), 4096, 512) as spooled:
+                    self.assertEqual(spooled.read(), expected)
+
+    def test_spool__file_object__read_in_place(self):
+        with spool_prepared_payload(self.encoded, ZlibCodec(), 1024) as spooled:
+            first = spooled.read(100)
+            self.assertEqual(spooled.tell(), 100)
+            spooled.seek(0)
+            self.assertEqual(spooled.read(100), first)
+            self.assertEqual(spooled.headers(), {})
@@ -0,0 +1,33 @@
+import json
+import os
+import unittest
+from base64 import b64encode
+
+from tn_sdk.payload.streaming import iter_b64encoded, iter_payload_bytes
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_iter_payload_bytes__dict_input__chunks_bounded_by_chunk_size(self):
+        payload = {"items": [{"id": i, "name": f"item-{i}"} for i in range(2000)]}
+
+        chunks = list(iter_payload_bytes(payload, chunk_size=1024))
+
+        self.assertGreater(len(chunks), 10)
+        # A chunk can only overshoot by the last small piece produced by the encoder
+        self.assertTrue(all(len(chunk) < 1024 + 64 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), json.dumps(payload).encode("utf-8"))
+
+    def test_iter_payload_bytes__bytes_input__yields_zero_copy_views(self):
+        data = b"x" * 1000
+
+        chunks = list(iter_payload_bytes(data, chunk_size=300))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+
+    def test_iter_b64encoded__chunks_not_multiple_of_three__same_as_one_shot(self):
+        data = os.urandom(1001)
+        chunks = [data[0:1], data[1:5], data[5:500], data[500:]]
+
+        self.assertEqual(b"".join(iter_b64encoded(chunks)), b64encode(data))
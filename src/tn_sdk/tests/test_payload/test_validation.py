@@ -0,0 +1,194 @@
+import copy
+import json
+import pickle
+import unittest
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.batch import prepare_payload
+from tn_sdk.payload.models import GenerateSolutionsRequest, Segment
+from tn_sdk.payload.validation import PayloadValidator
+
+
+class TestPayloadValidator(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(50, datasources=2, seed=3)
+        self.datasource = next(iter(self.data["datasource_responses"]))
+        self.validator = PayloadValidator()
+
+    def _solution(self, index: int = 7) -> dict:
+        return self.data["datasource_responses"][self.datasource][index]
+
+    def _assert_invalid(self, data, path: str) -> InvalidDataException:
+        with self.assertRaises(InvalidDataException) as raised:
+            self.validator.validate(data)
+        self.assertIn(path, str(raised.exception))
+        return raised.exception
+
+    def test_validate__valid_payloads__pass(self):
+        for payload in (
+            self.data,
+            json.dumps(self.data),
+            json.dumps(self.data).encode(),
+            GenerateSolutionsRequest.from_dict(self.data),
+        ):
+            with self.subTest(payload=type(payload).__name__):
+                self.validator.validate(payload)
+
+    def test_validate__error__points_at_solution_and_segment(self):
+        solution = self._solution()
+        solution["segments"][1][0]["cabin_class"] = "X"
+
+        error = self._assert_invalid(self.data, ".segments[1][0].cabin_class")
+        self.assertEqual(
+            str(error),
+            f"[INVALID_DATA] datasource_responses[{self.datasource!r}][7]"
+            f" (pricing_solution_id {solution['pricing_solution_id']!r})"
+            ".segments[1][0].cabin_class 'X' is not one of E, P, B, F",
+        )
+
+    def test_validate__malformed_solutions__raise(self):
+        cases = {
+            "missing segments": (lambda s: s.pop("segments"), "is missing segments"),
+            "empty segments": (lambda s: s.update(segments=[]), ".segments must"),
+            "empty leg": (lambda s: s["segments"].append([]), ".segments[2] must"),
+            "unknown field": (lambda s: s.update(fare=1), "has unknown fields fare"),
+            "price type": (lambda s: s.update(total_price="9"), ".total_price must"),
+            "negative price": (lambda s: s.update(total_price=-1), ".total_price must"),
+            "empty id": (lambda s: s.update(pricing_solution_id=""), "is empty"),
+            "flag type": (lambda s: s.update(refundable=0), ".refundable must be bool"),
+            "segment type": (lambda s: s["segments"][0].insert(0, 1), "[0][0] is not"),
+            "missing segment field": (
+                lambda s: s["segments"][0][0].pop("to_iata"),
+                ".segments[0][0] is missing to_iata",
+            ),
+            "extra segment field": (
+                lambda s: s["segments"][0][0].update(seat="1A"),
+                ".segments[0][0] has unknown fields seat",
+            ),
+            "timestamp type": (
+                lambda s: s["segments"][0][0].update(departure_timestamp="1"),
+                ".segments[0][0].departure_timestamp must be int, not str",
+            ),
+            "arrival before departure": (
+                lambda s: s["segments"][0][0].update(arrival_timestamp=1),
+                ".segments[0][0].arrival_timestamp is before the departure",
+            ),
+            "iata": (
+                lambda s: s["segments"][0][0].update(from_iata="YH"),
+                ".segments[0][0].from_iata 'YH' is not an IATA code",
+            ),
+        }
+        for name, (mutate, path) in cases.items():
+            with self.subTest(name):
+                data = copy.deepcopy(self.data)
+                mutate(data["datasource_responses"][self.datasource][7])
+                self._assert_invalid(data, path)
+
+    def test_validate__overlapping_segments__raise(self):
+        leg = self._solution()["segments"][0]
+        if len(leg) < 2:
+            leg.append(dict(leg[0]))
+        leg[1]["departure_timestamp"] = leg[0]["arrival_timestamp"] - 60
+
+        self._assert_invalid(
+            self.data, ".segments[0][1].departure_timestamp must be positive and not"
+        )
+
+    def test_validate__request_model__checks_attributes(self):
+        request = GenerateSolutionsRequest.from_dict(self.data)
+        solution = request.datasource_responses[self.datasource][3]
+        segment: Segment = solution.segments[0][0]
+        segment.departure_timestamp = float(segment.departure_timestamp)
+
+        error = self._assert_invalid(request, "[3] (pricing_solution_id")
+        self.assertIn(".segments[0][0].departure_timestamp must be int", str(error))
+
+    def test_validate__malformed_request__raises(self):
+        for data, message in (
+            ("{", "Input is not valid JSON"),
+            ([], "Payload must be"),
+            ({}, "missing datasource_responses"),
+            ({"datasource_responses": {}, "extra": 1}, "unknown fields extra"),
+            ({"datasource_responses": []}, "must be an object"),
+            ({"datasource_responses": {"a": {}}}, "['a'] must be a list"),
+            ({"datasource_responses": {}, "trip_id": 1}, "trip_id must be str"),
+        ):
+            with self.subTest(data=data):
+                self._assert_invalid(data, message)
+
+    def test_validate__check_times(self):
+        self._solution()["segments"][0][0]["departure_time"] = "2025-11-15 16:40"
+        self.validator.validate(self.data)
+
+        validator = PayloadValidator(check_times=True)
+        with self.assertRaisesRegex(InvalidDataException, "not an ISO 8601"):
+            validator.validate(self.data)
+        validator.validate(generate_request_data(20, seed=3))
+
+    def test_validate__cabin_classes(self):
+        for leg in self._solution()["segments"]:
+            for segment in leg:
+                segment["cabin_class"] = "W"
+
+        PayloadValidator(cabin_classes=("E", "W")).validate(
+            {"datasource_responses": {"a": [self._solution()]}}
+        )
+        self._assert_invalid(self.data, "'W' is not one of E, P, B, F")
+
+    def test_validate_many__reports_each_payload(self):
+        invalid = copy.deepcopy(self.data)
+        invalid["datasource_responses"][self.datasource][0]["total_price"] = None
+
+        errors = self.validator.validate_many([self.data, invalid, "[", self.data])
+
+        self.assertEqual(
+            [error is None for error in errors], [True, False, False, True]
+        )
+        self.assertIn("[0]", str(errors[1]))
+
+    def test_pickle__compiles_again(self):
+        validator = pickle.loads(pickle.dumps(PayloadValidator(("E",), True)))
+
+        self.assertEqual(repr(validator), repr(PayloadValidator(("E",), True)))
+        with self.assertRaisesRegex(InvalidDataException, "is not one of E"):
+            validator.validate(self.data)
+
+
+class TestValidatorIntegration(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(20, seed=5)
+        self.invalid = copy.deepcopy(self.data)
+        next(iter(self.invalid["datasource_responses"].values()))[4]["segments"] = []
+
+    def _client(self) -> TnApi:
+        client = TnApi(
+            "id",
+            "secret",
+            credential_store=InMemoryCredentialStore(),
+            validator=PayloadValidator(),
+            lazy=True,
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_prepare__invalid__raises_before_compressing(self):
+        client = self._client()
+
+        client.prepare_data_for_generate_solutions(json.dumps(self.data))
+        with self.assertRaisesRegex(InvalidDataException, r"\[4\].*\.segments must"):
+            client.prepare_data_for_generate_solutions(json.dumps(self.invalid))
+        with self.assertRaises(InvalidDataException):
+            client.iter_prepare_data_for_generate_solutions(self.invalid)
+
+    def test_prepare_many__invalid__error_in_its_slot(self):
+        results = self._client().prepare_many([self.data, self.invalid], workers=2)
+
+        self.assertIsInstance(results[0], bytes)
+        self.assertIsInstance(results[1], InvalidDataException)
+
+    def test_prepare_payload__validator(self):
+        with self.assertRaises(InvalidDataException):
+            prepare_payload(self.invalid, validator=PayloadValidator())
@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from tn_sdk.core.pipeline import AdaptiveLimiter
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def _acquire_in_thread(self, limiter: AdaptiveLimiter, size: int):
+        acquired = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (limiter.acquire(size), acquired.set()), daemon=True
+        )
+        thread.start()
+        return acquired
+
+    def test_acquire__over_limit__waits_for_release(self):
+        limiter = AdaptiveLimiter(2, 1000)
+        first = limiter.acquire(1)
+        limiter.acquire(1)
+
+        acquired = self._acquire_in_thread(limiter, 1)
+        self.assertFalse(acquired.wait(0.05))
+
+        limiter.release(1, first)
+        self.assertTrue(acquired.wait(1))
+        self.assertEqual(limiter.stats.peak_in_flight, 2)
+
+    def test_acquire__over_byte_budget__waits_for_release(self):
+        limiter = AdaptiveLimiter(8, 100)
+        token = limiter.acquire(60)
+
+        acquired = self._acquire_in_thread(limiter, 60)
+        self.assertFalse(acquired.wait(0.05))
+
+        limiter.release(60, token)
+        self.assertTrue(acquired.wait(1))
+
+    def test_acquire__larger_than_budget__admitted_alone(self):
+        limiter = AdaptiveLimiter(8, 100)
+
+        token = limiter.acquire(500)
+        limiter.release(500, token)
+
+        self.assertEqual(limiter.stats.peak_in_flight, 1)
+
+    def test_release__throttled__halves_limit_once_per_round(self):
+        limiter = AdaptiveLimiter(8, 1000, backoff=0)
+        tokens = [limiter.acquire(1) for _ in range(4)]
+
+        for token in tokens:
+            limiter.release(1, token, throttled=True)
+
+        stats = limiter.stats
+        self.assertEqual(stats.limit, 4)
+        self.assertEqual(stats.throttled, 4)
+        self.assertEqual(stats.slowdowns, 1)
+
+        limiter.release(1, limiter.acquire(1), throttled=True)
+        self.assertEqual(limiter.stats.limit, 2)
+
+    def test_release__successes__limit_grows_back(self):
+        limiter = AdaptiveLimiter(4, 1000, backoff=0)
+        limiter.release(1, limiter.acquire(1), throttled=True)
+        self.assertEqual(limiter.stats.limit, 2)
+
+        for _ in range(2 + 3):
+            limiter.release(1, limiter.acquire(1))
+
+        self.assertEqual(limiter.stats.limit, 4)
+
+    def test_release__retry_after__pauses_admissions(self):
+        limiter = AdaptiveLimiter(4, 1000)
+        limiter.release(1, limiter.acquire(1), throttled=True, retry_after=0.2)
+
+        started = time.monotonic()
+        limiter.acquire(1)
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.15)
+
+    def test_init__no_concurrency__raises(self):
+        with self.assertRaises(ValueError):
+            AdaptiveLimiter(0)
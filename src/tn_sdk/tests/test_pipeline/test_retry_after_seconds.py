@@ -0,0 +1,35 @@
+import os
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+from tn_sdk.core.pipeline import retry_after_seconds
+
+
+def _response(retry_after: str | None) -> MagicMock:
+    response = MagicMock()
+    response.headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return response
+
+
+class TestRetryAfterSeconds(unittest.TestCase):
+    def test_retry_after_seconds__delay_in_seconds(self):
+        self.assertEqual(retry_after_seconds(_response("2.5")), 2.5)
+
+    def test_retry_after_seconds__missing_or_invalid__none(self):
+        self.assertIsNone(retry_after_seconds(_response(None)))
+        self.assertIsNone(retry_after_seconds(_response("soon")))
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "requires time.tzset")
+    def test_retry_after_seconds__http_date__any_zone_is_utc(self):
+        # Far from UTC, so a date read as local time would be hours off
+        with patch.dict(os.environ, {"TZ": "America/New_York"}):
+            time.tzset()
+            self.addCleanup(time.tzset)
+            retry_at = time.time() + 60
+            for date in (formatdate(retry_at, usegmt=True), formatdate(retry_at)):
+                with self.subTest(date=date):
+                    self.assertAlmostEqual(
+                        retry_after_seconds(_response(date)), 60, delta=2
+                    )
@@ -0,0 +1,244 @@
+import gzip
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.recorder import (
+    REDACTED,
+    TrafficRecorder,
+    child_trace_path,
+    read_trace,
+    redact,
+)
+
+
+class TestTrafficRecorder(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "trace.jsonl.gz"
+
+    def _record(self, recorder: TrafficRecorder, **kwargs) -> None:
+        recorder.record(
+            "POST",
+            "/generate/",
+            TokenType.SANDBOX,
+            kwargs,
+            200,
+            0.25,
+            42,
+            None,
+            1700000000.0,
+        )
+
+    def test_record__writes_entry(self):
+        with TrafficRecorder(self.path) as recorder:
+            self._record(recorder, data="eJzL", headers={"X-Trace": "1"})
+
+        (entry,) = read_trace(self.path)
+        self.assertEqual(
+            entry,
+            {
+                "at": 1700000000.0,
+                "method": "POST",
+                "endpoint": "/generate/",
+                "token_type": TokenType.SANDBOX.value,
+                "headers": {"X-Trace": "1"},
+                "data": "eJzL",
+                "status": 200,
+                "seconds": 0.25,
+                "response_bytes": 42,
+                "error": None,
+            },
+        )
+        self.assertEqual(recorder.stats.recorded, 1)
+
+    def test_record__redacts_secrets(self):
+        with TrafficRecorder(self.path) as recorder:
+            self._record(
+                recorder,
+                headers={"authorization": "Token abc", "Accept": "*/*"},
+                json={"client_secret": "s", "nested": [{"Access_Token": "t"}], "n": 1},
+                params={"api_key": "k", "page": 2},
+            )
+
+        (entry,) = read_trace(self.path)
+        self.assertEqual(entry["headers"], {"authorization": REDACTED, "Accept": "*/*"})
+        self.assertEqual(
+            entry["json"],
+            {"client_secret": REDACTED, "nested": [{"Access_Token": REDACTED}], "n": 1},
+        )
+        self.assertEqual(entry["params"], {"api_key": REDACTED, "page": 2})
+
+    def test_record__redacts_secrets_in_json_bodies(self):
+        with TrafficRecorder(self.path) as recorder:
+            self._record(recorder, data='{"client_id": "i", "client_secret": "s"}')
+            self._record(recorder, data=b'{"refresh_token": "t"}')
+            self._record(recorder, data='{"client_id": "i"}')
+
+        text, ascii, unchanged = read_trace(self.path)
+        self.assertEqual(
+            json.loads(text["data"]), {"client_id": "i", "client_secret": REDACTED}
+        )
+        self.assertEqual(json.loads(ascii["data"]), {"refresh_token": REDACTED})
+        self.assertEqual(ascii["data_encoding"], "ascii")
+        # Bodies without secrets are kept as sent
+        self.assertEqual(unchanged["data"], '{"client_id": "i"}')
+
+    def test_record__bytes_and_streamed_bodies(self):
+        with TrafficRecorder(self.path) as recorder:
+            self._record(recorder, data=b"\x00\xff")
+            self._record(recorder, data=b"eJzL")
+            self._record(recorder, data=iter([b"chunk"]))
+
+        binary, ascii, streamed = read_trace(self.path)
+        self.assertEqual((binary["data"], binary["data_encoding"]), ("AP8=", "base64"))
+        self.assertEqual((ascii["data"], ascii["data_encoding"]), ("eJzL", "ascii"))
+        self.assertTrue(streamed["streamed_body"])
+        self.assertNotIn("data", streamed)
+
+    def test_record__rotates_at_max_bytes(self):
+        with TrafficRecorder(self.path, max_bytes=512, backups=2) as recorder:
+            for index in range(200):
+                self._record(recorder, data=os.urandom(64).hex())
+
+        rotated = sorted(path.name for path in self.path.parent.iterdir())
+        self.assertEqual(
+            rotated, ["trace.jsonl.gz", "trace.jsonl.gz.1", "trace.jsonl.gz.2"]
+        )
+        self.assertGreater(recorder.stats.rotations, 2)
+        self.assertLess(os.path.getsize(f"{self.path}.1"), 1024)
+        entries = list(read_trace(f"{self.path}.2", f"{self.path}.1", self.path))
+        self.assertLess(len(entries), 200)
+
+    def test_record__queue_full__drops_without_blocking(self):
+        with TrafficRecorder(self.path, queue_size=1) as recorder:
+            writing = threading.Event()
+            release = threading.Event()
+            encode = recorder._encode
+
+            def slow_encode(*entry):
+                writing.set()
+                release.wait()
+                return encode(*entry)
+
+            with patch.object(recorder, "_encode", slow_encode):
+                self._record(recorder)
+                writing.wait()
+                self._record(recorder)
+                self._record(recorder)
+                release.set()
+
+        self.assertEqual(recorder.stats.recorded, 2)
+        self.assertEqual(recorder.stats.dropped, 1)
+
+    def test_record__after_close__ignored(self):
+        recorder = TrafficRecorder(self.path)
+        recorder.close()
+        self._record(recorder)
+        recorder.close()
+
+        self.assertEqual(list(read_trace(self.path)), [])
+
+    def test_read_trace__truncated__reads_complete_entries(self):
+        with TrafficRecorder(self.path) as recorder:
+            for _ in range(3):
+                self._record(recorder)
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:-12])
+
+        self.assertEqual(len(list(read_trace(self.path))), 3)
+
+    def test_trace__appended_to(self):
+        for _ in range(2):
+            with TrafficRecorder(self.path) as recorder:
+                self._record(recorder)
+
+        self.assertEqual(len(list(read_trace(self.path))), 2)
+        with gzip.open(self.path, "rt") as trace:
+            self.assertEqual(len(trace.readlines()), 2)
+
+    def test_record__unencodable_entry__skipped_and_counted(self):
+        recorder = TrafficRecorder(self.path)
+        encode = recorder._encode
+        calls = []
+
+        def failing_once(*entry):
+            calls.append(entry)
+            if len(calls) == 1:
+                raise ValueError("bad entry")
+            return encode(*entry)
+
+        with patch.object(recorder, "_encode", failing_once):
+            self._record(recorder)
+            self._record(recorder)
+            recorder.close()
+
+        self.assertEqual(len(list(read_trace(self.path))), 1)
+        self.assertEqual(recorder.stats.failed, 1)
+        self.assertEqual(recorder.stats.recorded, 1)
+
+    def test_close__writer_failed__raises_without_blocking(self):
+        recorder = TrafficRecorder(self.path, queue_size=2)
+        with patch.object(
+            recorder._file, "write", side_effect=OSError("No space left on device")
+        ):
+            self._record(recorder)
+            recorder._thread.join(5)
+            self.assertIsInstance(recorder.error, OSError)
+
+            # The queue is full, and nothing empties it anymore
+            for _ in range(5):
+                self._record(recorder)
+
+            with self.assertRaisesRegex(OSError, "No space left"):
+                recorder.close()
+
+        self.assertEqual(recorder.stats.failed, 1)
+        self.assertEqual(recorder.stats.dropped, 5)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_fork__child_records_to_own_trace(self):
+        with TrafficRecorder(self.path) as recorder:
+            self._record(recorder)
+
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    self._record(recorder)
+                    recorder.close()
+                    status = 0
+                finally:
+                    os._exit(status)
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(status, 0)
+            self._record(recorder)
+
+        self.assertEqual(len(list(read_trace(self.path))), 2)
+        self.assertEqual(
+            len(list(read_trace(child_trace_path(str(self.path), pid)))), 1
+        )
+
+    def test_child_trace_path__pid_before_extensions(self):
+        self.assertEqual(
+            child_trace_path(os.path.join("logs", "trace.jsonl.gz"), 12),
+            os.path.join("logs", "trace-12.jsonl.gz"),
+        )
+        self.assertEqual(child_trace_path("trace", 12), "trace-12")
+
+
+class TestRedact(unittest.TestCase):
+    def test_redact__leaves_original(self):
+        value = {"password": "p", "items": ({"id_token": "t"},)}
+
+        self.assertEqual(
+            redact(value, frozenset({"password"})),
+            {"password": REDACTED, "items": [{"id_token": REDACTED}]},
+        )
+        self.assertEqual(value["password"], "p")
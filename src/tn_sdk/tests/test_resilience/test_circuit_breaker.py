@@ -0,0 +1,94 @@
+import unittest
+
+from tn_sdk.core.resilience import CircuitBreaker
+from tn_sdk.exceptions.exceptions import CircuitOpenException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            failure_threshold=3, recovery_timeout=10, clock=self.clock
+        )
+
+    def _fail(self, times: int, endpoint: str = "/a/") -> None:
+        for _ in range(times):
+            self.breaker.before_request(endpoint)
+            self.breaker.record_failure(endpoint)
+
+    def test_record_failure__threshold__opens(self):
+        self._fail(2)
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.CLOSED)
+
+        self._fail(1)
+
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before_request("/a/")
+        self.assertEqual(self.breaker.stats.rejected, 1)
+
+    def test_record_failure__per_endpoint(self):
+        self._fail(3, "/a/")
+
+        self.breaker.before_request("/b/")
+
+        self.assertEqual(self.breaker.state("/b/"), CircuitBreaker.CLOSED)
+
+    def test_record_success__resets_failures(self):
+        self._fail(2)
+        self.breaker.record_success("/a/")
+
+        self._fail(2)
+
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.CLOSED)
+
+    def test_before_request__after_recovery_timeout__single_probe(self):
+        self._fail(3)
+        self.clock.now += 10
+
+        self.breaker.before_request("/a/")
+
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.HALF_OPEN)
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before_request("/a/")
+
+    def test_probe_success__closes(self):
+        self._fail(3)
+        self.clock.now += 10
+        self.breaker.before_request("/a/")
+
+        self.breaker.record_success("/a/")
+
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.stats.closed, 1)
+
+    def test_probe_failure__reopens(self):
+        self._fail(3)
+        self.clock.now += 10
+        self.breaker.before_request("/a/")
+
+        self.breaker.record_failure("/a/")
+
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.stats.opened, 2)
+        self.clock.now += 9
+        with self.assertRaises(CircuitOpenException):
+            self.breaker.before_request("/a/")
+
+    def test_probe_aborted__next_request_probes(self):
+        self._fail(3)
+        self.clock.now += 10
+        self.breaker.before_request("/a/")
+
+        self.breaker.record_abort("/a/")
+
+        self.breaker.before_request("/a/")
+        self.assertEqual(self.breaker.state("/a/"), CircuitBreaker.HALF_OPEN)
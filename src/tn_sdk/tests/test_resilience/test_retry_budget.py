@@ -0,0 +1,34 @@
+import unittest
+
+from tn_sdk.core.resilience import RetryBudget
+
+
+class TestRetryBudget(unittest.TestCase):
+    def test_try_spend__reserve__then_rejected(self):
+        budget = RetryBudget(ratio=0.5, reserve=2)
+
+        self.assertEqual([budget.try_spend() for _ in range(3)], [True, True, False])
+
+        stats = budget.stats
+        self.assertEqual(stats.spent, 2)
+        self.assertEqual(stats.rejected, 1)
+
+    def test_deposit__successes__earn_retries(self):
+        budget = RetryBudget(ratio=0.5, reserve=2)
+        budget.try_spend()
+        budget.try_spend()
+
+        budget.deposit()
+        self.assertFalse(budget.try_spend())
+        budget.deposit()
+
+        self.assertTrue(budget.try_spend())
+
+    def test_deposit__capped_at_reserve(self):
+        budget = RetryBudget(ratio=1, reserve=2)
+
+        for _ in range(10):
+            budget.deposit()
+
+        self.assertEqual(budget.balance, 2)
+        self.assertEqual(budget.stats.deposits, 10)
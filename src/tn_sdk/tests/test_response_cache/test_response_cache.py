@@ -0,0 +1,214 @@
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.response_cache import ResponseCache, response_cache_key
+from tn_sdk.core.stats import CacheStats
+
+
+class TestResponseCacheKey(unittest.TestCase):
+    def test_key__same_request_with_another_token__same_key(self):
+        first = response_cache_key(
+            "POST",
+            "/endpoint",
+            TokenType.PRODUCTION,
+            {"data": b"payload", "headers": {"Authorization": "Token a"}},
+        )
+        second = response_cache_key(
+            "post",
+            "/endpoint",
+            TokenType.PRODUCTION,
+            {"data": "payload", "headers": {"authorization": "Token b"}},
+        )
+
+        self.assertEqual(first, second)
+
+    def test_key__any_difference__other_key(self):
+        base = {"data": b"payload", "headers": {"X-TN-Compression-Codec": "gzip"}}
+        keys = {
+            response_cache_key("POST", "/endpoint", TokenType.PRODUCTION, base),
+            response_cache_key("POST", "/other", TokenType.PRODUCTION, base),
+            response_cache_key("POST", "/endpoint", TokenType.SANDBOX, base),
+            response_cache_key(
+                "POST", "/endpoint", TokenType.PRODUCTION, base | {"data": b"other"}
+            ),
+            response_cache_key(
+                "POST", "/endpoint", TokenType.PRODUCTION, base | {"headers": {}}
+            ),
+            response_cache_key(
+                "POST", "/endpoint", TokenType.PRODUCTION, base | {"params": {"a": 1}}
+            ),
+        }
+
+        self.assertEqual(len(keys), 6)
+
+    def test_key__streamed_body__none(self):
+        key = response_cache_key(
+            "POST", "/endpoint", TokenType.PRODUCTION, {"data": iter([b"chunk"])}
+        )
+
+        self.assertIsNone(key)
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_get_or_load__second_lookup__hit(self):
+        cache = ResponseCache()
+        load = MagicMock(return_value=b'{"ok": true}')
+
+        cache.get_or_load("key", load)
+        body = cache.get_or_load("key", load)
+
+        self.assertEqual(body, b'{"ok": true}')
+        load.assert_called_once()
+        self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_get_or_load__more_entries_than_max__evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2)
+        cache.get_or_load("a", lambda: b"a")
+        cache.get_or_load("b", lambda: b"b")
+        cache.get_or_load("a", lambda: b"a")  # "b" is now the least recently used
+
+        cache.get_or_load("c", lambda: b"c")
+
+        load = MagicMock(return_value=b"b")
+        cache.get_or_load("a", MagicMock())
+        cache.get_or_load("b", load)
+        load.assert_called_once()
+        self.assertEqual(cache.stats.evictions, 2)
+
+    def test_get_or_load__more_bytes_than_max__evicts_until_within_bound(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.get_or_load("a", lambda: b"x" * 4)
+        cache.get_or_load("b", lambda: b"x" * 4)
+
+        cache.get_or_load("c", lambda: b"x" * 4)
+
+        self.assertEqual((len(cache), cache.size), (2, 8))
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_get_or_load__body_larger_than_max_bytes__not_cached(self):
+        cache = ResponseCache(max_bytes=3)
+
+        body = cache.get_or_load("a", lambda: b"x" * 4)
+
+        self.assertEqual(body, b"xxxx")
+        self.assertEqual(len(cache), 0)
+
+    def test_get_or_load__expired__loads_again(self):
+        cache = ResponseCache(ttl=30)
+        load = MagicMock(return_value=b"body")
+
+        with patch("tn_sdk.core.response_cache.time.monotonic", return_value=100):
+            cache.get_or_load("key", load)
+        with patch("tn_sdk.core.response_cache.time.monotonic", return_value=131):
+            cache.get_or_load("key", load)
+
+        self.assertEqual(load.call_count, 2)
+        self.assertEqual(cache.stats.expirations, 1)
+
+    def test_get_or_load__failure__not_cached_and_raised(self):
+        cache = ResponseCache()
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_load("key", MagicMock(side_effect=RuntimeError("down")))
+
+        self.assertEqual(cache.get_or_load("key", lambda: b"body"), b"body")
+
+    def test_get_or_load__concurrent_identical_lookups__single_load(self):
+        cache = ResponseCache()
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return b"body"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", load))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every lookup find the request in flight before it completes
+        for _ in range(500):
+            if cache.stats.coalesced == 4:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [b"body"] * 5)
+        self.assertEqual(cache.stats.coalesced, 4)
+
+    def test_get_or_load__concurrent_lookups_of_failing_request__all_raise(self):
+        cache = ResponseCache()
+        release = threading.Event()
+
+        def load():
+            release.wait(5)
+            raise RuntimeError("down")
+
+        errors = []
+
+        def lookup():
+            try:
+                cache.get_or_load("k", load)
+            except RuntimeError as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=lookup) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for _ in range(500):
+            if cache.stats.coalesced == 2:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(errors), 3)
+
+    def test_disk_tier__shared_between_caches(self):
+        with tempfile.TemporaryDirectory() as disk_path:
+            writer = ResponseCache(disk_path=disk_path)
+            reader = ResponseCache(disk_path=disk_path)
+            writer.get_or_load("key", lambda: b"body\nwith lines")
+
+            load = MagicMock()
+            body = reader.get_or_load("key", load)
+
+            self.assertEqual(body, b"body\nwith lines")
+            load.assert_not_called()
+            self.assertEqual(reader.stats.disk_hits, 1)
+
+    def test_disk_tier__expired_entry__loads_again(self):
+        with tempfile.TemporaryDirectory() as disk_path:
+            with patch("tn_sdk.core.response_cache.time.time", return_value=100):
+                ResponseCache(ttl=30, disk_path=disk_path).get_or_load(
+                    "key", lambda: b"old"
+                )
+
+            reader = ResponseCache(ttl=30, disk_path=disk_path)
+            with patch("tn_sdk.core.response_cache.time.time", return_value=131):
+                body = reader.get_or_load("key", lambda: b"new")
+
+            self.assertEqual(body, b"new")
+            self.assertEqual(reader.stats.expirations, 1)
+
+    def test_clear__drops_memory_and_disk(self):
+        with tempfile.TemporaryDirectory() as disk_path:
+            cache = ResponseCache(disk_path=disk_path)
+            cache.get_or_load("key", lambda: b"body")
+
+            cache.clear()
+
+            self.assertEqual(cache.get_or_load("key", lambda: b"new"), b"new")
@@ -0,0 +1,111 @@
+import json
+import unittest
+
+from tn_sdk.core.response_stream import JsonStreamReader
+from tn_sdk.exceptions.exceptions import InvalidResponseException
+
+DOCUMENT = {
+    "trip_id": "trip",
+    "metadata": {"skipped": [1, 2, {"nested": "values"}]},
+    "solutions": [
+        {"id": "a", "price": 12345.5, "carrier": "Zürich ✈"},
+        {"id": "b", "price": 7, "tags": []},
+        [1, 2],
+        123456789,
+        True,
+        None,
+    ],
+}
+
+
+def _chunks(data: bytes, size: int):
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+class TestJsonStreamReader(unittest.TestCase):
+    def test_iter_array__any_chunk_size__same_items(self):
+        encoded = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode("utf-8")
+
+        for size in (1, 2, 3, 7, 64, len(encoded)):
+            with self.subTest(size=size):
+                reader = JsonStreamReader(_chunks(encoded, size))
+
+                self.assertEqual(
+                    list(reader.iter_array("solutions")), DOCUMENT["solutions"]
+                )
+
+    def test_iter_array__nested_path(self):
+        encoded = json.dumps({"a": {"b": ["x", "y"]}}).encode("utf-8")
+
+        items = JsonStreamReader(_chunks(encoded, 3)).iter_array("a", "b")
+
+        self.assertEqual(list(items), ["x", "y"])
+
+    def test_iter_array__top_level_array(self):
+        reader = JsonStreamReader(_chunks(b"[10, 20, 30]", 2))
+
+        self.assertEqual(list(reader.iter_array()), [10, 20, 30])
+
+    def test_iter_array__empty_array(self):
+        reader = JsonStreamReader([b'{"solutions": [ ]}'])
+
+        self.assertEqual(list(reader.iter_array("solutions")), [])
+
+    def test_iter_array__lazy(self):
+        chunks = iter(_chunks(json.dumps(DOCUMENT).encode("utf-8"), 8))
+        items = JsonStreamReader(chunks).iter_array("solutions")
+
+        self.assertEqual(next(items)["id"], "a")
+        self.assertTrue(list(chunks), "the rest of the body should be left unread")
+
+    def test_iter_array__missing_key__raises(self):
+        reader = JsonStreamReader([b'{"trip_id": "", "other": []}'])
+
+        with self.assertRaises(InvalidResponseException):
+            list(reader.iter_array("solutions"))
+
+    def test_iter_array__not_an_array__raises(self):
+        reader = JsonStreamReader([b'{"solutions": {}}'])
+
+        with self.assertRaises(InvalidResponseException):
+            list(reader.iter_array("solutions"))
+
+    def test_value__truncated__raises(self):
+        reader = JsonStreamReader([b'{"solutions": [1, 2'])
+
+        with self.assertRaises(InvalidResponseException):
+            reader.value()
+
+    def test_value__number_split_across_chunks__read_whole(self):
+        reader = JsonStreamReader([b"12", b"34", b".5"])
+
+        self.assertEqual(reader.value(), 1234.5)
+
+    def test_value__value_spanning_many_chunks__read_whole(self):
+        document = {
+            "solutions": [{"id": str(i), "price": i * 1.5} for i in range(2000)]
+        }
+        encoded = json.dumps(document).encode("utf-8")
+
+        reader = JsonStreamReader(_chunks(encoded, 10))
+
+        self.assertEqual(reader.value(), document)
+        self.assertEqual(reader.peek(), "")
+
+    def test_document__any_chunk_size__same_as_json_loads(self):
+        encoded = json.dumps(DOCUMENT, ensure_ascii=False).encode("utf-8")
+
+        for size in (1, 3, len(encoded)):
+            with self.subTest(size=size):
+                reader = JsonStreamReader(_chunks(encoded, size))
+
+                self.assertEqual(reader.document(), DOCUMENT)
+
+    def test_document__invalid_or_already_read__raises(self):
+        with self.assertRaises(InvalidResponseException):
+            JsonStreamReader([b'{"solutions": [1, 2']).document()
+
+        reader = JsonStreamReader([b"[1, 2]"])
+        reader.peek()
+        with self.assertRaises(InvalidResponseException):
+            reader.document()
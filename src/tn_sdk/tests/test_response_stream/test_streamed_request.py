@@ -0,0 +1,72 @@
+import unittest
+
+from requests import HTTPError
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.response_stream import StreamedResponse
+from tn_sdk.exceptions.exceptions import InvalidResponseException
+
+BODY = {"trip_id": "", "solutions": [{"id": index} for index in range(1000)]}
+
+
+class TestStreamedRequest(unittest.TestCase):
+    def _client(self, server: StubApiServer) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_request__stream__iterates_items(self):
+        with StubApiServer(response_body=BODY) as server:
+            client = self._client(server)
+
+            with client._request("GET", "/solutions", stream=True) as response:
+                self.assertIsInstance(response, StreamedResponse)
+                self.assertEqual(
+                    list(response.iter_items("solutions")), BODY["solutions"]
+                )
+
+    def test_request__stream_gzip_response__decompressed(self):
+        with StubApiServer(response_body=BODY, gzip_responses=True) as server:
+            client = self._client(server)
+
+            with client._request("GET", "/solutions", stream=True) as response:
+                first = next(response.iter_items("solutions"))
+
+            self.assertEqual(first, {"id": 0})
+
+    def test_request__stream_json__whole_body(self):
+        with StubApiServer(response_body=BODY) as server:
+            client = self._client(server)
+
+            with client._request("GET", "/solutions", stream=True) as response:
+                self.assertEqual(response.json(), BODY)
+                with self.assertRaises(InvalidResponseException):
+                    response.json()
+
+    def test_request__stream_after_token_expiry__retried_with_new_token(self):
+        with StubApiServer(response_body=BODY) as server:
+            client = self._client(server)
+            client._request("GET", "/solutions")
+            server.expire_tokens()
+
+            with client._request("GET", "/solutions", stream=True) as response:
+                self.assertEqual(len(list(response.iter_items("solutions"))), 1000)
+
+            self.assertEqual(server.stats.unauthorized, 1)
+        self.assertEqual(client.pool_stats.discarded, 0)
+
+    def test_request__stream_error_status__raises_with_body(self):
+        with StubApiServer(burst_every=1, burst_status=400) as server:
+            client = self._client(server)
+
+            with self.assertRaises(HTTPError) as context:
+                client._request("GET", "/solutions", stream=True)
+
+            self.assertIn("stub error", context.exception.response.text)
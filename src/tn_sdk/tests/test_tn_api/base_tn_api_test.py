@@ -32,6 +32,13 @@ class BaseTnApiTest(unittest.TestCase):
         self.mock_path_instance.parent.exists.return_value = True
         self.mock_path_instance.exists.return_value = False
 
+        # Mock the credential store backing the credentials file
+        self.store_patcher = patch("tn_sdk.core.tn_api.FileCredentialStore")
+        self.MockStore = self.store_patcher.start()
+        self.mock_store_instance = self.MockStore.return_value
+        self.mock_store_instance.load.return_value = {}
+        self.mock_store_instance.issued_at.return_value = None
+
         # Mock the request session
         self.session_patcher = patch("requests.Session")
         self.MockSession = self.session_patcher.start()
@@ -41,4 +48,5 @@ class BaseTnApiTest(unittest.TestCase):
         self.env_patcher.stop()
         self.validator_patcher.stop()
         self.path_patcher.stop()
+        self.store_patcher.stop()
         self.session_patcher.stop()
@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, patch
 
+from requests import HTTPError
+
 from tn_sdk import TnApi
 from tn_sdk.core.enums import TokenType
 from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
@@ -71,3 +73,21 @@ class TestRequest(BaseTnApiTest):
             "headers"
         ]
         self.assertEqual(headers_second_call["Authorization"], "Token newer_disk")
+
+    def test_request__401_returned_for_streamed_body__refreshes_without_replaying(
+        self,
+    ):
+        api = TnApi()
+        api._credentials = {"prod_token": "stale"}
+        api._fetch_new_credentials_from_api = MagicMock(
+            return_value={"prod_token": "fresh"}
+        )
+        response_401 = MagicMock(status_code=401)
+        response_401.raise_for_status.side_effect = HTTPError("401")
+        self.mock_session_instance.request.return_value = response_401
+
+        with self.assertRaises(HTTPError):
+            api._request("POST", "/test", data=iter([b"chunk"]))
+
+        self.mock_session_instance.request.assert_called_once()
+        self.assertEqual(api._credentials, {"prod_token": "fresh"})
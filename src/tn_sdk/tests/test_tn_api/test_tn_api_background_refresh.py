@@ -0,0 +1,63 @@
+import time
+from unittest.mock import MagicMock
+
+from tn_sdk import TnApi
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestBackgroundRefresh(BaseTnApiTest):
+
+    def test_track_credentials_expiry__expires_in_returned__schedules_refresh_ahead_of_expiry(
+        self,
+    ):
+        api = TnApi(refresh_ahead=60)
+        now = time.time()
+
+        api._track_credentials_expiry({"prod_token": "t", "expires_in": 3600}, now)
+
+        self.assertAlmostEqual(api._seconds_until_refresh(), 3600 - 60, delta=1)
+
+    def test_track_credentials_expiry__no_expiry_and_no_ttl__expiry_unknown(self):
+        api = TnApi()
+
+        api._track_credentials_expiry({"prod_token": "t"}, time.time())
+
+        self.assertIsNone(api._seconds_until_refresh())
+        self.assertFalse(api._credentials_expired())
+
+    def test_request__credentials_known_to_be_expired__refreshes_before_sending(self):
+        api = TnApi(token_ttl=10)
+        api._credentials = {"prod_token": "old"}
+        api._track_credentials_expiry(api._credentials, time.time() - 20)
+        api._fetch_new_credentials_from_api = MagicMock(
+            return_value={"prod_token": "fresh"}
+        )
+        response_200 = MagicMock(status_code=200)
+        response_200.json.return_value = {}
+        self.mock_session_instance.request.return_value = response_200
+
+        api._request("GET", "/test")
+
+        self.mock_session_instance.request.assert_called_once()
+        headers = self.mock_session_instance.request.call_args[1]["headers"]
+        self.assertEqual(headers["Authorization"], "Token fresh")
+
+    def test_background_refresh__token_close_to_expiry__refreshed_without_a_request(
+        self,
+    ):
+        api = TnApi(token_ttl=0.2, refresh_ahead=0.05, background_refresh=True)
+        api._fetch_new_credentials_from_api = MagicMock(
+            side_effect=lambda: {"prod_token": f"fresh-{time.monotonic()}"}
+        )
+        api._credentials = {"prod_token": "initial"}
+        api._track_credentials_expiry(api._credentials, time.time())
+
+        deadline = time.monotonic() + 3
+        while api.refresh_stats.proactive == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        api.close()
+
+        self.assertGreaterEqual(api.refresh_stats.proactive, 1)
+        self.assertNotEqual(api._credentials["prod_token"], "initial")
+        self.mock_session_instance.request.assert_not_called()
+        self.assertIsNone(api._refresh_thread)
@@ -0,0 +1,101 @@
+import json
+import os
+import unittest
+import uuid
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import (
+    InMemoryCredentialStore,
+    SharedMemoryCredentialStore,
+)
+from tn_sdk.core.tn_api import _reset_clients_after_fork
+
+
+def _in_child(function) -> dict:
+    """
+    Runs function in a forked child, returning the dict it returned.
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            os.close(read_fd)
+            with os.fdopen(write_fd, "w") as pipe:
+                json.dump(function(), pipe)
+            status = 0
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        output = pipe.read()
+    _, status = os.waitpid(pid, 0)
+    if status:
+        raise AssertionError(f"Child failed with status {status}")
+    return json.loads(output)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+class TestTnApiFork(unittest.TestCase):
+    def _client(self, server: StubApiServer, credential_store=None) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=credential_store or InMemoryCredentialStore(),
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_fork__child_gets_own_connections_and_keeps_credentials(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            client._request("GET", "/x/")
+            parent_session = client.session
+
+            def child():
+                response = client._request("GET", "/x/")
+                return {
+                    "response": response,
+                    "new_session": client.session is not parent_session,
+                    "created": client.pool_stats.created,
+                }
+
+            result = _in_child(child)
+            client._request("GET", "/x/")
+
+            self.assertEqual(result["response"], {"ok": True})
+            self.assertTrue(result["new_session"])
+            self.assertEqual(result["created"], 1)
+            # Neither the child nor the parent had to authenticate again
+            self.assertEqual(server.stats.auth_requests, 1)
+        self.assertIs(client.session, parent_session)
+        self.assertEqual(client.pool_stats.created, 1)
+
+    def test_fork__shared_memory_store__refreshed_token_shared(self):
+        store = SharedMemoryCredentialStore(f"tn_sdk_test_{uuid.uuid4().hex[:12]}")
+        self.addCleanup(store.unlink)
+        self.addCleanup(store.close)
+        with StubApiServer() as server:
+            client = self._client(server, credential_store=store)
+            client._request("GET", "/x/")
+            server.expire_tokens()
+
+            # The child refreshes the expired tokens, the parent then reuses them
+            _in_child(lambda: client._request("GET", "/x/"))
+            self.assertEqual(client._request("GET", "/x/"), {"ok": True})
+
+            self.assertEqual(server.stats.auth_requests, 2)
+            self.assertEqual(server.stats.unauthorized, 2)
+
+    def test_reset_after_fork__closed_client__ignored(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+            session = client.session
+            client.close()
+
+            _reset_clients_after_fork()
+
+            self.assertIs(client.session, session)
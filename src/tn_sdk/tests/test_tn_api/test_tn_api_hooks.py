@@ -0,0 +1,134 @@
+from unittest.mock import ANY, MagicMock
+
+from requests import HTTPError
+from urllib3.exceptions import ConnectTimeoutError
+
+from tn_sdk import TnApi
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.hooks import TnApiHooks
+from tn_sdk.core.transport import ObservedRetry
+from tn_sdk.payload.codecs import ZlibCodec
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestHooks(BaseTnApiTest):
+
+    def setUp(self):
+        super().setUp()
+        self.hooks = MagicMock(spec=TnApiHooks)
+
+    def _response(self, status_code: int, json_data: dict | None = None):
+        response = MagicMock(status_code=status_code)
+        response.json.return_value = json_data or {}
+        if status_code >= 400:
+            response.raise_for_status.side_effect = HTTPError(response=response)
+        return response
+
+    def test_request__success__reports_start_and_end(self):
+        api = TnApi(hooks=self.hooks)
+        api._credentials = {"sandbox_token": "valid"}
+        self.mock_session_instance.request.return_value = self._response(200)
+
+        api._request("POST", "/endpoint", TokenType.SANDBOX)
+
+        self.hooks.on_request_start.assert_called_once_with(
+            "POST", "/endpoint", TokenType.SANDBOX
+        )
+        method, endpoint, token_type, status_code, seconds, error = (
+            self.hooks.on_request_end.call_args.args
+        )
+        self.assertEqual(
+            (method, endpoint, token_type, status_code, error),
+            ("POST", "/endpoint", TokenType.SANDBOX, 200, None),
+        )
+        self.assertGreaterEqual(seconds, 0)
+
+    def test_request__query_string__reported_without_it(self):
+        api = TnApi(hooks=self.hooks)
+        api._credentials = {"prod_token": "valid"}
+        self.mock_session_instance.request.return_value = self._response(200)
+
+        api._request("GET", "/endpoint?trip_id=1")
+
+        self.hooks.on_request_start.assert_called_once_with(
+            "GET", "/endpoint", TokenType.PRODUCTION
+        )
+        self.assertEqual(self.hooks.on_request_end.call_args.args[1], "/endpoint")
+
+    def test_request__error_status__reports_status_and_error(self):
+        api = TnApi(hooks=self.hooks)
+        api._credentials = {"prod_token": "valid"}
+        self.mock_session_instance.request.return_value = self._response(500)
+
+        with self.assertRaises(HTTPError) as context:
+            api._request("GET", "/endpoint")
+
+        args = self.hooks.on_request_end.call_args.args
+        self.assertEqual(args[3], 500)
+        self.assertIs(args[5], context.exception)
+
+    def test_request__401__reports_token_refresh_from_api(self):
+        api = TnApi(hooks=self.hooks)
+        api._credentials = {"prod_token": "stale"}
+        self.mock_store_instance.load.return_value = {"prod_token": "stale"}
+        api._fetch_new_credentials_from_api = MagicMock(
+            return_value={"prod_token": "fresh"}
+        )
+        self.mock_session_instance.request.side_effect = [
+            self._response(401),
+            self._response(200),
+        ]
+
+        api._request("GET", "/endpoint")
+
+        source, proactive, _, error = self.hooks.on_token_refresh.call_args.args
+        self.assertEqual((source, proactive, error), ("api", False, None))
+        self.hooks.on_credentials_load.assert_called_with(True, ANY)
+        self.assertEqual(self.hooks.on_request_end.call_args.args[3], 200)
+
+    def test_refresh_credentials__already_refreshed__reports_coalesced(self):
+        api = TnApi(hooks=self.hooks)
+        api._credentials = {"prod_token": "fresh"}
+
+        api._refresh_credentials({"prod_token": "stale"})
+
+        self.assertEqual(self.hooks.on_token_refresh.call_args.args[0], "coalesced")
+
+    def test_refresh_credentials__api_fails__reports_error(self):
+        api = TnApi(hooks=self.hooks)
+        error = RuntimeError("auth down")
+        api._fetch_new_credentials_from_api = MagicMock(side_effect=error)
+
+        with self.assertRaises(RuntimeError):
+            api._refresh_credentials({})
+
+        source, _, _, reported = self.hooks.on_token_refresh.call_args.args
+        self.assertEqual(source, "api")
+        self.assertIs(reported, error)
+
+    def test_prepare_data__reports_compression(self):
+        api = TnApi(hooks=self.hooks)
+
+        prepared = api.prepare_data_with_metadata('{"trip_id": ""}')
+
+        codec, raw_size, compressed_size, _ = self.hooks.on_compression.call_args.args
+        self.assertEqual(codec, ZlibCodec())
+        self.assertEqual(raw_size, prepared.raw_size)
+        self.assertEqual(compressed_size, prepared.compressed_size)
+
+    def test_init__hooks__retries_report_to_them(self):
+        api = TnApi(hooks=self.hooks)
+
+        retry = api._adapter.max_retries
+        self.assertIsInstance(retry, ObservedRetry)
+        retry.increment("GET", "/endpoint?page=1", error=ConnectTimeoutError())
+
+        self.hooks.on_retry.assert_called_once()
+        self.assertEqual(
+            self.hooks.on_retry.call_args.args[:3], ("GET", "/endpoint", None)
+        )
+
+    def test_init__no_hooks__plain_retries(self):
+        api = TnApi()
+
+        self.assertNotIsInstance(api._adapter.max_retries, ObservedRetry)
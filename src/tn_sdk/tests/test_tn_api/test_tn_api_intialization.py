@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
 from tn_sdk import TnApi
+from tn_sdk.core.stats import PoolStats
 
 
 class TestInit(BaseTnApiTest):
@@ -33,3 +34,53 @@ class TestInit(BaseTnApiTest):
         self.MockSession.assert_called_once()
         self.mock_session_instance.mount.assert_called()
         self.assertEqual(api._client_id, "test_id")
+
+    def test_init__pool_options__mounted_on_both_schemes(self):
+        api = TnApi(pool_connections=4, pool_maxsize=50, pool_block=True)
+
+        mounted = dict(
+            call.args for call in self.mock_session_instance.mount.call_args_list
+        )
+        self.assertEqual(set(mounted), {"http://", "https://"})
+        self.assertIs(mounted["http://"], mounted["https://"])
+        adapter = mounted["https://"]
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(api.pool_stats, PoolStats())
+
+    def test_init__timeouts__split_into_connect_and_read(self):
+        self.assertEqual(TnApi(timeout=20)._request_timeout, (20, 20))
+        self.assertEqual(TnApi(timeout=20, connect_timeout=3)._request_timeout, (3, 20))
+        self.assertEqual(
+            TnApi(connect_timeout=3, read_timeout=60)._request_timeout, (3, 60)
+        )
+
+    def test_init__keep_alive_disabled__closes_connections(self):
+        self.mock_session_instance.headers = {}
+
+        TnApi(keep_alive=False)
+
+        self.assertEqual(self.mock_session_instance.headers["Connection"], "close")
+
+    def test_init__lazy__defers_session_and_credentials(self):
+        api = TnApi(lazy=True)
+
+        self.MockSession.assert_not_called()
+        self.mock_store_instance.load.assert_not_called()
+        self.assertEqual(api.pool_stats, PoolStats())
+
+    def test_init__lazy__first_request_loads_them(self):
+        self.mock_store_instance.load.return_value = {
+            "prod_token": "stored_token",
+            "sandbox_token": "stored_sandbox",
+        }
+        self.mock_session_instance.request.return_value.status_code = 200
+        self.mock_session_instance.request.return_value.json.return_value = {}
+        api = TnApi(lazy=True)
+
+        api._request("GET", "/endpoint")
+
+        self.MockSession.assert_called_once()
+        _, kwargs = self.mock_session_instance.request.call_args
+        self.assertEqual(kwargs["headers"]["Authorization"], "Token stored_token")
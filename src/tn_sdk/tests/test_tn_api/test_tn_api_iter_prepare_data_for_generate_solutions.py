@@ -0,0 +1,102 @@
+import io
+import json
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestIterPrepareDataForGenerateSolutions(BaseTnApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = TnApi()
+        self.request_data = {
+            "trip_id": "",
+            "datasource_responses": {
+                "source": [
+                    {"pricing_solution_id": str(i), "total_price": i * 1.5, "é": "ü"}
+                    for i in range(500)
+                ]
+            },
+        }
+        self.expected = self.api.prepare_data_for_generate_solutions(
+            json.dumps(self.request_data)
+        )
+
+    def test_iter_prepare_data_for_generate_solutions__any_input_type__byte_identical_to_one_shot(
+        self,
+    ):
+        json_str = json.dumps(self.request_data)
+        inputs = {
+            "dict": self.request_data,
+            "str": json_str,
+            "bytes": json_str.encode("utf-8"),
+            "memoryview": memoryview(json_str.encode("utf-8")),
+            "text file": io.StringIO(json_str),
+            "binary file": io.BytesIO(json_str.encode("utf-8")),
+            "chunks": (json_str[i : i + 100] for i in range(0, len(json_str), 100)),
+        }
+
+        for name, data in inputs.items():
+            with self.subTest(input_type=name):
+                result = b"".join(
+                    self.api.iter_prepare_data_for_generate_solutions(
+                        data, chunk_size=257
+                    )
+                )
+                self.assertEqual(result, self.expected)
+
+    def test_iter_prepare_data_for_generate_solutions__deduplicate_segments__decoded_inputs_deduplicated(
+        self,
+    ):
+        api = TnApi(deduplicate_segments=True)
+        data = generate_request_data(20, duplication=0.9)
+        json_str = json.dumps(data)
+        expected = api.prepare_data_for_generate_solutions(json_str)
+        inputs = {
+            "dict": data,
+            "str": json_str,
+            "bytes": json_str.encode("utf-8"),
+            "memoryview": memoryview(json_str.encode("utf-8")),
+            "model": GenerateSolutionsRequest.from_dict(data),
+        }
+
+        for name, payload in inputs.items():
+            with self.subTest(input_type=name):
+                result = b"".join(api.iter_prepare_data_for_generate_solutions(payload))
+                self.assertEqual(result, expected)
+
+    def test_iter_prepare_data_for_generate_solutions__deduplicate_segments__streamed_inputs_rejected_up_front(
+        self,
+    ):
+        api = TnApi(deduplicate_segments=True)
+        json_str = json.dumps(self.request_data)
+        inputs = {
+            "text file": io.StringIO(json_str),
+            "binary file": io.BytesIO(json_str.encode("utf-8")),
+            "chunks": (json_str[i : i + 100] for i in range(0, len(json_str), 100)),
+        }
+
+        for name, payload in inputs.items():
+            with self.subTest(input_type=name):
+                # Raised by the call itself, before any chunk is read
+                with self.assertRaisesRegex(
+                    InvalidDataException, "Segment deduplication needs"
+                ):
+                    api.iter_prepare_data_for_generate_solutions(payload)
+
+    def test_iter_prepare_data_for_generate_solutions__invalid_data__raises_exception(
+        self,
+    ):
+        with self.assertRaises(InvalidDataException) as cm:
+            list(self.api.iter_prepare_data_for_generate_solutions(None))
+
+        self.assertEqual(cm.exception.code, "INVALID_DATA")
+
+    def test_iter_prepare_data_for_generate_solutions__not_json_serializable__raises_exception(
+        self,
+    ):
+        with self.assertRaises(InvalidDataException):
+            list(self.api.iter_prepare_data_for_generate_solutions({"bad": object()}))
@@ -1,13 +1,12 @@
-import json
-
 from tn_sdk import TnApi
+from tn_sdk.core.credential_store import InMemoryCredentialStore
 from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
 
 
 class TestLoadTokenFromDisk(BaseTnApiTest):
 
     def test_load_token_from_disk__file_does_not_exist__returns_empty_dict(self):
-        self.mock_path_instance.exists.return_value = False
+        self.mock_store_instance.load.return_value = {}
         api = TnApi()  # Init calls _load_token_from_disk internally
 
         # We call it again to test logic specifically
@@ -16,17 +15,19 @@ class TestLoadTokenFromDisk(BaseTnApiTest):
 
     def test_load_token_from_disk__valid_json_file_exists__returns_dict(self):
         expected_data = {"production": "abc", "sandbox": "123"}
-        self.mock_path_instance.exists.return_value = True
-        self.mock_path_instance.read_text.return_value = json.dumps(expected_data)
+        self.mock_store_instance.load.return_value = expected_data
 
         api = TnApi()
         result = api._load_token_from_disk()
         self.assertEqual(result, expected_data)
+        self.MockStore.assert_called_once_with(self.mock_path_instance)
 
-    def test_load_token_from_disk__corrupt_json_file__returns_empty_dict(self):
-        self.mock_path_instance.exists.return_value = True
-        self.mock_path_instance.read_text.return_value = "{ broken_json: "
+    def test_load_token_from_disk__custom_credential_store__reads_from_that_store(
+        self,
+    ):
+        store = InMemoryCredentialStore({"prod_token": "in_memory"})
 
-        api = TnApi()
-        result = api._load_token_from_disk()
-        self.assertEqual(result, {})
+        api = TnApi(credential_store=store)
+
+        self.assertEqual(api._credentials, {"prod_token": "in_memory"})
+        self.MockStore.assert_not_called()
@@ -0,0 +1,167 @@
+import os
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core import TnApiPool
+from tn_sdk.core.enums import TokenType
+from tn_sdk.tests.test_tn_api.test_tn_api_fork import _in_child
+
+
+class TestTnApiPool(unittest.TestCase):
+    def _pool(self, server: StubApiServer, tenants: int = 3, **kwargs) -> TnApiPool:
+        pool = TnApiPool(tn_api_url=server.url, **kwargs)
+        self.addCleanup(pool.close)
+        for index in range(tenants):
+            pool.register(f"tenant-{index}", f"id-{index}", f"secret-{index}")
+        return pool
+
+    def test_request__tenants_share_connections(self):
+        with StubApiServer() as server:
+            pool = self._pool(server)
+            for _ in range(3):
+                for index in range(3):
+                    self.assertEqual(
+                        pool._request(f"tenant-{index}", "GET", "/x/"), {"ok": True}
+                    )
+
+            # One connection for every tenant, each authenticated once
+            self.assertEqual(pool.pool_stats.created, 1)
+            self.assertEqual(server.stats.auth_requests, 3)
+            self.assertIs(pool.client("tenant-0").session, pool.session)
+
+    def test_request__tenants_have_own_tokens(self):
+        with StubApiServer() as server:
+            pool = self._pool(server)
+            for index in range(3):
+                pool._request(f"tenant-{index}", "GET", "/x/")
+
+            tokens = {
+                pool.client(f"tenant-{index}")._credentials[TokenType.PRODUCTION.value]
+                for index in range(3)
+            }
+            self.assertEqual(len(tokens), 3)
+
+    def test_request__401__only_that_tenant_refreshes(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=2)
+            pool._request("tenant-0", "GET", "/x/")
+            pool._request("tenant-1", "GET", "/x/")
+            old_token = pool.client("tenant-1")._credentials[TokenType.PRODUCTION.value]
+            server.expire_tokens()
+
+            pool._request("tenant-0", "GET", "/x/")
+
+            self.assertEqual(server.stats.auth_requests, 3)
+            self.assertEqual(
+                pool.client("tenant-1")._credentials[TokenType.PRODUCTION.value],
+                old_token,
+            )
+
+    def test_request__concurrent_tenants(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=4, pool_maxsize=8)
+            with ThreadPoolExecutor(8) as executor:
+                responses = list(
+                    executor.map(
+                        lambda n: pool._request(f"tenant-{n % 4}", "GET", "/x/"),
+                        range(40),
+                    )
+                )
+
+            self.assertEqual(responses, [{"ok": True}] * 40)
+            self.assertEqual(server.stats.auth_requests, 4)
+            self.assertLessEqual(pool.pool_stats.created, 8)
+
+    def test_client__evicts_least_recently_used(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, max_clients=2)
+            pool._request("tenant-0", "GET", "/x/")
+            pool._request("tenant-1", "GET", "/x/")
+            pool._request("tenant-0", "GET", "/x/")
+            pool._request("tenant-2", "GET", "/x/")
+
+            stats = pool.stats
+            self.assertEqual(stats.tenants, 3)
+            self.assertEqual(stats.clients, 2)
+            self.assertEqual(stats.evicted, 1)
+
+            # tenant-0 was kept, tenant-1 authenticates again
+            pool._request("tenant-0", "GET", "/x/")
+            self.assertEqual(server.stats.auth_requests, 3)
+            pool._request("tenant-1", "GET", "/x/")
+            self.assertEqual(server.stats.auth_requests, 4)
+            self.assertEqual(pool.pool_stats.created, 1)
+
+    def test_client__unknown_tenant__raises(self):
+        with StubApiServer() as server:
+            pool = self._pool(server)
+            with self.assertRaises(KeyError):
+                pool._request("unknown", "GET", "/x/")
+            self.assertEqual(server.stats.requests, 0)
+
+    def test_register__new_credentials__drops_client(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=1)
+            client = pool.client("tenant-0")
+
+            pool.register("tenant-0", "id-0", "secret-0")
+            self.assertIs(pool.client("tenant-0"), client)
+
+            pool.register("tenant-0", "id-0", "rotated-secret")
+            self.assertIsNot(pool.client("tenant-0"), client)
+
+    def test_unregister(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=2)
+            pool.client("tenant-0")
+
+            pool.unregister("tenant-0")
+
+            self.assertNotIn("tenant-0", pool)
+            self.assertEqual(len(pool), 1)
+            self.assertEqual(pool.stats.clients, 0)
+            with self.assertRaises(KeyError):
+                pool.client("tenant-0")
+
+    def test_close__keeps_client_sessions_to_pool(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=1)
+            pool._request("tenant-0", "GET", "/x/")
+            client = pool.client("tenant-0")
+
+            # A tenant client never closes the shared session
+            client.close()
+            pool._request("tenant-0", "GET", "/x/")
+            self.assertEqual(pool.pool_stats.created, 1)
+            self.assertEqual(pool.pool_stats.reused, 2)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            TnApiPool(tn_api_url="not a url")
+        with self.assertRaises(ValueError):
+            TnApiPool(tn_api_url="http://localhost", max_clients=0)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_fork__child_gets_own_session(self):
+        with StubApiServer() as server:
+            pool = self._pool(server, tenants=1)
+            pool._request("tenant-0", "GET", "/x/")
+            parent_session = pool.session
+
+            def child():
+                response = pool._request("tenant-0", "GET", "/x/")
+                return {
+                    "response": response,
+                    "new_session": pool.session is not parent_session,
+                    "client_session": pool.client("tenant-0").session is pool.session,
+                    "created": pool.pool_stats.created,
+                }
+
+            result = _in_child(child)
+
+            self.assertEqual(result["response"], {"ok": True})
+            self.assertTrue(result["new_session"])
+            self.assertTrue(result["client_session"])
+            self.assertEqual(result["created"], 1)
+            self.assertEqual(server.stats.auth_requests, 1)
@@ -1,9 +1,15 @@
+import bz2
 import json
 import zlib
-from base64 import b64encode
+from base64 import b64decode, b64encode
 
 from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
 from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.codecs import AdaptiveCompressionPolicy, Bz2Codec, ZlibCodec
+from tn_sdk.payload.dedup import expand_segments
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.itinerary_dictionary import ITINERARY_DICTIONARY_V1
 from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
 
 
@@ -38,3 +44,89 @@ class TestPrepareDataForGenerateSolutions(BaseTnApiTest):
 
         self.assertIn("Input must be a JSON-encoded string", str(cm.exception))
         self.assertEqual(cm.exception.code, "INVALID_DATA")
+
+    def test_prepare_data_for_generate_solutions__compression_dictionary__uses_zdict(
+        self,
+    ):
+        api = TnApi(compression_dictionary=ITINERARY_DICTIONARY_V1)
+        json_data = json.dumps({"cabin_class": "E", "fare_type": "PublicFare"})
+
+        result = api.prepare_data_for_generate_solutions(json_data)
+
+        self.assertEqual(
+            ITINERARY_DICTIONARY_V1.decompress(b64decode(result)).decode("utf-8"),
+            json_data,
+        )
+        self.assertEqual(
+            api.compression_headers(),
+            {"X-TN-Compression-Dictionary": "itinerary.v1"},
+        )
+        self.assertEqual(self.api_prod.compression_headers(), {})
+
+    def test_prepare_data_with_metadata__default__reports_default_zlib_codec(self):
+        json_data = json.dumps({"test": "value"})
+
+        prepared = self.api_prod.prepare_data_with_metadata(json_data)
+
+        self.assertEqual(
+            prepared.data, self.api_prod.prepare_data_for_generate_solutions(json_data)
+        )
+        self.assertEqual(prepared.codec, ZlibCodec(6))
+        self.assertEqual(prepared.raw_size, len(json_data))
+        self.assertEqual(prepared.compressed_size, len(b64decode(prepared.data)))
+        self.assertEqual(prepared.headers(), {})
+
+    def test_prepare_data_with_metadata__compression_codec__uses_and_reports_it(self):
+        api = TnApi(compression=Bz2Codec(9))
+        json_data = json.dumps({"test": "value"})
+
+        prepared = api.prepare_data_with_metadata(json_data)
+
+        self.assertEqual(bz2.decompress(b64decode(prepared.data)).decode(), json_data)
+        self.assertEqual(prepared.codec, Bz2Codec(9))
+        self.assertEqual(prepared.headers(), {"X-TN-Compression-Codec": "bz2"})
+        self.assertEqual(api.compression_headers(), {"X-TN-Compression-Codec": "bz2"})
+
+    def test_prepare_data_with_metadata__adaptive_policy__picks_level_per_payload(self):
+        api = TnApi(compression=AdaptiveCompressionPolicy(bandwidth=1.25e6))
+
+        large_data = json.dumps(["value"] * 10_000)
+
+        small = api.prepare_data_with_metadata(json.dumps({"test": "value"}))
+        large = api.prepare_data_with_metadata(large_data)
+
+        self.assertEqual(small.codec.level, 1)
+        self.assertGreater(large.codec.level, 1)
+        self.assertEqual(zlib.decompress(b64decode(large.data)).decode(), large_data)
+
+    def test_prepare_data_with_metadata__request_model__same_as_json_string(self):
+        data = generate_request_data(5)
+        request = GenerateSolutionsRequest.from_dict(data)
+
+        prepared = self.api_prod.prepare_data_with_metadata(request)
+
+        self.assertEqual(
+            prepared.data,
+            self.api_prod.prepare_data_for_generate_solutions(json.dumps(data)),
+        )
+        self.assertEqual(prepared.raw_size, len(json.dumps(data)))
+        self.assertEqual(prepared.codec, ZlibCodec(6))
+
+    def test_prepare_data_for_generate_solutions__deduplicate_segments__sends_table(
+        self,
+    ):
+        api = TnApi(deduplicate_segments=True)
+        data = generate_request_data(20, duplication=0.9)
+
+        result = api.prepare_data_for_generate_solutions(json.dumps(data))
+
+        normalized = json.loads(zlib.decompress(b64decode(result)))
+        self.assertIn("segment_table", normalized)
+        self.assertEqual(expand_segments(normalized), data)
+        self.assertEqual(
+            api.compression_headers(),
+            {"X-TN-Payload-Normalization": "segment-table.v1"},
+        )
+        self.assertEqual(
+            b"".join(api.iter_prepare_data_for_generate_solutions(data)), result
+        )
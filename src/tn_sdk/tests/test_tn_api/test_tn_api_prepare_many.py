@@ -0,0 +1,100 @@
+import json
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from tn_sdk import TnApi
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.batch import iter_prepare_many
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestPrepareMany(BaseTnApiTest):
+    def setUp(self):
+        super().setUp()
+        self.api = TnApi()
+        self.payloads = [{"trip_id": str(i), "value": "x" * i} for i in range(50)]
+
+    def test_prepare_many__mixed_str_and_dict_payloads__same_order_as_sequential(
+        self,
+    ):
+        payloads = [json.dumps(p) if i % 2 else p for i, p in enumerate(self.payloads)]
+
+        result = self.api.prepare_many(payloads, workers=4)
+
+        expected = [
+            self.api.prepare_data_for_generate_solutions(json.dumps(p))
+            for p in self.payloads
+        ]
+        self.assertEqual(result, expected)
+
+    def test_prepare_many__invalid_items__reported_in_place_without_aborting(self):
+        payloads = ["{}", None, {"bad": object()}, "[]"]
+
+        result = self.api.prepare_many(payloads, workers=2)
+
+        self.assertIsInstance(result[0], bytes)
+        self.assertIsInstance(result[1], InvalidDataException)
+        self.assertIsInstance(result[2], InvalidDataException)
+        self.assertIsInstance(result[3], bytes)
+
+    def test_prepare_many__lazy__returns_generator_consuming_input_incrementally(
+        self,
+    ):
+        consumed = []
+
+        def payload_source():
+            for payload in self.payloads:
+                consumed.append(payload)
+                yield payload
+
+        result = self.api.prepare_many(payload_source(), workers=2, lazy=True)
+        self.assertIsInstance(result, types.GeneratorType)
+
+        first = next(result)
+        result.close()
+
+        self.assertEqual(
+            first,
+            self.api.prepare_data_for_generate_solutions(json.dumps(self.payloads[0])),
+        )
+        self.assertLess(len(consumed), len(self.payloads))
+
+    def test_prepare_many__custom_executor__used_and_left_running(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = self.api.prepare_many(["{}", "[]"], executor=executor)
+
+            self.assertEqual(len(result), 2)
+            # Still usable: prepare_many didn't shut it down
+            self.assertEqual(executor.submit(lambda: 1).result(), 1)
+
+    def test_prepare_many__serialize_in_processes__same_result_as_threads(self):
+        result = self.api.prepare_many(
+            self.payloads[:5], workers=2, serialize_in_processes=True
+        )
+
+        self.assertEqual(result, self.api.prepare_many(self.payloads[:5], workers=2))
+
+    def test_prepare_many__process_executor_and_serialize_in_processes__same_result(
+        self,
+    ):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = self.api.prepare_many(
+                self.payloads[:5], executor=executor, serialize_in_processes=True
+            )
+
+        self.assertEqual(result, self.api.prepare_many(self.payloads[:5], workers=2))
+
+    def test_iter_prepare_many__serializer_with_process_executor__rejected(self):
+        with ThreadPoolExecutor(max_workers=1) as serializer:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                with self.assertRaisesRegex(ValueError, "ProcessPoolExecutor"):
+                    next(iter_prepare_many(["{}"], executor, serializer=serializer))
+
+    def test_iter_prepare_many__unexpected_error__raised(self):
+        validator = MagicMock()
+        validator.validate.side_effect = RuntimeError("bug")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with self.assertRaisesRegex(RuntimeError, "bug"):
+                list(iter_prepare_many(["{}"], executor, validator=validator))
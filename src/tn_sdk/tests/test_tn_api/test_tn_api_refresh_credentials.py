@@ -0,0 +1,71 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from tn_sdk import TnApi
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestRefreshCredentials(BaseTnApiTest):
+
+    def test_refresh_credentials__already_superseded__reuses_current_credentials(self):
+        api = TnApi()
+        stale = {"prod_token": "stale"}
+        api._credentials = {"prod_token": "fresh"}
+        api._fetch_new_credentials_from_api = MagicMock()
+
+        result = api._refresh_credentials(stale)
+
+        self.assertEqual(result, {"prod_token": "fresh"})
+        api._fetch_new_credentials_from_api.assert_not_called()
+        self.assertEqual(api.refresh_stats.coalesced, 1)
+        self.assertEqual(api.refresh_stats.performed, 0)
+
+    def test_refresh_credentials__current_credentials_are_stale__fetches_once(self):
+        api = TnApi()
+        api._credentials = {"prod_token": "stale"}
+        api._fetch_new_credentials_from_api = MagicMock(
+            return_value={"prod_token": "fresh"}
+        )
+
+        result = api._refresh_credentials(api._credentials)
+
+        self.assertEqual(result, {"prod_token": "fresh"})
+        self.assertEqual(api.refresh_stats.performed, 1)
+
+    def test_request__concurrent_401s__refreshes_exactly_once(self):
+        api = TnApi()
+        api._credentials = {"prod_token": "stale"}
+        thread_count = 10
+        all_sent_stale = threading.Barrier(thread_count)
+
+        def fake_fetch():
+            time.sleep(0.05)
+            return {"prod_token": "fresh"}
+
+        def fake_request(method, url, headers, **kwargs):
+            if headers["Authorization"] == "Token stale":
+                # Make sure every thread used the stale token before any refresh happens
+                all_sent_stale.wait(timeout=5)
+                return MagicMock(status_code=401)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"ok": True}
+            return response
+
+        api._fetch_new_credentials_from_api = MagicMock(side_effect=fake_fetch)
+        self.mock_session_instance.request.side_effect = fake_request
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(api._request("GET", "/t")))
+            for _ in range(thread_count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(results, [{"ok": True}] * thread_count)
+        api._fetch_new_credentials_from_api.assert_called_once()
+        self.assertEqual(api.refresh_stats.performed, 1)
+        self.assertEqual(api.refresh_stats.coalesced, thread_count - 1)
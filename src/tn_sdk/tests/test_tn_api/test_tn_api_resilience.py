@@ -0,0 +1,191 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from requests import ConnectionError, HTTPError
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.resilience import CircuitBreaker, RetryBudget
+from tn_sdk.core.transport import passthrough_statuses
+from tn_sdk.exceptions.exceptions import (
+    CircuitOpenException,
+    TnAuthenticationFailedException,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTnApiResilience(unittest.TestCase):
+    def _client(self, server: StubApiServer, **kwargs) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+            **kwargs,
+        )
+        self.addCleanup(client.close)
+        client.authenticate()
+        return client
+
+    def test_retry_budget__exhausted__failure_returned_without_retry(self):
+        budget = RetryBudget(ratio=0.5, reserve=1)
+        with StubApiServer(burst_every=1, burst_status=503) as server:
+            client = self._client(server, retry_budget=budget)
+
+            for _ in range(2):
+                with self.assertRaises(HTTPError) as context:
+                    client._request("GET", "/x/")
+                self.assertEqual(context.exception.response.status_code, 503)
+
+            # One retry from the reserve, then none
+            self.assertEqual(server.stats.requests, 3)
+        self.assertEqual(budget.stats.spent, 1)
+
+    def test_retry_budget__successes__refill_it(self):
+        budget = RetryBudget(ratio=0.5, reserve=1)
+        with StubApiServer(burst_every=4, burst_length=1, burst_status=503) as server:
+            client = self._client(server, retry_budget=budget)
+
+            for _ in range(6):
+                client._request("GET", "/x/")
+
+        self.assertEqual(budget.stats.rejected, 0)
+        self.assertEqual(budget.stats.spent, 1)
+
+    def test_circuit_breaker__open__fails_fast(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=5, clock=clock)
+        with StubApiServer(burst_every=1, burst_status=503) as server:
+            client = self._client(
+                server, circuit_breaker=breaker, retry_budget=RetryBudget(reserve=0)
+            )
+            for _ in range(2):
+                with self.assertRaises(HTTPError):
+                    client._request("GET", "/x/?page=1")
+
+            with self.assertRaises(CircuitOpenException):
+                client._request("GET", "/x/?page=2")
+            self.assertEqual(server.stats.requests, 2)
+
+            # Other endpoints are unaffected
+            with self.assertRaises(HTTPError):
+                client._request("GET", "/y/")
+
+            # A probe goes through once the recovery timeout elapsed
+            clock.now += 5
+            server.burst_every = 0
+            self.assertEqual(client._request("GET", "/x/"), {"ok": True})
+
+        self.assertEqual(breaker.state("/x/"), CircuitBreaker.CLOSED)
+
+    def test_circuit_breaker__probe_interrupted__next_request_probes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5, clock=clock)
+        with StubApiServer(burst_every=1, burst_status=503) as server:
+            client = self._client(
+                server, circuit_breaker=breaker, retry_budget=RetryBudget(reserve=0)
+            )
+            with self.assertRaises(HTTPError):
+                client._request("GET", "/x/")
+            clock.now += 5
+
+            with patch.object(client, "_send_request", side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    client._request("GET", "/x/")
+
+            server.burst_every = 0
+            self.assertEqual(client._request("GET", "/x/"), {"ok": True})
+
+        self.assertEqual(breaker.state("/x/"), CircuitBreaker.CLOSED)
+
+    def test_circuit_breaker__token_refresh_connection_error__counted(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        with StubApiServer() as server:
+            client = TnApi(
+                "stub-id",
+                "stub-secret",
+                tn_api_url=server.url,
+                credential_store=InMemoryCredentialStore(),
+                lazy=True,
+                circuit_breaker=breaker,
+            )
+            self.addCleanup(client.close)
+            refused = ConnectionError("refused")
+
+            with patch.object(client.session, "post", side_effect=refused):
+                with self.assertRaises(TnAuthenticationFailedException):
+                    client._request("GET", "/x/")
+
+        self.assertEqual(breaker.state("/x/"), CircuitBreaker.OPEN)
+
+    def test_circuit_breaker__client_errors__not_counted(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        with StubApiServer(burst_every=1, burst_status=400) as server:
+            client = self._client(server, circuit_breaker=breaker)
+
+            for _ in range(3):
+                with self.assertRaises(HTTPError):
+                    client._request("GET", "/x/")
+
+        self.assertEqual(breaker.state("/x/"), CircuitBreaker.CLOSED)
+
+    def test_hedge_after__slow_attempt__hedge_answers(self):
+        with StubApiServer(tail_every=2, tail_latency=1.0) as server:
+            client = self._client(server, hedge_after=0.05)
+
+            started = time.perf_counter()
+            response = client._request("GET", "/x/")
+
+            self.assertLess(time.perf_counter() - started, 0.5)
+            self.assertEqual(response, {"ok": True})
+        self.assertEqual(client.hedge_stats.sent, 1)
+        self.assertEqual(client.hedge_stats.won, 1)
+
+    def test_hedge_after__passthrough_statuses__apply_to_attempts(self):
+        with StubApiServer(burst_every=1, burst_status=503) as server:
+            client = self._client(server, hedge_after=0.0)
+
+            with passthrough_statuses(503), self.assertRaises(HTTPError):
+                client._request("GET", "/x/")
+
+            # The attempt and its hedge, neither retried
+            self.assertLessEqual(server.stats.requests, 2)
+
+    def test_hedge_after__fast_attempt__no_hedge(self):
+        with StubApiServer() as server:
+            client = self._client(server, hedge_after=0.5)
+
+            client._request("GET", "/x/")
+
+            self.assertEqual(server.stats.requests, 1)
+        self.assertEqual(client.hedge_stats.sent, 0)
+
+    def test_hedge_after__post__not_hedged_unless_asked(self):
+        with StubApiServer(tail_every=1, tail_latency=0.2) as server:
+            client = self._client(server, hedge_after=0.05)
+
+            client._request("POST", "/x/", data=b"{}")
+            self.assertEqual(client.hedge_stats.sent, 0)
+
+            client._request("POST", "/x/", data=b"{}", hedge=True)
+            self.assertEqual(client.hedge_stats.sent, 1)
+
+    def test_hedge_after__empty_budget__no_hedge(self):
+        with StubApiServer(tail_every=1, tail_latency=0.2) as server:
+            client = self._client(
+                server, hedge_after=0.05, retry_budget=RetryBudget(reserve=0)
+            )
+
+            client._request("GET", "/x/")
+
+            self.assertEqual(server.stats.requests, 1)
+        self.assertEqual(client.hedge_stats.sent, 0)
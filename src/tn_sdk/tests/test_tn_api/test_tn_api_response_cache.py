@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from tn_sdk import TnApi
+from tn_sdk.core.enums import TokenType
+from tn_sdk.core.response_cache import ResponseCache
+from tn_sdk.tests.test_tn_api.base_tn_api_test import BaseTnApiTest
+
+
+class TestResponseCache(BaseTnApiTest):
+
+    def setUp(self):
+        super().setUp()
+        response = MagicMock(status_code=200, content=b'{"solutions": [1]}')
+        self.mock_session_instance.request.return_value = response
+
+    def _api(self, **kwargs) -> TnApi:
+        api = TnApi(**kwargs)
+        api._credentials = {"prod_token": "valid", "sandbox_token": "valid"}
+        return api
+
+    def test_request__cache_requested__identical_request_sent_once(self):
+        api = self._api(response_cache=ResponseCache())
+
+        first = api._request("POST", "/solutions", data=b"payload", cache=True)
+        first["solutions"].append(2)
+        second = api._request("POST", "/solutions", data=b"payload", cache=True)
+
+        self.assertEqual(second, {"solutions": [1]})
+        self.mock_session_instance.request.assert_called_once()
+
+    def test_request__other_token_type__not_shared(self):
+        api = self._api(response_cache=ResponseCache())
+
+        api._request("POST", "/solutions", data=b"payload", cache=True)
+        api._request(
+            "POST", "/solutions", TokenType.SANDBOX, data=b"payload", cache=True
+        )
+
+        self.assertEqual(self.mock_session_instance.request.call_count, 2)
+
+    def test_request__cache_not_requested__always_sent(self):
+        api = self._api(response_cache=ResponseCache())
+        self.mock_session_instance.request.return_value.json.return_value = {}
+
+        api._request("POST", "/solutions", data=b"payload")
+        api._request("POST", "/solutions", data=b"payload")
+
+        self.assertEqual(self.mock_session_instance.request.call_count, 2)
+
+    def test_request__no_response_cache__cache_ignored(self):
+        api = self._api()
+        self.mock_session_instance.request.return_value.json.return_value = {}
+
+        api._request("POST", "/solutions", data=b"payload", cache=True)
+        api._request("POST", "/solutions", data=b"payload", cache=True)
+
+        self.assertEqual(self.mock_session_instance.request.call_count, 2)
+        self.assertNotIn("cache", self.mock_session_instance.request.call_args.kwargs)
@@ -0,0 +1,149 @@
+import io
+import json
+import unittest
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.itineraries import generate_request_data
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.codecs import AdaptiveCompressionPolicy
+from tn_sdk.payload.models import GenerateSolutionsRequest
+from tn_sdk.payload.spill import SpooledPayload
+from tn_sdk.payload.validation import PayloadValidator
+
+BODY = {"trip_id": "", "solutions": [{"id": index} for index in range(2000)]}
+
+
+class TestTnApiSpill(unittest.TestCase):
+    def setUp(self):
+        self.data = generate_request_data(60, seed=4)
+        self.encoded = json.dumps(self.data)
+
+    def _client(self, server: StubApiServer | None = None, **kwargs) -> TnApi:
+        if server is not None:
+            kwargs["tn_api_url"] = server.url
+        client = TnApi(
+            "id",
+            "secret",
+            credential_store=InMemoryCredentialStore(),
+            lazy=True,
+            **kwargs,
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_prepare__spilled__identical_to_in_memory(self):
+        for options in (
+            {},
+            {"compression": AdaptiveCompressionPolicy()},
+            {"deduplicate_segments": True},
+        ):
+            with self.subTest(options=options):
+                in_memory = self._client(**options)
+                spilled = self._client(spill_threshold=1024, **options)
+
+                for payload in (
+                    self.encoded,
+                    GenerateSolutionsRequest.from_dict(self.data),
+                ):
+                    self.assertEqual(
+                        spilled.prepare_data_with_metadata(payload),
+                        in_memory.prepare_data_with_metadata(payload),
+                    )
+
+    def test_spool_data__file_input__identical_bytes(self):
+        client = self._client(spill_threshold=1024)
+        expected = client.prepare_data_for_generate_solutions(self.encoded)
+
+        with client.spool_data_for_generate_solutions(
+            io.BytesIO(self.encoded.encode("utf-8"))
+        ) as spooled:
+            self.assertTrue(spooled.on_disk)
+            self.assertEqual(spooled.read(), expected)
+
+    def test_spool_data__validated_and_rewritten_like_prepare(self):
+        client = self._client(validator=PayloadValidator(), deduplicate_segments=True)
+        invalid = json.loads(self.encoded)
+        next(iter(invalid["datasource_responses"].values()))[0]["segments"] = []
+
+        with self.assertRaises(InvalidDataException):
+            client.spool_data_for_generate_solutions(json.dumps(invalid))
+        with self.assertRaisesRegex(InvalidDataException, "file object"):
+            self._client().spool_data_for_generate_solutions(12)
+        # Dicts are refused like by prepare_data_with_metadata, even when rewriting
+        with self.assertRaisesRegex(InvalidDataException, "JSON-encoded string"):
+            client.spool_data_for_generate_solutions(self.data)
+
+        with client.spool_data_for_generate_solutions(self.encoded) as spooled:
+            self.assertEqual(
+                spooled.read(), client.prepare_data_for_generate_solutions(self.encoded)
+            )
+
+    def test_spool_data__file_input__sent_as_is_without_rewriting(self):
+        client = self._client(deduplicate_segments=True)
+        expected = self._client().prepare_data_for_generate_solutions(self.encoded)
+
+        for payload in (
+            io.StringIO(self.encoded),
+            io.BytesIO(self.encoded.encode("utf-8")),
+        ):
+            with self.subTest(payload=type(payload).__name__):
+                with client.spool_data_for_generate_solutions(payload) as spooled:
+                    self.assertEqual(spooled.read(), expected)
+
+    def test_submit_many__spilled__uploads_same_bodies(self):
+        payloads = [self.encoded, self.data, "{}"]
+        with StubApiServer(keep_bodies=True) as server:
+            results = list(self._client(server).submit_many(payloads, "/solutions/"))
+            expected = server.bodies
+        with StubApiServer(keep_bodies=True) as server:
+            spilled = list(
+                self._client(server, spill_threshold=1024).submit_many(
+                    payloads, "/solutions/"
+                )
+            )
+
+            self.assertEqual(sorted(server.bodies), sorted(expected))
+        self.assertEqual(
+            [result.response for result in spilled],
+            [result.response for result in results],
+        )
+
+    def test_request__spooled_body_after_token_expiry__sent_again_whole(self):
+        with StubApiServer(keep_bodies=True) as server:
+            client = self._client(server, spill_threshold=1024)
+            client.authenticate()
+            server.expire_tokens()
+
+            with client.spool_data_for_generate_solutions(self.encoded) as spooled:
+                client._request("POST", "/solutions/", data=spooled)
+                spooled.seek(0)
+                expected = spooled.read()
+
+            self.assertEqual(server.stats.unauthorized, 1)
+            self.assertEqual(server.bodies, [expected, expected])
+
+    def test_request__spilled_response__same_json(self):
+        for gzip_responses in (False, True):
+            with self.subTest(gzip_responses=gzip_responses):
+                with StubApiServer(
+                    response_body=BODY, gzip_responses=gzip_responses
+                ) as server:
+                    small = self._client(server, spill_threshold=1 << 20)
+                    spilled = self._client(server, spill_threshold=1024)
+
+                    self.assertEqual(small._request("GET", "/solutions"), BODY)
+                    self.assertEqual(spilled._request("GET", "/solutions"), BODY)
+                    self.assertEqual(server.stats.requests, 2)
+
+    def test_spooled_payload__is_not_cached_nor_hedged(self):
+        with StubApiServer(keep_bodies=True) as server:
+            client = self._client(server, spill_threshold=1024, hedge_after=0.0)
+
+            with client.spool_data_for_generate_solutions(self.encoded) as spooled:
+                self.assertIsInstance(spooled, SpooledPayload)
+                client._request("GET", "/solutions/", data=spooled, cache=True)
+
+            self.assertEqual(client.hedge_stats.sent, 0)
+            self.assertEqual(len(server.bodies), 1)
@@ -0,0 +1,150 @@
+import json
+import unittest
+from unittest.mock import MagicMock
+
+from tn_sdk import TnApi
+from tn_sdk.benchmarks.stub_server import StubApiServer
+from tn_sdk.core.credential_store import InMemoryCredentialStore
+from tn_sdk.core.metrics import MetricsCollector
+from tn_sdk.core.pipeline import AdaptiveLimiter
+from tn_sdk.exceptions.exceptions import InvalidDataException
+from tn_sdk.payload.codecs import Bz2Codec
+
+PAYLOADS = [{"trip_id": str(index), "datasource_responses": {}} for index in range(40)]
+
+
+class TestTnApiSubmitMany(unittest.TestCase):
+    def _client(self, server: StubApiServer, **kwargs) -> TnApi:
+        client = TnApi(
+            "stub-id",
+            "stub-secret",
+            tn_api_url=server.url,
+            credential_store=InMemoryCredentialStore(),
+            pool_maxsize=8,
+            **kwargs,
+        )
+        self.addCleanup(client.close)
+        return client
+
+    def test_submit_many__ordered__results_in_input_order(self):
+        with StubApiServer(latency=0.005) as server:
+            client = self._client(server)
+
+            results = list(client.submit_many(PAYLOADS, "/solutions/", concurrency=4))
+
+            self.assertEqual([result.index for result in results], list(range(40)))
+            self.assertTrue(all(result.ok for result in results))
+            self.assertEqual(results[0].response, {"ok": True})
+            self.assertLessEqual(server.stats.peak_concurrency, 4)
+            self.assertEqual(server.stats.requests, 40)
+
+    def test_submit_many__unordered__every_result_once(self):
+        with StubApiServer(latency=0.005) as server:
+            client = self._client(server)
+
+            results = client.submit_many(PAYLOADS, "/solutions/", ordered=False)
+
+            self.assertEqual(
+                sorted(result.index for result in results), list(range(40))
+            )
+
+    def test_submit_many__sends_compression_headers_of_each_payload(self):
+        client = TnApi(
+            "id",
+            "secret",
+            credential_store=InMemoryCredentialStore(),
+            lazy=True,
+            compression=Bz2Codec(9),
+            deduplicate_segments=True,
+        )
+        self.addCleanup(client.close)
+        client._request = MagicMock(return_value={"ok": True})
+
+        list(client.submit_many(PAYLOADS[:2], "/solutions/"))
+
+        for call in client._request.call_args_list:
+            self.assertEqual(
+                call.kwargs["headers"], client.compression_headers(Bz2Codec(9))
+            )
+        self.assertEqual(
+            client.compression_headers(),
+            {
+                "X-TN-Compression-Codec": "bz2",
+                "X-TN-Payload-Normalization": "segment-table.v1",
+            },
+        )
+
+    def test_submit_many__mixed_payloads__invalid_one_reported(self):
+        with StubApiServer() as server:
+            client = self._client(server)
+
+            results = list(
+                client.submit_many(
+                    [json.dumps(PAYLOADS[0]), 12, PAYLOADS[1]], "/solutions/"
+                )
+            )
+
+            self.assertEqual([result.ok for result in results], [True, False, True])
+            self.assertIsInstance(results[1].error, InvalidDataException)
+            self.assertEqual(server.stats.requests, 2)
+
+    def test_submit_many__lazy_input__backpressure(self):
+        pulled = 0
+
+        def payloads():
+            nonlocal pulled
+            for payload in PAYLOADS:
+                pulled += 1
+                yield payload
+
+        with StubApiServer(latency=0.01) as server:
+            client = self._client(server)
+            results = client.submit_many(payloads(), "/solutions/", concurrency=2)
+
+            next(results)
+            self.assertLessEqual(pulled, 2 * 2 + 1)
+            self.assertEqual(len(list(results)), 39)
+
+    def test_submit_many__throttled__whole_pipeline_slows_down(self):
+        metrics = MetricsCollector()
+        limiter = AdaptiveLimiter(8, backoff=0.05)
+        with StubApiServer(burst_every=10, burst_length=2, burst_status=429) as server:
+            client = self._client(server, hooks=metrics)
+
+            results = list(client.submit_many(PAYLOADS, "/solutions/", limiter=limiter))
+
+            self.assertTrue(all(result.ok for result in results))
+            throttled = sum(result.throttled for result in results)
+            self.assertEqual(throttled, server.stats.failures)
+            self.assertEqual(server.stats.requests, 40 + throttled)
+
+        stats = limiter.stats
+        self.assertEqual(stats.throttled, throttled)
+        self.assertGreaterEqual(stats.slowdowns, 1)
+        self.assertEqual(sum(metrics.snapshot().retries.values()), throttled)
+
+    def test_submit_many__retry_after__honored(self):
+        limiter = AdaptiveLimiter(4)
+        with StubApiServer(
+            burst_every=20, burst_length=1, burst_status=429, retry_after=0.1
+        ) as server:
+            client = self._client(server)
+
+            results = list(
+                client.submit_many(PAYLOADS[:20], "/solutions/", limiter=limiter)
+            )
+
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(limiter.stats.throttled, 1)
+
+    def test_submit_many__always_throttled__error_after_retries(self):
+        limiter = AdaptiveLimiter(2, backoff=0)
+        with StubApiServer(burst_every=1, burst_status=429) as server:
+            client = self._client(server)
+
+            (result,) = client.submit_many(PAYLOADS[:1], "/solutions/", limiter=limiter)
+
+            self.assertFalse(result.ok)
+            self.assertEqual(result.error.response.status_code, 429)
+            self.assertEqual(result.throttled, 5)
+            self.assertEqual(server.stats.requests, 6)
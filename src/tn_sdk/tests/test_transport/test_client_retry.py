@@ -0,0 +1,38 @@
+import unittest
+
+from urllib3 import HTTPResponse
+from urllib3.exceptions import MaxRetryError
+
+from tn_sdk.core.resilience import RetryBudget
+from tn_sdk.core.transport import ClientRetry
+
+
+class TestClientRetry(unittest.TestCase):
+    def _retry(self, budget: RetryBudget, total: int) -> ClientRetry:
+        return ClientRetry(
+            total=total,
+            status_forcelist=[503],
+            allowed_methods=["GET"],
+            budget=budget,
+        )
+
+    def test_is_retry__retries_left__spends_budget(self):
+        budget = RetryBudget(reserve=10)
+
+        self.assertTrue(self._retry(budget, 1).is_retry("GET", 503))
+
+        self.assertEqual(budget.stats.spent, 1)
+
+    def test_is_retry__503_exhausts_total__budget_untouched(self):
+        budget = RetryBudget(reserve=10)
+        retry = self._retry(budget, 1)
+        response = HTTPResponse(status=503)
+
+        # The one retry allowed is paid for, the attempt after it gives up for free
+        self.assertTrue(retry.is_retry("GET", 503))
+        retry = retry.increment("GET", "/x/", response=response)
+        self.assertTrue(retry.is_retry("GET", 503))
+        with self.assertRaises(MaxRetryError):
+            retry.increment("GET", "/x/", response=response)
+
+        self.assertEqual(budget.stats.spent, 1)
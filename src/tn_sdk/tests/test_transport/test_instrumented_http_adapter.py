@@ -0,0 +1,111 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import requests
+
+from tn_sdk.core.hooks import TnApiHooks
+from tn_sdk.core.stats import PoolStats
+from tn_sdk.core.transport import InstrumentedHTTPAdapter, ObservedRetry
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/slow":
+            self.server.release.wait(5)
+        status = 200
+        if self.path.startswith("/flaky") and self.server.failures:
+            self.server.failures -= 1
+            status = 503
+        body = b"{}"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestInstrumentedHTTPAdapter(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.release = threading.Event()
+        self.server.failures = 0
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+        self.session = requests.Session()
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.server_thread.join()
+
+    def _mount(self, **kwargs) -> InstrumentedHTTPAdapter:
+        adapter = InstrumentedHTTPAdapter(**kwargs)
+        self.session.mount("http://", adapter)
+        return adapter
+
+    def test_stats__sequential_requests__reuse_one_connection(self):
+        adapter = self._mount()
+
+        for _ in range(5):
+            self.session.get(f"{self.url}/").raise_for_status()
+
+        self.assertEqual(adapter.stats, PoolStats(created=1, reused=4, discarded=0))
+
+    def test_stats__more_concurrent_requests_than_pool_size__discards_extras(self):
+        adapter = self._mount(pool_maxsize=2)
+        threads = [
+            threading.Thread(target=self.session.get, args=(f"{self.url}/slow",))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        # Let every request open its connection before any of them completes
+        for _ in range(500):
+            if adapter.stats.created == 5:
+                break
+            threading.Event().wait(0.01)
+        self.server.release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(adapter.stats, PoolStats(created=5, reused=0, discarded=3))
+
+    def test_stats__blocking_pool__never_exceeds_pool_size(self):
+        adapter = self._mount(pool_maxsize=2, pool_block=True)
+        self.server.release.set()
+        threads = [
+            threading.Thread(target=self.session.get, args=(f"{self.url}/slow",))
+            for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        stats = adapter.stats
+        self.assertLessEqual(stats.created, 2)
+        self.assertEqual(stats.created + stats.reused, 6)
+        self.assertEqual(stats.discarded, 0)
+
+    def test_observed_retry__retryable_statuses__reported_to_hooks(self):
+        hooks = MagicMock(spec=TnApiHooks)
+        self._mount(
+            max_retries=ObservedRetry(total=3, status_forcelist=[503], hooks=hooks)
+        )
+        self.server.failures = 2
+
+        response = self.session.get(f"{self.url}/flaky?attempt=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(hooks.on_retry.call_count, 2)
+        hooks.on_retry.assert_called_with("GET", "/flaky", 503, None)
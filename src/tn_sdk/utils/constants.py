@@ -2,3 +2,128 @@ SANDBOX_API_URL = "https://sandbox.tripninja.io"
 PRODUCTION_API_URL = "https://api.tripninja.io"
 DEFAULT_COMPRESSION_LEVEL = 6
 SDK_AUTH_ENDPOINT = "/sdk/auth/"
+
+# Network retry policy shared by the sync and async clients (does not cover 401s)
+NETWORK_RETRY_TOTAL = 3
+NETWORK_RETRY_BACKOFF_FACTOR = 0.5
+NETWORK_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+NETWORK_RETRY_METHODS = ("GET", "POST")
+# Retried statuses whose Retry-After header is honored, as urllib3 does
+NETWORK_RETRY_AFTER_STATUS_CODES = (429, 503)
+
+# Connection pooling of the sync client (the requests defaults)
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Proactive token refresh
+DEFAULT_TOKEN_REFRESH_AHEAD = 60
+TOKEN_REFRESH_RETRY_INTERVAL = 5
+
+# Credential stores: seconds a reader waits for a write to the shared memory segment to
+# finish (past it the writer is presumed dead), and the Windows file lock retry backoff
+SHARED_MEMORY_WRITE_TIMEOUT = 1.0
+FILE_LOCK_RETRY_INTERVAL = 0.01
+FILE_LOCK_MAX_RETRY_INTERVAL = 1.0
+
+# Streaming payload preparation
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Preset compression dictionaries
+COMPRESSION_DICTIONARY_HEADER = "X-TN-Compression-Dictionary"
+DEFAULT_DICTIONARY_SIZE = 4 * 1024
+
+# Compression codecs
+COMPRESSION_CODEC_HEADER = "X-TN-Compression-Codec"
+# Upload bandwidth assumed by the adaptive compression policy (100 Mbit/s)
+DEFAULT_UPLOAD_BANDWIDTH = 12.5e6
+# Raw size under which the adaptive policy always uses the cheapest level
+DEFAULT_SMALL_PAYLOAD_SIZE = 4 * 1024
+
+# Segment deduplication
+SEGMENT_TABLE_HEADER = "X-TN-Payload-Normalization"
+SEGMENT_TABLE_FORMAT = "segment-table.v1"
+
+# Latency histogram bucket upper bounds of MetricsCollector, in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Response cache
+DEFAULT_CACHE_TTL = 30.0
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Pipelined submission
+DEFAULT_SUBMIT_CONCURRENCY = 8
+DEFAULT_SUBMIT_MAX_IN_FLIGHT_BYTES = 32 * 1024 * 1024
+# Times a throttled (429) request is sent again before its error is returned
+SUBMIT_THROTTLE_RETRIES = 5
+# Pause of the whole pipeline after a 429 without Retry-After, doubling on each in a row
+SUBMIT_THROTTLE_BACKOFF = 0.5
+SUBMIT_MAX_THROTTLE_DELAY = 30.0
+
+# Retry budget: retries allowed per successful request, on top of a reserve
+DEFAULT_RETRY_BUDGET_RATIO = 0.1
+DEFAULT_RETRY_BUDGET_RESERVE = 10
+
+# Circuit breaker
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_RECOVERY_TIMEOUT = 30.0
+
+# Hedged requests: methods hedged unless a request says otherwise (the idempotent ones)
+HEDGE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Multi-tenant pool: tenant clients (and their tokens) kept at once
+DEFAULT_TENANT_POOL_MAX_CLIENTS = 128
+
+# Traffic recorder
+DEFAULT_RECORDER_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_RECORDER_BACKUPS = 5
+DEFAULT_RECORDER_QUEUE_SIZE = 10000
+RECORDER_REDACTED_HEADERS = (
+    "Authorization",
+    "Cookie",
+    "Proxy-Authorization",
+    "X-Api-Key",
+)
+# Keys ending in _secret or _token are redacted too
+RECORDER_REDACTED_FIELDS = ("password", "secret", "token", "api_key")
+
+# Data streams: NDJSON records sent over long-lived chunked requests
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+DEFAULT_DATA_STREAM_BATCH_BYTES = 64 * 1024
+DEFAULT_DATA_STREAM_LINGER = 0.05
+DEFAULT_DATA_STREAM_MAX_BUFFERED_BYTES = 8 * 1024 * 1024
+# Raw bytes sent before a stream is ended (and its records acknowledged) for a new one
+DEFAULT_DATA_STREAM_MAX_STREAM_BYTES = 16 * 1024 * 1024
+# Seconds a stream is kept open without records to send
+DEFAULT_DATA_STREAM_IDLE_TIMEOUT = 5.0
+# Failed streams in a row before the data stream gives up, and the first and longest
+# pauses between them
+DATA_STREAM_MAX_FAILURES = 5
+DATA_STREAM_RETRY_BACKOFF = 0.5
+DATA_STREAM_MAX_RETRY_DELAY = 30.0
+
+# Payload validation: the cabin classes of the generate-solutions schema
+VALID_CABIN_CLASSES = ("E", "P", "B", "F")
+
+# Payload canonicalization: fields the API can derive from others (the local times,
+# from the timestamps and the airports' time zones)
+DERIVABLE_SEGMENT_FIELDS = ("departure_time", "arrival_time")
+STRIPPED_FIELDS_HEADER = "X-TN-Stripped-Fields"
+
+# Spilling to disk: payloads and responses larger than this are prepared and read through
+# temporary files, when the client has no spill_threshold of its own
+DEFAULT_SPILL_THRESHOLD = 64 * 1024 * 1024